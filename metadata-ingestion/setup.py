@@ -56,6 +56,8 @@ framework_common = {
     "requests_file",
     "jsonref",
     "jsonschema",
+    # Checkpoint states can be compressed with zstd.
+    "zstandard",
 }
 
 rest_common = {"requests", "requests_file"}
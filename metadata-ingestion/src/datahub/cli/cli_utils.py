@@ -368,9 +368,15 @@ def get_urns_by_filter(
     search_query: str = "*",
     include_removed: bool = False,
     only_soft_deleted: Optional[bool] = None,
+    batch_size: int = 10000,
 ) -> Iterable[str]:
+    """
+    Yields the urns of all entities that match the filters, scrolling through the search
+    results in pages of batch_size entities. Unlike paging with an offset, scrolling is
+    not limited to the first 10,000 results of Elasticsearch.
+    """
     session, gms_host = get_session_and_host()
-    endpoint: str = "/entities?action=search"
+    endpoint: str = "/entities?action=scrollAcrossEntities"
     url = gms_host + endpoint
     filter_criteria = []
     entity_type_lower = entity_type.lower()
@@ -416,32 +422,40 @@ def get_urns_by_filter(
             }
         )
 
-    search_body = {
-        "input": search_query,
-        "entity": entity_type,
-        "start": 0,
-        "count": 10000,
-        "filter": {"or": [{"and": filter_criteria}]},
-    }
-    payload = json.dumps(search_body)
-    log.debug(payload)
-    response: Response = session.post(url, payload)
-    if response.status_code == 200:
+    entities_yielded: int = 0
+    num_entities: int = 0
+    scroll_id: Optional[str] = None
+    while True:
+        search_body = {
+            "input": search_query,
+            "entities": [entity_type],
+            "count": batch_size,
+            "keepAlive": "5m",
+            "filter": {"or": [{"and": filter_criteria}]},
+        }
+        if scroll_id is not None:
+            search_body["scrollId"] = scroll_id
+        payload = json.dumps(search_body)
+        log.debug(payload)
+        response: Response = session.post(url, payload)
+        if response.status_code != 200:
+            log.error(f"Failed to execute search query with {str(response.content)}")
+            response.raise_for_status()
         assert response._content
         results = json.loads(response._content)
         num_entities = results["value"]["numEntities"]
-        entities_yielded: int = 0
-        for x in results["value"]["entities"]:
+        entities = results["value"]["entities"]
+        for x in entities:
             entities_yielded += 1
             log.debug(f"yielding {x['entity']}")
             yield x["entity"]
-        if entities_yielded != num_entities:
-            log.warning(
-                f"Discrepancy in entities yielded {entities_yielded} and num entities {num_entities}. This means all entities may not have been deleted."
-            )
-    else:
-        log.error(f"Failed to execute search query with {str(response.content)}")
-        response.raise_for_status()
+        scroll_id = results["value"].get("scrollId")
+        if not entities or scroll_id is None:
+            break
+    if entities_yielded != num_entities:
+        log.warning(
+            f"Discrepancy in entities yielded {entities_yielded} and num entities {num_entities}. This means all entities may not have been deleted."
+        )
 
 
 def get_container_ids_by_filter(
@@ -1,9 +1,13 @@
 import logging
+import pathlib
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from random import choices
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 import click
 import progressbar
@@ -32,6 +36,7 @@ class DeletionResult:
     num_records: int = 0
     num_timeseries_records: int = 0
     num_entities: int = 0
+    num_failed_entities: int = 0
     sample_records: Optional[List[List[str]]] = None
 
     def start(self) -> None:
@@ -49,6 +54,7 @@ class DeletionResult:
         )
         self.num_timeseries_records += another_result.num_timeseries_records
         self.num_entities += another_result.num_entities
+        self.num_failed_entities += another_result.num_failed_entities
         if another_result.sample_records:
             if not self.sample_records:
                 self.sample_records = []
@@ -132,6 +138,32 @@ def delete_for_registry(
 @click.option("--registry-id", required=False, type=str)
 @click.option("-n", "--dry-run", required=False, is_flag=True)
 @click.option("--only-soft-deleted", required=False, is_flag=True, default=False)
+@click.option(
+    "--workers",
+    required=False,
+    type=click.IntRange(min=1),
+    default=4,
+    help="the number of delete requests to run concurrently when deleting using filters",
+)
+@click.option(
+    "--batch-size",
+    required=False,
+    type=click.IntRange(min=1),
+    default=100,
+    help="the number of entities to soft-delete in a single request when deleting using filters",
+)
+@click.option(
+    "--max-requests-per-second",
+    required=False,
+    type=click.FloatRange(min=0, min_open=True),
+    help="limits the rate of delete requests when deleting using filters",
+)
+@click.option(
+    "--checkpoint-file",
+    required=False,
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    help="a file to record deleted urns in, so that an interrupted delete using filters can be resumed by re-running it",
+)
 @upgrade.check_upgrade
 @telemetry.with_telemetry()
 def delete(
@@ -148,6 +180,10 @@ def delete(
     registry_id: str,
     dry_run: bool,
     only_soft_deleted: bool,
+    workers: int,
+    batch_size: int,
+    max_requests_per_second: Optional[float],
+    checkpoint_file: Optional[pathlib.Path],
 ) -> None:
     """Delete metadata from datahub using a single urn or a combination of filters"""
 
@@ -247,6 +283,10 @@ def delete(
             include_removed=include_removed,
             aspect_name=aspect_name,
             only_soft_deleted=only_soft_deleted,
+            workers=workers,
+            batch_size=batch_size,
+            max_requests_per_second=max_requests_per_second,
+            checkpoint_file=checkpoint_file,
         )
 
     if not dry_run:
@@ -257,6 +297,11 @@ def delete(
             f" and {deletion_result.num_timeseries_records} timeseries aspect rows"
             f" for {deletion_result.num_entities} entities."
         )
+        if deletion_result.num_failed_entities:
+            click.secho(
+                f"Failed to {message} {deletion_result.num_failed_entities} entities.",
+                fg="red",
+            )
     else:
         click.echo(
             f"{deletion_result.num_entities} entities with {deletion_result.num_records if deletion_result.num_records != UNKNOWN_NUM_RECORDS else 'unknown'} rows will be affected. Took {(deletion_result.end_time-deletion_result.start_time)/1000.0} seconds to evaluate."
@@ -271,6 +316,135 @@ def _get_current_time() -> int:
     return int(time.time() * 1000.0)
 
 
+class _RateLimiter:
+    """Spaces out calls to wait() so that at most max_rate calls happen per second, across threads."""
+
+    def __init__(self, max_rate: float):
+        self.interval = 1.0 / max_rate
+        self.next_call = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _DeletionCheckpoint:
+    """Appends the deleted urns to a file, so that a re-run can skip them."""
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.deleted_urns: Set[str] = set()
+        if path.exists():
+            with path.open() as f:
+                self.deleted_urns = {line.strip() for line in f if line.strip()}
+        self.file = path.open("a")
+
+    def record(self, urns: Iterable[str]) -> None:
+        for urn in urns:
+            self.file.write(f"{urn}\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _delete_urns(
+    urns: List[str],
+    soft: bool,
+    dry_run: bool,
+    workers: int,
+    batch_size: int,
+    cached_session_host: Tuple[sessions.Session, str],
+    cached_emitter: rest_emitter.DatahubRestEmitter,
+    aspect_name: Optional[str] = None,
+    is_soft_deleted: Optional[bool] = None,
+    rate_limiter: Optional[_RateLimiter] = None,
+    checkpoint: Optional[_DeletionCheckpoint] = None,
+) -> DeletionResult:
+    """
+    Deletes the urns on a pool of workers. Soft-deletes are sent in batches of
+    batch_size urns, hard-deletes are sent one urn at a time because that is all
+    the delete endpoint supports. The results are merged on the calling thread.
+    """
+    if soft and not dry_run:
+        batches = [urns[i : i + batch_size] for i in range(0, len(urns), batch_size)]
+    else:
+        batches = [[urn] for urn in urns]
+    deletion_timestamp = _get_current_time()
+    batch_endpoint_unsupported = threading.Event()
+    batch_endpoint_lock = threading.Lock()
+
+    def _delete_batch(batch: List[str]) -> Tuple[DeletionResult, List[str]]:
+        if rate_limiter:
+            rate_limiter.wait()
+        if len(batch) > 1 and not batch_endpoint_unsupported.is_set():
+            try:
+                return _soft_delete_urns(batch, cached_emitter, deletion_timestamp)
+            except Exception as e:
+                if not rest_emitter.is_batch_endpoint_unsupported(e):
+                    raise
+                with batch_endpoint_lock:
+                    if not batch_endpoint_unsupported.is_set():
+                        logger.warning(
+                            "DataHub GMS does not support batch ingestion; "
+                            "falling back to soft-deleting one entity at a time"
+                        )
+                        batch_endpoint_unsupported.set()
+
+        deletion_result = DeletionResult()
+        for i, urn in enumerate(batch):
+            if rate_limiter and i > 0:
+                rate_limiter.wait()
+            deletion_result.merge(
+                _delete_one_urn(
+                    urn,
+                    soft=soft,
+                    dry_run=dry_run,
+                    aspect_name=aspect_name,
+                    cached_session_host=cached_session_host,
+                    cached_emitter=cached_emitter,
+                    deletion_timestamp=deletion_timestamp,
+                    is_soft_deleted=is_soft_deleted,
+                )
+            )
+        return deletion_result, batch
+
+    deletion_result = DeletionResult()
+    bar = progressbar.ProgressBar(max_value=len(urns), redirect_stdout=True)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[
+            Tuple[List[str], Future[Tuple[DeletionResult, List[str]]]]
+        ] = deque()
+
+        def _merge_next() -> None:
+            batch, future = pending.popleft()
+            batch_result, deleted_urns = future.result()
+            deletion_result.merge(batch_result)
+            # Failed urns are not recorded, so that a re-run retries them.
+            if checkpoint and not dry_run:
+                checkpoint.record(deleted_urns)
+            bar.update(bar.value + len(batch))
+
+        try:
+            for batch in batches:
+                pending.append((batch, executor.submit(_delete_batch, batch)))
+                if len(pending) > 2 * workers:
+                    _merge_next()
+            while pending:
+                _merge_next()
+        finally:
+            for _, future in pending:
+                future.cancel()
+    bar.finish()
+    deletion_result.end()
+    return deletion_result
+
+
 @telemetry.with_telemetry()
 def delete_with_filters(
     dry_run: bool,
@@ -283,6 +457,10 @@ def delete_with_filters(
     env: Optional[str] = None,
     platform: Optional[str] = None,
     only_soft_deleted: Optional[bool] = False,
+    workers: int = 1,
+    batch_size: int = 1,
+    max_requests_per_second: Optional[float] = None,
+    checkpoint_file: Optional[pathlib.Path] = None,
 ) -> DeletionResult:
     session, gms_host = cli_utils.get_session_and_host()
     token = cli_utils.get_token()
@@ -332,6 +510,18 @@ def delete_with_filters(
         )
         return DeletionResult(end_time=int(time.time() * 1000.0))
 
+    checkpoint: Optional[_DeletionCheckpoint] = None
+    if checkpoint_file:
+        checkpoint = _DeletionCheckpoint(checkpoint_file)
+        if checkpoint.deleted_urns:
+            urns = [urn for urn in urns if urn not in checkpoint.deleted_urns]
+            soft_deleted_urns = [
+                urn for urn in soft_deleted_urns if urn not in checkpoint.deleted_urns
+            ]
+            click.echo(
+                f"Skipping {len(checkpoint.deleted_urns)} urns that were already deleted according to {checkpoint_file}"
+            )
+
     if not force and not dry_run:
         type_delete = "soft" if soft else "permanently"
         click.confirm(
@@ -339,35 +529,85 @@ def delete_with_filters(
             abort=True,
         )
 
-    if len(urns) > 0:
-        for urn in progressbar.progressbar(urns, redirect_stdout=True):
-            one_result = _delete_one_urn(
-                urn,
+    rate_limiter = (
+        _RateLimiter(max_requests_per_second) if max_requests_per_second else None
+    )
+    try:
+        if len(urns) > 0:
+            one_result = _delete_urns(
+                urns,
                 soft=soft,
-                aspect_name=aspect_name,
                 dry_run=dry_run,
+                workers=workers,
+                batch_size=batch_size,
                 cached_session_host=(session, gms_host),
                 cached_emitter=emitter,
+                aspect_name=aspect_name,
+                rate_limiter=rate_limiter,
+                checkpoint=checkpoint,
             )
             batch_deletion_result.merge(one_result)
 
-    if len(soft_deleted_urns) > 0 and not soft:
-        click.echo("Starting to delete soft-deleted URNs")
-        for urn in progressbar.progressbar(soft_deleted_urns, redirect_stdout=True):
-            one_result = _delete_one_urn(
-                urn,
+        if len(soft_deleted_urns) > 0 and not soft:
+            click.echo("Starting to delete soft-deleted URNs")
+            one_result = _delete_urns(
+                soft_deleted_urns,
                 soft=soft,
                 dry_run=dry_run,
+                workers=workers,
+                batch_size=batch_size,
                 cached_session_host=(session, gms_host),
                 cached_emitter=emitter,
                 is_soft_deleted=True,
+                rate_limiter=rate_limiter,
+                checkpoint=checkpoint,
             )
             batch_deletion_result.merge(one_result)
+    finally:
+        if checkpoint:
+            checkpoint.close()
     batch_deletion_result.end()
 
     return batch_deletion_result
 
 
+def _soft_delete_urns(
+    urns: List[str],
+    emitter: rest_emitter.DatahubRestEmitter,
+    deletion_timestamp: int,
+    run_id: str = "delete-run-id",
+) -> Tuple[DeletionResult, List[str]]:
+    """
+    Soft-deletes the urns in a single request. GMS ingests the proposals one by
+    one, so some urns can fail while the others are soft-deleted. The failed urns
+    are reported, and the soft-deleted urns are returned along with the result.
+    """
+    deletion_result = DeletionResult()
+    deletion_result.num_records = UNKNOWN_NUM_RECORDS  # Default is unknown
+    failures = emitter.emit_mcps(
+        [
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=StatusClass(removed=True),
+                systemMetadata=SystemMetadataClass(
+                    runId=run_id, lastObserved=deletion_timestamp
+                ),
+            )
+            for urn in urns
+        ]
+    )
+    deleted_urns: List[str] = []
+    for i, urn in enumerate(urns):
+        if i in failures:
+            logger.error(f"Failed to soft-delete {urn}: {failures[i]}")
+        else:
+            deleted_urns.append(urn)
+    deletion_result.num_entities = len(deleted_urns)
+    deletion_result.num_failed_entities = len(urns) - len(deleted_urns)
+    deletion_result.end()
+    return deletion_result, deleted_urns
+
+
 def _delete_one_urn(
     urn: str,
     soft: bool = False,
@@ -1,9 +1,10 @@
+import itertools
 import json
 import logging
 import os
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 import click
 from click.shell_completion import CompletionItem
@@ -24,9 +25,12 @@ from datahub.lite.lite_local import (
     AutoComplete,
     DataHubLiteLocal,
     PathNotFoundException,
+    Searchable,
     SearchFlavor,
+    SearchResults,
 )
 from datahub.lite.lite_util import LiteLocalConfig, get_datahub_lite
+from datahub.lite.search_index import parse_facet_filters
 from datahub.telemetry import telemetry
 
 logger = logging.getLogger(__name__)
@@ -271,6 +275,30 @@ def ls(path: Optional[str]) -> None:
     help="Constrain the search to a specific set of aspects",
 )
 @click.option("--details/--no-details", required=False, is_flag=True, default=True)
+@click.option(
+    "--start", required=False, type=int, default=0, help="Offset of the first result"
+)
+@click.option(
+    "--count",
+    required=False,
+    type=int,
+    default=None,
+    help="Maximum number of results to return, defaults to all results",
+)
+@click.option(
+    "--filter",
+    "filters",
+    required=False,
+    multiple=True,
+    help="Only return entities with a facet value, e.g. platform=snowflake. Free text only.",
+)
+@click.option(
+    "--facets/--no-facets",
+    required=False,
+    is_flag=True,
+    default=False,
+    help="Print the facet counts of all matching entities. Free text only.",
+)
 @click.pass_context
 @telemetry.with_telemetry()
 def search(
@@ -279,6 +307,10 @@ def search(
     flavor: str = SearchFlavor.FREE_TEXT.name.lower(),
     aspect: List[str] = [],
     details: bool = True,
+    start: int = 0,
+    count: Optional[int] = None,
+    filters: List[str] = [],
+    facets: bool = False,
 ) -> None:
     """Search with a free text or exact query string"""
 
@@ -289,13 +321,31 @@ def search(
         raise click.UsageError(
             f"Failed to find a matching query flavor for {flavor}. Valid values are {[x.lower() for x in SearchFlavor._member_names_]}"
         )
+    try:
+        parsed_filters = parse_facet_filters(filters)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    if (parsed_filters or facets) and search_flavor != SearchFlavor.FREE_TEXT:
+        raise click.UsageError("--filter and --facets require a free text query")
+
     catalog = _get_datahub_lite(read_only=True)
     # sanitize query
     result_ids = set()
+    search_results: Optional[SearchResults] = None
     try:
-        for searchable in catalog.search(
-            query=query, flavor=search_flavor, aspects=aspect
-        ):
+        if search_flavor == SearchFlavor.FREE_TEXT:
+            search_results = catalog.search_with_facets(
+                query=query, start=start, count=count, filters=parsed_filters
+            )
+            searchables: Iterable[Searchable] = search_results.results
+        else:
+            end = None if count is None else start + count
+            searchables = itertools.islice(
+                catalog.search(query=query, flavor=search_flavor, aspects=aspect),
+                start,
+                end,
+            )
+        for searchable in searchables:
             result_str = searchable.id
             if details:
                 result_str = json.dumps(searchable.dict())
@@ -304,6 +354,14 @@ def search(
                 click.secho(result_str)
                 result_ids.add(searchable.id)
 
+        if search_results is not None and facets:
+            click.secho(f"Total: {search_results.total}", bold=True)
+            for facet, values in search_results.facets.items():
+                click.secho(
+                    f"{facet}: " + ", ".join(f"{v.value} ({v.count})" for v in values),
+                    fg="cyan",
+                )
+
     except Exception as e:
         logger.exception("Failed to process request", exc_info=e)
 
@@ -68,4 +68,4 @@ def inspect(
     )
     assert checkpoint
 
-    click.echo(json.dumps(checkpoint.state.urns, indent=2))
+    click.echo(json.dumps(list(checkpoint.state.urns), indent=2))
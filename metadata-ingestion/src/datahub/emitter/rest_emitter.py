@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from json.decoder import JSONDecodeError
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -25,6 +25,24 @@ from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
 logger = logging.getLogger(__name__)
 
 
+def serialize_mcp(
+    mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+) -> str:
+    """Serializes a single proposal into the JSON form expected by GMS."""
+    return json.dumps(pre_json_transform(mcp.to_obj()))
+
+
+def is_batch_endpoint_unsupported(e: Exception) -> bool:
+    """Whether an error of `emit_mcps` means that GMS has no batch endpoint."""
+    # Older GMS versions reject the unknown action as a whole, rather than
+    # failing on any of the proposals in it.
+    if not isinstance(e, OperationalError):
+        return False
+    return e.info.get("status") == 404 or "ingestProposalBatch" in str(
+        e.info.get("message", "")
+    )
+
+
 class DataHubRestEmitter(Closeable):
     DEFAULT_CONNECT_TIMEOUT_SEC = 30  # 30 seconds should be plenty to connect
     DEFAULT_READ_TIMEOUT_SEC = (
@@ -231,6 +249,29 @@ class DataHubRestEmitter(Closeable):
 
         self._emit_generic(url, payload)
 
+    def emit_mcps(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+    ) -> Dict[int, str]:
+        return self.emit_serialized_mcps([serialize_mcp(mcp) for mcp in mcps])
+
+    def emit_serialized_mcps(self, serialized_mcps: Sequence[str]) -> Dict[int, str]:
+        """Emits a batch of proposals that were serialized with `serialize_mcp`.
+
+        The whole batch is sent in a single request. GMS ingests the proposals one
+        by one, so some of them can fail while the others are ingested. Returns the
+        error messages of the failed proposals, keyed by their index in the batch.
+        """
+        url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
+
+        payload = '{"proposals": [' + ", ".join(serialized_mcps) + "]}"
+
+        response = self._emit_generic(url, payload)
+        return {
+            int(index): message
+            for index, message in response.json().get("value", {}).items()
+        }
+
     def emit_usage(self, usageStats: UsageAggregation) -> None:
         url = f"{self._gms_server}/usageStats?action=batchIngest"
 
@@ -245,7 +286,7 @@ class DataHubRestEmitter(Closeable):
         payload = json.dumps(snapshot)
         self._emit_generic(url, payload)
 
-    def _emit_generic(self, url: str, payload: str) -> None:
+    def _emit_generic(self, url: str, payload: str) -> requests.Response:
         curl_command = _make_curl_command(self._session, "POST", url, payload)
         logger.debug(
             "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
@@ -254,6 +295,7 @@ class DataHubRestEmitter(Closeable):
         try:
             response = self._session.post(url, data=payload)
             response.raise_for_status()
+            return response
         except HTTPError as e:
             try:
                 info = response.json()
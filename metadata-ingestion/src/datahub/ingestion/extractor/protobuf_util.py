@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import sys
+import threading
 from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
@@ -51,6 +52,10 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
 
 logger = logging.getLogger(__name__)
 
+# Compiling schemas writes them to a temporary directory that is added to `sys.path` for
+# `grpc.protos` to import them from, which is not safe to do from concurrent threads.
+_protos_lock = threading.Lock()
+
 
 # ------------------------------------------------------------------------------
 #  API
@@ -238,7 +243,7 @@ def _from_protobuf_schema_to_descriptors(
     if imported_schemas is None:
         imported_schemas = []
     imported_schemas.insert(0, main_schema)
-    with TemporaryDirectory() as tmpdir, _add_sys_path(tmpdir):
+    with _protos_lock, TemporaryDirectory() as tmpdir, _add_sys_path(tmpdir):
         for schema in imported_schemas:  # type: ProtobufSchema
             #
             # Ignore any google/protobuf modules
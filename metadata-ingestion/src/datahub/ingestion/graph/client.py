@@ -1,7 +1,11 @@
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from json.decoder import JSONDecodeError
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import pydantic
 from avro.schema import RecordSchema
@@ -46,6 +50,12 @@ class DatahubClientConfig(ConfigModel):
     ca_certificate_path: Optional[str]
     max_threads: int = 1
     disable_ssl_verification: bool = False
+    # Aspects that are prefetched in bulk, e.g. for transformers with PATCH semantics, are
+    # fetched with concurrent requests and cached for a limited time.
+    prefetch_batch_size: int = 1000
+    prefetch_max_threads: int = 10
+    aspect_cache_size: int = 10000
+    aspect_cache_ttl_sec: int = 300
 
 
 class DataHubGraphConfig(DatahubClientConfig):
@@ -55,9 +65,53 @@ class DataHubGraphConfig(DatahubClientConfig):
         )  # lossy to allow interop with DataHubRestSinkConfig
 
 
+_AspectKey = Tuple[str, str]
+
+
+class _AspectCache:
+    """
+    A thread-safe LRU cache of the serialized aspects of entities, whose entries expire
+    after `ttl_sec` seconds. A cached value of None means that the aspect does not exist.
+    """
+
+    def __init__(self, max_size: int, ttl_sec: float):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_AspectKey, Tuple[float, Optional[dict]]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: _AspectKey) -> Tuple[bool, Optional[dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def __contains__(self, key: _AspectKey) -> bool:
+        return self.get(key)[0]
+
+    def put(self, key: _AspectKey, value: Optional[dict]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
 class DataHubGraph(DatahubRestEmitter):
     def __init__(self, config: Union[DatahubClientConfig, DataHubGraphConfig]) -> None:
         self.config = config
+        self._aspect_cache = _AspectCache(
+            max_size=self.config.aspect_cache_size,
+            ttl_sec=self.config.aspect_cache_ttl_sec,
+        )
         super().__init__(
             gms_server=self.config.server,
             token=self.config.token,
@@ -135,6 +189,25 @@ class DataHubGraph(DatahubRestEmitter):
         :raises HttpError: if the HTTP response is not a 200 or a 404
         """
 
+        if version == 0:
+            found, aspect_obj = self._aspect_cache.get(
+                (entity_urn, aspect_type.ASPECT_NAME)
+            )
+            if not found:
+                aspect_obj = self._get_aspect_obj(entity_urn, aspect_type, version)
+        else:
+            aspect_obj = self._get_aspect_obj(entity_urn, aspect_type, version)
+
+        if aspect_obj is None:
+            return None
+        return aspect_type.from_obj(aspect_obj)
+
+    def _get_aspect_obj(
+        self,
+        entity_urn: str,
+        aspect_type: Type[Aspect],
+        version: int,
+    ) -> Optional[dict]:
         aspect = aspect_type.ASPECT_NAME
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
         response = self._session.get(url)
@@ -154,13 +227,61 @@ class DataHubGraph(DatahubRestEmitter):
         aspect_json = response_json.get("aspect", {}).get(aspect_type_name)
         if aspect_json is not None:
             # need to apply a transform to the response to match rest.li and avro serialization
-            post_json_obj = post_json_transform(aspect_json)
-            return aspect_type.from_obj(post_json_obj)
+            return post_json_transform(aspect_json)
         else:
             raise GraphError(
                 f"Failed to find {aspect_type_name} in response {response_json}"
             )
 
+    def update_cached_aspect(self, entity_urn: str, aspect: Aspect) -> None:
+        """
+        Replaces the cached version of an aspect with one that is being written, so that
+        `get_aspect` does not return the stale server version until the cache expires.
+
+        :param entity_urn: The urn of the entity
+        :param aspect: The aspect that is written
+        """
+        self._aspect_cache.put((entity_urn, aspect.ASPECT_NAME), aspect.to_obj())
+
+    def prefetch_aspects(
+        self, entity_urns: Iterable[str], aspect_types: Iterable[Type[Aspect]]
+    ) -> None:
+        """
+        Fetches the latest version of the given aspects of many entities with concurrent
+        requests. They are cached, so that `get_aspect` and the getters built on it
+        return them without a round-trip until they expire after `aspect_cache_ttl_sec`.
+        Aspects that fail to be fetched are not cached and are fetched again on access.
+
+        :param entity_urns: The urns of the entities
+        :param aspect_types: The type classes of the aspects to prefetch
+        """
+
+        to_fetch = [
+            (entity_urn, aspect_type)
+            for entity_urn in dict.fromkeys(entity_urns)
+            for aspect_type in aspect_types
+            if (entity_urn, aspect_type.ASPECT_NAME) not in self._aspect_cache
+        ]
+        if not to_fetch:
+            return
+
+        def _prefetch(entity_urn: str, aspect_type: Type[Aspect]) -> None:
+            try:
+                aspect_obj = self._get_aspect_obj(entity_urn, aspect_type, 0)
+            except Exception as e:
+                logger.debug(
+                    f"Failed to prefetch {aspect_type.ASPECT_NAME} of {entity_urn}: {e}"
+                )
+                return
+            self._aspect_cache.put((entity_urn, aspect_type.ASPECT_NAME), aspect_obj)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.config.prefetch_max_threads, len(to_fetch))
+        ) as executor:
+            for future in [executor.submit(_prefetch, *r) for r in to_fetch]:
+                future.result()
+        logger.debug(f"Prefetched {len(to_fetch)} aspects")
+
     @deprecated(reason="Use get_aspect instead which makes aspect string name optional")
     def get_aspect_v2(
         self,
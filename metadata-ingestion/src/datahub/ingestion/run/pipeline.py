@@ -3,10 +3,24 @@ import itertools
 import logging
 import os
 import platform
+import queue
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
+import zlib
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import click
 import humanfriendly
@@ -19,12 +33,18 @@ from datahub.configuration.common import (
     PipelineExecutionError,
 )
 from datahub.ingestion.api.committable import CommitPolicy
-from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.api.common import (
+    EndOfStream,
+    PipelineContext,
+    RecordEnvelope,
+    WorkUnit,
+)
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.source import Extractor, Source
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
@@ -33,6 +53,7 @@ from datahub.ingestion.run.pipeline_config import PipelineConfig, ReporterConfig
 from datahub.ingestion.sink.file import FileSink, FileSinkConfig
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
+from datahub.ingestion.transformer.base_transformer import BaseTransformer
 from datahub.ingestion.transformer.transform_registry import transform_registry
 from datahub.metadata.schema_classes import MetadataChangeProposalClass
 from datahub.telemetry import stats, telemetry
@@ -136,6 +157,279 @@ class CliReport(Report):
         return super().compute_stats()
 
 
+@dataclass
+class PipelineStageReport(Report):
+    """
+    Time spent by each stage of a staged pipeline working, waiting for input from the
+    stage before it and waiting for the stage after it to accept its output.
+    """
+
+    transform_workers: int = 0
+    workunits_dispatched: int = 0
+    source_time: timedelta = timedelta()
+    source_blocked_time: timedelta = timedelta()
+    transform_time: timedelta = timedelta()
+    transform_idle_time: timedelta = timedelta()
+    transform_blocked_time: timedelta = timedelta()
+    sink_time: timedelta = timedelta()
+    sink_idle_time: timedelta = timedelta()
+    bottleneck: Optional[str] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_times(self, **seconds: float) -> None:
+        with self._lock:
+            for name, value in seconds.items():
+                setattr(self, name, getattr(self, name) + timedelta(seconds=value))
+
+    def compute_stats(self) -> None:
+        # The stage that spends the most time working, as opposed to waiting on the
+        # other stages, is the one that limits the throughput of the pipeline.
+        busy_time = {
+            "source": self.source_time,
+            "transform": self.transform_time / max(self.transform_workers, 1),
+            "sink": self.sink_time,
+        }
+        if any(busy_time.values()):
+            self.bottleneck = max(busy_time, key=lambda stage: busy_time[stage])
+        return super().compute_stats()
+
+
+class _PipelineCancelled(Exception):
+    pass
+
+
+# Markers for the items that are passed between the stages of a staged pipeline.
+_END_OF_INPUT = object()
+_WORKUNIT_START = "workunit_start"
+_WORKUNIT_END = "workunit_end"
+_RECORD = "record"
+
+_QUEUE_POLL_INTERVAL_SEC = 0.1
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> float:
+    """Puts an item on a bounded queue, returning the seconds spent blocked on it."""
+
+    try:
+        q.put_nowait(item)
+        return 0
+    except queue.Full:
+        pass
+    start = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _PipelineCancelled()
+        try:
+            q.put(item, timeout=_QUEUE_POLL_INTERVAL_SEC)
+            return time.perf_counter() - start
+        except queue.Full:
+            pass
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Tuple[Any, float]:
+    """Gets an item from a queue, along with the seconds spent waiting for it."""
+
+    try:
+        return q.get_nowait(), 0
+    except queue.Empty:
+        pass
+    start = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _PipelineCancelled()
+        try:
+            item = q.get(timeout=_QUEUE_POLL_INTERVAL_SEC)
+            return item, time.perf_counter() - start
+        except queue.Empty:
+            pass
+
+
+def _get_workunit_shard(workunit: WorkUnit, num_shards: int) -> int:
+    # All workunits of an entity go to the same shard, so that they are transformed
+    # by the same transformer instances and in the order the source produced them.
+    key = workunit.get_urn() if isinstance(workunit, MetadataWorkUnit) else workunit.id
+    return zlib.crc32(key.encode()) % num_shards
+
+
+def _transform(
+    transformers: List[Transformer], records: Iterable[RecordEnvelope]
+) -> Iterable[RecordEnvelope]:
+    for transformer in transformers:
+        records = transformer.transform(records)
+    return records
+
+
+class _StagedRun:
+    """
+    Runs the source, the extractor and transformers, and the sink of a pipeline as
+    separate stages connected by bounded queues, so that they can overlap. The
+    extractor and transformers run on `transform_workers` threads, each with its own
+    instances of them. Workunits are sharded across those threads by entity urn, which
+    keeps the records of an entity in order. The sink is written to from a single thread.
+    """
+
+    def __init__(
+        self,
+        pipeline: "Pipeline",
+        callback: WriteCallback,
+        report: PipelineStageReport,
+    ) -> None:
+        self.pipeline = pipeline
+        self.callback = callback
+        self.report = report
+        self.num_workers = pipeline.config.execution.transform_workers
+        queue_size = pipeline.config.execution.queue_size
+        self.worker_queues: List[queue.Queue] = [
+            queue.Queue(maxsize=queue_size) for _ in range(self.num_workers)
+        ]
+        self.sink_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.stop = threading.Event()
+        self.errors: List[BaseException] = []
+
+    def run(self, workunits: Iterable[WorkUnit]) -> None:
+        threads = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(
+                    self._transform_stage,
+                    worker_queue,
+                    self.pipeline.extractor
+                    if i == 0
+                    else self.pipeline._create_extractor(),
+                    self.pipeline.transformers
+                    if i == 0
+                    else self.pipeline._create_transformers(),
+                ),
+                name=f"pipeline-transform-{i}",
+                daemon=True,
+            )
+            for i, worker_queue in enumerate(self.worker_queues)
+        ]
+        threads.append(
+            threading.Thread(
+                target=self._run_stage,
+                args=(self._sink_stage,),
+                name="pipeline-sink",
+                daemon=True,
+            )
+        )
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._source_stage(workunits)
+        except _PipelineCancelled:
+            pass
+        except BaseException:
+            self.stop.set()
+            raise
+
+        for thread in threads:
+            thread.join()
+        if self.errors:
+            raise self.errors[0]
+
+    def _run_stage(self, stage: Callable[..., None], *args: Any) -> None:
+        try:
+            stage(*args)
+        except _PipelineCancelled:
+            pass
+        except BaseException as e:
+            # Stops the other stages, the error is raised from the source stage.
+            self.errors.append(e)
+            self.stop.set()
+
+    def _source_stage(self, workunits: Iterable[WorkUnit]) -> None:
+        workunit_iter = iter(workunits)
+        while True:
+            start = time.perf_counter()
+            wu = next(workunit_iter, _END_OF_INPUT)
+            source_time = time.perf_counter() - start
+            if wu is _END_OF_INPUT:
+                break
+            blocked_time = _put(
+                self.worker_queues[_get_workunit_shard(wu, self.num_workers)],
+                wu,
+                self.stop,
+            )
+            self.report.workunits_dispatched += 1
+            self.report.add_times(
+                source_time=source_time, source_blocked_time=blocked_time
+            )
+        for worker_queue in self.worker_queues:
+            _put(worker_queue, _END_OF_INPUT, self.stop)
+
+    def _transform_stage(
+        self,
+        worker_queue: queue.Queue,
+        extractor: Extractor,
+        transformers: List[Transformer],
+    ) -> None:
+        while True:
+            wu, idle_time = _get(worker_queue, self.stop)
+            if wu is _END_OF_INPUT:
+                break
+            start = time.perf_counter()
+            blocked_time = _put(self.sink_queue, (_WORKUNIT_START, wu), self.stop)
+            try:
+                for record_envelope in _transform(
+                    transformers, extractor.get_records(wu)
+                ):
+                    blocked_time += _put(
+                        self.sink_queue, (_RECORD, record_envelope), self.stop
+                    )
+            except (RuntimeError, SystemExit, _PipelineCancelled):
+                raise
+            except Exception as e:
+                logger.error("Failed to process some records. Continuing.", exc_info=e)
+            extractor.close()
+            blocked_time += _put(self.sink_queue, (_WORKUNIT_END, wu), self.stop)
+            self.report.add_times(
+                transform_time=time.perf_counter() - start - blocked_time,
+                transform_idle_time=idle_time,
+                transform_blocked_time=blocked_time,
+            )
+
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        for record_envelope in _transform(
+            transformers,
+            [
+                RecordEnvelope(
+                    record=EndOfStream(), metadata={"workunit_id": "end-of-stream"}
+                )
+            ],
+        ):
+            if not isinstance(record_envelope.record, EndOfStream):
+                _put(self.sink_queue, (_RECORD, record_envelope), self.stop)
+        _put(self.sink_queue, (_END_OF_INPUT, None), self.stop)
+
+    def _sink_stage(self) -> None:
+        pipeline = self.pipeline
+        remaining_workers = self.num_workers
+        while remaining_workers:
+            (kind, payload), idle_time = _get(self.sink_queue, self.stop)
+            start = time.perf_counter()
+            if kind is _END_OF_INPUT:
+                remaining_workers -= 1
+            elif kind == _WORKUNIT_START:
+                try:
+                    if pipeline._time_to_print():
+                        pipeline.pretty_print_summary(currently_running=True)
+                except Exception as e:
+                    logger.warning(f"Failed to print summary {e}")
+                if not pipeline.dry_run:
+                    pipeline.sink.handle_work_unit_start(payload)
+            elif pipeline.dry_run:
+                pass
+            elif kind == _RECORD:
+                pipeline.sink.write_record_async(payload, self.callback)
+            else:
+                pipeline.sink.handle_work_unit_end(payload)
+            self.report.add_times(
+                sink_time=time.perf_counter() - start, sink_idle_time=idle_time
+            )
+
+
 class Pipeline:
     config: PipelineConfig
     ctx: PipelineContext
@@ -162,6 +456,7 @@ class Pipeline:
         self.num_intermediate_workunits = 0
         self.last_time_printed = int(time.time())
         self.cli_report = CliReport()
+        self.stage_report: Optional[PipelineStageReport] = None
 
         with _add_init_error_context("set up framework context"):
             self.ctx = PipelineContext(
@@ -202,27 +497,32 @@ class Pipeline:
 
         extractor_type = self.config.source.extractor
         with _add_init_error_context(f"configure the extractor ({extractor_type})"):
-            extractor_class = extractor_registry.get(extractor_type)
-            self.extractor = extractor_class(
-                self.config.source.extractor_config, self.ctx
-            )
+            self.extractor = self._create_extractor()
 
         with _add_init_error_context("configure transformers"):
             self._configure_transforms()
 
+    def _create_extractor(self) -> Extractor:
+        extractor_class = extractor_registry.get(self.config.source.extractor)
+        return extractor_class(self.config.source.extractor_config, self.ctx)
+
     def _configure_transforms(self) -> None:
-        self.transformers = []
+        self.transformers = self._create_transformers()
+
+    def _create_transformers(self) -> List[Transformer]:
+        transformers: List[Transformer] = []
         if self.config.transformers is not None:
             for transformer in self.config.transformers:
                 transformer_type = transformer.type
                 transformer_class = transform_registry.get(transformer_type)
                 transformer_config = transformer.dict().get("config", {})
-                self.transformers.append(
+                transformers.append(
                     transformer_class.create(transformer_config, self.ctx)
                 )
                 logger.debug(
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
+        return transformers
 
     def _configure_reporting(
         self, report_to: Optional[str], no_default_report: bool
@@ -336,50 +636,16 @@ class Pipeline:
                     self.ctx, self.config.failure_log.log_config
                 )
             )
-            for wu in itertools.islice(
-                self.source.get_workunits(),
-                self.preview_workunits if self.preview_mode else None,
-            ):
-                try:
-                    if self._time_to_print():
-                        self.pretty_print_summary(currently_running=True)
-                except Exception as e:
-                    logger.warning(f"Failed to print summary {e}")
-
-                if not self.dry_run:
-                    self.sink.handle_work_unit_start(wu)
-                try:
-                    record_envelopes = self.extractor.get_records(wu)
-                    for record_envelope in self.transform(record_envelopes):
-                        if not self.dry_run:
-                            self.sink.write_record_async(record_envelope, callback)
-
-                except RuntimeError:
-                    raise
-                except SystemExit:
-                    raise
-                except Exception as e:
-                    logger.error(
-                        "Failed to process some records. Continuing.", exc_info=e
-                    )
-
-                self.extractor.close()
-                if not self.dry_run:
-                    self.sink.handle_work_unit_end(wu)
-            self.source.close()
-            # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
-            for record_envelope in self.transform(
-                [
-                    RecordEnvelope(
-                        record=EndOfStream(), metadata={"workunit_id": "end-of-stream"}
-                    )
-                ]
-            ):
-                if not self.dry_run and not isinstance(
-                    record_envelope.record, EndOfStream
-                ):
-                    # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                    self.sink.write_record_async(record_envelope, callback)
+            workunits = self._prefetch_server_aspects(
+                itertools.islice(
+                    self.source.get_workunits(),
+                    self.preview_workunits if self.preview_mode else None,
+                )
+            )
+            if self.config.execution.transform_workers:
+                self._run_staged(workunits, callback)
+            else:
+                self._run_sequential(workunits, callback)
 
             self.sink.close()
             self.process_commits()
@@ -394,16 +660,97 @@ class Pipeline:
 
             self._notify_reporters_on_ingestion_completion()
 
+    def _run_sequential(
+        self, workunits: Iterable[WorkUnit], callback: WriteCallback
+    ) -> None:
+        for wu in workunits:
+            try:
+                if self._time_to_print():
+                    self.pretty_print_summary(currently_running=True)
+            except Exception as e:
+                logger.warning(f"Failed to print summary {e}")
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+            try:
+                record_envelopes = self.extractor.get_records(wu)
+                for record_envelope in self.transform(record_envelopes):
+                    if not self.dry_run:
+                        self.sink.write_record_async(record_envelope, callback)
+
+            except RuntimeError:
+                raise
+            except SystemExit:
+                raise
+            except Exception as e:
+                logger.error("Failed to process some records. Continuing.", exc_info=e)
+
+            self.extractor.close()
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+        self.source.close()
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        for record_envelope in self.transform(
+            [
+                RecordEnvelope(
+                    record=EndOfStream(), metadata={"workunit_id": "end-of-stream"}
+                )
+            ]
+        ):
+            if not self.dry_run and not isinstance(record_envelope.record, EndOfStream):
+                # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                self.sink.write_record_async(record_envelope, callback)
+
+    def _run_staged(
+        self, workunits: Iterable[WorkUnit], callback: WriteCallback
+    ) -> None:
+        self.stage_report = PipelineStageReport(
+            transform_workers=self.config.execution.transform_workers
+        )
+        _StagedRun(self, callback, self.stage_report).run(workunits)
+        self.source.close()
+
+    def _prefetch_server_aspects(
+        self, workunits: Iterable[WorkUnit]
+    ) -> Iterable[WorkUnit]:
+        """
+        Looks ahead a batch of workunits at a time and has the transformers that patch
+        server aspects prefetch them for the batch's entities in one go, instead of
+        fetching them one request at a time as each entity is transformed.
+        """
+        patch_transformers = [
+            t
+            for t in self.transformers
+            if isinstance(t, BaseTransformer) and t.get_patch_graph() is not None
+        ]
+        if not patch_transformers:
+            yield from workunits
+            return
+
+        batch_size = max(
+            t.get_patch_graph().config.prefetch_batch_size  # type: ignore
+            for t in patch_transformers
+        )
+        workunit_iter = iter(workunits)
+        while True:
+            batch = list(itertools.islice(workunit_iter, batch_size))
+            if not batch:
+                return
+            urns = [wu.get_urn() for wu in batch if isinstance(wu, MetadataWorkUnit)]
+            for transformer in patch_transformers:
+                try:
+                    transformer.prefetch_server_aspects(urns)
+                except Exception as e:
+                    logger.warning(f"Failed to prefetch server aspects: {e}")
+            yield from batch
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
         :param records: the records to transform
         :return: the transformed records
         """
-        for transformer in self.transformers:
-            records = transformer.transform(records)
-
-        return records
+        return _transform(self.transformers, records)
 
     def process_commits(self) -> None:
         """
@@ -516,6 +863,9 @@ class Pipeline:
         click.echo(self.source.get_report().as_string())
         click.secho(f"Sink ({self.config.sink.type}) report:", bold=True)
         click.echo(self.sink.get_report().as_string())
+        if self.stage_report:
+            click.secho("Pipeline stages report:", bold=True)
+            click.echo(self.stage_report.as_string())
         global_warnings = get_global_warnings()
         if len(global_warnings) > 0:
             click.secho("Global Warnings:", bold=True)
@@ -566,7 +916,7 @@ class Pipeline:
             return 0
 
     def _get_structured_report(self) -> Dict[str, Any]:
-        return {
+        report = {
             "cli": self.cli_report.as_obj(),
             "source": {
                 "type": self.config.source.type,
@@ -577,3 +927,6 @@ class Pipeline:
                 "report": self.sink.get_report().as_obj(),
             },
         }
+        if self.stage_report:
+            report["stages"] = self.stage_report.as_obj()
+        return report
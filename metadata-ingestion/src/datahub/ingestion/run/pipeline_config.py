@@ -3,7 +3,7 @@ import logging
 import uuid
 from typing import Any, Dict, List, Optional
 
-from pydantic import Field, root_validator, validator
+from pydantic import Field, PositiveInt, root_validator, validator
 
 from datahub.cli.cli_utils import get_url_and_token
 from datahub.configuration import config_loader
@@ -37,6 +37,22 @@ class FailureLoggingConfig(ConfigModel):
     log_config: Optional[FileSinkConfig] = None
 
 
+class PipelineExecutionConfig(ConfigModel):
+    transform_workers: int = Field(
+        0,
+        ge=0,
+        description="Number of threads that extract and transform workunits. When set, the source, "
+        "the transformers and the sink run as separate stages connected by bounded queues, and "
+        "workunits of the same entity are always handled by the same thread and in order. "
+        "When 0, all stages run one after the other on a single thread.",
+    )
+    queue_size: PositiveInt = Field(
+        1000,
+        description="The maximum number of workunits queued for each transform thread, "
+        "and of records queued for the sink. A full queue blocks the stage feeding it.",
+    )
+
+
 class PipelineConfig(ConfigModel):
     # Once support for discriminated unions gets merged into Pydantic, we can
     # simplify this configuration and validation.
@@ -50,6 +66,7 @@ class PipelineConfig(ConfigModel):
     datahub_api: Optional[DataHubGraphConfig] = None
     pipeline_name: Optional[str] = None
     failure_log: FailureLoggingConfig = FailureLoggingConfig()
+    execution: PipelineExecutionConfig = PipelineExecutionConfig()
 
     _raw_dict: Optional[
         dict
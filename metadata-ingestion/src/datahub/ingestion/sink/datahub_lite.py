@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Union
+from typing import List, Tuple, Union
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -18,11 +18,14 @@ logger = logging.getLogger(__name__)
 class DataHubLiteSinkConfig(LiteLocalConfig):
     type: str = "duckdb"
     config: dict = {"file": os.path.expanduser("~/.datahub/lite/datahub.duckdb")}
+    # Records are buffered and written to DataHub Lite in batches of this size.
+    batch_size: int = 1000
 
 
 class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
-        self.datahub_lite = get_datahub_lite(self.config.dict())
+        self.datahub_lite = get_datahub_lite(self.config.dict(exclude={"batch_size"}))
+        self.pending: List[Tuple[RecordEnvelope, WriteCallback]] = []
 
     def write_record_async(
         self,
@@ -41,17 +44,51 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             self.report.report_warning(f"datahub-local does not support {type(record)}")
             return
 
+        self.pending.append((record_envelope, write_callback))
+        if len(self.pending) >= self.config.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        pending = self.pending
+        self.pending = []
+        if not pending:
+            return
+
         try:
-            self.datahub_lite.write(record)
-            self.report.report_record_written(record_envelope)
+            self.datahub_lite.write_batch(
+                [record_envelope.record for record_envelope, _ in pending]
+            )
         except Exception as e:
-            self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
-            if write_callback:
-                write_callback.on_failure(record_envelope, e, {})
+            logger.debug(
+                f"Failed to write batch of {len(pending)} records, retrying them one at a time: {e}"
+            )
         else:
-            if write_callback:
-                write_callback.on_success(record_envelope, success_metadata={})
+            for record_envelope, write_callback in pending:
+                self._report_success(record_envelope, write_callback)
+            return
+
+        # Write the records of a failed batch one by one, so that the failures can
+        # be attributed to individual records.
+        for record_envelope, write_callback in pending:
+            try:
+                self.datahub_lite.write(record_envelope.record)
+            except Exception as e:
+                self.report.report_failure(
+                    f"{record_envelope.metadata}: {type(e)}: {e}"
+                )
+                if write_callback:
+                    write_callback.on_failure(record_envelope, e, {})
+            else:
+                self._report_success(record_envelope, write_callback)
+
+    def _report_success(
+        self, record_envelope: RecordEnvelope, write_callback: WriteCallback
+    ) -> None:
+        self.report.report_record_written(record_envelope)
+        if write_callback:
+            write_callback.on_success(record_envelope, success_metadata={})
 
     def close(self):
         if self.datahub_lite:
+            self._flush()
             self.datahub_lite.close()
@@ -1,13 +1,16 @@
 import concurrent.futures
 import contextlib
+import datetime
 import functools
 import logging
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import auto
 from threading import BoundedSemaphore
-from typing import Union, cast
+from typing import List, Optional, Tuple, Union, cast
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import (
@@ -16,7 +19,11 @@ from datahub.configuration.common import (
     OperationalError,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.rest_emitter import (
+    DatahubRestEmitter,
+    is_batch_endpoint_unsupported,
+    serialize_mcp,
+)
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -34,17 +41,41 @@ logger = logging.getLogger(__name__)
 class SyncOrAsync(ConfigEnum):
     SYNC = auto()
     ASYNC = auto()
+    ASYNC_BATCH = auto()
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
     max_pending_requests: int = 1000
     mode: SyncOrAsync = SyncOrAsync.ASYNC
 
+    # These only apply in ASYNC_BATCH mode. A batch is flushed as soon as any
+    # one of the limits is reached.
+    max_batch_size: int = 100
+    max_batch_bytes: int = 5 * 1024 * 1024
+    batch_linger_ms: int = 1000
+
 
 @dataclass
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
+    batches_written: int = 0
+    batches_failed: int = 0
+
+    # The counters are updated from the write callbacks of the executor threads.
+    _lock: threading.Lock = field(default_factory=lambda: threading.Lock())
+
+    def report_pending_requests(self, delta: int) -> None:
+        with self._lock:
+            self.pending_requests += delta
+
+    def report_batch_written(self) -> None:
+        with self._lock:
+            self.batches_written += 1
+
+    def report_batch_failed(self) -> None:
+        with self._lock:
+            self.batches_failed += 1
 
     def compute_stats(self) -> None:
         super().compute_stats()
@@ -84,10 +115,25 @@ class BoundedExecutor:
         self.executor.shutdown(wait)
 
 
+@dataclass
+class _PendingRecord:
+    record_envelope: RecordEnvelope
+    write_callback: WriteCallback
+    serialized_mcp: str
+
+
+_WriteResult = Union[Tuple[datetime.datetime, datetime.datetime], Exception]
+
+
 class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
     emitter: DatahubRestEmitter
     treat_errors_as_warnings: bool = False
 
+    _batch: List[_PendingRecord]
+    _batch_bytes: int = 0
+    _batch_started_at: float = 0.0
+    _batching_supported: bool = True
+
     def __post_init__(self) -> None:
         self.emitter = DatahubRestEmitter(
             self.config.server,
@@ -122,6 +168,18 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             bound=self.config.max_pending_requests,
         )
 
+        self._batch = []
+        self._batch_lock = threading.Lock()
+        self._linger_stop = threading.Event()
+        self._linger_thread: Optional[threading.Thread] = None
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self._linger_thread = threading.Thread(
+                target=self._linger_flush_loop,
+                name="datahub-rest-sink-linger",
+                daemon=True,
+            )
+            self._linger_thread.start()
+
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         if isinstance(workunit, MetadataWorkUnit):
             mwu: MetadataWorkUnit = cast(MetadataWorkUnit, workunit)
@@ -136,7 +194,7 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
         future: concurrent.futures.Future,
     ) -> None:
-        self.report.pending_requests -= 1
+        self.report.report_pending_requests(-1)
         if future.cancelled():
             self.report.report_failure({"error": "future was cancelled"})
             write_callback.on_failure(
@@ -145,39 +203,200 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         elif future.done():
             e = future.exception()
             if not e:
-                start_time, end_time = future.result()
-                self.report.report_record_written(record_envelope)
-                self.report.report_write_latency(end_time - start_time)
-                write_callback.on_success(record_envelope, {})
-            elif isinstance(e, OperationalError):
-                # only OperationalErrors should be ignored
-                # trim exception stacktraces in all cases when reporting
-                if "stackTrace" in e.info:
-                    with contextlib.suppress(Exception):
-                        e.info["stackTrace"] = "\n".join(
-                            e.info["stackTrace"].split("\n")[:3]
-                        )
-                        e.info["message"] = e.info.get("message", "").split("\n")[0][
-                            :200
-                        ]
-
-                # Include information about the entity that failed.
-                record = record_envelope.record
-                if isinstance(record, MetadataChangeProposalWrapper):
-                    entity_id = record.entityUrn
-                    e.info["id"] = entity_id
-                elif isinstance(record, MetadataChangeEvent):
-                    entity_id = record.proposedSnapshot.urn
-                    e.info["id"] = entity_id
-
-                if not self.treat_errors_as_warnings:
-                    self.report.report_failure({"error": e.message, "info": e.info})
+                self._handle_write_success(
+                    record_envelope, write_callback, future.result()
+                )
+            else:
+                self._handle_write_failure(record_envelope, write_callback, e)
+
+    def _handle_write_success(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        timing: Tuple[datetime.datetime, datetime.datetime],
+    ) -> None:
+        start_time, end_time = timing
+        self.report.report_record_written(record_envelope)
+        self.report.report_write_latency(end_time - start_time)
+        write_callback.on_success(record_envelope, {})
+
+    def _handle_write_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        e: BaseException,
+    ) -> None:
+        if isinstance(e, OperationalError):
+            # only OperationalErrors should be ignored
+            # trim exception stacktraces in all cases when reporting
+            if "stackTrace" in e.info:
+                with contextlib.suppress(Exception):
+                    e.info["stackTrace"] = "\n".join(
+                        e.info["stackTrace"].split("\n")[:3]
+                    )
+                    e.info["message"] = e.info.get("message", "").split("\n")[0][:200]
+
+            # Include information about the entity that failed.
+            record = record_envelope.record
+            if isinstance(record, MetadataChangeProposalWrapper):
+                entity_id = record.entityUrn
+                e.info["id"] = entity_id
+            elif isinstance(record, MetadataChangeEvent):
+                entity_id = record.proposedSnapshot.urn
+                e.info["id"] = entity_id
+
+            if not self.treat_errors_as_warnings:
+                self.report.report_failure({"error": e.message, "info": e.info})
+            else:
+                self.report.report_warning({"warning": e.message, "info": e.info})
+            write_callback.on_failure(record_envelope, e, e.info)
+        else:
+            self.report.report_failure({"e": e})
+            write_callback.on_failure(record_envelope, Exception(e), {})
+
+    def _add_to_batch(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+    ) -> None:
+        pending = _PendingRecord(
+            record_envelope=record_envelope,
+            write_callback=write_callback,
+            serialized_mcp=serialize_mcp(record_envelope.record),
+        )
+        size = len(pending.serialized_mcp)
+
+        full_batches: List[List[_PendingRecord]] = []
+        with self._batch_lock:
+            # Flush before going over the byte limit, so that a batch only
+            # exceeds it if a single record is larger than the limit.
+            if self._batch and self._batch_bytes + size > self.config.max_batch_bytes:
+                full_batches.append(self._take_batch())
+
+            if not self._batch:
+                self._batch_started_at = time.monotonic()
+            self._batch.append(pending)
+            self._batch_bytes += size
+            self.report.report_pending_requests(1)
+
+            if (
+                len(self._batch) >= self.config.max_batch_size
+                or self._batch_bytes >= self.config.max_batch_bytes
+            ):
+                full_batches.append(self._take_batch())
+
+        # Submitting may block on the bounded executor, so it must happen
+        # outside of the lock.
+        for batch in full_batches:
+            self._submit_batch(batch)
+
+    def _take_batch(self) -> List[_PendingRecord]:
+        # Must be called with _batch_lock held.
+        batch = self._batch
+        self._batch = []
+        self._batch_bytes = 0
+        return batch
+
+    def _flush_batch(self) -> None:
+        with self._batch_lock:
+            batch = self._take_batch()
+        if batch:
+            self._submit_batch(batch)
+
+    def _linger_flush_loop(self) -> None:
+        linger_sec = self.config.batch_linger_ms / 1000
+        while not self._linger_stop.wait(max(linger_sec / 2, 0.01)):
+            batch = None
+            with self._batch_lock:
+                if (
+                    self._batch
+                    and time.monotonic() - self._batch_started_at >= linger_sec
+                ):
+                    batch = self._take_batch()
+            if batch:
+                self._submit_batch(batch)
+
+    def _submit_batch(self, batch: List[_PendingRecord]) -> None:
+        write_future = self.executor.submit(self._emit_batch, batch)
+        write_future.add_done_callback(
+            functools.partial(self._write_batch_done_callback, batch)
+        )
+
+    def _emit_batch(self, batch: List[_PendingRecord]) -> List[_WriteResult]:
+        if self._batching_supported:
+            try:
+                start_time = datetime.datetime.now()
+                failures = self.emitter.emit_serialized_mcps(
+                    [p.serialized_mcp for p in batch]
+                )
+                end_time = datetime.datetime.now()
+                self.report.report_batch_written()
+                # GMS ingests the proposals of a batch independently, so only the
+                # failed ones are reported as failures.
+                return [
+                    OperationalError(
+                        "Unable to emit metadata to DataHub GMS",
+                        {"message": failures[i]},
+                    )
+                    if i in failures
+                    else (start_time, end_time)
+                    for i in range(len(batch))
+                ]
+            except Exception as e:
+                self.report.report_batch_failed()
+                if is_batch_endpoint_unsupported(e):
+                    logger.warning(
+                        f"DataHub GMS at {self.config.server} does not support batch ingestion; "
+                        "falling back to ingesting one record at a time"
+                    )
+                    self._batching_supported = False
                 else:
-                    self.report.report_warning({"warning": e.message, "info": e.info})
-                write_callback.on_failure(record_envelope, e, e.info)
+                    logger.debug(
+                        f"Failed to emit batch of {len(batch)} records, retrying them one at a time: {e}"
+                    )
+
+        # The request as a whole failed, e.g. because one of the proposals was not
+        # authorized, which GMS checks before ingesting any of them. Retrying each
+        # record on its own reports the failures per record. A proposal that was
+        # ingested before the request failed, e.g. on a timeout, is just written
+        # again with the same value.
+        results: List[_WriteResult] = []
+        for pending in batch:
+            try:
+                results.append(self.emitter.emit(pending.record_envelope.record))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _write_batch_done_callback(
+        self,
+        batch: List[_PendingRecord],
+        future: concurrent.futures.Future,
+    ) -> None:
+        self.report.report_pending_requests(-len(batch))
+        if future.cancelled():
+            for pending in batch:
+                self.report.report_failure({"error": "future was cancelled"})
+                pending.write_callback.on_failure(
+                    pending.record_envelope,
+                    OperationalError("future was cancelled"),
+                    {},
+                )
+            return
+
+        e = future.exception()
+        results: List[_WriteResult] = (
+            [cast(Exception, e)] * len(batch) if e else future.result()
+        )
+        for pending, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                self._handle_write_failure(
+                    pending.record_envelope, pending.write_callback, result
+                )
             else:
-                self.report.report_failure({"e": e})
-                write_callback.on_failure(record_envelope, Exception(e), {})
+                self._handle_write_success(
+                    pending.record_envelope, pending.write_callback, result
+                )
 
     def write_record_async(
         self,
@@ -192,14 +411,22 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if (
+            self.config.mode == SyncOrAsync.ASYNC_BATCH
+            and self._batching_supported
+            and isinstance(
+                record, (MetadataChangeProposal, MetadataChangeProposalWrapper)
+            )
+        ):
+            self._add_to_batch(record_envelope, write_callback)
+        elif self.config.mode in {SyncOrAsync.ASYNC, SyncOrAsync.ASYNC_BATCH}:
             write_future = self.executor.submit(self.emitter.emit, record)
+            self.report.report_pending_requests(1)
             write_future.add_done_callback(
                 functools.partial(
                     self._write_done_callback, record_envelope, write_callback
                 )
             )
-            self.report.pending_requests += 1
         else:
             # execute synchronously
             try:
@@ -209,6 +436,10 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 write_callback.on_failure(record_envelope, e, failure_metadata={})
 
     def close(self):
+        if self._linger_thread is not None:
+            self._linger_stop.set()
+            self._linger_thread.join()
+        self._flush_batch()
         self.executor.shutdown(wait=True)
 
     def __repr__(self) -> str:
@@ -1,9 +1,10 @@
 import json
 import logging
 import pathlib
-from typing import Iterable, Union
+from enum import auto
+from typing import Iterable, Optional, Union
 
-from datahub.configuration.common import ConfigModel
+from datahub.configuration.common import ConfigEnum, ConfigModel
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
@@ -12,6 +13,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities import json_lines
 
 logger = logging.getLogger(__name__)
 
@@ -30,17 +32,36 @@ def _to_obj_for_file(
     return obj.to_obj()
 
 
+class FileSinkFormat(ConfigEnum):
+    # A single, indented JSON array.
+    JSON = auto()
+    # Compact JSON lines, one record per line.
+    JSONL = auto()
+
+
 class FileSinkConfig(ConfigModel):
     filename: str
 
     legacy_nested_json_string: bool = False
 
+    # If not set, JSONL is used for files ending in .jsonl or .ndjson and JSON otherwise.
+    # Files ending in .gz or .zst are compressed in either format.
+    format: Optional[FileSinkFormat] = None
+
+    def get_format(self) -> FileSinkFormat:
+        if self.format is not None:
+            return self.format
+        if json_lines.has_json_lines_suffix(self.filename):
+            return FileSinkFormat.JSONL
+        return FileSinkFormat.JSON
+
 
 class FileSink(Sink[FileSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
-        fpath = pathlib.Path(self.config.filename)
-        self.file = fpath.open("w")
-        self.file.write("[\n")
+        self.format = self.config.get_format()
+        self.file = json_lines.open_file(self.config.filename, "w")
+        if self.format == FileSinkFormat.JSON:
+            self.file.write("[\n")
         self.wrote_something = False
 
     def write_record_async(
@@ -60,10 +81,13 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
             record, simplified_structure=not self.config.legacy_nested_json_string
         )
 
-        if self.wrote_something:
-            self.file.write(",\n")
-
-        json.dump(obj, self.file, indent=4)
+        if self.format == FileSinkFormat.JSONL:
+            self.file.write(json_lines.dumps(obj))
+            self.file.write("\n")
+        else:
+            if self.wrote_something:
+                self.file.write(",\n")
+            json.dump(obj, self.file, indent=4)
         self.wrote_something = True
 
         self.report.report_record_written(record_envelope)
@@ -71,7 +95,8 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
             write_callback.on_success(record_envelope, {})
 
     def close(self):
-        self.file.write("\n]")
+        if self.format == FileSinkFormat.JSON:
+            self.file.write("\n]")
         self.file.close()
 
 
@@ -87,6 +112,13 @@ def write_metadata_file(
     ],
 ) -> None:
     # This simplified version of the FileSink can be used for testing purposes.
+    if json_lines.has_json_lines_suffix(str(file)):
+        with json_lines.open_file(str(file), "w") as f:
+            for record in records:
+                f.write(json_lines.dumps(_to_obj_for_file(record)))
+                f.write("\n")
+        return
+
     with file.open("w") as f:
         f.write("[\n")
         for i, record in enumerate(records):
@@ -1,10 +1,11 @@
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import boto3
 from boto3.session import Session
 from botocore.config import Config
 from botocore.utils import fix_s3_host
 from pydantic.fields import Field
+from typing_extensions import Literal
 
 from datahub.configuration.common import (
     AllowDenyPattern,
@@ -103,6 +104,15 @@ class AwsConnectionConfig(ConfigModel):
         default=None,
         description="Autodetected. See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html",
     )
+    aws_retry_mode: Optional[Literal["legacy", "standard", "adaptive"]] = Field(
+        default=None,
+        description="Retry mode of the AWS clients. In `adaptive` mode, clients also slow down their requests when they are throttled. "
+        "If not set, the retry mode configured for boto3 is used. See https://boto3.amazonaws.com/v1/documentation/api/latest/guide/retries.html",
+    )
+    aws_retry_num: Optional[int] = Field(
+        default=None,
+        description="Maximum number of attempts of a request made by the AWS clients. If not set, the default of the retry mode is used.",
+    )
 
     def _normalized_aws_roles(self) -> List[AwsAssumeRoleConfig]:
         if not self.aws_role:
@@ -167,13 +177,21 @@ class AwsConnectionConfig(ConfigModel):
             }
         return {}
 
+    def _aws_config(self) -> Config:
+        retries: Dict[str, Any] = {}
+        if self.aws_retry_mode is not None:
+            retries["mode"] = self.aws_retry_mode
+        if self.aws_retry_num is not None:
+            retries["max_attempts"] = self.aws_retry_num
+        return Config(proxies=self.aws_proxy, retries=retries or None)
+
     def get_s3_client(
         self, verify_ssl: Optional[Union[bool, str]] = None
     ) -> "S3Client":
         return self.get_session().client(
             "s3",
             endpoint_url=self.aws_endpoint_url,
-            config=Config(proxies=self.aws_proxy),
+            config=self._aws_config(),
             verify=verify_ssl,
         )
 
@@ -183,7 +201,7 @@ class AwsConnectionConfig(ConfigModel):
         resource = self.get_session().resource(
             "s3",
             endpoint_url=self.aws_endpoint_url,
-            config=Config(proxies=self.aws_proxy),
+            config=self._aws_config(),
             verify=verify_ssl,
         )
         # according to: https://stackoverflow.com/questions/32618216/override-s3-endpoint-using-boto3-configuration-file
@@ -195,7 +213,7 @@ class AwsConnectionConfig(ConfigModel):
         return resource
 
     def get_glue_client(self) -> "GlueClient":
-        return self.get_session().client("glue")
+        return self.get_session().client("glue", config=self._aws_config())
 
     def get_sagemaker_client(self) -> "SageMakerClient":
         return self.get_session().client("sagemaker")
@@ -1,9 +1,12 @@
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field as dataclass_field
 from typing import (
     Any,
+    Callable,
     DefaultDict,
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -12,6 +15,7 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    TypeVar,
     Union,
 )
 from urllib.parse import urlparse
@@ -108,6 +112,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_PLATFORM = "glue"
 VALID_PLATFORMS = [DEFAULT_PLATFORM, "athena"]
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class GlueSourceConfig(AwsSourceConfig, StatefulIngestionConfigBase):
     extract_owners: Optional[bool] = Field(
@@ -156,6 +163,11 @@ class GlueSourceConfig(AwsSourceConfig, StatefulIngestionConfigBase):
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = Field(
         default=None, description=""
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of threads used to list the tables of databases, fetch the partitions of tables for profiling and download the scripts of jobs.",
+    )
 
     @property
     def glue_client(self):
@@ -270,6 +282,9 @@ class GlueSource(StatefulIngestionSourceBase):
         self.s3_client = config.s3_client
         self.extract_transforms = config.extract_transforms
         self.env = config.env
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.max_workers, thread_name_prefix="glue"
+        )
 
         # Create and register the stateful ingestion use-case handlers.
         self.stale_entity_removal_handler = StaleEntityRemovalHandler(
@@ -293,6 +308,24 @@ class GlueSource(StatefulIngestionSourceBase):
         config = GlueSourceConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _map_concurrently(
+        self, func: Callable[[T], R], items: Iterable[T]
+    ) -> Iterator[Tuple[T, R]]:
+        """
+        Calls func for the items on the thread pool of the source and yields the items with their
+        results in order. At most 2 * max_workers calls run ahead of the item that is yielded.
+        """
+        pending: Deque[Tuple[T, "Future[R]"]] = deque()
+        for item in items:
+            pending.append((item, self.executor.submit(func, item)))
+            if len(pending) > 2 * self.source_config.max_workers:
+                item, future = pending.popleft()
+                yield item, future.result()
+
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
     @property
     def platform(self) -> str:
         """
@@ -695,8 +728,10 @@ class GlueSource(StatefulIngestionSourceBase):
 
         all_tables: List[dict] = [
             table
-            for databaseName in databases.keys()
-            for table in get_tables_from_database(databaseName)
+            for _, tables in self._map_concurrently(
+                get_tables_from_database, databases.keys()
+            )
+            for table in tables
         ]
 
         return databases, all_tables
@@ -825,36 +860,59 @@ class GlueSource(StatefulIngestionSourceBase):
         )
         return mcp
 
-    def get_profile_if_enabled(
-        self, mce: MetadataChangeEventClass, database_name: str, table_name: str
-    ) -> List[MetadataChangeProposalWrapper]:
-        if self.source_config.profiling:
+    def get_table_and_partitions(
+        self, database_name: str, table_name: str, table: Optional[dict] = None
+    ) -> Tuple[dict, List[dict]]:
+        """
+        Returns the table and all of its partitions if it is partitioned. The table is only
+        fetched if it is not given, e.g. from the response of get_tables.
+        """
+        if table is None:
             # for cross-account ingestion
             kwargs = dict(
                 DatabaseName=database_name,
                 Name=table_name,
                 CatalogId=self.source_config.catalog_id,
             )
-            response = self.glue_client.get_table(
+            table = self.glue_client.get_table(
                 **{k: v for k, v in kwargs.items() if v}
+            )["Table"]
+
+        partitions: List[dict] = []
+        # check if this table is partitioned
+        if table.get("PartitionKeys"):
+            # for cross-account ingestion
+            kwargs = dict(
+                DatabaseName=database_name,
+                TableName=table_name,
+                CatalogId=self.source_config.catalog_id,
+            )
+            # see https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/glue.html#Glue.Client.get_partitions
+            paginator = self.glue_client.get_paginator("get_partitions")
+            for page in paginator.paginate(**{k: v for k, v in kwargs.items() if v}):
+                partitions += page["Partitions"]
+
+        return table, partitions
+
+    def get_profile_if_enabled(
+        self,
+        mce: MetadataChangeEventClass,
+        database_name: str,
+        table_name: str,
+        table_and_partitions: Optional[Tuple[dict, List[dict]]] = None,
+    ) -> List[MetadataChangeProposalWrapper]:
+        if self.source_config.profiling:
+            table, partitions = (
+                table_and_partitions
+                if table_and_partitions is not None
+                else self.get_table_and_partitions(database_name, table_name)
             )
 
-            partition_keys = response["Table"]["PartitionKeys"]
+            partition_keys = table.get("PartitionKeys")
 
             # check if this table is partitioned
             if partition_keys:
                 # ingest data profile with partitions
-                # for cross-account ingestion
-                kwargs = dict(
-                    DatabaseName=database_name,
-                    TableName=table_name,
-                    CatalogId=self.source_config.catalog_id,
-                )
-                response = self.glue_client.get_partitions(
-                    **{k: v for k, v in kwargs.items() if v}
-                )
-
-                partitions = response["Partitions"]
                 partition_keys = [k["Name"] for k in partition_keys]
 
                 mcps = []
@@ -878,8 +936,8 @@ class GlueSource(StatefulIngestionSourceBase):
                 return mcps
             else:
                 # ingest data profile without partition
-                table_stats = response["Table"]["Parameters"]
-                column_stats = response["Table"]["StorageDescriptor"]["Columns"]
+                table_stats = table["Parameters"]
+                column_stats = table["StorageDescriptor"]["Columns"]
                 return [self._create_profile_mcp(mce, table_stats, column_stats)]
 
         return []
@@ -954,16 +1012,36 @@ class GlueSource(StatefulIngestionSourceBase):
         database_seen = set()
         databases, tables = self.get_all_tables_and_databases()
 
+        allowed_tables: List[dict] = []
         for table in tables:
-            database_name = table["DatabaseName"]
-            table_name = table["Name"]
-            full_table_name = f"{database_name}.{table_name}"
+            full_table_name = f"{table['DatabaseName']}.{table['Name']}"
             self.report.report_table_scanned()
             if not self.source_config.database_pattern.allowed(
-                database_name
+                table["DatabaseName"]
             ) or not self.source_config.table_pattern.allowed(full_table_name):
                 self.report.report_table_dropped(full_table_name)
                 continue
+            allowed_tables.append(table)
+
+        # The partitions of upcoming tables are fetched for profiling while the current
+        # table is processed.
+        tables_with_profile_data: Iterator[
+            Tuple[dict, Optional[Tuple[dict, List[dict]]]]
+        ] = (
+            self._map_concurrently(
+                lambda t: self.get_table_and_partitions(
+                    t["DatabaseName"], t["Name"], t
+                ),
+                allowed_tables,
+            )
+            if self.source_config.profiling
+            else ((table, None) for table in allowed_tables)
+        )
+
+        for table, table_and_partitions in tables_with_profile_data:
+            database_name = table["DatabaseName"]
+            table_name = table["Name"]
+            full_table_name = f"{database_name}.{table_name}"
             if database_name not in database_seen:
                 database_seen.add(database_name)
                 yield from self.gen_database_containers(databases[database_name])
@@ -1005,7 +1083,9 @@ class GlueSource(StatefulIngestionSourceBase):
                 self.report.report_workunit(mcp_wu)
                 yield mcp_wu
 
-            mcps_profiling = self.get_profile_if_enabled(mce, database_name, table_name)
+            mcps_profiling = self.get_profile_if_enabled(
+                mce, database_name, table_name, table_and_partitions
+            )
             if mcps_profiling:
                 for mcp_index, mcp in enumerate(mcps_profiling):
                     mcp_wu = MetadataWorkUnit(
@@ -1021,7 +1101,17 @@ class GlueSource(StatefulIngestionSourceBase):
     def _transform_extraction(self) -> Iterable[MetadataWorkUnit]:
         dags: Dict[str, Optional[Dict[str, Any]]] = {}
         flow_names: Dict[str, str] = {}
-        for job in self.get_all_jobs():
+
+        def get_job_dataflow_graph(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            job_script_location = job.get("Command", {}).get("ScriptLocation")
+            if job_script_location is None:
+                return None
+            return self.get_dataflow_graph(job_script_location)
+
+        # The scripts of upcoming jobs are downloaded while the current job is processed.
+        for job, dag in self._map_concurrently(
+            get_job_dataflow_graph, self.get_all_jobs()
+        ):
             flow_urn = mce_builder.make_data_flow_urn(
                 self.platform, job["Name"], self.env
             )
@@ -1030,13 +1120,6 @@ class GlueSource(StatefulIngestionSourceBase):
             self.report.report_workunit(flow_wu)
             yield flow_wu
 
-            job_script_location = job.get("Command", {}).get("ScriptLocation")
-
-            dag: Optional[Dict[str, Any]] = None
-
-            if job_script_location is not None:
-                dag = self.get_dataflow_graph(job_script_location)
-
             dags[flow_urn] = dag
             flow_names[flow_urn] = job["Name"]
         # run a first pass to pick up s3 bucket names and formats
@@ -1252,5 +1335,9 @@ class GlueSource(StatefulIngestionSourceBase):
     def get_report(self):
         return self.report
 
+    def close(self) -> None:
+        self.executor.shutdown()
+        super().close()
+
     def get_platform_instance_id(self) -> Optional[str]:
         return self.source_config.platform_instance or self.platform
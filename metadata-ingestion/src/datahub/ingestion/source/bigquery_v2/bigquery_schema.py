@@ -212,6 +212,18 @@ order by
   table_suffix DESC
 """
 
+    # https://cloud.google.com/bigquery/docs/information-schema-partitions
+    partitions_for_table: str = """
+SELECT
+  partition_id,
+  last_modified_time
+FROM
+  `{project_id}`.`{dataset_name}`.INFORMATION_SCHEMA.PARTITIONS
+WHERE
+  table_name = '{table_name}'
+  and partition_id not in ('__NULL__', '__UNPARTITIONED__', '__STREAMING_UNPARTITIONED__')
+"""
+
     views_for_dataset: str = """
 SELECT
   t.table_catalog as table_catalog,
@@ -444,6 +456,21 @@ class BigQueryDataDictionary:
             for table in cur
         ]
 
+    @staticmethod
+    def get_partitions_for_table(
+        conn: bigquery.Client, project_id: str, dataset_name: str, table_name: str
+    ) -> Dict[str, datetime]:
+        """Returns the last modification time of every partition of a table."""
+        cur = BigQueryDataDictionary.get_query_result(
+            conn,
+            BigqueryQuery.partitions_for_table.format(
+                project_id=project_id, dataset_name=dataset_name, table_name=table_name
+            ),
+        )
+        return {
+            partition.partition_id: partition.last_modified_time for partition in cur
+        }
+
     @staticmethod
     def get_views_for_dataset(
         conn: bigquery.Client,
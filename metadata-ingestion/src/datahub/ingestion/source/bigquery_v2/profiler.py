@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Tuple, cast
 
 from dateutil.relativedelta import relativedelta
+from google.cloud import bigquery
 
 from datahub.emitter.mce_builder import make_dataset_urn_with_platform_instance
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -13,22 +14,46 @@ from datahub.ingestion.source.bigquery_v2.bigquery_config import BigQueryV2Confi
 from datahub.ingestion.source.bigquery_v2.bigquery_report import BigQueryV2Report
 from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
     RANGE_PARTITION_NAME,
+    BigQueryDataDictionary,
     BigqueryTable,
 )
-from datahub.ingestion.source.ge_data_profiler import GEProfilerRequest
+from datahub.ingestion.source.bigquery_v2.common import get_bigquery_client
+from datahub.ingestion.source.profiling.partition_stats import (
+    get_partition_stats,
+    get_partitions_to_profile,
+    merge_partition_stats,
+)
 from datahub.ingestion.source.sql.sql_generic_profiler import (
     GenericProfiler,
     TableProfilerRequest,
 )
+from datahub.ingestion.source.state.profiling_state import PartitionProfileStats
 from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
 
 logger = logging.getLogger(__name__)
 
 
 @dataclasses.dataclass
-class BigqueryProfilerRequest(GEProfilerRequest):
+class BigqueryProfilerRequest(TableProfilerRequest):
     table: BigqueryTable
     profile_table_level_only: bool = False
+    # The name of the incrementally profiled table, if only one of its partitions
+    # is profiled. The pretty name of such a request names the partition.
+    incremental_table_name: Optional[str] = None
+
+
+@dataclasses.dataclass
+class IncrementalTableProfile:
+    """The state of a table whose partitions are profiled incrementally."""
+
+    dataset_urn: str
+    table: BigqueryTable
+    # The last modification time of every partition, in millis.
+    partitions: Dict[str, Optional[int]]
+    partition_stats: Dict[str, PartitionProfileStats]
+    pending_partitions: int = 0
+    # Whether all new and modified partitions were profiled successfully.
+    complete: bool = True
 
 
 class BigqueryProfiler(GenericProfiler):
@@ -44,6 +69,8 @@ class BigqueryProfiler(GenericProfiler):
         super().__init__(config, report, "bigquery", state_handler)
         self.config = config
         self.report = report
+        self._client: Optional[bigquery.Client] = None
+        self.incremental_tables: Dict[str, IncrementalTableProfile] = {}
 
     @staticmethod
     def get_partition_range_from_partition_id(
@@ -80,16 +107,17 @@ class BigqueryProfiler(GenericProfiler):
         schema: str,
         table: BigqueryTable,
         partition_datetime: Optional[datetime] = None,
+        partition_id: Optional[str] = None,
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         Method returns partition id if table is partitioned or sharded and generate custom partition query for
-        partitioned table.
+        partitioned table. The latest partition is profiled, unless a partition_id is given.
         See more about partitioned tables at https://cloud.google.com/bigquery/docs/partitioned-tables
         """
         logger.debug(
             f"generate partition profiler query for project: {project} schema: {schema} and table {table.name}, partition_datetime: {partition_datetime}"
         )
-        partition = table.max_partition_id
+        partition = partition_id or table.max_partition_id
         if table.partition_info and partition:
             partition_where_clause: str
 
@@ -186,13 +214,154 @@ WHERE
                 profile_request = self.get_bigquery_profile_request(
                     project=project_id, dataset=dataset, table=table
                 )
-                if profile_request is not None:
+                if profile_request is None:
+                    continue
+                if self.is_incremental_profiling_applicable(profile_request):
+                    profile_requests.extend(
+                        self.get_partition_profile_requests(
+                            project_id, dataset, profile_request
+                        )
+                    )
+                else:
                     profile_requests.append(profile_request)
 
+        # The profiles of incrementally profiled tables without new or modified
+        # partitions are merged from the stored partition statistics right away.
+        for dataset_name, incremental in list(self.incremental_tables.items()):
+            if incremental.pending_partitions == 0:
+                yield from self.generate_incremental_profile_wu(dataset_name)
+
         if len(profile_requests) == 0:
             return
         yield from self.generate_wu_from_profile_requests(profile_requests)
 
+    def is_incremental_profiling_applicable(
+        self, request: BigqueryProfilerRequest
+    ) -> bool:
+        partition_info = request.table.partition_info
+        return (
+            self.config.profiling.incremental_profiling
+            and self.state_handler is not None
+            and self.state_handler.is_checkpointing_enabled()
+            and not request.profile_table_level_only
+            and self.config.profiling.partition_datetime is None
+            and partition_info is not None
+            and partition_info.type in ("HOUR", "DAY", "MONTH", "YEAR")
+        )
+
+    def get_partition_profile_requests(
+        self, project: str, dataset: str, request: BigqueryProfilerRequest
+    ) -> List[BigqueryProfilerRequest]:
+        """
+        Returns a profile request for every new or modified partition of the table, and
+        keeps track of the table until the profiles of all its partitions are merged.
+        Only the newest incremental_profiling_max_stored_partitions partitions are
+        considered. Falls back to profiling the latest partition if the partitions
+        can't be listed.
+        """
+        assert self.state_handler is not None
+        dataset_name = request.pretty_name
+        table = request.table
+        try:
+            if self._client is None:
+                self._client = get_bigquery_client(self.config)
+            partitions_last_modified = BigQueryDataDictionary.get_partitions_for_table(
+                self._client, project, dataset, table.name
+            )
+        except Exception as e:
+            logger.debug(f"Unable to list partitions of {dataset_name}", exc_info=e)
+            self.report.report_warning(
+                "incremental profiling skipped as partitions could not be listed",
+                f"{dataset_name}: {e}",
+            )
+            return [request]
+
+        # Partition ids of time-partitioned tables sort chronologically.
+        max_stored_partitions = (
+            self.config.profiling.incremental_profiling_max_stored_partitions
+        )
+        partitions: Dict[str, Optional[int]] = {
+            partition_id: int(last_modified.timestamp() * 1000)
+            if last_modified
+            else None
+            for partition_id, last_modified in sorted(
+                partitions_last_modified.items(), reverse=True
+            )[:max_stored_partitions]
+        }
+        dataset_urn = make_dataset_urn_with_platform_instance(
+            self.platform,
+            dataset_name,
+            self.config.platform_instance,
+            self.config.env,
+        )
+        last_partition_stats = self.state_handler.get_last_partition_stats(dataset_urn)
+        # The statistics of partitions that no longer exist, e.g. expired ones, or
+        # that are older than the stored partitions are dropped.
+        incremental = IncrementalTableProfile(
+            dataset_urn=dataset_urn,
+            table=table,
+            partitions=partitions,
+            partition_stats={
+                partition_id: stats
+                for partition_id, stats in last_partition_stats.items()
+                if partition_id in partitions
+            },
+        )
+        self.incremental_tables[dataset_name] = incremental
+
+        max_partitions = self.config.profiling.incremental_profiling_max_partitions
+        partitions_to_profile = get_partitions_to_profile(
+            partitions, last_partition_stats
+        )
+        if len(partitions_to_profile) > max_partitions:
+            # The remaining partitions are profiled in the next runs.
+            incremental.complete = False
+            partitions_to_profile = partitions_to_profile[:max_partitions]
+
+        partition_requests = []
+        for partition_id in partitions_to_profile:
+            (partition, custom_sql) = self.generate_partition_profiler_query(
+                project, dataset, table, partition_id=partition_id
+            )
+            if partition is None or custom_sql is None:
+                incremental.complete = False
+                continue
+            partition_requests.append(
+                dataclasses.replace(
+                    request,
+                    pretty_name=f"{dataset_name}${partition_id}",
+                    incremental_table_name=dataset_name,
+                    batch_kwargs=dict(
+                        request.batch_kwargs, custom_sql=custom_sql, partition=partition
+                    ),
+                )
+            )
+        incremental.pending_partitions = len(partition_requests)
+        return partition_requests
+
+    def generate_incremental_profile_wu(
+        self, dataset_name: str
+    ) -> Iterable[MetadataWorkUnit]:
+        incremental = self.incremental_tables.pop(dataset_name)
+        assert self.state_handler is not None
+        self.state_handler.add_partition_stats_to_state(
+            incremental.dataset_urn, incremental.partition_stats
+        )
+        if incremental.complete:
+            self.state_handler.add_to_state(
+                incremental.dataset_urn, int(datetime.now().timestamp() * 1000)
+            )
+        if not incremental.partition_stats:
+            return
+
+        profile = merge_partition_stats(
+            incremental.partition_stats.values(), incremental.table.rows_count
+        )
+        profile.sizeInBytes = incremental.table.size_in_bytes
+        yield MetadataChangeProposalWrapper(
+            entityUrn=incremental.dataset_urn, aspect=profile
+        ).as_workunit()
+
     def generate_wu_from_profile_requests(
         self, profile_requests: List[BigqueryProfilerRequest]
     ) -> Iterable[MetadataWorkUnit]:
@@ -203,10 +372,29 @@ WHERE
             platform=self.platform,
             profiler_args=self.get_profile_args(),
         ):
-            if request is None or profile is None:
+            if request is None:
                 continue
 
             request = cast(BigqueryProfilerRequest, request)
+            if request.incremental_table_name is not None:
+                incremental = self.incremental_tables[request.incremental_table_name]
+                partition = request.batch_kwargs["partition"]
+                if profile is not None:
+                    incremental.partition_stats[partition] = get_partition_stats(
+                        profile, incremental.partitions.get(partition)
+                    )
+                else:
+                    incremental.complete = False
+                incremental.pending_partitions -= 1
+                if incremental.pending_partitions == 0:
+                    yield from self.generate_incremental_profile_wu(
+                        request.incremental_table_name
+                    )
+                continue
+
+            if profile is None:
+                continue
+
             profile.sizeInBytes = request.table.size_in_bytes
             # If table is partitioned we profile only one partition (if nothing set then the last one)
             # but for table level we can use the rows_count from the table metadata
@@ -1,10 +1,8 @@
-import collections
 import logging
 import textwrap
 import time
 import traceback
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Union, cast
 
 import cachetools
@@ -33,15 +31,13 @@ from datahub.ingestion.source.bigquery_v2.common import (
     BQ_DATETIME_FORMAT,
     _make_gcp_logging_client,
 )
-from datahub.ingestion.source.usage.usage_common import GenericAggregatedDataset
+from datahub.ingestion.source.usage.usage_common import UsageAggregator
 from datahub.metadata.schema_classes import OperationClass, OperationTypeClass
 from datahub.utilities.delayed_iter import delayed_iter
 from datahub.utilities.perf_timer import PerfTimer
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-AggregatedDataset = GenericAggregatedDataset[BigQueryTableRef]
-
 OPERATION_STATEMENT_TYPES = {
     "INSERT": OperationTypeClass.INSERT,
     "UPDATE": OperationTypeClass.UPDATE,
@@ -172,9 +168,9 @@ class BigQueryUsageExtractor:
     def generate_usage_for_project(
         self, project_id: str, tables: Dict[str, List[str]]
     ) -> Iterable[MetadataWorkUnit]:
-        aggregated_info: Dict[
-            datetime, Dict[BigQueryTableRef, AggregatedDataset]
-        ] = collections.defaultdict(dict)
+        aggregator: UsageAggregator[BigQueryTableRef] = UsageAggregator(
+            self.config.usage, self.config.usage.user_email_pattern
+        )
 
         parsed_bigquery_log_events: Iterable[
             Union[ReadEvent, QueryEvent, MetadataWorkUnit]
@@ -222,32 +218,26 @@ class BigQueryUsageExtractor:
                             yield operational_wu
                             self.report.num_operational_stats_workunits_emitted += 1
                     if event.read_event:
-                        aggregated_info = self._aggregate_enriched_read_events(
-                            aggregated_info, event, tables
-                        )
+                        self._aggregate_enriched_read_events(aggregator, event, tables)
                         num_aggregated += 1
                 logger.info(f"Total number of events aggregated = {num_aggregated}.")
-                bucket_level_stats: str = "\n\t" + "\n\t".join(
-                    [
-                        f'bucket:{db.strftime("%m-%d-%Y:%H:%M:%S")}, size={len(ads)}'
-                        for db, ads in aggregated_info.items()
-                    ]
-                )
                 logger.debug(
-                    f"Number of buckets created = {len(aggregated_info)}. Per-bucket details:{bucket_level_stats}"
+                    f"Number of aggregates spilled to disk = {aggregator.num_spilled_aggregates}."
                 )
 
                 self.report.usage_extraction_sec[project_id] = round(
                     timer.elapsed_seconds(), 2
                 )
 
-                yield from self.get_workunits(aggregated_info)
+                yield from self.get_workunits(aggregator)
             except Exception as e:
                 self.report.usage_failed_extraction.append(project_id)
                 trace = traceback.format_exc()
                 logger.error(
                     f"Error getting usage for project {project_id} due to error {e}, trace: {trace}"
                 )
+            finally:
+                aggregator.close()
 
     def _get_bigquery_log_entries_via_exported_bigquery_audit_metadata(
         self, client: BigQueryClient
@@ -749,12 +739,12 @@ class BigQueryUsageExtractor:
 
     def _aggregate_enriched_read_events(
         self,
-        datasets: Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]],
+        aggregator: UsageAggregator[BigQueryTableRef],
         event: AuditEvent,
         tables: Dict[str, List[str]],
-    ) -> Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]]:
+    ) -> None:
         if not event.read_event:
-            return datasets
+            return
 
         floored_ts = get_time_bucket(
             event.read_event.timestamp, self.config.bucket_duration
@@ -768,7 +758,7 @@ class BigQueryUsageExtractor:
                 not in tables[resource.table_identifier.dataset]
             ):
                 logger.debug(f"Skipping non existing {resource} from usage")
-                return datasets
+                return
         except Exception as e:
             self.report.report_warning(
                 str(event.read_event.resource), f"Failed to clean up resource, {e}"
@@ -776,47 +766,31 @@ class BigQueryUsageExtractor:
             logger.warning(
                 f"Failed to process event {str(event.read_event.resource)} - {e}"
             )
-            return datasets
+            return
 
         if resource.is_temporary_table([self.config.temp_table_dataset_prefix]):
             logger.debug(f"Dropping temporary table {resource}")
             self.report.report_dropped(str(resource))
-            return datasets
+            return
 
-        agg_bucket = datasets[floored_ts].setdefault(
+        aggregator.add_read_entry(
+            floored_ts,
             resource,
-            AggregatedDataset(
-                bucket_start_time=floored_ts,
-                resource=resource,
-                user_email_pattern=self.config.usage.user_email_pattern,
-            ),
-        )
-
-        agg_bucket.add_read_entry(
             event.read_event.actor_email,
             event.query_event.query if event.query_event else None,
             event.read_event.fieldsRead,
         )
 
-        return datasets
-
     def get_workunits(
-        self, aggregated_info: Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]]
+        self, aggregator: UsageAggregator[BigQueryTableRef]
     ) -> Iterable[MetadataWorkUnit]:
         self.report.num_usage_workunits_emitted = 0
-        for time_bucket in aggregated_info.values():
-            for aggregate in time_bucket.values():
-                yield self._make_usage_stat(aggregate)
-                self.report.num_usage_workunits_emitted += 1
-
-    def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
-        return agg.make_usage_workunit(
+        for wu in aggregator.generate_workunits(
             self.config.bucket_duration,
             lambda resource: resource.to_urn(self.config.env),
-            self.config.usage.top_n_queries,
-            self.config.usage.format_sql_queries,
-            self.config.usage.include_top_n_queries,
-        )
+        ):
+            yield wu
+            self.report.num_usage_workunits_emitted += 1
 
     def _get_parsed_bigquery_log_events(
         self, project_id: str, limit: Optional[int] = None
@@ -1,8 +1,11 @@
+import bisect
+import copy
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from hashlib import md5
-from typing import Any, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import confluent_kafka
 import jsonref
@@ -61,6 +64,20 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             )
         except Exception as e:
             logger.warning(f"Failed to get subjects from schema registry: {e}")
+        # Index of the subjects to look up the subjects of a topic by prefix.
+        self._known_subjects_set: Set[str] = set(self.known_schema_registry_subjects)
+        self._sorted_subjects: List[Tuple[str, int]] = sorted(
+            (subject, index)
+            for index, subject in enumerate(self.known_schema_registry_subjects)
+        )
+
+        # Topics are processed concurrently, and many topics share the same subjects,
+        # references and schemas. Registered schemas are cached by subject (and version),
+        # and the schema fields are cached by schema id.
+        self._cache_lock = threading.Lock()
+        self._latest_version_cache: Dict[str, RegisteredSchema] = {}
+        self._version_cache: Dict[Tuple[str, int], RegisteredSchema] = {}
+        self._schema_fields_cache: Dict[Tuple[Any, bool], List[SchemaField]] = {}
 
     @classmethod
     def create(
@@ -83,10 +100,40 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
         # Subject name format when the schema registry subject name strategy is
         #  (a) TopicNameStrategy(default strategy): <topic name>-<key/value>
         #  (b) TopicRecordNameStrategy: <topic name>-<fully-qualified record name>-<key/value>
-        for subject in self.known_schema_registry_subjects:
-            if subject.startswith(topic) and subject.endswith(subject_key_suffix):
-                return subject
-        return None
+        # The first registered subject that matches wins.
+        matched: Optional[Tuple[int, str]] = None
+        start = bisect.bisect_left(self._sorted_subjects, (topic, -1))
+        for position in range(start, len(self._sorted_subjects)):
+            subject, index = self._sorted_subjects[position]
+            if not subject.startswith(topic):
+                break
+            if subject.endswith(subject_key_suffix) and (
+                matched is None or index < matched[0]
+            ):
+                matched = (index, subject)
+        return matched[1] if matched is not None else None
+
+    def _get_latest_version(self, subject: str) -> RegisteredSchema:
+        with self._cache_lock:
+            registered_schema = self._latest_version_cache.get(subject)
+        if registered_schema is None:
+            registered_schema = self.schema_registry_client.get_latest_version(
+                subject_name=subject
+            )
+            with self._cache_lock:
+                self._latest_version_cache[subject] = registered_schema
+        return registered_schema
+
+    def _get_version(self, subject: str, version: int) -> RegisteredSchema:
+        with self._cache_lock:
+            registered_schema = self._version_cache.get((subject, version))
+        if registered_schema is None:
+            registered_schema = self.schema_registry_client.get_version(
+                subject_name=subject, version=version
+            )
+            with self._cache_lock:
+                self._version_cache[(subject, version)] = registered_schema
+        return registered_schema
 
     @staticmethod
     def _compact_schema(schema_str: str) -> str:
@@ -107,14 +154,12 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             if ref_subject in schema_seen:
                 continue
 
-            if ref_subject not in self.known_schema_registry_subjects:
+            if ref_subject not in self._known_subjects_set:
                 logger.warning(
                     f"{ref_subject} is not present in the list of registered subjects with schema registry!"
                 )
 
-            reference_schema = self.schema_registry_client.get_latest_version(
-                subject_name=ref_subject,
-            )
+            reference_schema = self._get_latest_version(ref_subject)
             schema_seen.add(ref_subject)
             logger.debug(
                 f"ref for {ref_subject} is {reference_schema.schema.schema_str}"
@@ -157,9 +202,7 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             ref_subject: str = schema_ref["subject"]
             if ref_subject in schema_seen:
                 continue
-            reference_schema: RegisteredSchema = (
-                self.schema_registry_client.get_latest_version(ref_subject)
-            )
+            reference_schema: RegisteredSchema = self._get_latest_version(ref_subject)
             schema_seen.add(ref_subject)
             all_schemas.append(
                 ProtobufSchema(
@@ -185,10 +228,8 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             ref_subject: str = schema_ref["subject"]
             if ref_subject in schema_seen:
                 continue
-            reference_schema: RegisteredSchema = (
-                self.schema_registry_client.get_version(
-                    subject_name=ref_subject, version=schema_ref["version"]
-                )
+            reference_schema: RegisteredSchema = self._get_version(
+                ref_subject, schema_ref["version"]
             )
             schema_seen.add(ref_subject)
             all_schemas.extend(
@@ -213,6 +254,7 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
         self, topic: str, is_key_schema: bool
     ) -> Tuple[Optional[Schema], List[SchemaField]]:
         schema: Optional[Schema] = None
+        schema_id: Optional[Any] = None
         schema_type_str: str = "key" if is_key_schema else "value"
         topic_subject: Optional[str] = self._get_subject_for_topic(
             topic=topic, is_key_schema=is_key_schema
@@ -222,10 +264,9 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
                 f"The {schema_type_str} schema subject:'{topic_subject}' is found for topic:'{topic}'."
             )
             try:
-                registered_schema = self.schema_registry_client.get_latest_version(
-                    subject_name=topic_subject
-                )
+                registered_schema = self._get_latest_version(topic_subject)
                 schema = registered_schema.schema
+                schema_id = registered_schema.schema_id
             except Exception as e:
                 logger.warning(
                     f"For topic: {topic}, failed to get {schema_type_str} schema from schema registry using subject:'{topic_subject}': {e}."
@@ -249,10 +290,40 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
         # Obtain the schema fields from schema for the topic.
         fields: List[SchemaField] = []
         if schema is not None:
+            fields = self._get_cached_schema_fields(
+                topic=topic,
+                schema=schema,
+                schema_id=schema_id,
+                is_key_schema=is_key_schema,
+            )
+        return (schema, fields)
+
+    def _get_cached_schema_fields(
+        self,
+        topic: str,
+        schema: Schema,
+        schema_id: Optional[Any],
+        is_key_schema: bool,
+    ) -> List[SchemaField]:
+        # The fields of Avro and Protobuf schemas only depend on the schema itself, and
+        # are shared by all topics that use the same schema. The fields of JSON schemas
+        # depend on the topic name, so they are not cached.
+        if schema_id is None or schema.schema_type not in ("AVRO", "PROTOBUF"):
+            return self._get_schema_fields(
+                topic=topic, schema=schema, is_key_schema=is_key_schema
+            )
+
+        cache_key = (schema_id, is_key_schema)
+        with self._cache_lock:
+            fields = self._schema_fields_cache.get(cache_key)
+        if fields is None:
             fields = self._get_schema_fields(
                 topic=topic, schema=schema, is_key_schema=is_key_schema
             )
-        return (schema, fields)
+            with self._cache_lock:
+                self._schema_fields_cache[cache_key] = fields
+        # Transformers may modify the fields of a topic, so every topic gets its own copy.
+        return copy.deepcopy(fields)
 
     def _load_json_schema_with_resolved_references(
         self, schema: Schema, name: str, subject: str
@@ -360,34 +431,5 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
     def get_schema_metadata(
         self, topic: str, platform_urn: str
     ) -> Optional[SchemaMetadata]:
-        logger.debug(f"Inside _get_schema_metadata {topic} {platform_urn}")
-        # Process the value schema
-        schema, fields = self._get_schema_and_fields(
-            topic=topic, is_key_schema=False
-        )  # type: Tuple[Optional[Schema], List[SchemaField]]
-
-        # Process the key schema
-        key_schema, key_fields = self._get_schema_and_fields(
-            topic=topic, is_key_schema=True
-        )  # type:Tuple[Optional[Schema], List[SchemaField]]
-
-        # Create the schemaMetadata aspect.
-        if schema is not None or key_schema is not None:
-            # create a merged string for the combined schemas and compute an md5 hash across
-            schema_as_string = (schema.schema_str if schema is not None else "") + (
-                key_schema.schema_str if key_schema is not None else ""
-            )
-            md5_hash = md5(schema_as_string.encode()).hexdigest()
-
-            return SchemaMetadata(
-                schemaName=topic,
-                version=0,
-                hash=md5_hash,
-                platform=platform_urn,
-                platformSchema=KafkaSchema(
-                    documentSchema=schema.schema_str if schema is not None else "",
-                    keySchema=key_schema.schema_str if key_schema else None,
-                ),
-                fields=key_fields + fields,
-            )
-        return None
+        logger.debug(f"Inside get_schema_metadata {topic} {platform_urn}")
+        return self._get_schema_metadata(topic=topic, platform_urn=platform_urn)
@@ -3,10 +3,23 @@ import json
 import logging
 import os.path
 import pathlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import auto
 from io import BufferedReader
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import ijson
 from pydantic import validator
@@ -34,6 +47,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import UsageAggregationClass
+from datahub.utilities import json_lines
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +78,14 @@ class FileSourceConfig(ConfigModel):
         default=True,
         description="When enabled, counts total number of records in the file before starting. Used for accurate estimation of completion time. Turn it off if startup time is too high.",
     )
+    parallelism: int = Field(
+        default=1,
+        description="Number of processes used to read and deserialize files in the JSON lines format. Uncompressed files are split into chunks of `chunk_size_in_bytes` that are read in parallel. Compressed files are read by a single process.",
+    )
+    chunk_size_in_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        description="Size of the chunks that JSON lines files are split into when `parallelism` is greater than 1.",
+    )
 
     _minsize_for_streaming_mode_in_bytes: int = (
         100 * 1000 * 1000  # Must be at least 100MB before we use streaming mode
@@ -170,7 +192,8 @@ class GenericFileSource(TestableSource):
         self.ctx = ctx
         self.config = config
         self.report = FileSourceReport()
-        self.fp: Optional[BufferedReader] = None
+        self.fp: Optional[Union[BufferedReader, IO]] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -231,11 +254,48 @@ class GenericFileSource(TestableSource):
     def close(self):
         if self.fp:
             self.fp.close()
+        if self._executor:
+            self._executor.shutdown(wait=True)
         super().close()
 
     def _iterate_file(self, path: str) -> Iterable[Tuple[int, Any]]:
         self.report.current_file_name = path
         self.report.current_file_size = os.path.getsize(path)
+        if json_lines.is_json_lines_file(path):
+            yield from self._iterate_json_lines_file(path)
+        else:
+            yield from self._iterate_json_file(path)
+
+        self._complete_file(path)
+
+    def _complete_file(self, path: str) -> None:
+        self.report.files_completed.append(path)
+        self.report.num_files_completed += 1
+        self.report.total_bytes_read_completed_files += os.path.getsize(path)
+        self.report.reset_current_file_stats()
+
+    def _count_json_lines(self, path: str) -> None:
+        # Counting lines is only cheap for uncompressed files.
+        if self.config.count_all_before_starting and not json_lines.is_compressed(path):
+            count_start_time = datetime.datetime.now()
+            with open(path, "rb") as f:
+                self.report.current_file_num_elements = sum(
+                    1 for line in f if line.strip()
+                )
+            self.report.add_count_time(datetime.datetime.now() - count_start_time)
+        self.report.current_file_elements_read = 0
+
+    def _iterate_json_lines_file(self, path: str) -> Iterable[Tuple[int, Any]]:
+        logger.info(f"Reading file {path} as JSON lines")
+        self._count_json_lines(path)
+        parse_start_time = datetime.datetime.now()
+        for i, obj in enumerate(json_lines.iterate_json_lines(path)):
+            self.report.add_parse_time(datetime.datetime.now() - parse_start_time)
+            self.report.current_file_elements_read = i + 1
+            yield i, obj
+            parse_start_time = datetime.datetime.now()
+
+    def _iterate_json_file(self, path: str) -> Iterable[Tuple[int, Any]]:
         if self.config.read_mode == FileReadMode.AUTO:
             file_read_mode = (
                 FileReadMode.BATCH
@@ -248,7 +308,7 @@ class GenericFileSource(TestableSource):
             file_read_mode = self.config.read_mode
 
         if file_read_mode == FileReadMode.BATCH:
-            with open(path, "r") as f:
+            with json_lines.open_file(path, "r") as f:
                 parse_start_time = datetime.datetime.now()
                 obj_list = json.load(f)
                 parse_end_time = datetime.datetime.now()
@@ -263,7 +323,7 @@ class GenericFileSource(TestableSource):
                 yield i, obj
                 self.report.current_file_elements_read += 1
         else:
-            self.fp = open(path, "rb")
+            self.fp = json_lines.open_file(path, "rb")
             if self.config.count_all_before_starting:
                 count_start_time = datetime.datetime.now()
                 parse_stream = ijson.parse(self.fp, use_float=True)
@@ -286,11 +346,6 @@ class GenericFileSource(TestableSource):
                 yield rows_yielded, row
                 parse_start_time = datetime.datetime.now()
 
-        self.report.files_completed.append(path)
-        self.report.num_files_completed += 1
-        self.report.total_bytes_read_completed_files += self.report.current_file_size
-        self.report.reset_current_file_stats()
-
     def iterate_mce_file(self, path: str) -> Iterator[MetadataChangeEvent]:
         for i, obj in self._iterate_file(path):
             mce: MetadataChangeEvent = MetadataChangeEvent.from_obj(obj)
@@ -310,6 +365,10 @@ class GenericFileSource(TestableSource):
             ],
         ]
     ]:
+        if self.config.parallelism > 1 and json_lines.is_json_lines_file(path):
+            yield from self._iterate_json_lines_file_parallel(path)
+            return
+
         for i, obj in self._iterate_file(path):
             try:
                 deserialize_start_time = datetime.datetime.now()
@@ -320,6 +379,75 @@ class GenericFileSource(TestableSource):
             except Exception as e:
                 self.report.report_failure(f"path-{i}", str(e))
 
+    def _iterate_json_lines_file_parallel(
+        self, path: str
+    ) -> Iterator[
+        Tuple[
+            int,
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposalWrapper,
+                MetadataChangeProposal,
+                UsageAggregationClass,
+            ],
+        ]
+    ]:
+        self.report.current_file_name = path
+        self.report.current_file_size = os.path.getsize(path)
+        logger.info(
+            f"Reading file {path} as JSON lines with {self.config.parallelism} processes"
+        )
+        self._count_json_lines(path)
+
+        chunks: List[Tuple[int, Optional[int]]]
+        if json_lines.is_compressed(path):
+            chunks = [(0, None)]
+        else:
+            chunks = list(
+                json_lines.split_byte_ranges(path, self.config.chunk_size_in_bytes)
+            )
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.config.parallelism)
+
+        # Keep a bounded number of chunks in flight, and consume them in order so
+        # that the output is the same as when reading the file serially.
+        pending: Deque[Tuple[Optional[int], Future]] = deque()
+        chunks_iter = iter(chunks)
+        i = 0
+        while True:
+            while len(pending) < 2 * self.config.parallelism:
+                chunk = next(chunks_iter, None)
+                if chunk is None:
+                    break
+                start, end = chunk
+                pending.append(
+                    (
+                        end,
+                        self._executor.submit(_read_json_lines_chunk, path, start, end),
+                    )
+                )
+            if not pending:
+                break
+
+            end, future = pending.popleft()
+            deserialize_start_time = datetime.datetime.now()
+            results = future.result()
+            self.report.add_deserialize_time(
+                datetime.datetime.now() - deserialize_start_time
+            )
+            for item, error in results:
+                if item is not None:
+                    yield i, item
+                else:
+                    self.report.report_failure(f"path-{i}", str(error))
+                i += 1
+                self.report.current_file_elements_read = i
+            if end is not None:
+                self.report.current_file_bytes_read = end
+
+        self._complete_file(path)
+
     @staticmethod
     def test_connection(config_dict: dict) -> TestConnectionReport:
         config = FileSourceConfig.parse_obj(config_dict)
@@ -391,8 +519,39 @@ def read_metadata_file(
     ]
 ]:
     # This simplified version of the FileSource can be used for testing purposes.
+    if json_lines.is_json_lines_file(str(file)):
+        return [
+            _from_obj_for_file(obj) for obj in json_lines.iterate_json_lines(str(file))
+        ]
+
     records = []
-    with file.open("r") as f:
+    with json_lines.open_file(str(file), "r") as f:
         for obj in json.load(f):
             records.append(_from_obj_for_file(obj))
     return records
+
+
+def _read_json_lines_chunk(
+    path: str, start: int, end: Optional[int]
+) -> List[
+    Tuple[
+        Optional[
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposal,
+                MetadataChangeProposalWrapper,
+                UsageAggregationClass,
+            ]
+        ],
+        Optional[str],
+    ]
+]:
+    # Runs in a worker process. Returns either the deserialized item or the error
+    # for every line, so that failures can be reported by the source.
+    results: List = []
+    for obj in json_lines.iterate_json_lines(path, start, end):
+        try:
+            results.append((_from_obj_for_file(obj), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
@@ -6,7 +6,9 @@ import contextlib
 import dataclasses
 import functools
 import logging
+import math
 import threading
+import time
 import traceback
 import unittest.mock
 import uuid
@@ -105,11 +107,51 @@ def _inject_connection_into_datasource(conn: Connection) -> Iterator[None]:
             yield
 
 
+class _ProfileTimedOut(BaseException):
+    """
+    Raised in a thread whose profile timed out when it runs its next query. It is not an
+    Exception, so that the profiler's error handling does not catch it and carry on.
+    """
+
+
+@contextlib.contextmanager
+def _cancel_timed_out_profiles(
+    engine: Engine, thread_state: threading.local
+) -> Iterator[None]:
+    # Threads cannot be interrupted, so the query that is running when a profile times
+    # out runs to completion, but the queries after it are not run.
+    def _before_cursor_execute(*args: Any, **kwargs: Any) -> None:
+        timed_out: Optional[threading.Event] = getattr(thread_state, "timed_out", None)
+        if timed_out is not None and timed_out.is_set():
+            raise _ProfileTimedOut()
+
+    sa.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
 @dataclasses.dataclass
 class GEProfilerRequest:
     pretty_name: str
     batch_kwargs: dict
 
+    # Size estimates of the profiled table, which are used to profile the most
+    # expensive tables first. They are not constructor arguments, so that subclasses
+    # can still declare fields without defaults.
+    rows_count: Optional[int] = dataclasses.field(default=None, init=False)
+    column_count: Optional[int] = dataclasses.field(default=None, init=False)
+
+    def get_cost_estimate(self) -> Optional[int]:
+        """
+        Returns the estimated cost of profiling the table, or None if its row count
+        is unknown.
+        """
+        if self.rows_count is None:
+            return None
+        return max(self.rows_count, 1) * max(self.column_count or 1, 1)
+
 
 def get_column_unique_count_patch(self: SqlAlchemyDataset, column: str) -> int:
     if self.engine.dialect.name.lower() == "redshift":
@@ -168,6 +210,54 @@ def _get_column_quantiles_bigquery_patch(  # type:ignore
         return list()
 
 
+# Clauses that sample roughly a percentage of the rows of a table, by dialect. Block
+# sampling is used where the database supports it, since it avoids scanning the whole
+# table. Every query of a profile reads the sample again, so the clauses are seeded to
+# return the same rows each time. Databases that cannot seed their samples, like
+# BigQuery, Trino, Presto and Athena, are not sampled.
+_TABLE_SAMPLE_CLAUSES: Dict[str, str] = {
+    "databricks": "TABLESAMPLE ({percent} PERCENT) REPEATABLE ({seed})",
+    "mssql": "TABLESAMPLE SYSTEM ({percent} PERCENT) REPEATABLE ({seed})",
+    "oracle": "SAMPLE BLOCK ({percent}) SEED ({seed})",
+    "postgresql": "TABLESAMPLE SYSTEM ({percent}) REPEATABLE ({seed})",
+    "snowflake": "SAMPLE SYSTEM ({percent}) SEED ({seed})",
+}
+_TABLE_SAMPLE_SEED = 42
+
+# Approximate distinct counts, by dialect. Redshift, BigQuery and Snowflake always use
+# them, see get_column_unique_count_patch.
+_APPROX_COUNT_DISTINCT_SQL: Dict[str, str] = {
+    "awsathena": "approx_distinct({column})",
+    "databricks": "approx_count_distinct({column})",
+    "mssql": "APPROX_COUNT_DISTINCT({column})",
+    "oracle": "APPROX_COUNT_DISTINCT({column})",
+    "presto": "approx_distinct({column})",
+    "trino": "approx_distinct({column})",
+}
+
+# Approximate quantiles, by dialect.
+_APPROX_QUANTILE_SQL: Dict[str, str] = {
+    "awsathena": "approx_percentile({column}, {quantile})",
+    "bigquery": "approx_quantiles({column}, 100)[OFFSET({percent})]",
+    "databricks": "percentile_approx({column}, {quantile})",
+    "presto": "approx_percentile({column}, {quantile})",
+    "snowflake": "APPROX_PERCENTILE({column}, {quantile})",
+    "trino": "approx_percentile({column}, {quantile})",
+}
+
+
+def _sample_error_bound(sample_row_count: int, row_count: int) -> float:
+    """
+    Returns the half-width of the 95% confidence interval of a proportion estimated
+    from a sample, in the worst case of a proportion of 0.5. This assumes that rows
+    were sampled independently, so block samples of clustered data can be less accurate.
+    """
+    if sample_row_count >= row_count:
+        return 0.0
+    finite_population_correction = (row_count - sample_row_count) / (row_count - 1)
+    return 1.96 * math.sqrt(0.25 / sample_row_count * finite_population_correction)
+
+
 def _is_single_row_query_method(query: Any) -> bool:
     SINGLE_ROW_QUERY_FILES = {
         # "great_expectations/dataset/dataset.py",
@@ -267,6 +357,98 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
     query_combiner: SQLAlchemyQueryCombiner
 
+    # Set when the column-level metrics are computed on a sample of the table.
+    sample_row_count: Optional[int] = None
+    sample_scale: float = 1.0
+
+    def _extrapolate_count(self, count: int) -> int:
+        if self.sample_row_count is None:
+            return count
+        return int(round(count * self.sample_scale))
+
+    def _get_approximate_sql(self, templates: Dict[str, str]) -> Optional[str]:
+        if not self.config.approximate_profiling:
+            return None
+        return templates.get(self.dataset.engine.dialect.name.lower())
+
+    def _quote(self, column: str) -> str:
+        return self.dataset.engine.dialect.identifier_preparer.quote(column)
+
+    def _sample_dataset(self, profile: DatasetProfileClass) -> None:
+        assert profile.rowCount is not None
+        clause = self._get_approximate_sql(_TABLE_SAMPLE_CLAUSES)
+        if clause is None or profile.rowCount <= self.config.sample_row_count_threshold:
+            return
+
+        table = self.dataset._table
+        if isinstance(table, sa.Table):
+            table_name = self.dataset.engine.dialect.identifier_preparer.format_table(
+                table
+            )
+        else:
+            table_name = str(table)
+        sampled_table = sa.text(
+            f"{table_name} {clause.format(percent=self.config.sample_percent, seed=_TABLE_SAMPLE_SEED)}"
+        )
+        try:
+            sample_row_count = self.dataset.engine.execute(
+                sa.select([sa.func.count()]).select_from(sampled_table)
+            ).scalar()
+        except Exception as e:
+            logger.debug(f"Caught exception while sampling {self.dataset_name}. {e}")
+            self.report.report_warning(
+                "Profiling - Unable to sample table", self.dataset_name
+            )
+            return
+        if not sample_row_count:
+            # Block samples of small or sparse tables can be empty.
+            return
+
+        logger.debug(
+            f"profiling {self.dataset_name}: using a sample of {sample_row_count} rows"
+        )
+        self.dataset._table = sampled_table
+        self.sample_row_count = sample_row_count
+        self.sample_scale = profile.rowCount / sample_row_count
+        profile.sampleFraction = min(1.0, sample_row_count / profile.rowCount)
+        profile.sampleErrorBound = _sample_error_bound(
+            sample_row_count, profile.rowCount
+        )
+
+    def _get_column_unique_count(self, column: str) -> int:
+        approx_sql = self._get_approximate_sql(_APPROX_COUNT_DISTINCT_SQL)
+        if approx_sql is None:
+            return self.dataset.get_column_unique_count(column)
+        return convert_to_json_serializable(
+            self.dataset.engine.execute(
+                sa.select(
+                    [sa.text(approx_sql.format(column=self._quote(column)))]
+                ).select_from(self.dataset._table)
+            ).scalar()
+        )
+
+    def _get_approximate_quantiles(
+        self, column: str, quantiles: List[float]
+    ) -> Optional[List[Any]]:
+        approx_sql = self._get_approximate_sql(_APPROX_QUANTILE_SQL)
+        if approx_sql is None:
+            return None
+        row = self.dataset.engine.execute(
+            sa.select(
+                [
+                    sa.text(
+                        approx_sql.format(
+                            column=self._quote(column),
+                            quantile=quantile,
+                            percent=round(quantile * 100),
+                        )
+                    )
+                    for quantile in quantiles
+                ]
+            ).select_from(self.dataset._table)
+        ).fetchone()
+        return [convert_to_json_serializable(value) for value in row]
+
     def _get_columns_to_profile(self) -> List[str]:
         if not self.config.any_field_level_metrics_enabled():
             return []
@@ -328,7 +510,7 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         unique_count = None
         pct_unique = None
         try:
-            unique_count = self.dataset.get_column_unique_count(column)
+            unique_count = self._get_column_unique_count(column)
             if nonnull_count > 0:
                 pct_unique = float(unique_count) / nonnull_count
         except Exception:
@@ -372,7 +554,10 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         if not self.config.include_field_median_value:
             return
         try:
-            if self.dataset.engine.dialect.name.lower() == "snowflake":
+            approximate_median = self._get_approximate_quantiles(column, [0.5])
+            if approximate_median is not None:
+                column_profile.median = str(approximate_median[0])
+            elif self.dataset.engine.dialect.name.lower() == "snowflake":
                 column_profile.median = str(
                     self.dataset.engine.execute(
                         sa.select([sa.func.median(sa.column(column))]).select_from(
@@ -420,8 +605,16 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
             # this does not.
             # values = dataset.get_column_quantiles(column, tuple(quantiles))
 
-            self.dataset.set_config_value("interactive_evaluation", True)
             quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+            approximate_values = self._get_approximate_quantiles(column, quantiles)
+            if approximate_values is not None:
+                column_profile.quantiles = [
+                    QuantileClass(quantile=str(quantile), value=str(value))
+                    for quantile, value in zip(quantiles, approximate_values)
+                ]
+                return
+
+            self.dataset.set_config_value("interactive_evaluation", True)
 
             res = self.dataset.expect_column_quantile_values_to_be_between(
                 column,
@@ -454,7 +647,9 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
     ) -> None:
         if self.config.include_field_distinct_value_frequencies:
             column_profile.distinctValueFrequencies = [
-                ValueFrequencyClass(value=str(value), frequency=count)
+                ValueFrequencyClass(
+                    value=str(value), frequency=self._extrapolate_count(count)
+                )
                 for value, count in self.dataset.get_column_value_counts(column).items()
             ]
 
@@ -524,7 +719,15 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
                 f"{self.dataset_name}.{column}",
             )
 
-    def generate_dataset_profile(  # noqa: C901 (complexity)
+    def generate_dataset_profile(self) -> DatasetProfileClass:
+        table = self.dataset._table
+        try:
+            return self._generate_dataset_profile()
+        finally:
+            # The table is replaced with a sample of it when sampling.
+            self.dataset._table = table
+
+    def _generate_dataset_profile(  # noqa: C901 (complexity)
         self,
     ) -> DatasetProfileClass:
         self.dataset.set_default_expectation_argument(
@@ -544,6 +747,8 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         logger.debug(f"profiling {self.dataset_name}: flushing stage 1 queries")
         self.query_combiner.flush()
 
+        self._sample_dataset(profile)
+
         columns_profiling_queue: List[_SingleColumnSpec] = []
         for column in all_columns:
             column_profile = DatasetFieldProfileClass(fieldPath=column)
@@ -561,6 +766,8 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
         assert profile.rowCount is not None
         row_count: int = profile.rowCount
+        # The column-level metrics are computed on the sample, if there is one.
+        sample_row_count: int = self.sample_row_count or row_count
 
         for column_spec in columns_profiling_queue:
             column = column_spec.column
@@ -572,17 +779,26 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
             unique_count = column_spec.unique_count
 
             if non_null_count is not None:
-                null_count = max(0, row_count - non_null_count)
+                null_count = max(0, sample_row_count - non_null_count)
 
                 if self.config.include_field_null_count:
-                    column_profile.nullCount = null_count
-                    if row_count > 0:
+                    column_profile.nullCount = self._extrapolate_count(null_count)
+                    if sample_row_count > 0:
                         # Sometimes this value is bigger than 1 because of the approx queries
-                        column_profile.nullProportion = min(1, null_count / row_count)
+                        column_profile.nullProportion = min(
+                            1, null_count / sample_row_count
+                        )
 
             if unique_count is not None:
                 if self.config.include_field_distinct_count:
                     column_profile.uniqueCount = unique_count
+                    # Distinct counts do not grow in proportion to the sample, except
+                    # for columns whose sampled values are all distinct, which are
+                    # assumed to be unique.
+                    if non_null_count is not None and unique_count >= non_null_count:
+                        column_profile.uniqueCount = self._extrapolate_count(
+                            unique_count
+                        )
                     if non_null_count is not None and non_null_count > 0:
                         # Sometimes this value is bigger than 1 because of the approx queries
                         column_profile.uniqueProportion = min(
@@ -702,6 +918,8 @@ class DatahubGEProfiler:
         # make the threading code work correctly. As such, we need to make sure we've
         # got an engine here.
         self.base_engine = conn.engine
+        # Tells the threads that profile tables whether their profile has timed out.
+        self._profiling_thread_state = threading.local()
 
         if IS_SQLALCHEMY_1_4:
             # SQLAlchemy 1.4 added a statement "linter", which issues warnings about cartesian products in SELECT statements.
@@ -763,7 +981,11 @@ class DatahubGEProfiler:
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
     ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
-        with PerfTimer() as timer, concurrent.futures.ThreadPoolExecutor(
+        # Timed out profiles stop at their next query, and the executor waits for them,
+        # so that no profiling queries run once the profiles have been generated.
+        with PerfTimer() as timer, _cancel_timed_out_profiles(
+            self.base_engine, self._profiling_thread_state
+        ), concurrent.futures.ThreadPoolExecutor(
             max_workers=max_workers
         ) as async_executor, SQLAlchemyQueryCombiner(
             enabled=self.config.query_combiner_enabled,
@@ -783,24 +1005,15 @@ class DatahubGEProfiler:
                     "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
                     _get_column_quantiles_bigquery_patch,
                 ):
-                    async_profiles = collections.deque(
-                        async_executor.submit(
-                            self._generate_profile_from_request,
-                            query_combiner,
-                            request,
-                            platform=platform,
-                            profiler_args=profiler_args,
-                        )
-                        for request in requests
+                    yield from self._schedule_profiles(
+                        async_executor,
+                        query_combiner,
+                        requests,
+                        max_workers,
+                        platform=platform,
+                        profiler_args=profiler_args,
                     )
 
-                    # Avoid using as_completed so that the results are yielded in the
-                    # same order as the requests.
-                    # for async_profile in concurrent.futures.as_completed(async_profiles):
-                    while len(async_profiles) > 0:
-                        async_profile = async_profiles.popleft()
-                        yield async_profile.result()
-
                     total_time_taken = timer.elapsed_seconds()
 
                     logger.info(
@@ -836,6 +1049,98 @@ class DatahubGEProfiler:
 
                     self.report.report_from_query_combiner(query_combiner.report)
 
+    def _schedule_profiles(
+        self,
+        async_executor: concurrent.futures.Executor,
+        query_combiner: SQLAlchemyQueryCombiner,
+        requests: List[GEProfilerRequest],
+        max_workers: int,
+        platform: Optional[str] = None,
+        profiler_args: Optional[Dict] = None,
+    ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
+        # The most expensive tables are profiled first, so that they do not end up
+        # running alone at the end. Tables of unknown cost keep their order and follow
+        # the ones with an estimate. At most max_workers requests are submitted at a
+        # time, and the profiles are yielded as soon as they are complete.
+        ordered_requests = collections.deque(
+            sorted(
+                requests,
+                key=lambda request: -(request.get_cost_estimate() or -1),
+            )
+        )
+        timeout = self.config.profile_table_timeout_seconds
+
+        start_times: Dict[int, float] = {}
+        timed_out_events: Dict[int, threading.Event] = {}
+
+        def _profile(
+            request: GEProfilerRequest,
+        ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
+            self._profiling_thread_state.timed_out = timed_out_events[id(request)]
+            start_times[id(request)] = time.perf_counter()
+            try:
+                return self._generate_profile_from_request(
+                    query_combiner,
+                    request,
+                    platform=platform,
+                    profiler_args=profiler_args,
+                )
+            finally:
+                self._profiling_thread_state.timed_out = None
+
+        in_flight: Dict[concurrent.futures.Future, GEProfilerRequest] = {}
+        while ordered_requests or in_flight:
+            while ordered_requests and len(in_flight) < max_workers:
+                request = ordered_requests.popleft()
+                timed_out_events[id(request)] = threading.Event()
+                in_flight[async_executor.submit(_profile, request)] = request
+
+            wait_timeout: Optional[float] = None
+            if timeout is not None:
+                # Requests that are still queued in the executor have not started yet,
+                # so their deadline is at least a full timeout away.
+                now = time.perf_counter()
+                wait_timeout = max(
+                    0.0,
+                    min(
+                        [
+                            start_times[id(request)] + timeout - now
+                            for request in in_flight.values()
+                            if id(request) in start_times
+                        ]
+                        + [timeout]
+                    ),
+                )
+            done, _ = concurrent.futures.wait(
+                in_flight,
+                timeout=wait_timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            now = time.perf_counter()
+            for async_profile in done:
+                request = in_flight.pop(async_profile)
+                self.report.report_table_profiling_cost(
+                    request.pretty_name,
+                    now - start_times[id(request)],
+                    request.get_cost_estimate(),
+                )
+                yield async_profile.result()
+
+            if timeout is not None:
+                for async_profile, request in list(in_flight.items()):
+                    started = start_times.get(id(request))
+                    if started is None or now - started < timeout:
+                        continue
+                    # The thread stops profiling the table at its next query.
+                    del in_flight[async_profile]
+                    timed_out_events[id(request)].set()
+                    logger.warning(
+                        f"Profiling {request.pretty_name} did not finish within {timeout} seconds"
+                    )
+                    self.report.report_profiling_timeout(request.pretty_name, timeout)
+                    yield request, None
+
     def _generate_profile_from_request(
         self,
         query_combiner: SQLAlchemyQueryCombiner,
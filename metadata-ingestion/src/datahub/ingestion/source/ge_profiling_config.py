@@ -12,6 +12,8 @@ _PROFILING_FLAGS_TO_REPORT = {
     "turn_off_expensive_profiling_metrics",
     "profile_table_level_only",
     "query_combiner_enabled",
+    "approximate_profiling",
+    "incremental_profiling",
     # all include_field_ flags are reported.
 }
 
@@ -115,6 +117,22 @@ class GEProfilingConfig(ConfigModel):
         description="Profile tables only if their row count is less then specified count. If set to `null`, no limit on the row count of tables to profile. Supported only in `snowflake` and `BigQuery`",
     )
 
+    approximate_profiling: bool = Field(
+        default=False,
+        description="Whether to compute the distinct counts, medians and quantiles of columns with the approximate aggregate functions of the database, where it provides them, and to compute the column-level metrics of large tables on a sample of their rows. The table row count stays exact. The profiles record the fraction of rows that were sampled and the error bound of the estimated proportions. Sampling is supported on Snowflake, Postgres, Databricks, SQL Server and Oracle, which can sample the same rows for every query of a profile.",
+    )
+    sample_percent: float = Field(
+        default=10,
+        gt=0,
+        le=100,
+        description="The percentage of rows to sample when `approximate_profiling` is enabled. The database may sample whole blocks of rows, so the actual fraction can differ and is recorded in the profile.",
+    )
+    sample_row_count_threshold: int = Field(
+        default=1000000,
+        ge=0,
+        description="When `approximate_profiling` is enabled, only tables with more rows than this are sampled.",
+    )
+
     # The default of (5 * cpu_count) is adopted from the default max_workers
     # parameter of ThreadPoolExecutor. Given that profiling is often an I/O-bound
     # task, it may make sense to increase this default value in the future.
@@ -124,6 +142,11 @@ class GEProfilingConfig(ConfigModel):
         description="Number of worker threads to use for profiling. Set to 1 to disable.",
     )
 
+    profile_table_timeout_seconds: Optional[pydantic.PositiveFloat] = Field(
+        default=None,
+        description="Maximum time to spend profiling a single table. The profile of a table that takes longer is discarded and a warning is reported. The timeout is best-effort: the query that is running when it is reached is not cancelled, but no further queries are run for the table, and profiling finishes only once that query does. By default, there is no timeout.",
+    )
+
     # The query combiner enables us to combine multiple queries into a single query,
     # reducing the number of round-trips to the database and speeding up profiling.
     query_combiner_enabled: bool = Field(
@@ -139,6 +162,20 @@ class GEProfilingConfig(ConfigModel):
         default=None,
         description="For partitioned datasets profile only the partition which matches the datetime or profile the latest one if not set. Only Bigquery supports this.",
     )
+    incremental_profiling: bool = Field(
+        default=False,
+        description="For partitioned datasets, profile only the partitions that are new or were modified since the last run, and merge the row counts, null counts, min, max and mean values of all partitions into the table profile. Distinct counts, medians, quantiles and histograms cannot be merged and are left out of the table profile. Requires `stateful_ingestion` and `store_last_profiling_timestamps`, and ignored if `partition_datetime` is set. Only Bigquery time-partitioned tables support this.",
+    )
+    incremental_profiling_max_partitions: int = Field(
+        default=10,
+        ge=1,
+        description="When `incremental_profiling` is enabled, the maximum number of new or modified partitions to profile per table and run, newest first. The remaining partitions are profiled in the next runs.",
+    )
+    incremental_profiling_max_stored_partitions: int = Field(
+        default=365,
+        ge=1,
+        description="When `incremental_profiling` is enabled, the number of newest partitions per table whose statistics are kept in the state and merged into the table profile. Older partitions are not profiled, and the metrics of the table are extrapolated from the newest partitions; the profile records the fraction of rows that these cover.",
+    )
 
     @pydantic.root_validator(pre=True)
     def deprecate_bigquery_temp_table_schema(cls, values):
@@ -1,9 +1,10 @@
 import concurrent.futures
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Type
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Type
 
 import confluent_kafka
 import confluent_kafka.admin
@@ -51,6 +52,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
 from datahub.metadata.com.linkedin.pegasus2avro.common import Status
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
+from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaMetadata
 from datahub.metadata.schema_classes import (
     BrowsePathsClass,
     DataPlatformInstanceClass,
@@ -96,6 +98,11 @@ class KafkaSourceConfig(StatefulIngestionConfigBase, DatasetSourceConfigBase):
         default=False,
         description="Disables warnings reported for non-AVRO/Protobuf value or key schemas if set.",
     )
+    max_workers: int = pydantic.Field(
+        default=4,
+        ge=1,
+        description="Number of threads used to fetch the schemas of topics from the schema registry. Custom schema registry implementations must be thread-safe if this is greater than 1.",
+    )
 
 
 @dataclass
@@ -206,18 +213,58 @@ class KafkaSource(StatefulIngestionSourceBase):
         ).topics
         extra_topic_details = self.fetch_extra_topic_details(topics.keys())
 
-        for t, t_detail in topics.items():
+        allowed_topics: List[str] = []
+        for t in topics:
             self.report.report_topic_scanned(t)
             if self.source_config.topic_patterns.allowed(t):
-                yield from self._extract_record(t, t_detail, extra_topic_details.get(t))
+                allowed_topics.append(t)
             else:
                 self.report.report_dropped(t)
 
+        for t, schema_metadata in self._get_schema_metadata_of_topics(allowed_topics):
+            yield from self._extract_record(
+                t, topics[t], extra_topic_details.get(t), schema_metadata
+            )
+
+    def _get_schema_metadata_of_topics(
+        self, topics: List[str]
+    ) -> Iterable[Tuple[str, Optional[SchemaMetadata]]]:
+        """
+        Fetches the schema metadata of the topics on a thread pool and yields it in the
+        order of the topics. At most a few topics per thread are fetched ahead of the
+        topic that is being yielded.
+        """
+        platform_urn = make_data_platform_urn(self.platform)
+        max_workers = self.source_config.max_workers
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kafka-schema"
+        ) as executor:
+            pending: Deque[Tuple[str, concurrent.futures.Future]] = deque()
+            for topic in topics:
+                pending.append(
+                    (
+                        topic,
+                        executor.submit(
+                            self.schema_registry_client.get_schema_metadata,
+                            topic,
+                            platform_urn,
+                        ),
+                    )
+                )
+                if len(pending) > 2 * max_workers:
+                    t, future = pending.popleft()
+                    yield t, future.result()
+
+            while pending:
+                t, future = pending.popleft()
+                yield t, future.result()
+
     def _extract_record(
         self,
         topic: str,
         topic_detail: Optional[TopicMetadata],
         extra_topic_config: Optional[Dict[str, ConfigEntry]],
+        schema_metadata: Optional[SchemaMetadata],
     ) -> Iterable[MetadataWorkUnit]:
         logger.debug(f"topic = {topic}")
 
@@ -235,10 +282,7 @@ class KafkaSource(StatefulIngestionSourceBase):
             aspects=[Status(removed=False)],  # we append to this list later on
         )
 
-        # 2. Attach schemaMetadata aspect (pass control to SchemaRegistry)
-        schema_metadata = self.schema_registry_client.get_schema_metadata(
-            topic, platform_urn
-        )
+        # 2. Attach schemaMetadata aspect (fetched from the SchemaRegistry)
         if schema_metadata is not None:
             dataset_snapshot.aspects.append(schema_metadata)
 
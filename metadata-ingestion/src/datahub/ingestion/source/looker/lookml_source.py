@@ -1,9 +1,13 @@
 import glob
+import hashlib
 import itertools
+import json
 import logging
+import os
 import pathlib
 import re
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field as dataclass_field, replace
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
@@ -80,7 +84,11 @@ from datahub.utilities.source_helpers import (
     auto_stale_entity_removal,
     auto_status_aspect,
 )
-from datahub.utilities.sql_parser import SQLParser
+from datahub.utilities.sql_parser import (
+    SqlLineageSQLParser,
+    SQLParser,
+    get_sql_parser_pool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -230,6 +238,17 @@ class LookMLSourceConfig(LookerCommonConfig, StatefulIngestionConfigBase):
         False,
         description="When enabled, sql parsing will be executed in a separate process to prevent memory leaks.",
     )
+    parse_workers: int = Field(
+        0,
+        ge=0,
+        description="Number of processes used to parse all LookML files of the project and its dependencies upfront. "
+        "When `parse_table_names_from_sql` is enabled, the SQL of derived tables is then also parsed ahead of time on the SQL parser worker pool. "
+        "If 0, files are parsed one at a time when they are first included.",
+    )
+    lookml_cache_dir: Optional[str] = Field(
+        None,
+        description="A directory in which parsed LookML files are kept between runs. A file is parsed again once its modification time or size changes.",
+    )
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = Field(
         default=None, description=""
     )
@@ -312,6 +331,10 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
     query_parse_attempts: int = 0
     query_parse_failures: int = 0
     query_parse_failure_views: List[str] = dataclass_field(default_factory=LossyList)
+    lookml_files_parsed: int = 0
+    lookml_files_cache_hits: int = 0
+    lookml_files_disk_cache_hits: int = 0
+    lookml_parse_upfront_time: Optional[timedelta] = None
     _looker_api: Optional[LookerAPI] = None
 
     def report_models_scanned(self) -> None:
@@ -335,6 +358,141 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
         return super().compute_stats()
 
 
+# Bump this when the structure of parsed files changes, e.g. because lkml is patched.
+_LOOKML_CACHE_FORMAT_VERSION = 1
+
+# (mtime_ns, size) of a file, used to tell whether a cached parse is still valid.
+_FileVersion = Tuple[int, int]
+
+
+def _get_file_version(path: str) -> _FileVersion:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_lookml_files(
+    paths: List[str],
+) -> List[Tuple[str, Optional[_FileVersion], Optional[dict]]]:
+    """Parses a chunk of files in a worker process. Files that fail to parse are returned without a result."""
+    results: List[Tuple[str, Optional[_FileVersion], Optional[dict]]] = []
+    for path in paths:
+        try:
+            version = _get_file_version(path)
+            with open(path, "r") as file:
+                results.append((path, version, lkml.load(file)))
+        except Exception:
+            results.append((path, None, None))
+    return results
+
+
+class LookMLFileCache:
+    """
+    Caches parsed LookML files by path, so that files that are included by many models
+    are only parsed once per run. An entry is used as long as the modification time and
+    size of the file are unchanged. If a cache_dir is given, parsed files are also kept
+    on disk so that unchanged files are not parsed again in later runs.
+
+    Parsed files are shared between callers and must not be modified.
+    """
+
+    def __init__(
+        self, reporter: LookMLSourceReport, cache_dir: Optional[str] = None
+    ) -> None:
+        self.reporter = reporter
+        self._parsed: Dict[str, Tuple[_FileVersion, dict]] = {}
+        self._cache_dir: Optional[pathlib.Path] = None
+        if cache_dir is not None:
+            self._cache_dir = pathlib.Path(cache_dir)
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self, path: str) -> dict:
+        """Returns the parsed file at path. Raises if it can't be read or parsed."""
+        path = os.path.realpath(path)
+        version = _get_file_version(path)
+        parsed = self._get_cached(path, version)
+        if parsed is None:
+            logger.debug(f"Parsing LookML file {path}")
+            with open(path, "r") as file:
+                parsed = lkml.load(file)
+            self._add(path, version, parsed)
+        return parsed
+
+    def preload(self, paths: Iterable[str], max_workers: int) -> None:
+        """Parses all given files that are not cached yet on a pool of processes."""
+        to_parse = []
+        for path in paths:
+            path = os.path.realpath(path)
+            try:
+                version = _get_file_version(path)
+            except OSError:
+                continue
+            if self._get_cached(path, version, count_hit=False) is None:
+                to_parse.append(path)
+        if not to_parse:
+            return
+
+        # Send the files in chunks to keep the inter-process overhead low.
+        chunk_size = max(1, min(64, len(to_parse) // (4 * max_workers)))
+        chunks = [
+            to_parse[i : i + chunk_size] for i in range(0, len(to_parse), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for results in executor.map(_parse_lookml_files, chunks):
+                for path, version, parsed in results:
+                    # Files that failed are parsed again when they are loaded, which
+                    # reports the error where the file is used.
+                    if version is not None and parsed is not None:
+                        self._add(path, version, parsed)
+
+    def _get_cached(
+        self, path: str, version: _FileVersion, count_hit: bool = True
+    ) -> Optional[dict]:
+        cached = self._parsed.get(path)
+        if cached is not None and cached[0] == version:
+            if count_hit:
+                self.reporter.lookml_files_cache_hits += 1
+            return cached[1]
+
+        disk_path = self._get_disk_path(path)
+        if disk_path is None or not disk_path.exists():
+            return None
+        try:
+            with disk_path.open("r") as file:
+                entry = json.load(file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {disk_path}", exc_info=e)
+            return None
+        if entry.get("path") != path or tuple(entry.get("version", ())) != version:
+            return None
+        self.reporter.lookml_files_disk_cache_hits += 1
+        self._parsed[path] = (version, entry["parsed"])
+        return entry["parsed"]
+
+    def _add(self, path: str, version: _FileVersion, parsed: dict) -> None:
+        self.reporter.lookml_files_parsed += 1
+        self._parsed[path] = (version, parsed)
+
+        disk_path = self._get_disk_path(path)
+        if disk_path is None:
+            return
+        # Write to a temporary file first, so that readers never see partial entries.
+        tmp_path = disk_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("w") as file:
+                json.dump({"path": path, "version": version, "parsed": parsed}, file)
+            os.replace(tmp_path, disk_path)
+        except Exception as e:
+            logger.debug(f"Failed to write cache entry {disk_path}", exc_info=e)
+
+    def _get_disk_path(self, path: str) -> Optional[pathlib.Path]:
+        if self._cache_dir is None:
+            return None
+        key = hashlib.sha1(
+            f"{_LOOKML_CACHE_FORMAT_VERSION}:{path}".encode("utf-8")
+        ).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+
 @dataclass
 class LookerModel:
     connection: str
@@ -350,6 +508,7 @@ class LookerModel:
         base_projects_folders: Dict[str, pathlib.Path],
         path: str,
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
     ) -> "LookerModel":
         logger.debug(f"Loading model from {path}")
         connection = looker_model_dict["connection"]
@@ -361,11 +520,13 @@ class LookerModel:
             base_projects_folders,
             path,
             reporter,
+            file_cache,
             seen_so_far=set(),
             traversal_path=pathlib.Path(path).stem,
         )
         logger.debug(f"{path} has resolved_includes: {resolved_includes}")
-        explores = looker_model_dict.get("explores", [])
+        # Copied, because the parsed model is shared through the file cache.
+        explores = list(looker_model_dict.get("explores", []))
 
         explore_files = [
             x.include
@@ -374,10 +535,9 @@ class LookerModel:
         ]
         for included_file in explore_files:
             try:
-                with open(included_file, "r") as file:
-                    parsed = lkml.load(file)
-                    included_explores = parsed.get("explores", [])
-                    explores.extend(included_explores)
+                parsed = file_cache.load(included_file)
+                included_explores = parsed.get("explores", [])
+                explores.extend(included_explores)
             except Exception as e:
                 reporter.report_warning(
                     path, f"Failed to load {included_file} due to {e}"
@@ -400,6 +560,7 @@ class LookerModel:
         base_projects_folder: Dict[str, pathlib.Path],
         path: str,
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
         seen_so_far: Set[str],
         traversal_path: str = "",  # a cosmetic parameter to aid debugging
     ) -> List[ProjectInclude]:
@@ -481,24 +642,24 @@ class LookerModel:
                     f"Will be loading {included_file}, traversed here via {traversal_path}"
                 )
                 try:
-                    with open(included_file, "r") as file:
-                        parsed = lkml.load(file)
-                        seen_so_far.add(included_file)
-                        if "includes" in parsed:  # we have more includes to resolve!
-                            resolved.extend(
-                                LookerModel.resolve_includes(
-                                    parsed["includes"],
-                                    resolved_project_name,
-                                    base_folder,
-                                    base_projects_folder,
-                                    included_file,
-                                    reporter,
-                                    seen_so_far,
-                                    traversal_path=traversal_path
-                                    + "."
-                                    + pathlib.Path(included_file).stem,
-                                )
+                    parsed = file_cache.load(included_file)
+                    seen_so_far.add(included_file)
+                    if "includes" in parsed:  # we have more includes to resolve!
+                        resolved.extend(
+                            LookerModel.resolve_includes(
+                                parsed["includes"],
+                                resolved_project_name,
+                                base_folder,
+                                base_projects_folder,
+                                included_file,
+                                reporter,
+                                file_cache,
+                                seen_so_far,
+                                traversal_path=traversal_path
+                                + "."
+                                + pathlib.Path(included_file).stem,
                             )
+                        )
                 except Exception as e:
                     reporter.report_warning(
                         path, f"Failed to load {included_file} due to {e}"
@@ -534,6 +695,7 @@ class LookerViewFile:
         base_projects_folder: Dict[str, pathlib.Path],
         raw_file_content: str,
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
     ) -> "LookerViewFile":
         logger.debug(f"Loading view file at {absolute_file_path}")
         includes = looker_view_file_dict.get("includes", [])
@@ -547,6 +709,7 @@ class LookerViewFile:
             base_projects_folder,
             absolute_file_path,
             reporter,
+            file_cache,
             seen_so_far=seen_so_far,
         )
         logger.debug(
@@ -581,11 +744,13 @@ class LookerViewFileLoader:
         base_folder: str,
         base_projects_folder: Dict[str, pathlib.Path],
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
     ) -> None:
         self.viewfile_cache: Dict[str, LookerViewFile] = {}
         self._base_folder = base_folder
         self._base_projects_folder = base_projects_folder
         self.reporter = reporter
+        self.file_cache = file_cache
 
     def is_view_seen(self, path: str) -> bool:
         return path in self.viewfile_cache
@@ -616,21 +781,21 @@ class LookerViewFileLoader:
             self.reporter.report_failure(path, f"failed to load view file: {e}")
             return None
         try:
-            with open(path, "r") as file:
-                logger.debug(f"Loading viewfile {path}")
-                parsed = lkml.load(file)
-                looker_viewfile = LookerViewFile.from_looker_dict(
-                    absolute_file_path=path,
-                    looker_view_file_dict=parsed,
-                    project_name=project_name,
-                    base_folder=self._base_folder,
-                    base_projects_folder=self._base_projects_folder,
-                    raw_file_content=raw_file_content,
-                    reporter=reporter,
-                )
-                logger.debug(f"adding viewfile for path {path} to the cache")
-                self.viewfile_cache[path] = looker_viewfile
-                return looker_viewfile
+            logger.debug(f"Loading viewfile {path}")
+            parsed = self.file_cache.load(path)
+            looker_viewfile = LookerViewFile.from_looker_dict(
+                absolute_file_path=path,
+                looker_view_file_dict=parsed,
+                project_name=project_name,
+                base_folder=self._base_folder,
+                base_projects_folder=self._base_projects_folder,
+                raw_file_content=raw_file_content,
+                reporter=reporter,
+                file_cache=self.file_cache,
+            )
+            logger.debug(f"adding viewfile for path {path} to the cache")
+            self.viewfile_cache[path] = looker_viewfile
+            return looker_viewfile
         except Exception as e:
             self.reporter.report_failure(path, f"failed to load view file: {e}")
             return None
@@ -965,15 +1130,8 @@ class LookerView:
                         if maybe_table_match.group(1) not in sql_table_names:
                             sql_table_names.append(maybe_table_match.group(1))
                     return fields, sql_table_names
-            # Looker supports sql fragments that omit the SELECT and FROM parts of the query
-            # Add those in if we detect that it is missing
-            if not re.search(r"SELECT\s", sql_query, flags=re.I):
-                # add a SELECT clause at the beginning
-                sql_query = f"SELECT {sql_query}"
-            if not re.search(r"FROM\s", sql_query, flags=re.I):
-                # add a FROM clause at the end
-                sql_query = f"{sql_query} FROM {sql_table_name if sql_table_name is not None else view_name}"
-                # Get the list of tables in the query
+            sql_query = cls._complete_sql_query(sql_query, sql_table_name, view_name)
+            # Get the list of tables in the query
             try:
                 sql_info = cls._get_sql_info(
                     sql_query, sql_parser_path, use_external_process
@@ -1003,6 +1161,43 @@ class LookerView:
 
         return fields, sql_table_names
 
+    @classmethod
+    def _complete_sql_query(
+        cls, sql_query: str, sql_table_name: Optional[str], view_name: str
+    ) -> str:
+        # Looker supports sql fragments that omit the SELECT and FROM parts of the query
+        # Add those in if we detect that it is missing
+        if not re.search(r"SELECT\s", sql_query, flags=re.I):
+            # add a SELECT clause at the beginning
+            sql_query = f"SELECT {sql_query}"
+        if not re.search(r"FROM\s", sql_query, flags=re.I):
+            # add a FROM clause at the end
+            sql_query = f"{sql_query} FROM {sql_table_name if sql_table_name is not None else view_name}"
+        return sql_query
+
+    @classmethod
+    def get_derived_table_sql_queries(cls, looker_view: dict) -> List[str]:
+        """
+        Returns the queries that are parsed for the derived table of a view, so that they
+        can be parsed ahead of time. This doesn't resolve extended views, so the queries
+        of views that inherit their derived table or sql_table_name may differ.
+        """
+        derived_table = looker_view.get("derived_table")
+        if not isinstance(derived_table, dict) or "sql" not in derived_table:
+            return []
+        sql_query: str = derived_table["sql"]
+        sql_table_name: Optional[str] = looker_view.get("sql_table_name")
+        if sql_table_name is not None:
+            sql_table_name = sql_table_name.replace('"', "").replace("`", "")
+
+        queries = []
+        if "{%" in sql_query:
+            queries.append(sql_query)
+        queries.append(
+            cls._complete_sql_query(sql_query, sql_table_name, looker_view["name"])
+        )
+        return queries
+
     @classmethod
     def resolve_extends_view_name(
         cls,
@@ -1116,6 +1311,9 @@ class LookMLSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
         self.source_config = config
         self.reporter = LookMLSourceReport()
+        self.file_cache = LookMLFileCache(
+            self.reporter, self.source_config.lookml_cache_dir
+        )
         if self.source_config.api:
             self.looker_client = LookerAPI(self.source_config.api)
             self.reporter._looker_api = self.looker_client
@@ -1135,19 +1333,75 @@ class LookMLSource(StatefulIngestionSourceBase):
         )
 
     def _load_model(self, path: str) -> LookerModel:
-        with open(path, "r") as file:
-            logger.debug(f"Loading model from file {path}")
-            parsed = lkml.load(file)
-            looker_model = LookerModel.from_looker_dict(
-                parsed,
-                _BASE_PROJECT_NAME,
-                str(self.source_config.base_folder),
-                self.base_projects_folder,
-                path,
-                self.reporter,
-            )
+        logger.debug(f"Loading model from file {path}")
+        parsed = self.file_cache.load(path)
+        looker_model = LookerModel.from_looker_dict(
+            parsed,
+            _BASE_PROJECT_NAME,
+            str(self.source_config.base_folder),
+            self.base_projects_folder,
+            path,
+            self.reporter,
+            self.file_cache,
+        )
         return looker_model
 
+    def _parse_upfront(self) -> None:
+        """
+        Parses all LookML files of the project and its dependencies on a pool of
+        processes, instead of one at a time as they are included.
+        """
+        start_time = datetime.now()
+        paths = sorted(
+            {
+                str(path)
+                for folder in self.base_projects_folder.values()
+                for path in pathlib.Path(folder).glob("**/*.lkml")
+                # Dashboards are not LookML, we get those through the looker source.
+                if not path.name.endswith(".dashboard.lkml")
+            }
+        )
+        logger.info(f"Parsing {len(paths)} LookML files upfront")
+        self.file_cache.preload(paths, self.source_config.parse_workers)
+        if self.source_config.parse_table_names_from_sql:
+            self._parse_derived_table_sql_upfront(paths)
+        self.reporter.lookml_parse_upfront_time = datetime.now() - start_time
+
+    def _parse_derived_table_sql_upfront(self, paths: List[str]) -> None:
+        parser_cls = LookerView._import_sql_parser_cls(self.source_config.sql_parser)
+        if not issubclass(parser_cls, SqlLineageSQLParser):
+            # Only parsers that run on the SQL parser worker pool gain from this.
+            return
+
+        queries: Dict[str, None] = {}
+        for path in paths:
+            if not path.endswith((_VIEW_FILE_EXTENSION, _EXPLORE_FILE_EXTENSION)):
+                continue
+            try:
+                parsed = self.file_cache.load(path)
+            except Exception:
+                # Reported once the file is included.
+                continue
+            for view in parsed.get("views", []):
+                queries.update(
+                    dict.fromkeys(LookerView.get_derived_table_sql_queries(view))
+                )
+
+        def _parse(sql_query: str) -> None:
+            # The results are kept in the SQL parse cache, from where they are picked
+            # up when the views are processed. Failures are reported at that point.
+            try:
+                parser_cls(sql_query, use_external_process=True)
+            except Exception as e:
+                logger.debug(f"Failed to parse derived table sql {sql_query}: {e}")
+
+        logger.info(f"Parsing {len(queries)} derived table queries upfront")
+        with ThreadPoolExecutor(
+            max_workers=get_sql_parser_pool().max_workers
+        ) as executor:
+            for _ in executor.map(_parse, queries):
+                pass
+
     def _platform_names_have_2_parts(self, platform: str) -> bool:
         return platform in {"hive", "mysql", "athena"}
 
@@ -1579,10 +1833,14 @@ class LookMLSource(StatefulIngestionSourceBase):
     def get_internal_workunits(self) -> Iterable[MetadataWorkUnit]:  # noqa: C901
         assert self.source_config.base_folder
 
+        if self.source_config.parse_workers:
+            self._parse_upfront()
+
         viewfile_loader = LookerViewFileLoader(
             str(self.source_config.base_folder),
             self.base_projects_folder,
             self.reporter,
+            self.file_cache,
         )
 
         # some views can be mentioned by multiple 'include' statements and can be included via different connections.
@@ -110,6 +110,7 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     filtered_dashboards: List[str] = dataclass_field(default_factory=list)
     filtered_charts: List[str] = dataclass_field(default_factory=list)
     number_of_workspaces: int = 0
+    m_query_parse_cache_hits: int = 0
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -177,6 +178,21 @@ class PowerBiDashboardSourceConfig(StatefulIngestionConfigBase):
     scan_timeout: int = pydantic.Field(
         default=60, description="timeout for PowerBI metadata scanning"
     )
+    # Number of workspaces submitted to one admin API scan job
+    scan_batch_size: int = pydantic.Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Number of workspaces that are scanned together by one admin API scan job. The admin API "
+        "accepts up to 100 workspaces per scan job.",
+    )
+    # Number of threads used to call the PowerBI APIs
+    max_workers: int = pydantic.Field(
+        default=4,
+        ge=1,
+        description="Number of threads used to call the PowerBI APIs. Scan jobs of upcoming workspaces and the "
+        "details of dashboards, tiles, reports, datasets and users are fetched concurrently.",
+    )
     # Enable/Disable extracting ownership information of Dashboard
     extract_ownership: bool = pydantic.Field(
         default=False,
@@ -220,6 +236,14 @@ class PowerBiDashboardSourceConfig(StatefulIngestionConfigBase):
         default=True,
         description="Whether to convert the urns of ingested lineage dataset to lowercase",
     )
+    # Number of processes used to parse the M-Query expressions of a workspace upfront
+    m_query_parse_workers: int = pydantic.Field(
+        default=0,
+        ge=0,
+        description="Number of processes used to parse the M-Query expressions of all tables of a workspace upfront. "
+        "If 0, each expression is parsed when the lineage of its table is extracted. "
+        "Either way, identical expressions are parsed only once.",
+    )
     # Configuration for stateful ingestion
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = pydantic.Field(
         default=None, description="PowerBI Stateful Ingestion Config."
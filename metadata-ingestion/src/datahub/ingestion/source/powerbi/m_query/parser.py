@@ -1,7 +1,10 @@
 import importlib.resources as pkg_resource
 import logging
 import sys
-from typing import List, Optional, cast
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union, cast
 
 import lark
 from lark import Lark, Tree
@@ -13,19 +16,99 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
 logger = logging.getLogger(__name__)
 
 lark_parser: Optional[Lark] = None
+_lark_parser_lock = threading.Lock()
 
+# Many tables share the same expression, so parse trees are cached by expression text.
+# Expressions that failed to parse are cached along with their error.
+PARSE_TREE_CACHE_SIZE = 5000
+_parse_tree_cache: "OrderedDict[str, Union[Tree, Exception]]" = OrderedDict()
+_parse_tree_cache_lock = threading.Lock()
 
-def get_lark_parser():
+
+def get_lark_parser() -> Lark:
     global lark_parser
-    if lark_parser is not None:
+    with _lark_parser_lock:
+        if lark_parser is not None:
+            return lark_parser
+
+        # Read lexical grammar as text
+        grammar: str = pkg_resource.read_text(
+            "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
+        )
+        # Create lark parser for the grammar text. The grammar is ambiguous, so it
+        # needs the Earley parser and can't be compiled to LALR.
+        lark_parser = Lark(grammar, start="let_expression", regex=True)
         return lark_parser
 
-    # Read lexical grammar as text
-    grammar: str = pkg_resource.read_text(
-        "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
-    )
-    # Create lark parser for the grammar text
-    return Lark(grammar, start="let_expression", regex=True)
+
+def _get_cached_parse_tree(expression: str) -> Optional[Union[Tree, Exception]]:
+    with _parse_tree_cache_lock:
+        cached = _parse_tree_cache.get(expression)
+        if cached is not None:
+            _parse_tree_cache.move_to_end(expression)
+        return cached
+
+
+def _add_cached_parse_tree(expression: str, result: Union[Tree, Exception]) -> None:
+    with _parse_tree_cache_lock:
+        _parse_tree_cache[expression] = result
+        _parse_tree_cache.move_to_end(expression)
+        while len(_parse_tree_cache) > PARSE_TREE_CACHE_SIZE:
+            _parse_tree_cache.popitem(last=False)
+
+
+def clear_parse_tree_cache() -> None:
+    with _parse_tree_cache_lock:
+        _parse_tree_cache.clear()
+
+
+def _parse_expression_in_worker(expression: str) -> Optional[Tree]:
+    # Errors are not sent back, the expression is parsed again when it is used and
+    # the error is reported for the table at that point.
+    try:
+        return _parse_expression(expression)
+    except Exception:
+        return None
+
+
+def parse_expressions(expressions: Iterable[str], executor: Executor) -> None:
+    """
+    Parses the expressions that are not cached yet on the given executor, usually a
+    process pool, and caches the parse trees for get_upstream_tables.
+    """
+    to_parse = [
+        expression
+        for expression in dict.fromkeys(expressions)
+        if _get_cached_parse_tree(expression) is None
+    ]
+    # Don't parse more than fits in the cache, or parse trees would be evicted before
+    # they are used.
+    to_parse = to_parse[:PARSE_TREE_CACHE_SIZE]
+    if not to_parse:
+        return
+    logger.debug(f"Parsing {len(to_parse)} expressions upfront")
+    for expression, parse_tree in zip(
+        to_parse, executor.map(_parse_expression_in_worker, to_parse)
+    ):
+        if parse_tree is not None:
+            _add_cached_parse_tree(expression, parse_tree)
+
+
+def _get_parse_tree(expression: str, reporter: PowerBiDashboardSourceReport) -> Tree:
+    cached = _get_cached_parse_tree(expression)
+    if cached is None:
+        try:
+            cached = _parse_expression(expression)
+        except Exception as e:
+            cached = e
+        _add_cached_parse_tree(expression, cached)
+    else:
+        reporter.m_query_parse_cache_hits += 1
+
+    if isinstance(cached, Exception):
+        # Drop the traceback of earlier raises, so it doesn't grow with every reuse.
+        raise cached.with_traceback(None)
+    return cached
 
 
 def _parse_expression(expression: str) -> Tree:
@@ -53,7 +136,7 @@ def get_upstream_tables(
         return []
 
     try:
-        parse_tree: Tree = _parse_expression(table.expression)
+        parse_tree: Tree = _get_parse_tree(table.expression, reporter)
 
         valid, message = validator.validate_parse_tree(
             parse_tree, native_query_enabled=native_query_enabled
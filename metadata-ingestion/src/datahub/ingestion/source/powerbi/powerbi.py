@@ -5,6 +5,7 @@
 #########################################################
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterable, List, Optional, Tuple, Union, cast
 
 import datahub.emitter.mce_builder as builder
@@ -900,6 +901,15 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
 
         self.mapper = Mapper(config, self.reporter)
 
+        self.m_query_parse_executor: Optional[ProcessPoolExecutor] = None
+        if (
+            self.source_config.extract_lineage
+            and self.source_config.m_query_parse_workers
+        ):
+            self.m_query_parse_executor = ProcessPoolExecutor(
+                max_workers=self.source_config.m_query_parse_workers
+            )
+
         # Create and register the stateful ingestion use-case handler.
         self.stale_entity_removal_handler = StaleEntityRemovalHandler(
             source=self,
@@ -950,9 +960,20 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
         # Validate dataset type mapping
         self.validate_dataset_type_mapping()
         # Fetch PowerBi workspace for given workspace identifier
-        for workspace in self.get_allowed_workspaces():
-            logger.info(f"Scanning workspace id: {workspace.id}")
-            self.powerbi_client.fill_workspace(workspace, self.reporter)
+        for workspace in self.powerbi_client.fill_workspaces(
+            self.get_allowed_workspaces(), self.reporter
+        ):
+            logger.info(f"Scanned workspace id: {workspace.id}")
+            if self.m_query_parse_executor is not None:
+                parser.parse_expressions(
+                    (
+                        table.expression
+                        for dataset in workspace.datasets.values()
+                        for table in dataset.tables
+                        if table.expression is not None
+                    ),
+                    self.m_query_parse_executor,
+                )
 
             if self.source_config.extract_workspaces_to_containers:
                 workspace_workunits = self.mapper.generate_container_for_workspace(
@@ -963,17 +984,10 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
                     # Return workunit to Datahub Ingestion framework
                     yield workunit
             for dashboard in workspace.dashboards:
-                try:
-                    # Fetch PowerBi users for dashboards
-                    dashboard.users = self.powerbi_client.get_dashboard_users(dashboard)
-                    # Increase dashboard and tiles count in report
-                    self.reporter.report_dashboards_scanned()
-                    self.reporter.report_charts_scanned(count=len(dashboard.tiles))
-                except Exception as e:
-                    message = f"Error ({e}) occurred while loading dashboard {dashboard.displayName}(id={dashboard.id}) tiles."
-
-                    logger.exception(message, e)
-                    self.reporter.report_warning(dashboard.id, message)
+                # Dashboard tiles and users are fetched along with the workspace
+                # Increase dashboard and tiles count in report
+                self.reporter.report_dashboards_scanned()
+                self.reporter.report_charts_scanned(count=len(dashboard.tiles))
                 # Convert PowerBi Dashboard and child entities to Datahub work unit to ingest into Datahub
                 workunits = self.mapper.to_datahub_work_units(dashboard, workspace)
                 for workunit in workunits:
@@ -996,3 +1010,10 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        if self.m_query_parse_executor is not None:
+            self.m_query_parse_executor.shutdown()
+            self.m_query_parse_executor = None
+        self.powerbi_client.close()
+        super().close()
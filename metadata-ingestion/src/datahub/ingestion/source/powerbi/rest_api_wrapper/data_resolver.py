@@ -1,8 +1,10 @@
 import logging
 import math
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
 
 import msal
 import requests
@@ -25,6 +27,9 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import (
 # Logger instance
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def is_permission_error(e: Exception) -> bool:
     if not isinstance(e, requests.exceptions.HTTPError):
@@ -45,6 +50,7 @@ class DataResolverBase(ABC):
         client_id: str,
         client_secret: str,
         tenant_id: str,
+        max_workers: int = 1,
     ):
         self.__access_token: Optional[str] = None
         self.__tenant_id = tenant_id
@@ -60,18 +66,26 @@ class DataResolverBase(ABC):
 
         logger.info("Connected to {}".format(self._get_authority_url()))
         self._request_session = requests.Session()
-        # set re-try parameter for request_session
+        # set re-try parameter for request_session. Requests that are rate limited (429)
+        # are retried after the delay given by the Retry-After header of the response.
         self._request_session.mount(
             "https://",
             HTTPAdapter(
+                pool_maxsize=max(max_workers, 10),
                 max_retries=Retry(
-                    total=3,
+                    total=5,
                     backoff_factor=1,
                     allowed_methods=None,
                     status_forcelist=[429, 500, 502, 503, 504],
-                )
+                    respect_retry_after_header=True,
+                ),
             ),
         )
+        # Fetches the details of entities concurrently.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="powerbi-api"
+        )
+        self._thread_local = threading.local()
 
     @abstractmethod
     def get_groups_endpoint(self) -> str:
@@ -103,6 +117,28 @@ class DataResolverBase(ABC):
     def get_users(self, workspace_id: str, entity: str, entity_id: str) -> List[User]:
         pass
 
+    def map_concurrently(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Calls func for all items on the thread pool of the resolver and returns the
+        results in order. Calls made from a thread of the pool run inline, so that
+        nested calls can't wait on each other for a free thread.
+        """
+        items = list(items)
+        if len(items) <= 1 or getattr(self._thread_local, "in_pool", False):
+            return [func(item) for item in items]
+
+        def _call(item: T) -> R:
+            self._thread_local.in_pool = True
+            try:
+                return func(item)
+            finally:
+                self._thread_local.in_pool = False
+
+        return list(self._executor.map(_call, items))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
     def _get_authority_url(self):
         return "{}{}".format(DataResolverBase.AUTHORITY, self.__tenant_id)
 
@@ -239,6 +275,13 @@ class DataResolverBase(ABC):
             logger.debug(f"Request response = {response_dict}")
             return response_dict.get(Constant.VALUE, [])
 
+        raw_instances: List[dict] = fetch_reports()
+        pages: List[List[Page]] = self.map_concurrently(
+            lambda raw_instance: self._get_pages_by_report(
+                workspace=workspace, report_id=raw_instance[Constant.ID]
+            ),
+            raw_instances,
+        )
         reports: List[Report] = [
             Report(
                 id=raw_instance.get(Constant.ID),
@@ -246,14 +289,12 @@ class DataResolverBase(ABC):
                 webUrl=raw_instance.get(Constant.WEB_URL),
                 embedUrl=raw_instance.get(Constant.EMBED_URL),
                 description=raw_instance.get(Constant.DESCRIPTION),
-                pages=self._get_pages_by_report(
-                    workspace=workspace, report_id=raw_instance[Constant.ID]
-                ),
+                pages=report_pages,
                 users=[],  # It will be fetched using Admin Fetcher based on condition
                 tags=[],  # It will be fetched using Admin Fetcher based on condition
                 dataset=workspace.datasets.get(raw_instance.get(Constant.DATASET_ID)),
             )
-            for raw_instance in fetch_reports()
+            for raw_instance, report_pages in zip(raw_instances, pages)
         ]
 
         return reports
@@ -469,11 +510,11 @@ class AdminAPIResolver(DataResolverBase):
         Constant.DATASET_LIST: "{POWERBI_ADMIN_BASE_URL}/groups/{WORKSPACE_ID}/datasets",
     }
 
-    def create_scan_job(self, workspace_id: str) -> str:
+    def create_scan_job(self, workspace_ids: List[str]) -> str:
         """
-        Create scan job on PowerBI for the workspace
+        Create scan job on PowerBI for the workspaces, at most 100 per scan job
         """
-        request_body = {"workspaces": [workspace_id]}
+        request_body = {"workspaces": workspace_ids}
 
         scan_create_endpoint = AdminAPIResolver.API_ENDPOINTS[Constant.SCAN_CREATE]
         scan_create_endpoint = scan_create_endpoint.format(
@@ -498,7 +539,7 @@ class AdminAPIResolver(DataResolverBase):
         )
 
         res.raise_for_status()
-        # Return scan_id of Scan created for the given workspace
+        # Return scan_id of Scan created for the given workspaces
         scan_id = res.json()["id"]
 
         logger.debug(f"Scan id({scan_id})")
@@ -616,7 +657,7 @@ class AdminAPIResolver(DataResolverBase):
 
         return users
 
-    def get_scan_result(self, scan_id: str) -> Optional[dict]:
+    def get_scan_result(self, scan_id: str) -> List[dict]:
         logger.info("Fetching scan result")
         logger.info(f"{Constant.SCAN_ID}={scan_id}")
         scan_result_get_endpoint = AdminAPIResolver.API_ENDPOINTS[
@@ -643,9 +684,9 @@ class AdminAPIResolver(DataResolverBase):
             logger.warning(
                 f"Scan result is not available for scan identifier = {scan_id}"
             )
-            return None
+            return []
 
-        return res.json()["workspaces"][0]
+        return res.json()["workspaces"]
 
     def get_groups_endpoint(self) -> str:
         return f"{AdminAPIResolver.ADMIN_BASE_URL}/groups"
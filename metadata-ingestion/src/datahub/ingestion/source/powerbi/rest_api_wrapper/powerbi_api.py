@@ -1,7 +1,10 @@
+import itertools
 import json
 import logging
 import sys
-from typing import Any, Dict, List, Optional, cast
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, cast
 
 import requests
 
@@ -16,6 +19,7 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import (
     PowerBIDataset,
     Report,
     Table,
+    Tile,
     User,
     Workspace,
 )
@@ -36,14 +40,20 @@ class PowerBiAPI:
             client_id=self.__config.client_id,
             client_secret=self.__config.client_secret,
             tenant_id=self.__config.tenant_id,
+            max_workers=self.__config.max_workers,
         )
 
         self.__admin_api_resolver = AdminAPIResolver(
             client_id=self.__config.client_id,
             client_secret=self.__config.client_secret,
             tenant_id=self.__config.tenant_id,
+            max_workers=self.__config.max_workers,
         )
 
+    def close(self) -> None:
+        self.__regular_api_resolver.close()
+        self.__admin_api_resolver.close()
+
     def log_http_error(self, message: str) -> Any:
         logger.warning(message)
         _, e, _ = sys.exc_info()
@@ -162,10 +172,14 @@ class PowerBiAPI:
                 )
                 return
 
-            for report in reports:
-                report.users = self.get_report_users(
+            users: List[List[User]] = self.__admin_api_resolver.map_concurrently(
+                lambda report: self.get_report_users(
                     workspace_id=workspace.id, report_id=report.id
-                )
+                ),
+                reports,
+            )
+            for report, report_users in zip(reports, users):
+                report.users = report_users
 
         def fill_tags() -> None:
             if self.__config.extract_endorsements_to_tags is False:
@@ -204,22 +218,28 @@ class PowerBiAPI:
         ]
         return workspaces
 
-    def _get_scan_result(self, workspace: Workspace) -> Any:
+    def _get_scan_results(self, workspaces: List[Workspace]) -> Dict[str, dict]:
+        """
+        Scan the workspaces with one scan job and return the scan results by lower-cased workspace id
+        """
         scan_id: Optional[str] = None
         try:
             scan_id = self.__admin_api_resolver.create_scan_job(
-                workspace_id=workspace.id
+                workspace_ids=[workspace.id for workspace in workspaces]
             )
         except:
+            workspace_names: str = ", ".join(
+                f"{workspace.name}({workspace.id})" for workspace in workspaces
+            )
             e = self.log_http_error(
-                message=f"Unable to fetch dataset lineage for {workspace.name}({workspace.id})."
+                message=f"Unable to fetch dataset lineage for {workspace_names}."
             )
             if data_resolver.is_permission_error(cast(Exception, e)):
                 logger.warning(
                     "Dataset lineage can not be ingestion because this user does not have access to the PowerBI Admin "
                     "API. "
                 )
-            return None
+            return {}
 
         logger.info("Waiting for scan to complete")
         if (
@@ -234,11 +254,14 @@ class PowerBiAPI:
             )
 
         # Scan is complete lets take the result
-        scan_result = self.__admin_api_resolver.get_scan_result(scan_id=scan_id)
-        pretty_json: str = json.dumps(scan_result, indent=1)
+        scan_results = self.__admin_api_resolver.get_scan_result(scan_id=scan_id)
+        pretty_json: str = json.dumps(scan_results, indent=1)
         logger.debug(f"scan result = {pretty_json}")
 
-        return scan_result
+        return {
+            scan_result[Constant.ID].lower(): scan_result
+            for scan_result in scan_results
+        }
 
     @staticmethod
     def _parse_endorsement(endorsements: Optional[dict]) -> List[str]:
@@ -271,11 +294,16 @@ class PowerBiAPI:
 
         logger.debug("Processing scan result for datasets")
 
-        for dataset_dict in datasets:
-            dataset_instance: PowerBIDataset = self._get_resolver().get_dataset(
+        resolver = self._get_resolver()
+        dataset_instances: List[PowerBIDataset] = resolver.map_concurrently(
+            lambda dataset_dict: resolver.get_dataset(
                 workspace_id=scan_result[Constant.ID],
                 dataset_id=dataset_dict[Constant.ID],
-            )
+            ),
+            datasets,
+        )
+
+        for dataset_dict, dataset_instance in zip(datasets, dataset_instances):
 
             if self.__config.extract_endorsements_to_tags:
                 dataset_instance.tags = self._parse_endorsement(
@@ -310,8 +338,10 @@ class PowerBiAPI:
 
         return dataset_map
 
-    def _fill_metadata_from_scan_result(self, workspace: Workspace) -> None:
-        workspace.scan_result = self._get_scan_result(workspace)
+    def _fill_metadata_from_scan_result(
+        self, workspace: Workspace, scan_result: Optional[dict]
+    ) -> None:
+        workspace.scan_result = scan_result
         workspace.datasets = self._get_workspace_datasets(workspace.scan_result)
         # Fetch endorsements tag if it is enabled from configuration
         if self.__config.extract_endorsements_to_tags is False:
@@ -330,12 +360,24 @@ class PowerBiAPI:
 
     def _fill_regular_metadata_detail(self, workspace: Workspace) -> None:
         def fill_dashboards() -> None:
-            workspace.dashboards = self._get_resolver().get_dashboards(workspace)
+            resolver = self._get_resolver()
+            workspace.dashboards = resolver.get_dashboards(workspace)
             # set tiles of Dashboard
-            for dashboard in workspace.dashboards:
-                dashboard.tiles = self._get_resolver().get_tiles(
-                    workspace, dashboard=dashboard
-                )
+            tiles: List[List[Tile]] = resolver.map_concurrently(
+                lambda dashboard: resolver.get_tiles(workspace, dashboard=dashboard),
+                workspace.dashboards,
+            )
+            for dashboard, dashboard_tiles in zip(workspace.dashboards, tiles):
+                dashboard.tiles = dashboard_tiles
+
+        def fill_dashboard_users() -> None:
+            if self.__config.extract_ownership is False:
+                return
+            users: List[List[User]] = self.__admin_api_resolver.map_concurrently(
+                self.get_dashboard_users, workspace.dashboards
+            )
+            for dashboard, dashboard_users in zip(workspace.dashboards, users):
+                dashboard.users = dashboard_users
 
         def fill_reports() -> None:
             if self.__config.extract_reports is False:
@@ -355,16 +397,52 @@ class PowerBiAPI:
                 dashboard.tags = workspace.dashboard_endorsements.get(dashboard.id, [])
 
         fill_dashboards()
+        fill_dashboard_users()
         fill_reports()
         fill_dashboard_tags()
 
+    def _fill_scanned_workspaces(
+        self, workspaces: List[Workspace], scan: "Future[Dict[str, dict]]"
+    ) -> Iterable[Workspace]:
+        scan_results: Dict[str, dict] = scan.result()
+        for workspace in workspaces:
+            self._fill_metadata_from_scan_result(
+                workspace=workspace,
+                scan_result=scan_results.get(workspace.id.lower()),
+            )  # First try to fill the admin detail as some regular metadata contains lineage to admin metadata
+
+            self._fill_regular_metadata_detail(workspace=workspace)
+            yield workspace
+
     # flake8: noqa: C901
+    def fill_workspaces(
+        self, workspaces: Iterable[Workspace], reporter: PowerBiDashboardSourceReport
+    ) -> Iterable[Workspace]:
+        """
+        Fill the workspaces and yield them in the given order. Workspaces are scanned in batches of
+        scan_batch_size, and the scan jobs of up to max_workers upcoming batches run in the background
+        while the current batch is filled.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.__config.max_workers, thread_name_prefix="powerbi-scan"
+        ) as executor:
+            pending: Deque[Tuple[List[Workspace], Future]] = deque()
+            workspace_iter = iter(workspaces)
+            while True:
+                batch = list(
+                    itertools.islice(workspace_iter, self.__config.scan_batch_size)
+                )
+                if not batch:
+                    break
+                pending.append((batch, executor.submit(self._get_scan_results, batch)))
+                if len(pending) > self.__config.max_workers:
+                    yield from self._fill_scanned_workspaces(*pending.popleft())
+
+            while pending:
+                yield from self._fill_scanned_workspaces(*pending.popleft())
+
     def fill_workspace(
         self, workspace: Workspace, reporter: PowerBiDashboardSourceReport
     ) -> None:
-
-        self._fill_metadata_from_scan_result(
-            workspace=workspace
-        )  # First try to fill the admin detail as some regular metadata contains lineage to admin metadata
-
-        self._fill_regular_metadata_detail(workspace=workspace)
+        for _ in self.fill_workspaces([workspace], reporter):
+            pass
@@ -0,0 +1,155 @@
+"""
+Helpers to profile partitioned tables incrementally. The mergeable statistics of each
+profiled partition are kept, so that only new or modified partitions need to be
+profiled, and a table-level profile is merged from the statistics of all partitions.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.state.profiling_state import (
+    ColumnProfileStats,
+    PartitionProfileStats,
+)
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+)
+
+
+def get_partition_stats(
+    profile: DatasetProfileClass, last_modified: Optional[int]
+) -> PartitionProfileStats:
+    """Extracts the mergeable statistics from the profile of a partition."""
+    columns: Dict[str, ColumnProfileStats] = {}
+    for field_profile in profile.fieldProfiles or []:
+        mean: Optional[float] = None
+        if field_profile.mean is not None:
+            try:
+                mean = float(field_profile.mean)
+            except ValueError:
+                pass
+        columns[field_profile.fieldPath] = ColumnProfileStats(
+            null_count=field_profile.nullCount,
+            min=field_profile.min,
+            max=field_profile.max,
+            mean=mean,
+        )
+    return PartitionProfileStats(
+        last_modified=last_modified,
+        row_count=profile.rowCount or 0,
+        columns=columns,
+    )
+
+
+def get_partitions_to_profile(
+    partitions: Dict[str, Optional[int]],
+    partition_stats: Dict[str, PartitionProfileStats],
+    max_partitions: Optional[int] = None,
+) -> List[str]:
+    """
+    Returns the ids of the partitions that are new or were modified since they were
+    profiled, given the last modification time of every partition. The newest
+    partitions come first, and at most max_partitions are returned if it is set.
+    """
+    changed = [
+        partition
+        for partition, last_modified in partitions.items()
+        if partition not in partition_stats
+        or last_modified is None
+        or partition_stats[partition].last_modified != last_modified
+    ]
+    return sorted(changed, reverse=True)[:max_partitions]
+
+
+def _as_number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _merge_extreme(
+    values: Iterable[Optional[str]], pick: Callable[[Iterable[Any]], Any]
+) -> Optional[str]:
+    # Numeric values are compared as numbers, and other values, like ISO formatted
+    # dates, as strings.
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    numbers = [_as_number(value) for value in present]
+    if all(number is not None for number in numbers):
+        return pick(zip(numbers, present))[1]
+    return pick(present)
+
+
+def merge_partition_stats(
+    partition_stats: Iterable[PartitionProfileStats],
+    total_row_count: Optional[int] = None,
+) -> DatasetProfileClass:
+    """
+    Merges the statistics of partitions into a table-level profile. The row counts,
+    null counts, min, max and mean values are merged, while distinct counts, medians,
+    quantiles and histograms cannot be merged and are left out.
+
+    If the total row count of the table is given and the partitions cover only part
+    of it, the null counts are extrapolated to the whole table, and the profile
+    records the fraction of rows that the partitions cover.
+    """
+    partitions = list(partition_stats)
+    covered_row_count = sum(partition.row_count for partition in partitions)
+    column_names: Dict[str, None] = {}
+    for partition in partitions:
+        column_names.update(dict.fromkeys(partition.columns))
+
+    profile = DatasetProfileClass(
+        timestampMillis=get_sys_time(),
+        rowCount=covered_row_count,
+        columnCount=len(column_names),
+        fieldProfiles=[],
+    )
+    scale = 1.0
+    if total_row_count is not None and covered_row_count < total_row_count:
+        profile.rowCount = total_row_count
+        if covered_row_count > 0:
+            scale = total_row_count / covered_row_count
+            profile.partitionCoverage = covered_row_count / total_row_count
+
+    for column in column_names:
+        column_stats = [
+            (partition.row_count, partition.columns[column])
+            for partition in partitions
+            if column in partition.columns
+        ]
+        field_profile = DatasetFieldProfileClass(fieldPath=column)
+
+        if all(stats.null_count is not None for _, stats in column_stats):
+            row_count = sum(rows for rows, _ in column_stats)
+            null_count = sum(stats.null_count or 0 for _, stats in column_stats)
+            field_profile.nullCount = int(round(null_count * scale))
+            if row_count > 0:
+                field_profile.nullProportion = min(1, null_count / row_count)
+
+        field_profile.min = _merge_extreme(
+            (stats.min for _, stats in column_stats), min
+        )
+        field_profile.max = _merge_extreme(
+            (stats.max for _, stats in column_stats), max
+        )
+
+        # The means are weighted by the number of non-null values of each partition.
+        weighted_means = [
+            (rows - (stats.null_count or 0), stats.mean)
+            for rows, stats in column_stats
+            if stats.mean is not None
+        ]
+        total_weight = sum(weight for weight, _ in weighted_means)
+        if weighted_means and total_weight > 0:
+            field_profile.mean = str(
+                sum(weight * mean for weight, mean in weighted_means) / total_weight
+            )
+
+        assert profile.fieldProfiles is not None
+        profile.fieldProfiles.append(field_profile)
+
+    return profile
@@ -58,7 +58,13 @@ class DataLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
+    )
+
+    max_bytes: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="Maximum number of bytes to read when inferring schemas for JSON files. "
+        "If not set, the file is read until max_rows records have been sampled.",
     )
 
     verify_ssl: Union[bool, str] = Field(
@@ -208,9 +208,8 @@ class S3Source(Source):
 
     Schemas for Parquet and Avro files are extracted as provided.
 
-    Schemas for schemaless formats (CSV, TSV, JSON) are inferred. For CSV and TSV files, we consider the first 100 rows by default, which can be controlled via the `max_rows` recipe parameter (see [below](#config-details))
-    JSON file schemas are inferred on the basis of the entire file (given the difficulty in extracting only the first few objects of the file), which may impact performance.
-    We are working on using iterator-based JSON parsers to avoid reading in the entire JSON object.
+    Schemas for schemaless formats (CSV, TSV, JSON) are inferred. For CSV, TSV and JSON files, we consider the first 100 rows by default, which can be controlled via the `max_rows` recipe parameter (see [below](#config-details))
+    JSON files are parsed incrementally, so only the sampled records are read. The sample can additionally be limited to a number of bytes with the `max_bytes` recipe parameter.
 
     Note that because the profiling is run with PySpark, we require Spark 3.0.3 with Hadoop 3.2 to be installed (see [compatibility](#compatibility) for more details). If profiling, make sure that permissions for **s3a://** access are set because Spark and Hadoop use the s3a:// protocol to interface with AWS (schema inference outside of profiling requires s3:// access).
     Enabling profiling will slow down ingestion runs.
@@ -407,7 +406,10 @@ class S3Source(Source):
                     max_rows=self.source_config.max_rows
                 ).infer_schema(file)
             elif extension == ".json":
-                fields = json.JsonInferrer().infer_schema(file)
+                fields = json.JsonInferrer(
+                    max_rows=self.source_config.max_rows,
+                    max_bytes=self.source_config.max_bytes,
+                ).infer_schema(file)
             elif extension == ".avro":
                 fields = avro.AvroInferrer().infer_schema(file)
             else:
@@ -1,11 +1,13 @@
+import io
+import itertools
 import logging
-from typing import IO, Dict, List, Type, Union
+from typing import IO, Any, Dict, Iterable, List, Optional, Type, Union
 
-import jsonlines as jsl
+import ijson
 import ujson
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
-from datahub.ingestion.source.schema_inference.object import construct_schema
+from datahub.ingestion.source.schema_inference.object import SchemaBuilder
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     ArrayTypeClass,
     BooleanTypeClass,
@@ -32,20 +34,106 @@ _field_type_mapping: Dict[Union[Type, str], Type] = {
 logger = logging.getLogger(__name__)
 
 
+# The read-ahead of the sampled file, which is small so that little is read beyond
+# the sampled rows.
+_BUFFER_SIZE = 64 * 1024
+
+
+class _LimitedReader(io.RawIOBase):
+    """Reads at most `max_bytes` bytes of a file, or the whole file if it is None."""
+
+    def __init__(self, file: IO[bytes], max_bytes: Optional[int]):
+        self.file = file
+        self.max_bytes = max_bytes
+        self.position = 0
+
+    @property
+    def limit_reached(self) -> bool:
+        return self.max_bytes is not None and self.position >= self.max_bytes
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = len(buffer)
+        if self.max_bytes is not None:
+            size = min(size, self.max_bytes - self.position)
+            if size <= 0:
+                return 0
+        data = self.file.read(size)
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def seekable(self) -> bool:
+        return self.file.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self.position = self.file.seek(offset, whence)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+
+def _iterate_json_documents(file: IO[bytes]) -> Iterable[Any]:
+    """
+    Streams the records of a JSON file: the items of a top-level array, or otherwise
+    each top-level value, which covers a single object as well as JSON lines.
+    """
+    head = file.peek(_BUFFER_SIZE).lstrip()  # type: ignore
+    if head.startswith(b"["):
+        return ijson.items(file, "item", use_float=True)
+    return ijson.items(file, "", multiple_values=True, use_float=True)
+
+
+def _iterate_json_lines_documents(file: IO[bytes]) -> Iterable[Any]:
+    """Streams the records of a JSON lines file, skipping invalid lines."""
+    for line in file:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield ujson.loads(line)
+        except ValueError:
+            continue
+
+
 class JsonInferrer(SchemaInferenceBase):
+    """
+    Infers the schema of a JSON or JSON lines file. The records are streamed and folded
+    into the schema one at a time, and only the first `max_rows` records and
+    `max_bytes` bytes of the file are read, if set.
+    """
+
+    def __init__(self, max_rows: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+    def _add_documents(self, builder: SchemaBuilder, documents: Iterable[Any]) -> None:
+        records = (doc for doc in documents if isinstance(doc, dict))
+        for record in itertools.islice(records, self.max_rows):
+            builder.add_document(record)
+
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
+        reader = _LimitedReader(file, self.max_bytes)
+        stream = io.BufferedReader(reader, buffer_size=_BUFFER_SIZE)
+        builder = SchemaBuilder()
         try:
-            datastore = ujson.load(file)
-        except ujson.JSONDecodeError as e:
-            logger.info(f"Got ValueError: {e}. Retry with jsonlines")
-            file.seek(0)
-            reader = jsl.Reader(file)
-            datastore = [obj for obj in reader.iter(type=dict, skip_invalid=True)]
-
-        if not isinstance(datastore, list):
-            datastore = [datastore]
+            self._add_documents(builder, _iterate_json_documents(stream))
+        except ijson.JSONError as e:
+            if reader.limit_reached:
+                # The sample ends in the middle of a record.
+                logger.debug(
+                    f"Inferred schema from the first {builder.document_count} records"
+                )
+            else:
+                logger.info(f"Got JSONError: {e}. Retry as JSON lines")
+                stream.seek(0)
+                builder = SchemaBuilder()
+                self._add_documents(builder, _iterate_json_lines_documents(stream))
+        schema = builder.build(delimiter=".")
 
-        schema = construct_schema(datastore, delimiter=".")
         fields: List[SchemaField] = []
 
         for schema_field in sorted(schema.values(), key=lambda x: x["delimited_name"]):
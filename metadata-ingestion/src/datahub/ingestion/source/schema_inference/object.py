@@ -1,5 +1,15 @@
 from collections import Counter
-from typing import Any, Counter as CounterType, Dict, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Counter as CounterType,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mypy_extensions import TypedDict
 
@@ -80,30 +90,60 @@ def is_nullable_collection(
     return any(is_field_nullable(doc, field_path) for doc in collection)
 
 
-def construct_schema(
-    collection: Sequence[Dict[str, Any]], delimiter: str
-) -> Dict[Tuple[str, ...], SchemaDescription]:
+def _non_nullable_field_paths(
+    doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+) -> Set[Tuple[str, ...]]:
+    """
+    Returns the nested field paths of a document that are not nullable, i.e. those for
+    which is_field_nullable would return False.
     """
-    Construct (infer) a schema from a collection of documents.
 
-    For each field (represented as a tuple to handle nested items), reports the following:
-        - `types`: Python types of field values
-        - `count`: Number of times the field was encountered
-        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
-        - `nullable`: if field is ever null/missing
-        - `delimited_name`: name of the field, joined by a given delimiter
+    field_paths: Set[Tuple[str, ...]] = set()
+    for key, value in doc.items():
+        if value is None:
+            continue
+        field_path = parent_prefix + (key,)
+        field_paths.add(field_path)
 
-    Parameters
-    ----------
-        collection:
-            collection to construct schema over.
-        delimiter:
-            string to concatenate field names by
+        if isinstance(value, dict):
+            field_paths.update(_non_nullable_field_paths(value, field_path))
+        elif isinstance(value, list) and value:
+            # a nested field of a list is only non-nullable if every member has it
+            nested: Optional[Set[Tuple[str, ...]]] = None
+            for item in value:
+                item_paths = (
+                    _non_nullable_field_paths(item, field_path)
+                    if isinstance(item, dict)
+                    else set()
+                )
+                nested = item_paths if nested is None else nested & item_paths
+                if not nested:
+                    break
+            if nested:
+                field_paths.update(nested)
+    return field_paths
+
+
+class SchemaBuilder:
     """
+    Incrementally constructs (infers) a schema from documents, so that a collection can
+    be streamed instead of being held in memory. See construct_schema for the result.
+    """
+
+    def __init__(self) -> None:
+        self.document_count = 0
+        self._schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        # number of documents in which a field is not nullable
+        self._non_nullable_counts: CounterType[Tuple[str, ...]] = Counter()
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+    def add_document(self, doc: Dict[str, Any]) -> None:
+        self.document_count += 1
+        self._append_to_schema(doc, ())
+        self._non_nullable_counts.update(_non_nullable_field_paths(doc, ()))
 
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
+    def _append_to_schema(
+        self, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> None:
         """
         Recursively update the schema with a document, which may/may not contain nested fields.
 
@@ -120,50 +160,86 @@ def construct_schema(
 
             # if nested value, look at the types within
             if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
+                self._append_to_schema(value, new_parent_prefix)
             # if array of values, check what types are within
             if isinstance(value, list):
                 for item in value:
                     # if dictionary, add it as a nested object
                     if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
+                        self._append_to_schema(item, new_parent_prefix)
 
             # don't record None values (counted towards nullable)
             if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
+                if new_parent_prefix not in self._schema:
+                    self._schema[new_parent_prefix] = {
                         "types": Counter([type(value)]),
                         "count": 1,
                     }
 
                 else:
                     # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
+                    self._schema[new_parent_prefix]["types"].update({type(value): 1})
+                    self._schema[new_parent_prefix]["count"] += 1
+
+    def build(self, delimiter: str) -> Dict[Tuple[str, ...], SchemaDescription]:
+        """
+        Returns the schema of the documents added so far.
+
+        Parameters
+        ----------
+            delimiter:
+                string to concatenate field names by
+        """
+
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path in self._schema.keys():
+            field_types = self._schema[field_path]["types"]
+            field_type: Union[str, type] = "mixed"
+
+            # if single type detected, mark that as the type to go with
+            if len(field_types.keys()) == 1:
+                field_type = next(iter(field_types))
+            elif set(field_types.keys()) == {int, float}:
+                # If there's only floats and ints, it's not really a mixed type.
+                field_type = float
+            field_extended: SchemaDescription = {
+                "types": self._schema[field_path]["types"],
+                "count": self._schema[field_path]["count"],
+                "nullable": self._non_nullable_counts[field_path] < self.document_count,
+                "delimited_name": delimiter.join(field_path),
+                "type": field_type,
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
+
+
+def construct_schema(
+    collection: Iterable[Dict[str, Any]], delimiter: str
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Construct (infer) a schema from a collection of documents.
+
+    For each field (represented as a tuple to handle nested items), reports the following:
+        - `types`: Python types of field values
+        - `count`: Number of times the field was encountered
+        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
+        - `nullable`: if field is ever null/missing
+        - `delimited_name`: name of the field, joined by a given delimiter
+
+    The collection is only iterated once, so it can be a stream of documents.
+
+    Parameters
+    ----------
+        collection:
+            collection to construct schema over.
+        delimiter:
+            string to concatenate field names by
+    """
 
+    builder = SchemaBuilder()
     for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema.keys():
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+        builder.add_document(document)
+    return builder.build(delimiter)
@@ -80,6 +80,12 @@ class SnowflakeV2Config(
         description="Whether `schema_pattern` is matched against fully qualified schema name `<catalog>.<schema>`.",
     )
 
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of connections used to fetch the columns and constraints of schemas. The default of 1 fetches them on the ingestion connection, one schema at a time. Higher values open `max_workers - 1` additional connections, which fetch the metadata of upcoming schemas concurrently while the current schema is being ingested.",
+    )
+
     @validator("include_column_lineage")
     def validate_include_column_lineage(cls, v, values):
         if not values.get("include_table_lineage") and v:
@@ -11,10 +11,7 @@ from datahub.configuration.pattern_utils import is_schema_allowed
 from datahub.emitter.mce_builder import make_dataset_urn_with_platform_instance
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.workunit import MetadataWorkUnit
-from datahub.ingestion.source.ge_data_profiler import (
-    DatahubGEProfiler,
-    GEProfilerRequest,
-)
+from datahub.ingestion.source.ge_data_profiler import DatahubGEProfiler
 from datahub.ingestion.source.snowflake.snowflake_config import SnowflakeV2Config
 from datahub.ingestion.source.snowflake.snowflake_query import SnowflakeQuery
 from datahub.ingestion.source.snowflake.snowflake_report import SnowflakeV2Report
@@ -35,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 
 @dataclasses.dataclass
-class SnowflakeProfilerRequest(GEProfilerRequest):
+class SnowflakeProfilerRequest(TableProfilerRequest):
     table: SnowflakeTable
     profile_table_level_only: bool = False
 
@@ -1,16 +1,22 @@
+import functools
 import logging
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 from snowflake.connector import SnowflakeConnection
 
 from datahub.ingestion.source.snowflake.constants import SnowflakeObjectDomain
 from datahub.ingestion.source.snowflake.snowflake_query import SnowflakeQuery
-from datahub.ingestion.source.snowflake.snowflake_utils import SnowflakeQueryMixin
+from datahub.ingestion.source.snowflake.snowflake_utils import (
+    SnowflakeConnectionPool,
+    SnowflakeQueryMixin,
+)
 from datahub.ingestion.source.sql.sql_generic import BaseColumn, BaseTable, BaseView
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -173,19 +179,143 @@ class _SnowflakeTagCache:
         )
 
 
+def _schema_cached(func: Callable) -> Callable:
+    """
+    Caches the result of a per schema query of the data dictionary, or waits for the
+    result if the query was prefetched. Errors are cached and raised again as well.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: "SnowflakeDataDictionary", schema_name: str, db_name: str) -> Any:
+        key = (func.__name__, schema_name, db_name)
+        future = self._schema_results.get(key)
+        if future is None:
+            self.schema_cache_info[func.__name__]["misses"] += 1
+            future = Future()
+            try:
+                future.set_result(func(self, schema_name, db_name))
+            except Exception as e:
+                future.set_exception(e)
+            self._add_schema_result(key, future)
+        else:
+            self.schema_cache_info[func.__name__]["hits"] += 1
+        return future.result()
+
+    return wrapper
+
+
 class SnowflakeDataDictionary(SnowflakeQueryMixin):
     def __init__(self) -> None:
         self.logger = logger
         self.connection: Optional[SnowflakeConnection] = None
 
+        # Threads fetching schema metadata in the background use a pool connection.
+        self._thread_local = threading.local()
+        self._connection_pool: Optional[SnowflakeConnectionPool] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # The results of the per schema queries, keyed by query and schema. Schemas are
+        # processed in the order they are prefetched, so the oldest results are evicted.
+        self._schema_results: "OrderedDict[Tuple[str, str, str], Future]" = (
+            OrderedDict()
+        )
+        self._max_schema_results = 2 * len(self._schema_queries())
+        self.schema_cache_info: Dict[str, Dict[str, int]] = {
+            query.__name__: {"hits": 0, "misses": 0, "prefetched": 0}
+            for query in self._schema_queries()
+        }
+
     def set_connection(self, connection: SnowflakeConnection) -> None:
         self.connection = connection
 
     def get_connection(self) -> SnowflakeConnection:
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is not None:
+            return connection
         # Connection is already present by the time this is called
         assert self.connection is not None
         return self.connection
 
+    def set_connection_pool(self, connection_pool: SnowflakeConnectionPool) -> None:
+        self._connection_pool = connection_pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=connection_pool.size,
+            thread_name_prefix="snowflake-schema-prefetch",
+        )
+        self._max_schema_results = (connection_pool.size + 2) * len(
+            self._schema_queries()
+        )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._connection_pool is not None:
+            self._connection_pool.close()
+            self._connection_pool = None
+        self._schema_results.clear()
+
+    def _schema_queries(self) -> List[Callable[[str, str], Any]]:
+        return [
+            self.get_columns_for_schema,
+            self.get_pk_constraints_for_schema,
+            self.get_fk_constraints_for_schema,
+        ]
+
+    @property
+    def prefetch_window(self) -> int:
+        """The number of schemas whose metadata can be fetched ahead of their use."""
+        if self._connection_pool is None:
+            return 0
+        return self._connection_pool.size + 1
+
+    def prefetch_schema_metadata(
+        self, schema_names: Iterable[str], db_name: str, include_constraints: bool
+    ) -> None:
+        """
+        Starts fetching the columns, and optionally the constraints, of the given schemas
+        concurrently on the connections of the pool. Does nothing if no pool is set.
+        """
+        if self._executor is None:
+            return
+        queries = (
+            self._schema_queries()
+            if include_constraints
+            else [self.get_columns_for_schema]
+        )
+        for schema_name in schema_names:
+            for query in queries:
+                key = (query.__name__, schema_name, db_name)
+                if key in self._schema_results:
+                    continue
+                # A prefetched query counts as a miss, the first lookup as a hit.
+                self.schema_cache_info[query.__name__]["misses"] += 1
+                self.schema_cache_info[query.__name__]["prefetched"] += 1
+                self._add_schema_result(
+                    key,
+                    self._executor.submit(
+                        self._run_on_pool_connection,
+                        query.__wrapped__,  # type: ignore
+                        self,
+                        schema_name,
+                        db_name,
+                    ),
+                )
+
+    def _run_on_pool_connection(self, func: Callable, *args: Any) -> Any:
+        assert self._connection_pool is not None
+        with self._connection_pool.connection() as connection:
+            self._thread_local.connection = connection
+            try:
+                return func(*args)
+            finally:
+                self._thread_local.connection = None
+
+    def _add_schema_result(self, key: Tuple[str, str, str], future: Future) -> None:
+        self._schema_results[key] = future
+        while len(self._schema_results) > self._max_schema_results:
+            self._schema_results.popitem(last=False)
+
     def show_databases(self) -> List[SnowflakeDatabase]:
         databases: List[SnowflakeDatabase] = []
 
@@ -341,7 +471,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             )
         return views
 
-    @lru_cache(maxsize=1)
+    @_schema_cached
     def get_columns_for_schema(
         self, schema_name: str, db_name: str
     ) -> Optional[Dict[str, List[SnowflakeColumn]]]:
@@ -397,7 +527,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             )
         return columns
 
-    @lru_cache(maxsize=1)
+    @_schema_cached
     def get_pk_constraints_for_schema(
         self, schema_name: str, db_name: str
     ) -> Dict[str, SnowflakePK]:
@@ -414,7 +544,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             constraints[row["table_name"]].column_names.append(row["column_name"])
         return constraints
 
-    @lru_cache(maxsize=1)
+    @_schema_cached
     def get_fk_constraints_for_schema(
         self, schema_name: str, db_name: str
     ) -> Dict[str, List[SnowflakeFK]]:
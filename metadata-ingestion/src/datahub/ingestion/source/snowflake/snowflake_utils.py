@@ -1,5 +1,7 @@
+import contextlib
 import logging
-from typing import Any, Optional
+import queue
+from typing import Any, Iterator, List, Optional
 
 from snowflake.connector import SnowflakeConnection
 from snowflake.connector.cursor import DictCursor
@@ -276,6 +278,37 @@ class SnowflakeConnectionMixin:
             self.connection.close()
 
 
+class SnowflakeConnectionPool:
+    """
+    A fixed set of connections that queries can be run on concurrently, each
+    connection being used by one thread at a time.
+    """
+
+    def __init__(self, connections: List[SnowflakeConnection]) -> None:
+        assert connections
+        self._connections = connections
+        self._idle: "queue.Queue[SnowflakeConnection]" = queue.Queue()
+        for connection in connections:
+            self._idle.put(connection)
+
+    @property
+    def size(self) -> int:
+        return len(self._connections)
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[SnowflakeConnection]:
+        connection = self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self) -> None:
+        for connection in self._connections:
+            if not connection.is_closed():
+                connection.close()
+
+
 def is_permission_error(e: Exception) -> bool:
     msg = str(e)
     # 002003 (02000): SQL compilation error: Database/SCHEMA 'XXXX' does not exist or not authorized.
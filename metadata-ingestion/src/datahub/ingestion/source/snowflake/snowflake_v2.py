@@ -70,6 +70,7 @@ from datahub.ingestion.source.snowflake.snowflake_usage_v2 import (
 from datahub.ingestion.source.snowflake.snowflake_utils import (
     SnowflakeCommonMixin,
     SnowflakeConnectionMixin,
+    SnowflakeConnectionPool,
     SnowflakePermissionError,
     SnowflakeQueryMixin,
 )
@@ -482,6 +483,11 @@ class SnowflakeV2Source(
             return
 
         self.data_dictionary.set_connection(self.connection)
+        if self.config.include_technical_schema and self.config.max_workers > 1:
+            connection_pool = self.create_connection_pool()
+            if connection_pool is not None:
+                self.data_dictionary.set_connection_pool(connection_pool)
+
         databases = self.get_databases()
 
         if databases is None or len(databases) == 0:
@@ -498,16 +504,15 @@ class SnowflakeV2Source(
                 return
 
         self.connection.close()
+        self.data_dictionary.close()
 
         lru_cache_functions: List[Callable] = [
             self.data_dictionary.get_tables_for_database,
             self.data_dictionary.get_views_for_database,
-            self.data_dictionary.get_columns_for_schema,
-            self.data_dictionary.get_pk_constraints_for_schema,
-            self.data_dictionary.get_fk_constraints_for_schema,
         ]
         for func in lru_cache_functions:
             self.report.lru_cache_info[func.__name__] = func.cache_info()._asdict()  # type: ignore
+        self.report.lru_cache_info.update(self.data_dictionary.schema_cache_info)
 
         # TODO: The checkpoint state for stale entity detection can be committed here.
 
@@ -567,6 +572,23 @@ class SnowflakeV2Source(
             auto_status_aspect(self.get_workunits_internal()),
         )
 
+    def create_connection_pool(self) -> Optional[SnowflakeConnectionPool]:
+        connections: List[SnowflakeConnection] = []
+        for _ in range(self.config.max_workers - 1):
+            try:
+                connections.append(self.config.get_connection())
+            except Exception as e:
+                logger.debug(
+                    f"Failed to open connection for fetching schemas due to error {e}",
+                    exc_info=e,
+                )
+                self.report_warning(
+                    "snowflake-connection-pool",
+                    f"Failed to open connection for fetching schemas concurrently, using {len(connections)} connection(s).",
+                )
+                break
+        return SnowflakeConnectionPool(connections) if connections else None
+
     def report_warehouse_failure(self):
         if self.config.warehouse is not None:
             self.report_error(
@@ -672,7 +694,37 @@ class SnowflakeV2Source(
                 yield from self._process_tag(tag)
 
         self.db_tables = {}
+        schema_names_to_prefetch: List[str] = []
+        if self.config.include_technical_schema and (
+            self.config.include_tables or self.config.include_views
+        ):
+            schema_names_to_prefetch = [
+                snowflake_schema.name
+                for snowflake_schema in snowflake_db.schemas
+                if is_schema_allowed(
+                    self.config.schema_pattern,
+                    snowflake_schema.name,
+                    db_name,
+                    self.config.match_fully_qualified_names,
+                )
+            ]
+        prefetch_index = 0
         for snowflake_schema in snowflake_db.schemas:
+            if (
+                prefetch_index < len(schema_names_to_prefetch)
+                and schema_names_to_prefetch[prefetch_index] == snowflake_schema.name
+            ):
+                # Fetches the metadata of the next schemas while this one is processed.
+                # Schemas are still processed in order, so the output is unchanged.
+                self.data_dictionary.prefetch_schema_metadata(
+                    schema_names_to_prefetch[
+                        prefetch_index : prefetch_index
+                        + self.data_dictionary.prefetch_window
+                    ],
+                    db_name,
+                    include_constraints=self.config.include_tables,
+                )
+                prefetch_index += 1
             yield from self._process_schema(snowflake_schema, db_name)
 
         if self.config.profiling.enabled and self.db_tables:
@@ -1539,6 +1591,7 @@ class SnowflakeV2Source(
 
     def close(self) -> None:
         super().close()
+        self.data_dictionary.close()
         super(StatefulIngestionSourceBase, self).close()
         if hasattr(self, "lineage_extractor"):
             self.lineage_extractor.close()
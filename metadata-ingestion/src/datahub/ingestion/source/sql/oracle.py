@@ -1,5 +1,6 @@
+import contextlib
 import logging
-from typing import Any, Iterable, List, NoReturn, Optional, Tuple, cast
+from typing import Any, Iterable, Iterator, List, NoReturn, Optional, Tuple, cast
 from unittest.mock import patch
 
 # This import verifies that the dependencies are available.
@@ -189,6 +190,11 @@ class OracleSource(SQLAlchemySource):
             # To silent the mypy lint error
             yield cast(Inspector, OracleInspectorObjectWrapper(inspector))
 
+    @contextlib.contextmanager
+    def get_worker_inspector(self, inspector: Inspector) -> Iterator[Inspector]:
+        with super().get_worker_inspector(inspector) as worker_inspector:
+            yield cast(Inspector, OracleInspectorObjectWrapper(worker_inspector))
+
     def get_workunits(self):
         with patch.dict(
             "sqlalchemy.dialects.oracle.base.OracleDialect.ischema_names",
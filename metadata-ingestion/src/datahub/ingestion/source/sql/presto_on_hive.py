@@ -108,6 +108,9 @@ class PrestoOnHiveConfig(BasicSQLAlchemyConfig):
         description="Host URL and port to connect to. Example: localhost:3306",
     )
     scheme: str = Field(default="mysql+pymysql", description="", hidden_from_docs=True)
+    # The metastore is queried over a single connection, so schemas cannot be
+    # processed concurrently.
+    max_workers: int = Field(default=1, ge=1, le=1, hidden_from_docs=True)
 
     database_pattern: AllowDenyPattern = Field(
         default=AllowDenyPattern.allow_all(),
@@ -1,7 +1,11 @@
+import contextlib
 import datetime
 import logging
+import queue
+import threading
 import traceback
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
@@ -10,6 +14,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -32,9 +37,13 @@ from datahub.emitter.mce_builder import (
     make_tag_urn,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.api.common import PipelineContext, WorkUnit
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.sql_config import SQLAlchemyConfig
+from datahub.ingestion.source.sql.sql_reflection import (
+    SchemaReflection,
+    get_schema_reflection,
+)
 from datahub.ingestion.source.sql.sql_utils import (
     add_table_to_schema_container,
     gen_database_container,
@@ -93,6 +102,7 @@ from datahub.utilities.source_helpers import (
     auto_status_aspect,
 )
 from datahub.utilities.sqlalchemy_query_combiner import SQLAlchemyQueryCombinerReport
+from datahub.utilities.stats_collections import TopKDict
 
 if TYPE_CHECKING:
     from datahub.ingestion.source.ge_data_profiler import (
@@ -156,6 +166,12 @@ class SqlContainerSubTypes(str, Enum):
     SCHEMA = "Schema"
 
 
+@dataclass
+class _SchemaDone:
+    profile_requests: Optional[List["GEProfilerRequest"]] = None
+    error: Optional[Exception] = None
+
+
 @dataclass
 class SQLSourceReport(StaleEntityRemovalSourceReport):
     tables_scanned: int = 0
@@ -165,22 +181,57 @@ class SQLSourceReport(StaleEntityRemovalSourceReport):
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
 
+    profiling_time_taken_seconds: TopKDict[str, float] = field(default_factory=TopKDict)
+    profiling_cost_estimate: TopKDict[str, int] = field(default_factory=TopKDict)
+    profiling_timed_out: LossyList[str] = field(default_factory=LossyList)
+
+    # Schemas can be processed on several threads, which all update the report.
+    _lock: threading.Lock = field(default_factory=lambda: threading.Lock())
+
+    def report_workunit(self, wu: WorkUnit) -> None:
+        with self._lock:
+            super().report_workunit(wu)
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
+
     def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
         """
         Entity could be a view or a table
         """
-        if ent_type == "table":
-            self.tables_scanned += 1
-        elif ent_type == "view":
-            self.views_scanned += 1
-        else:
-            raise KeyError(f"Unknown entity {ent_type}.")
+        with self._lock:
+            if ent_type == "table":
+                self.tables_scanned += 1
+            elif ent_type == "view":
+                self.views_scanned += 1
+            else:
+                raise KeyError(f"Unknown entity {ent_type}.")
 
     def report_entity_profiled(self, name: str) -> None:
-        self.entities_profiled += 1
+        with self._lock:
+            self.entities_profiled += 1
 
     def report_dropped(self, ent_name: str) -> None:
-        self.filtered.append(ent_name)
+        with self._lock:
+            self.filtered.append(ent_name)
+
+    def report_table_profiling_cost(
+        self, name: str, time_taken: float, cost_estimate: Optional[int]
+    ) -> None:
+        with self._lock:
+            self.profiling_time_taken_seconds[name] = round(time_taken, 3)
+            if cost_estimate is not None:
+                self.profiling_cost_estimate[name] = cost_estimate
+
+    def report_profiling_timeout(self, name: str, timeout: float) -> None:
+        with self._lock:
+            self.profiling_timed_out.append(name)
+        self.report_warning(name, f"Profiling did not finish within {timeout} seconds")
 
     def report_from_query_combiner(
         self, query_combiner_report: SQLAlchemyQueryCombinerReport
@@ -364,6 +415,10 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                 cached_domains=[k for k in self.config.domain], graph=self.ctx.graph
             )
 
+        # Reflections of the schemas that are being processed, keyed by the id of
+        # their inspector and the schema name.
+        self._schema_reflections: Dict[Tuple[int, str], SchemaReflection] = {}
+
     def warn(self, log: logging.Logger, key: str, reason: str) -> None:
         self.report.report_warning(key, reason)
         log.warning(f"{key} => {reason}")
@@ -499,9 +554,15 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
 
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
-        if sql_config.profiling.enabled:
+        if sql_config.profiling.enabled or sql_config.max_workers > 1:
             sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
+                "max_overflow",
+                max(
+                    sql_config.profiling.max_workers
+                    if sql_config.profiling.enabled
+                    else 0,
+                    sql_config.max_workers,
+                ),
             )
 
         for inspector in self.get_inspectors():
@@ -515,32 +576,164 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                 database=db_name,
             )
 
-            for schema in self.get_allowed_schemas(inspector, db_name):
-                self.add_information_for_schema(inspector, schema)
+            yield from self.loop_schemas(
+                inspector, db_name, profile_requests if profiler else None
+            )
 
-                yield from self.gen_schema_containers(
-                    database=db_name,
-                    schema=schema,
-                    extra_properties=self.get_schema_properties(
-                        inspector=inspector, schema=schema, database=db_name
-                    ),
+            if profiler and profile_requests:
+                yield from self.loop_profiler(
+                    profile_requests, profiler, platform=self.platform
+                )
+
+    def loop_schemas(
+        self,
+        inspector: Inspector,
+        db_name: str,
+        profile_requests: Optional[List["GEProfilerRequest"]] = None,
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        """
+        Processes the allowed schemas of a database, one after the other or, if
+        max_workers is greater than 1, concurrently on separate connections.
+        """
+        schemas = self.get_allowed_schemas(inspector, db_name)
+        if self.config.max_workers <= 1:
+            for schema in schemas:
+                yield from self._loop_schema_and_release_reflection(
+                    inspector, schema, db_name, profile_requests
                 )
+        else:
+            yield from self._loop_schemas_concurrently(
+                inspector, list(schemas), db_name, profile_requests
+            )
+
+    def loop_schema(
+        self,
+        inspector: Inspector,
+        schema: str,
+        db_name: str,
+        profile_requests: Optional[List["GEProfilerRequest"]] = None,
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        """
+        Emits the container, tables and views of a schema. If profile_requests is
+        given, the profile requests of the schema are appended to it.
+        """
+        sql_config = self.config
+        self.add_information_for_schema(inspector, schema)
 
-                if sql_config.include_tables:
-                    yield from self.loop_tables(inspector, schema, sql_config)
+        yield from self.gen_schema_containers(
+            database=db_name,
+            schema=schema,
+            extra_properties=self.get_schema_properties(
+                inspector=inspector, schema=schema, database=db_name
+            ),
+        )
 
-                if sql_config.include_views:
-                    yield from self.loop_views(inspector, schema, sql_config)
+        if sql_config.include_tables:
+            yield from self.loop_tables(inspector, schema, sql_config)
 
-                if profiler:
-                    profile_requests += list(
-                        self.loop_profiler_requests(inspector, schema, sql_config)
-                    )
+        if sql_config.include_views:
+            yield from self.loop_views(inspector, schema, sql_config)
 
-            if profiler and profile_requests:
-                yield from self.loop_profiler(
-                    profile_requests, profiler, platform=self.platform
-                )
+        if profile_requests is not None:
+            profile_requests += list(
+                self.loop_profiler_requests(inspector, schema, sql_config)
+            )
+
+    def _loop_schema_and_release_reflection(
+        self,
+        inspector: Inspector,
+        schema: str,
+        db_name: str,
+        profile_requests: Optional[List["GEProfilerRequest"]],
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        try:
+            yield from self.loop_schema(inspector, schema, db_name, profile_requests)
+        finally:
+            # The reflection of the schema is kept until subclasses that override
+            # loop_schema are done with the schema as well.
+            self._schema_reflections.pop((id(inspector), schema), None)
+
+    @contextlib.contextmanager
+    def get_worker_inspector(self, inspector: Inspector) -> Iterator[Inspector]:
+        """
+        Provides an inspector on a new connection of the inspector's engine, so that a
+        schema can be processed on a worker thread. Subclasses that set up connections
+        or wrap inspectors in get_inspectors should do the same here.
+        """
+        with inspector.engine.connect() as conn:
+            yield inspect(conn)
+
+    def _loop_schemas_concurrently(
+        self,
+        inspector: Inspector,
+        schemas: List[str],
+        db_name: str,
+        profile_requests: Optional[List["GEProfilerRequest"]],
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        # The workers stream their work units back through a bounded queue, so that
+        # memory use does not depend on the size of the schemas. Once a worker is done
+        # with its schema, it puts a _SchemaDone marker on the queue.
+        results: "queue.Queue[Union[MetadataWorkUnit, SqlWorkUnit, _SchemaDone]]" = (
+            queue.Queue(maxsize=100 * self.config.max_workers)
+        )
+        stopped = threading.Event()
+
+        def _process_schema(schema: str) -> None:
+            done = _SchemaDone(
+                profile_requests=[] if profile_requests is not None else None
+            )
+            try:
+                with self.get_worker_inspector(inspector) as worker_inspector:
+                    for wu in self._loop_schema_and_release_reflection(
+                        worker_inspector, schema, db_name, done.profile_requests
+                    ):
+                        if stopped.is_set():
+                            return
+                        results.put(wu)
+            except Exception as e:
+                done.error = e
+            finally:
+                results.put(done)
+
+        with ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="sql_schema"
+        ) as executor:
+            futures = [executor.submit(_process_schema, schema) for schema in schemas]
+            try:
+                pending = len(futures)
+                while pending:
+                    result = results.get()
+                    if not isinstance(result, _SchemaDone):
+                        yield result
+                        continue
+                    pending -= 1
+                    if result.error:
+                        raise result.error
+                    if profile_requests is not None and result.profile_requests:
+                        profile_requests += result.profile_requests
+            finally:
+                # Unblock the workers if we stopped early, so that they can finish.
+                stopped.set()
+                for future in futures:
+                    future.cancel()
+                while not all(future.done() for future in futures):
+                    try:
+                        results.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+    def get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> SchemaReflection:
+        """
+        Returns the reflection of a schema, which loads the metadata of all of its tables
+        in bulk where the dialect supports it. Subclasses can override this to provide a
+        bulk reflection for their dialect.
+        """
+        key = (id(inspector), schema)
+        if key not in self._schema_reflections:
+            self._schema_reflections[key] = get_schema_reflection(inspector, schema)
+        return self._schema_reflections[key]
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         return auto_stale_entity_removal(
@@ -718,7 +911,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             yield lineage_wu
 
         extra_tags = self.get_extra_tags(inspector, schema, table)
-        pk_constraints: dict = inspector.get_pk_constraint(table, schema)
+        pk_constraints: dict = self.get_schema_reflection(
+            inspector, schema
+        ).get_pk_constraint(table)
         foreign_keys = self._get_foreign_keys(dataset_urn, inspector, schema, table)
         schema_fields = self.get_schema_fields(
             dataset_name, columns, pk_constraints, tags=extra_tags
@@ -789,9 +984,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         location: Optional[str] = None
 
         try:
-            # SQLAlchemy stubs are incomplete and missing this method.
-            # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
-            table_info: dict = inspector.get_table_comment(table, schema)  # type: ignore
+            table_info: dict = self.get_schema_reflection(
+                inspector, schema
+            ).get_table_comment(table)
         except NotImplementedError:
             return description, properties, location
         except ProgrammingError as pe:
@@ -839,7 +1034,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     ) -> List[dict]:
         columns = []
         try:
-            columns = inspector.get_columns(table, schema)
+            columns = self.get_schema_reflection(inspector, schema).get_columns(table)
             if len(columns) == 0:
                 self.report.report_warning(MISSING_COLUMN_INFO, dataset_name)
         except Exception as e:
@@ -855,7 +1050,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         try:
             foreign_keys = [
                 self.get_foreign_key_metadata(dataset_urn, schema, fk_rec, inspector)
-                for fk_rec in inspector.get_foreign_keys(table, schema)
+                for fk_rec in self.get_schema_reflection(
+                    inspector, schema
+                ).get_foreign_keys(table)
             ]
         except KeyError:
             # certain databases like MySQL cause issues due to lower-case/upper-case irregularities
@@ -961,7 +1158,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
         try:
-            columns = inspector.get_columns(view, schema)
+            columns = self.get_schema_reflection(inspector, schema).get_columns(view)
         except KeyError:
             # For certain types of views, we are unable to fetch the list of columns.
             self.report.report_warning(
@@ -979,7 +1176,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             )
         description, properties, _ = self.get_table_properties(inspector, schema, view)
         try:
-            view_definition = inspector.get_view_definition(view, schema)
+            view_definition = self.get_schema_reflection(
+                inspector, schema
+            ).get_view_definition(view)
             if view_definition is None:
                 view_definition = ""
             else:
@@ -1189,7 +1388,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             logger.debug(
                 f"Preparing profiling request for {schema}, {table}, {partition}"
             )
-            yield GEProfilerRequest(
+            request = GEProfilerRequest(
                 pretty_name=dataset_name,
                 batch_kwargs=self.prepare_profiler_args(
                     inspector=inspector,
@@ -1199,6 +1398,23 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                     custom_sql=custom_sql,
                 ),
             )
+            (
+                request.rows_count,
+                request.column_count,
+            ) = self.get_table_size_estimate(inspector, schema, table)
+            yield request
+
+    # Override if needed
+    def get_table_size_estimate(
+        self, inspector: Inspector, schema: str, table: str
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Returns the estimated row and column counts of a table, which are used to
+        profile the most expensive tables first. Sources can override this to read
+        them from catalog statistics. By default, nothing is estimated, and the tables
+        are profiled in the order they are read.
+        """
+        return None, None
 
     def loop_profiler(
         self,
@@ -61,6 +61,12 @@ class SQLAlchemyConfig(StatefulIngestionConfigBase):
         description="If the source supports it, include table lineage to the underlying storage location.",
     )
 
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of schemas that are processed concurrently, each on its own connection. Set this above 1 when the latency to the database, rather than the database itself, limits the ingestion speed.",
+    )
+
     profiling: GEProfilingConfig = GEProfilingConfig()
     # Custom Stateful Ingestion settings
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = None
@@ -38,6 +38,10 @@ class TableProfilerRequest(GEProfilerRequest):
     table: Union[BaseTable, BaseView]
     profile_table_level_only: bool = False
 
+    def __post_init__(self) -> None:
+        self.rows_count = self.table.rows_count
+        self.column_count = self.table.column_count
+
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +146,11 @@ class GenericProfiler:
             if last_profiled:
                 # If profiling state exists we have to carry over to the new state
                 self.state_handler.add_to_state(dataset_urn, last_profiled)
+            partition_stats = self.state_handler.get_last_partition_stats(dataset_urn)
+            if partition_stats:
+                self.state_handler.add_partition_stats_to_state(
+                    dataset_urn, partition_stats
+                )
 
         threshold_time: Optional[datetime] = (
             datetime.fromtimestamp(last_profiled / 1000, timezone.utc)
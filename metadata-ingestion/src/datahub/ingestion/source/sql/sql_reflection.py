@@ -0,0 +1,332 @@
+import inspect
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import sql
+from sqlalchemy.engine.reflection import Inspector
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class SchemaReflection:
+    """
+    Reflects the tables and views of a single schema.
+
+    Subclasses can load a kind of metadata for all tables of the schema with a single
+    catalog query by overriding the matching `load_*` method. Kinds that are not loaded
+    in bulk, and tables that are missing from a bulk index, fall back to the per-table
+    inspector methods.
+    """
+
+    def __init__(self, inspector: Inspector, schema: str):
+        self.inspector = inspector
+        self.schema = schema
+        self._indexes: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def load_columns(self) -> Optional[Dict[str, List[dict]]]:
+        return None
+
+    def load_pk_constraints(self) -> Optional[Dict[str, dict]]:
+        return None
+
+    def load_foreign_keys(self) -> Optional[Dict[str, List[dict]]]:
+        return None
+
+    def load_table_comments(self) -> Optional[Dict[str, dict]]:
+        return None
+
+    def load_view_definitions(self) -> Optional[Dict[str, str]]:
+        return None
+
+    def _get_index(
+        self, kind: str, load: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        if kind not in self._indexes:
+            try:
+                self._indexes[kind] = load()
+            except Exception as e:
+                logger.warning(
+                    f"Unable to load the {kind} of schema {self.schema} in bulk, falling back to per-table reflection: {e}"
+                )
+                self._indexes[kind] = None
+        return self._indexes[kind] or {}
+
+    def get_columns(self, table: str) -> List[dict]:
+        columns = self._get_index("columns", self.load_columns).get(table)
+        if columns is None:
+            return self.inspector.get_columns(table, self.schema)
+        return columns
+
+    def get_pk_constraint(self, table: str) -> dict:
+        pk_constraint = self._get_index("primary keys", self.load_pk_constraints).get(
+            table
+        )
+        if pk_constraint is None:
+            return self.inspector.get_pk_constraint(table, self.schema)
+        return pk_constraint
+
+    def get_foreign_keys(self, table: str) -> List[dict]:
+        foreign_keys = self._get_index("foreign keys", self.load_foreign_keys).get(
+            table
+        )
+        if foreign_keys is None:
+            return self.inspector.get_foreign_keys(table, self.schema)
+        return foreign_keys
+
+    def get_table_comment(self, table: str) -> dict:
+        table_comment = self._get_index("table comments", self.load_table_comments).get(
+            table
+        )
+        if table_comment is None:
+            # SQLAlchemy stubs are incomplete and missing this method.
+            # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
+            return self.inspector.get_table_comment(table, self.schema)  # type: ignore
+        return table_comment
+
+    def get_view_definition(self, view: str) -> Optional[str]:
+        view_definition = self._get_index(
+            "view definitions", self.load_view_definitions
+        ).get(view)
+        if view_definition is None:
+            return self.inspector.get_view_definition(view, self.schema)
+        return view_definition
+
+
+class PostgresSchemaReflection(SchemaReflection):
+    """
+    Reflects a Postgres schema with one pg_catalog query per kind of metadata,
+    instead of the several queries per table that the SQLAlchemy dialect issues.
+    The results match those of the dialect's per-table methods.
+    """
+
+    # Relation kinds of tables, partitioned tables, views, materialized views and
+    # foreign tables.
+    _RELKINDS = "('r', 'p', 'v', 'm', 'f')"
+
+    def _execute(self, query: str) -> List[Any]:
+        return self.inspector.bind.execute(
+            sql.text(query), dict(schema=self.schema)
+        ).fetchall()
+
+    def _relations(self) -> List[str]:
+        if "relations" not in self._indexes:
+            self._indexes["relations"] = {
+                row[0]: None
+                for row in self._execute(
+                    f"""
+                    SELECT c.relname
+                    FROM pg_catalog.pg_class c
+                    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = :schema AND c.relkind IN {self._RELKINDS}
+                    """
+                )
+            }
+        return list(self._indexes["relations"] or {})
+
+    def load_columns(self) -> Optional[Dict[str, List[dict]]]:
+        dialect = self.inspector.dialect
+        generated = (
+            "a.attgenerated AS generated"
+            if dialect.server_version_info >= (12,)
+            else "NULL AS generated"
+        )
+        rows = self._execute(
+            f"""
+            SELECT c.relname,
+              a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (
+                SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_catalog.pg_attrdef d
+                WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+                AND a.atthasdef
+              ) AS column_default,
+              a.attnotnull,
+              pgd.description AS comment,
+              {generated},
+              (SELECT json_build_object(
+                  'always', a.attidentity = 'a',
+                  'start', s.seqstart,
+                  'increment', s.seqincrement,
+                  'minvalue', s.seqmin,
+                  'maxvalue', s.seqmax,
+                  'cache', s.seqcache,
+                  'cycle', s.seqcycle)
+                FROM pg_catalog.pg_sequence s
+                JOIN pg_catalog.pg_class sc ON s.seqrelid = sc.oid
+                WHERE sc.relkind = 'S'
+                AND a.attidentity != ''
+                AND s.seqrelid = pg_catalog.pg_get_serial_sequence(
+                    a.attrelid::regclass::text, a.attname
+                )::regclass::oid
+              ) AS identity_options
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            WHERE n.nspname = :schema AND c.relkind IN {self._RELKINDS}
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum
+            """
+        )
+        # Domains and enums are loaded once for the schema, rather than for every table.
+        # These are the private dialect methods that `PGDialect.get_columns` uses. Their
+        # signatures are the same in all supported SQLAlchemy versions, except for the
+        # arguments of `_get_column_info`, which is called with keywords for that reason.
+        domains = dialect._load_domains(self.inspector.bind)
+        enums = {
+            ((rec["name"],) if rec["visible"] else (rec["schema"], rec["name"])): rec
+            for rec in dialect._load_enums(self.inspector.bind, schema="*")
+        }
+        # Identity columns are only reflected since SQLAlchemy 1.4.
+        supports_identity = (
+            "identity" in inspect.signature(dialect._get_column_info).parameters
+        )
+        columns: Dict[str, List[dict]] = {table: [] for table in self._relations()}
+        for (
+            table,
+            name,
+            format_type,
+            default,
+            notnull,
+            comment,
+            generated,
+            identity,
+        ) in rows:
+            column_info_kwargs = dict(
+                name=name,
+                format_type=format_type,
+                default=default,
+                notnull=notnull,
+                domains=domains,
+                enums=enums,
+                schema=self.schema,
+                comment=comment,
+                generated=generated,
+            )
+            if supports_identity:
+                column_info_kwargs["identity"] = identity
+            columns.setdefault(table, []).append(
+                dialect._get_column_info(**column_info_kwargs)
+            )
+        return columns
+
+    def load_pk_constraints(self) -> Optional[Dict[str, dict]]:
+        pk_constraints: Dict[str, dict] = {
+            table: {"constrained_columns": [], "name": None}
+            for table in self._relations()
+        }
+        for table, name, column in self._execute(
+            """
+            SELECT c.relname, con.conname, a.attname
+            FROM pg_catalog.pg_constraint con
+            JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_catalog.pg_attribute a
+              ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+            WHERE n.nspname = :schema AND con.contype = 'p'
+            ORDER BY c.relname, k.ord
+            """
+        ):
+            pk_constraint = pk_constraints.setdefault(
+                table, {"constrained_columns": [], "name": None}
+            )
+            pk_constraint["name"] = name
+            pk_constraint["constrained_columns"].append(column)
+        return pk_constraints
+
+    def load_foreign_keys(self) -> Optional[Dict[str, List[dict]]]:
+        foreign_keys: Dict[str, List[dict]] = {table: [] for table in self._relations()}
+        for (
+            table,
+            name,
+            referred_schema,
+            referred_table,
+            constrained_columns,
+            referred_columns,
+        ) in self._execute(
+            """
+            SELECT c.relname,
+              con.conname,
+              rn.nspname,
+              rc.relname,
+              array(
+                SELECT a.attname::text
+                FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_catalog.pg_attribute a
+                  ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+                ORDER BY k.ord
+              ),
+              array(
+                SELECT a.attname::text
+                FROM unnest(con.confkey) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_catalog.pg_attribute a
+                  ON a.attrelid = con.confrelid AND a.attnum = k.attnum
+                ORDER BY k.ord
+              )
+            FROM pg_catalog.pg_constraint con
+            JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+            JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+            WHERE n.nspname = :schema AND con.contype = 'f'
+            ORDER BY c.relname, con.conname
+            """
+        ):
+            foreign_keys.setdefault(table, []).append(
+                {
+                    "name": name,
+                    "constrained_columns": list(constrained_columns),
+                    "referred_schema": referred_schema,
+                    "referred_table": referred_table,
+                    "referred_columns": list(referred_columns),
+                    "options": {},
+                }
+            )
+        return foreign_keys
+
+    def load_table_comments(self) -> Optional[Dict[str, dict]]:
+        table_comments: Dict[str, dict] = {
+            table: {"text": None} for table in self._relations()
+        }
+        for table, comment in self._execute(
+            f"""
+            SELECT c.relname, pgd.description
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_description pgd
+              ON pgd.objoid = c.oid AND pgd.objsubid = 0
+            WHERE n.nspname = :schema AND c.relkind IN {self._RELKINDS}
+            """
+        ):
+            table_comments[table] = {"text": comment}
+        return table_comments
+
+    def load_view_definitions(self) -> Optional[Dict[str, str]]:
+        return {
+            view: view_definition
+            for view, view_definition in self._execute(
+                """
+                SELECT c.relname, pg_catalog.pg_get_viewdef(c.oid)
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema AND c.relkind IN ('v', 'm')
+                """
+            )
+        }
+
+
+def get_schema_reflection(inspector: Inspector, schema: str) -> SchemaReflection:
+    dialect = inspector.dialect
+    # The bulk queries use the pg_catalog layout and functions of Postgres 10 and
+    # later. Dialects that only derive from the Postgres dialect, like Redshift,
+    # have a different catalog and are reflected table by table.
+    if (
+        dialect.name == "postgresql"
+        and getattr(dialect, "server_version_info", None)
+        and dialect.server_version_info >= (10,)
+    ):
+        return PostgresSchemaReflection(inspector, schema)
+    return SchemaReflection(inspector, schema)
@@ -151,9 +151,15 @@ class VerticaSource(SQLAlchemySource):
 
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
-        if sql_config.profiling.enabled:
+        if sql_config.profiling.enabled or sql_config.max_workers > 1:
             sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
+                "max_overflow",
+                max(
+                    sql_config.profiling.max_workers
+                    if sql_config.profiling.enabled
+                    else 0,
+                    sql_config.max_workers,
+                ),
             )
 
         for inspector in self.get_inspectors():
@@ -170,31 +176,9 @@ class VerticaSource(SQLAlchemySource):
                 ),
             )
 
-            for schema in self.get_allowed_schemas(inspector, db_name):
-                self.add_information_for_schema(inspector, schema)
-
-                yield from self.gen_schema_containers(
-                    schema=schema,
-                    database=db_name,
-                    extra_properties=self.get_schema_properties(
-                        inspector=inspector, schema=schema, database=db_name
-                    ),
-                )
-
-                if sql_config.include_tables:
-                    yield from self.loop_tables(inspector, schema, sql_config)
-
-                if sql_config.include_views:
-                    yield from self.loop_views(inspector, schema, sql_config)
-                if sql_config.include_projections:
-                    yield from self.loop_projections(inspector, schema, sql_config)
-                if sql_config.include_models:
-                    yield from self.loop_models(inspector, schema, sql_config)
-
-                if profiler:
-                    profile_requests += list(
-                        self.loop_profiler_requests(inspector, schema, sql_config)
-                    )
+            yield from self.loop_schemas(
+                inspector, db_name, profile_requests if profiler else None
+            )
 
             if profiler and profile_requests:
                 yield from self.loop_profiler(
@@ -205,6 +189,21 @@ class VerticaSource(SQLAlchemySource):
             if sql_config.include_oauth:
                 yield from self.loop_oauth(inspector, oauth_schema, sql_config)
 
+    def loop_schema(
+        self,
+        inspector: Inspector,
+        schema: str,
+        db_name: str,
+        profile_requests: Optional[List["GEProfilerRequest"]] = None,
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        sql_config = self.config
+        yield from super().loop_schema(inspector, schema, db_name, profile_requests)
+
+        if sql_config.include_projections:
+            yield from self.loop_projections(inspector, schema, sql_config)
+        if sql_config.include_models:
+            yield from self.loop_models(inspector, schema, sql_config)
+
     def get_database_properties(
         self, inspector: Inspector, database: str
     ) -> Optional[Dict[str, str]]:
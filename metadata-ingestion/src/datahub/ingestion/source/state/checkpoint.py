@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Callable, Generic, Optional, Type, TypeVar
 
 import pydantic
+import zstandard
 
 from datahub.configuration.common import ConfigModel
 from datahub.metadata.schema_classes import (
@@ -21,6 +22,20 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_STATE_SIZE = 2**22  # 4MB
 
+# The serdes that checkpoint states can be written with.
+WRITABLE_SERDES = ["utf-8", "base85-bz2-json", "base85-zstd-json"]
+ZSTD_COMPRESSION_LEVEL = 3
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    # The compressor always writes the content size, so the frame can be
+    # decompressed in one go.
+    return zstandard.ZstdDecompressor().decompress(data)
+
 
 class CheckpointStateBase(ConfigModel):
     """
@@ -35,9 +50,7 @@ class CheckpointStateBase(ConfigModel):
 
     def to_bytes(
         self,
-        compressor: Callable[[bytes], bytes] = functools.partial(
-            bz2.compress, compresslevel=9
-        ),
+        compressor: Optional[Callable[[bytes], bytes]] = None,
         max_allowed_state_size: int = DEFAULT_MAX_STATE_SIZE,
     ) -> bytes:
         """
@@ -56,7 +69,15 @@ class CheckpointStateBase(ConfigModel):
                 "Cannot write base85 encoded bytes. Use base85-bz2-json instead."
             )
         elif self.serde == "base85-bz2-json":
-            encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+            encoded_bytes = CheckpointStateBase._to_bytes_base85_json(
+                self, compressor or functools.partial(bz2.compress, compresslevel=9)
+            )
+        elif self.serde == "base85-zstd-json":
+            # zstd compresses about as well as bz2 for the urn lists in typical states,
+            # while being an order of magnitude faster.
+            encoded_bytes = CheckpointStateBase._to_bytes_base85_json(
+                self, compressor or _zstd_compress
+            )
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -127,6 +148,12 @@ class Checkpoint(Generic[StateType]):
                         functools.partial(bz2.decompress),
                         state_class,
                     )
+                elif checkpoint_aspect.state.serde == "base85-zstd-json":
+                    state_obj = Checkpoint._from_base85_json_bytes(
+                        checkpoint_aspect,
+                        _zstd_decompress,
+                        state_class,
+                    )
                 else:
                     raise ValueError(f"Unknown serde: {checkpoint_aspect.state.serde}")
             except Exception as e:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, List, Type
+from typing import Dict, Iterable, List, Type
 
 import pydantic
 
@@ -7,7 +7,7 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityCheckpointStateBase,
 )
 from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
-from datahub.utilities.dedup_list import deduplicate_list
+from datahub.utilities.ordered_set import OrderedSet
 from datahub.utilities.urns.urn import guess_entity_type
 
 
@@ -34,6 +34,7 @@ def pydantic_state_migrator(mapping: Dict[str, str]) -> classmethod:
                 continue
 
             value = values.pop(old_field)
+            values["urns"] = list(values["urns"])
             if mapped_type == "dataset":
                 values["urns"] += [
                     CheckpointStateUtil.get_urn_from_encoded_dataset(encoded_urn)
@@ -57,13 +58,12 @@ def pydantic_state_migrator(mapping: Dict[str, str]) -> classmethod:
 
 
 class GenericCheckpointState(StaleEntityCheckpointStateBase["GenericCheckpointState"]):
-    urns: List[str] = pydantic.Field(default_factory=list)
+    # The urns are kept in a single ordered set, which deduplicates them while
+    # maintaining their order. It is serialized as a list.
+    urns: OrderedSet[str] = pydantic.Field(default_factory=OrderedSet)
 
-    # We store a bit of extra internal-only state so that we can keep the urns list deduplicated.
-    # However, we still want `urns` to be a list so that it maintains its order.
-    # We can't used OrderedSet here because pydantic doesn't recognize it and
-    # it isn't JSON serializable.
-    _urns_set: set = pydantic.PrivateAttr(default_factory=set)
+    class Config:
+        json_encoders = {OrderedSet: list}
 
     _migration = pydantic_state_migrator(
         {
@@ -80,24 +80,19 @@ class GenericCheckpointState(StaleEntityCheckpointStateBase["GenericCheckpointSt
         }
     )
 
-    def __init__(self, **data: Any):  # type: ignore
-        super().__init__(**data)
-        self.urns = deduplicate_list(self.urns)
-        self._urns_set = set(self.urns)
-
     @classmethod
     def get_supported_types(cls) -> List[str]:
         return ["*"]
 
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
-        if urn not in self._urns_set:
-            self.urns.append(urn)
-            self._urns_set.add(urn)
+        self.urns.add(urn)
 
     def get_urns_not_in(
         self, type: str, other_checkpoint_state: "GenericCheckpointState"
     ) -> Iterable[str]:
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream the difference instead of materializing it.
+        other_urns = other_checkpoint_state.urns
+        diff = (urn for urn in self.urns if urn not in other_urns)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         if type == "*":
@@ -110,6 +105,9 @@ class GenericCheckpointState(StaleEntityCheckpointStateBase["GenericCheckpointSt
     def get_percent_entities_changed(
         self, old_checkpoint_state: "GenericCheckpointState"
     ) -> float:
-        return StaleEntityCheckpointStateBase.compute_percent_entities_changed(
-            [(self.urns, old_checkpoint_state.urns)]
-        )
+        # Equivalent to compute_percent_entities_changed, but without building sets.
+        old_count = len(old_checkpoint_state.urns)
+        if not old_count:
+            return 0.0
+        overlap_count = sum(1 for urn in old_checkpoint_state.urns if urn in self.urns)
+        return (1 - overlap_count / old_count) * 100.0
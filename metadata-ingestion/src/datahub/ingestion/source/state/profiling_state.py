@@ -1,10 +1,30 @@
-from typing import Dict
+from typing import Dict, Optional
 
 import pydantic
 
+from datahub.configuration.common import ConfigModel
 from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
 
 
+class ColumnProfileStats(ConfigModel):
+    """The mergeable statistics of a column in a partition."""
+
+    null_count: Optional[int] = None
+    min: Optional[str] = None
+    max: Optional[str] = None
+    # The mean of the non-null values.
+    mean: Optional[float] = None
+
+
+class PartitionProfileStats(ConfigModel):
+    """The mergeable statistics of a profiled partition."""
+
+    # The last modification time of the partition when it was profiled, in millis.
+    last_modified: Optional[int] = None
+    row_count: int
+    columns: Dict[str, ColumnProfileStats] = {}
+
+
 class ProfilingCheckpointState(CheckpointStateBase):
     """
     Base class for representing the checkpoint state for all profiling based sources.
@@ -14,3 +34,7 @@ class ProfilingCheckpointState(CheckpointStateBase):
 
     # Last profiled stores urn, last_profiled timestamp millis in a dict
     last_profiled: Dict[str, pydantic.PositiveInt]
+
+    # The statistics of the profiled partitions of incrementally profiled tables, by
+    # urn and partition id.
+    partition_stats: Dict[str, Dict[str, PartitionProfileStats]] = {}
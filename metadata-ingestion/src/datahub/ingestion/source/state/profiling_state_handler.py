@@ -1,12 +1,15 @@
 import logging
 from collections import defaultdict
-from typing import Optional, cast
+from typing import Dict, Optional, cast
 
 import pydantic
 
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
 from datahub.ingestion.source.state.checkpoint import Checkpoint
-from datahub.ingestion.source.state.profiling_state import ProfilingCheckpointState
+from datahub.ingestion.source.state.profiling_state import (
+    PartitionProfileStats,
+    ProfilingCheckpointState,
+)
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfig,
     StatefulIngestionConfigBase,
@@ -105,6 +108,13 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
         if cur_state:
             cur_state.last_profiled[urn] = profile_time_millis
 
+    def add_partition_stats_to_state(
+        self, urn: str, partition_stats: Dict[str, PartitionProfileStats]
+    ) -> None:
+        cur_state = self.get_current_state()
+        if cur_state:
+            cur_state.partition_stats[urn] = partition_stats
+
     def get_last_state(self) -> Optional[ProfilingCheckpointState]:
         if not self.is_checkpointing_enabled() or self._ignore_old_state():
             return None
@@ -122,3 +132,10 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
             return state.last_profiled.get(urn)
 
         return None
+
+    def get_last_partition_stats(self, urn: str) -> Dict[str, PartitionProfileStats]:
+        state = self.get_last_state()
+        if state:
+            return state.partition_stats.get(urn, {})
+
+        return {}
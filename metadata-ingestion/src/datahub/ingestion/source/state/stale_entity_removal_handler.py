@@ -19,7 +19,11 @@ import pydantic
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
 from datahub.ingestion.api.workunit import MetadataWorkUnit
-from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.checkpoint import (
+    WRITABLE_SERDES,
+    Checkpoint,
+    CheckpointStateBase,
+)
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfig,
     StatefulIngestionConfigBase,
@@ -50,6 +54,19 @@ class StatefulStaleMetadataRemovalConfig(StatefulIngestionConfig):
         ge=0.0,
         hidden_from_docs=True,
     )
+    checkpoint_serde: str = pydantic.Field(
+        default="base85-bz2-json",
+        description="The serialization format of the checkpoint state. 'base85-zstd-json' is much faster to write for large states than 'base85-bz2-json', but can only be read by newer versions of DataHub. Only switch to it once no older versions read the state, since they would lose it.",
+        hidden_from_docs=True,
+    )
+
+    @pydantic.validator("checkpoint_serde")
+    def validate_checkpoint_serde(cls, serde: str) -> str:
+        if serde not in WRITABLE_SERDES:
+            raise ValueError(
+                f"Unsupported checkpoint_serde {serde}. Valid values are {WRITABLE_SERDES}"
+            )
+        return serde
 
 
 @dataclass
@@ -228,7 +245,9 @@ class StaleEntityRemovalHandler(
                 job_name=self.job_id,
                 pipeline_name=self.pipeline_name,
                 run_id=self.run_id,
-                state=self.state_type_class(),
+                state=self.state_type_class(
+                    serde=self.stateful_ingestion_config.checkpoint_serde
+                ),
             )
         return None
 
@@ -1,9 +1,12 @@
 import json
 import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
 
 import dateutil.parser as dp
 import tableauserverclient as TSC
@@ -261,6 +264,11 @@ class TableauConfig(
         default=1,
         description="[advanced] Number of workbooks to query at a time using the Tableau API.",
     )
+    max_workers: int = Field(
+        default=4,
+        ge=1,
+        description="[advanced] Number of pages of a metadata query that are fetched concurrently using the Tableau API, once the first page tells how many objects there are.",
+    )
 
     env: str = Field(
         default=builder.DEFAULT_ENV,
@@ -335,21 +343,32 @@ class TableauSource(StatefulIngestionSourceBase):
         self.report = StaleEntityRemovalSourceReport()
         self.server = None
 
-        # This list keeps track of sheets in workbooks so that we retrieve those
+        # The following dicts are used as ordered sets of ids, so that every id is only
+        # queried once and looked up in constant time.
+        # This keeps track of sheets in workbooks so that we retrieve those
         # when emitting sheets.
-        self.sheet_ids: List[str] = []
-        # This list keeps track of dashboards in workbooks so that we retrieve those
+        self.sheet_ids: Dict[str, None] = {}
+        # This keeps track of dashboards in workbooks so that we retrieve those
         # when emitting dashboards.
-        self.dashboard_ids: List[str] = []
-        # This list keeps track of embedded datasources in workbooks so that we retrieve those
+        self.dashboard_ids: Dict[str, None] = {}
+        # This keeps track of embedded datasources in workbooks so that we retrieve those
         # when emitting embedded data sources.
-        self.embedded_datasource_ids_being_used: List[str] = []
-        # This list keeps track of datasource being actively used by workbooks so that we only retrieve those
+        self.embedded_datasource_ids_being_used: Dict[str, None] = {}
+        # This keeps track of datasource being actively used by workbooks so that we only retrieve those
         # when emitting published data sources.
-        self.datasource_ids_being_used: List[str] = []
-        # This list keeps track of datasource being actively used by workbooks so that we only retrieve those
+        self.datasource_ids_being_used: Dict[str, None] = {}
+        # This keeps track of datasource being actively used by workbooks so that we only retrieve those
         # when emitting custom SQL data sources.
-        self.custom_sql_ids_being_used: List[str] = []
+        self.custom_sql_ids_being_used: Dict[str, None] = {}
+
+        # Fetches the pages of metadata queries concurrently.
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="tableau"
+        )
+        self._auth_lock = threading.Lock()
+        # Incremented on every sign-in, so that threads whose requests failed with the
+        # same expired credentials re-authenticate only once.
+        self._auth_generation = 0
 
         # Create and register the stateful ingestion use-case handlers.
         self.stale_entity_removal_handler = StaleEntityRemovalHandler(
@@ -373,6 +392,7 @@ class TableauSource(StatefulIngestionSourceBase):
                 err,
             )
             self.server = None
+        self.executor.shutdown()
         super().close()
 
     def _populate_usage_stat_registry(self):
@@ -386,9 +406,21 @@ class TableauSource(StatefulIngestionSourceBase):
             self.tableau_stat_registry[view.id] = UsageStat(view_count=view.total_views)
         logger.debug("Tableau stats %s", self.tableau_stat_registry)
 
-    def _authenticate(self):
+    def _authenticate(self, failed_auth_generation: Optional[int] = None) -> None:
+        """
+        Signs in to Tableau. If failed_auth_generation is given, it is the generation of
+        the credentials a request failed with, and signing in is skipped if another
+        thread has signed in again since then.
+        """
         try:
-            self.server = self.config.make_tableau_client()
+            with self._auth_lock:
+                if (
+                    failed_auth_generation is not None
+                    and failed_auth_generation != self._auth_generation
+                ):
+                    return
+                self.server = self.config.make_tableau_client()
+                self._auth_generation += 1
             logger.info("Authenticated to Tableau server")
         # Note that we're not catching ConfigurationError, since we want that to throw.
         except ValueError as e:
@@ -419,6 +451,7 @@ class TableauSource(StatefulIngestionSourceBase):
         logger.debug(
             f"Query {connection_type} to get {count} objects with offset {offset}"
         )
+        auth_generation = self._auth_generation
         try:
             query_data = query_metadata(
                 self.server, query, connection_type, count, offset, query_filter
@@ -430,7 +463,7 @@ class TableauSource(StatefulIngestionSourceBase):
             # If ingestion has been running for over 2 hours, the Tableau
             # temporary credentials will expire. If this happens, this exception
             # will be thrown and we need to re-authenticate and retry.
-            self._authenticate()
+            self._authenticate(auth_generation)
             return self.get_connection_object_page(
                 query, connection_type, query_filter, count, offset, False
             )
@@ -465,33 +498,46 @@ class TableauSource(StatefulIngestionSourceBase):
         page_size_override: Optional[int] = None,
     ) -> Iterable[dict]:
         # Calls the get_connection_object_page function to get the objects,
-        # and automatically handles pagination.
+        # and automatically handles pagination. Once the first page tells the total
+        # count of objects, the remaining pages are fetched concurrently and yielded
+        # in order.
 
         page_size = page_size_override or self.config.page_size
 
-        total_count = page_size
-        has_next_page = 1
-        offset = 0
-        while has_next_page:
-            count = (
-                page_size if offset + page_size < total_count else total_count - offset
-            )
-            (
-                connection_objects,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object_page(
-                query,
-                connection_type,
-                query_filter,
-                count,
-                offset,
-            )
+        (
+            connection_objects,
+            total_count,
+            has_next_page,
+        ) = self.get_connection_object_page(
+            query,
+            connection_type,
+            query_filter,
+            page_size,
+            0,
+        )
+        yield from connection_objects.get("nodes", [])
+        if not has_next_page:
+            return
 
-            offset += count
+        pending: Deque[Future] = deque()
+        for offset in range(page_size, total_count, page_size):
+            pending.append(
+                self.executor.submit(
+                    self.get_connection_object_page,
+                    query,
+                    connection_type,
+                    query_filter,
+                    min(page_size, total_count - offset),
+                    offset,
+                )
+            )
+            if len(pending) > self.config.max_workers:
+                connection_objects, _, _ = pending.popleft().result()
+                yield from connection_objects.get("nodes", [])
 
-            for obj in connection_objects.get("nodes", []):
-                yield obj
+        while pending:
+            connection_objects, _, _ = pending.popleft().result()
+            yield from connection_objects.get("nodes", [])
 
     def emit_workbooks(self) -> Iterable[MetadataWorkUnit]:
         projects = (
@@ -508,13 +554,13 @@ class TableauSource(StatefulIngestionSourceBase):
         ):
             yield from self.emit_workbook_as_container(workbook)
             for sheet in workbook.get("sheets", []):
-                self.sheet_ids.append(sheet["id"])
+                self.sheet_ids[sheet["id"]] = None
 
             for dashboard in workbook.get("dashboards", []):
-                self.dashboard_ids.append(dashboard["id"])
+                self.dashboard_ids[dashboard["id"]] = None
 
             for ds in workbook.get("embeddedDatasources", []):
-                self.embedded_datasource_ids_being_used.append(ds["id"])
+                self.embedded_datasource_ids_being_used[ds["id"]] = None
 
     def _track_custom_sql_ids(self, field: dict) -> None:
         # Tableau shows custom sql datasource as a table in ColumnField's upstreamColumns.
@@ -526,8 +572,8 @@ class TableauSource(StatefulIngestionSourceBase):
                 else None
             )
 
-            if table_id is not None and table_id not in self.custom_sql_ids_being_used:
-                self.custom_sql_ids_being_used.append(table_id)
+            if table_id is not None:
+                self.custom_sql_ids_being_used[table_id] = None
 
     def _create_upstream_table_lineage(
         self,
@@ -610,8 +656,7 @@ class TableauSource(StatefulIngestionSourceBase):
     def get_upstream_datasources(self, datasource, upstream_tables):
         upstream_tables = []
         for ds in datasource.get("upstreamDatasources", []):
-            if ds["id"] not in self.datasource_ids_being_used:
-                self.datasource_ids_being_used.append(ds["id"])
+            self.datasource_ids_being_used[ds["id"]] = None
 
             upstream_ds_urn = builder.make_dataset_urn_with_platform_instance(
                 platform=self.platform,
@@ -843,7 +888,9 @@ class TableauSource(StatefulIngestionSourceBase):
         return op
 
     def emit_custom_sql_datasources(self) -> Iterable[MetadataWorkUnit]:
-        custom_sql_filter = f"idWithin: {json.dumps(self.custom_sql_ids_being_used)}"
+        custom_sql_filter = (
+            f"idWithin: {json.dumps(list(self.custom_sql_ids_being_used))}"
+        )
 
         custom_sql_connection = list(
             self.get_connection_objects(
@@ -1077,8 +1124,7 @@ class TableauSource(StatefulIngestionSourceBase):
         datasource_urn = builder.make_dataset_urn_with_platform_instance(
             self.platform, datasource_id, self.config.platform_instance, self.config.env
         )
-        if datasource_id not in self.datasource_ids_being_used:
-            self.datasource_ids_being_used.append(datasource_id)
+        self.datasource_ids_being_used[datasource_id] = None
 
         dataset_snapshot = DatasetSnapshot(
             urn=datasource_urn,
@@ -1176,7 +1222,9 @@ class TableauSource(StatefulIngestionSourceBase):
                 yield wu
 
     def emit_published_datasources(self) -> Iterable[MetadataWorkUnit]:
-        datasource_filter = f"idWithin: {json.dumps(self.datasource_ids_being_used)}"
+        datasource_filter = (
+            f"idWithin: {json.dumps(list(self.datasource_ids_being_used))}"
+        )
 
         for datasource in self.get_connection_objects(
             published_datasource_graphql_query,
@@ -1291,7 +1339,7 @@ class TableauSource(StatefulIngestionSourceBase):
         ).as_workunit()
 
     def emit_sheets(self) -> Iterable[MetadataWorkUnit]:
-        sheets_filter = f"idWithin: {json.dumps(self.sheet_ids)}"
+        sheets_filter = f"idWithin: {json.dumps(list(self.sheet_ids))}"
 
         for sheet in self.get_connection_objects(
             sheet_graphql_query,
@@ -1349,8 +1397,7 @@ class TableauSource(StatefulIngestionSourceBase):
                 self.platform, ds_id, self.config.platform_instance, self.config.env
             )
             datasource_urn.append(ds_urn)
-            if ds_id not in self.datasource_ids_being_used:
-                self.datasource_ids_being_used.append(ds_id)
+            self.datasource_ids_being_used[ds_id] = None
 
         # Chart Info
         chart_info = ChartInfoClass(
@@ -1587,7 +1634,7 @@ class TableauSource(StatefulIngestionSourceBase):
         )
 
     def emit_dashboards(self) -> Iterable[MetadataWorkUnit]:
-        dashboards_filter = f"idWithin: {json.dumps(self.dashboard_ids)}"
+        dashboards_filter = f"idWithin: {json.dumps(list(self.dashboard_ids))}"
 
         for dashboard in self.get_connection_objects(
             dashboard_graphql_query,
@@ -1694,7 +1741,7 @@ class TableauSource(StatefulIngestionSourceBase):
 
     def emit_embedded_datasources(self) -> Iterable[MetadataWorkUnit]:
         datasource_filter = (
-            f"idWithin: {json.dumps(self.embedded_datasource_ids_being_used)}"
+            f"idWithin: {json.dumps(list(self.embedded_datasource_ids_being_used))}"
         )
 
         for datasource in self.get_connection_objects(
@@ -1,8 +1,7 @@
-import collections
 import dataclasses
 import logging
 from datetime import datetime
-from typing import Dict, Iterable, List
+from typing import Iterable, List
 
 from dateutil import parser
 from pydantic.fields import Field
@@ -26,7 +25,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.clickhouse import ClickHouseConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
-    GenericAggregatedDataset,
+    UsageAggregator,
 )
 
 logger = logging.getLogger(__name__)
@@ -55,7 +54,6 @@ SELECT user
  ORDER BY event_time DESC"""
 
 ClickHouseTableRef = str
-AggregatedDataset = GenericAggregatedDataset[ClickHouseTableRef]
 
 
 class ClickHouseJoinedAccessEvent(BaseModel):
@@ -120,13 +118,11 @@ class ClickHouseUsageSource(Source):
             return []
 
         joined_access_event = self._get_joined_access_event(access_events)
-        aggregated_info = self._aggregate_access_events(joined_access_event)
+        aggregator = self._aggregate_access_events(joined_access_event)
 
-        for time_bucket in aggregated_info.values():
-            for aggregate in time_bucket.values():
-                wu = self._make_usage_stat(aggregate)
-                self.report.report_workunit(wu)
-                yield wu
+        for wu in self._make_usage_stats(aggregator):
+            self.report.report_workunit(wu)
+            yield wu
 
     def _make_usage_query(self) -> str:
         return clickhouse_usage_sql_comment.format(
@@ -213,10 +209,8 @@ class ClickHouseUsageSource(Source):
 
     def _aggregate_access_events(
         self, events: List[ClickHouseJoinedAccessEvent]
-    ) -> Dict[datetime, Dict[ClickHouseTableRef, AggregatedDataset]]:
-        datasets: Dict[
-            datetime, Dict[ClickHouseTableRef, AggregatedDataset]
-        ] = collections.defaultdict(dict)
+    ) -> UsageAggregator[ClickHouseTableRef]:
+        aggregator: UsageAggregator[ClickHouseTableRef] = UsageAggregator(self.config)
 
         for event in events:
             floored_ts = get_time_bucket(event.starttime, self.config.bucket_duration)
@@ -226,32 +220,28 @@ class ClickHouseUsageSource(Source):
                 f"{event.schema_}.{event.table}"
             )
 
-            agg_bucket = datasets[floored_ts].setdefault(
-                resource,
-                AggregatedDataset(bucket_start_time=floored_ts, resource=resource),
-            )
-
             # current limitation in user stats UI, we need to provide email to show users
             user_email = f"{event.usename if event.usename else 'unknown'}"
             if "@" not in user_email:
                 user_email += f"@{self.config.email_domain}"
             logger.info(f"user_email: {user_email}")
-            agg_bucket.add_read_entry(
+            aggregator.add_read_entry(
+                floored_ts,
+                resource,
                 user_email,
                 event.query,
                 event.columns,
             )
-        return datasets
+        return aggregator
 
-    def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
-        return agg.make_usage_workunit(
+    def _make_usage_stats(
+        self, aggregator: UsageAggregator[ClickHouseTableRef]
+    ) -> Iterable[MetadataWorkUnit]:
+        return aggregator.generate_workunits(
             self.config.bucket_duration,
             lambda resource: builder.make_dataset_urn(
                 "clickhouse", resource, self.config.env
             ),
-            self.config.top_n_queries,
-            self.config.format_sql_queries,
-            self.config.include_top_n_queries,
         )
 
     def get_report(self) -> SourceReport:
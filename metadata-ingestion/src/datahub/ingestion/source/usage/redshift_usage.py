@@ -1,4 +1,3 @@
-import collections
 import dataclasses
 import logging
 import time
@@ -28,7 +27,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.redshift import RedshiftConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
-    GenericAggregatedDataset,
+    UsageAggregator,
 )
 from datahub.metadata.schema_classes import OperationClass, OperationTypeClass
 
@@ -127,8 +126,7 @@ ORDER BY
 """.strip()
 
 RedshiftTableRef = str
-AggregatedDataset = GenericAggregatedDataset[RedshiftTableRef]
-AggregatedAccessEvents = Dict[datetime, Dict[RedshiftTableRef, AggregatedDataset]]
+AggregatedAccessEvents = UsageAggregator[RedshiftTableRef]
 
 
 class RedshiftAccessEvent(BaseModel):
@@ -239,12 +237,10 @@ class RedshiftUsageSource(Source):
         )
         # Generate usage workunits from aggregated events.
         self.report.num_usage_workunits_emitted = 0
-        for time_bucket in aggregated_events.values():
-            for aggregate in time_bucket.values():
-                wu: MetadataWorkUnit = self._make_usage_stat(aggregate)
-                self.report.report_workunit(wu)
-                self.report.num_usage_workunits_emitted += 1
-                yield wu
+        for wu in self._make_usage_stats(aggregated_events):
+            self.report.report_workunit(wu)
+            self.report.num_usage_workunits_emitted += 1
+            yield wu
 
     def _gen_operation_aspect_workunits(
         self, engine: Engine
@@ -361,35 +357,32 @@ class RedshiftUsageSource(Source):
     def _aggregate_access_events(
         self, events_iterable: Iterable[RedshiftAccessEvent]
     ) -> AggregatedAccessEvents:
-        datasets: AggregatedAccessEvents = collections.defaultdict(dict)
+        aggregator: AggregatedAccessEvents = UsageAggregator(
+            self.config, self.config.user_email_pattern
+        )
         for event in events_iterable:
             floored_ts: datetime = get_time_bucket(
                 event.starttime, self.config.bucket_duration
             )
             resource: str = f"{event.database}.{event.schema_}.{event.table}"
-            # Get a reference to the bucket value(or initialize not yet in dict) and update it.
-            agg_bucket: AggregatedDataset = datasets[floored_ts].setdefault(
-                resource,
-                AggregatedDataset(
-                    bucket_start_time=floored_ts,
-                    resource=resource,
-                    user_email_pattern=self.config.user_email_pattern,
-                ),
-            )
             # current limitation in user stats UI, we need to provide email to show users
             user_email: str = f"{event.username if event.username else 'unknown'}"
             if "@" not in user_email:
                 user_email += f"@{self.config.email_domain}"
             logger.info(f"user_email: {user_email}")
-            agg_bucket.add_read_entry(
+            aggregator.add_read_entry(
+                floored_ts,
+                resource,
                 user_email,
                 event.text,
                 [],  # TODO: not currently supported by redshift; find column level changes
             )
-        return datasets
+        return aggregator
 
-    def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
-        return agg.make_usage_workunit(
+    def _make_usage_stats(
+        self, aggregator: AggregatedAccessEvents
+    ) -> Iterable[MetadataWorkUnit]:
+        return aggregator.generate_workunits(
             self.config.bucket_duration,
             lambda resource: builder.make_dataset_urn_with_platform_instance(
                 "redshift",
@@ -397,9 +390,6 @@ class RedshiftUsageSource(Source):
                 self.config.platform_instance,
                 self.config.env,
             ),
-            self.config.top_n_queries,
-            self.config.format_sql_queries,
-            self.config.include_top_n_queries,
         )
 
     def get_report(self) -> RedshiftUsageSourceReport:
@@ -1,10 +1,9 @@
-import collections
 import dataclasses
 import json
 import logging
 from datetime import datetime
 from email.utils import parseaddr
-from typing import Dict, Iterable, List, Optional
+from typing import Iterable, List, Optional
 
 from dateutil import parser
 from pydantic.fields import Field
@@ -25,7 +24,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.trino import TrinoConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
-    GenericAggregatedDataset,
+    UsageAggregator,
 )
 
 logger = logging.getLogger(__name__)
@@ -53,7 +52,6 @@ ORDER BY end_time desc
 """.strip()
 
 TrinoTableRef = str
-AggregatedDataset = GenericAggregatedDataset[TrinoTableRef]
 
 
 class TrinoConnectorInfo(BaseModel):
@@ -136,13 +134,11 @@ class TrinoUsageSource(Source):
             return []
 
         joined_access_event = self._get_joined_access_event(access_events)
-        aggregated_info = self._aggregate_access_events(joined_access_event)
+        aggregator = self._aggregate_access_events(joined_access_event)
 
-        for time_bucket in aggregated_info.values():
-            for aggregate in time_bucket.values():
-                wu = self._make_usage_stat(aggregate)
-                self.report.report_workunit(wu)
-                yield wu
+        for wu in self._make_usage_stats(aggregator):
+            self.report.report_workunit(wu)
+            yield wu
 
     def _make_usage_query(self) -> str:
         return trino_usage_sql_comment.format(
@@ -224,10 +220,10 @@ class TrinoUsageSource(Source):
 
     def _aggregate_access_events(
         self, events: List[TrinoJoinedAccessEvent]
-    ) -> Dict[datetime, Dict[TrinoTableRef, AggregatedDataset]]:
-        datasets: Dict[
-            datetime, Dict[TrinoTableRef, AggregatedDataset]
-        ] = collections.defaultdict(dict)
+    ) -> UsageAggregator[TrinoTableRef]:
+        aggregator: UsageAggregator[TrinoTableRef] = UsageAggregator(
+            self.config, self.config.user_email_pattern
+        )
 
         for event in events:
             floored_ts = get_time_bucket(event.starttime, self.config.bucket_duration)
@@ -249,15 +245,6 @@ class TrinoUsageSource(Source):
                     f"{metadata.catalog_name}.{metadata.schema_name}.{metadata.table}"
                 )
 
-                agg_bucket = datasets[floored_ts].setdefault(
-                    resource,
-                    AggregatedDataset(
-                        bucket_start_time=floored_ts,
-                        resource=resource,
-                        user_email_pattern=self.config.user_email_pattern,
-                    ),
-                )
-
                 # add @unknown.com to username
                 # current limitation in user stats UI, we need to provide email to show users
                 if event.usr and "@" in parseaddr(event.usr)[1]:
@@ -265,15 +252,19 @@ class TrinoUsageSource(Source):
                 else:
                     username = f"{event.usr if event.usr else 'unknown'}@{self.config.email_domain}"
 
-                agg_bucket.add_read_entry(
+                aggregator.add_read_entry(
+                    floored_ts,
+                    resource,
                     username,
                     event.query,
                     metadata.columns,
                 )
-        return datasets
+        return aggregator
 
-    def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
-        return agg.make_usage_workunit(
+    def _make_usage_stats(
+        self, aggregator: UsageAggregator[TrinoTableRef]
+    ) -> Iterable[MetadataWorkUnit]:
+        return aggregator.generate_workunits(
             self.config.bucket_duration,
             lambda resource: builder.make_dataset_urn_with_platform_instance(
                 "trino",
@@ -281,9 +272,6 @@ class TrinoUsageSource(Source):
                 self.config.platform_instance,
                 self.config.env,
             ),
-            self.config.top_n_queries,
-            self.config.format_sql_queries,
-            self.config.include_top_n_queries,
         )
 
     def get_report(self) -> SourceReport:
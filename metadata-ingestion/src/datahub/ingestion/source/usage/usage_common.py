@@ -1,8 +1,27 @@
 import collections
+import contextlib
 import dataclasses
+import hashlib
+import itertools
+import json
 import logging
+import os
+import pickle
+import sqlite3
+import tempfile
 from datetime import datetime
-from typing import Callable, Counter, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import pydantic
 from pydantic.fields import Field
@@ -14,6 +33,7 @@ from datahub.configuration.time_window_config import (
     BucketDuration,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.schema_classes import (
     DatasetFieldUsageCountsClass,
@@ -22,6 +42,7 @@ from datahub.metadata.schema_classes import (
     TimeWindowSizeClass,
 )
 from datahub.utilities.sql_formatter import format_sql_query
+from datahub.utilities.stats_collections import SpaceSavingCounter
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +53,9 @@ ResourceType = TypeVar("ResourceType")
 class GenericAggregatedDataset(Generic[ResourceType]):
     bucket_start_time: datetime
     resource: ResourceType
-    user_email_pattern: AllowDenyPattern = AllowDenyPattern.allow_all()
+    user_email_pattern: AllowDenyPattern = dataclasses.field(
+        default_factory=AllowDenyPattern.allow_all
+    )
 
     readCount: int = 0
     queryCount: int = 0
@@ -155,6 +178,32 @@ class BaseUsageConfig(BaseTimeWindowConfig):
         default=True, description="Whether to ingest the top_n_queries."
     )
 
+    query_frequency_capacity: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="Number of distinct queries whose frequency is tracked per table and time bucket. "
+        "Less frequent queries are dropped once it is exceeded, which makes the top queries approximate. "
+        "Defaults to 10 times top_n_queries.",
+    )
+    user_frequency_capacity: pydantic.PositiveInt = Field(
+        default=1000,
+        description="Number of distinct users whose frequency is tracked per table and time bucket. "
+        "Less frequent users are dropped once it is exceeded, which makes the user counts approximate.",
+    )
+    max_in_memory_aggregates: pydantic.PositiveInt = Field(
+        default=10000,
+        description="Number of table and time bucket aggregates kept in memory. "
+        "Once exceeded, the oldest time buckets are spilled to a temporary file on disk.",
+    )
+    max_in_memory_query_text_size: pydantic.PositiveInt = Field(
+        default=100 * 1024 * 1024,
+        description="Number of characters of distinct query text kept in memory before it is spilled to disk.",
+    )
+    spill_directory: Optional[str] = Field(
+        default=None,
+        description="Directory of the temporary files that usage aggregates are spilled to. "
+        "Defaults to the system temporary directory.",
+    )
+
     @pydantic.validator("top_n_queries")
     def ensure_top_n_queries_is_not_too_big(cls, v: int) -> int:
         minimum_query_size = 20
@@ -170,3 +219,289 @@ class BaseUsageConfig(BaseTimeWindowConfig):
                 f"top_n_queries is set to {v} but it can be maximum {max_queries}"
             )
         return v
+
+    @pydantic.validator("query_frequency_capacity")
+    def ensure_query_frequency_capacity_fits_top_n_queries(
+        cls, v: Optional[int], values: Dict[str, Any]
+    ) -> Optional[int]:
+        top_n_queries = values.get("top_n_queries")
+        if v is not None and top_n_queries is not None and v < top_n_queries:
+            raise ValueError(
+                f"query_frequency_capacity is set to {v} but it must be at least top_n_queries ({top_n_queries})"
+            )
+        return v
+
+    def get_query_frequency_capacity(self) -> int:
+        if self.query_frequency_capacity is not None:
+            return self.query_frequency_capacity
+        return 10 * self.top_n_queries
+
+
+def get_query_digest(query: str) -> str:
+    return hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclasses.dataclass
+class _UsageAggregate:
+    users: SpaceSavingCounter[str]
+    # Keyed by query digest, the texts are interned in the aggregator.
+    queries: SpaceSavingCounter[str]
+    columns: Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    read_count: int = 0
+    query_count: int = 0
+
+    def to_json(self) -> str:
+        return json.dumps(
+            [
+                self.read_count,
+                self.query_count,
+                self.users.most_common(),
+                self.queries.most_common(),
+                self.columns.most_common(),
+            ]
+        )
+
+    def merge_json(self, data: str) -> None:
+        read_count, query_count, users, queries, columns = json.loads(data)
+        self.read_count += read_count
+        self.query_count += query_count
+        self.users.update(users)
+        self.queries.update(queries)
+        self.columns.update(dict(columns))
+
+
+class UsageAggregator(Generic[ResourceType], Closeable):
+    """
+    Aggregates read events into per table and time bucket usage statistics with bounded
+    memory, for high volume audit logs.
+
+    Query texts are interned by their digest, so every distinct query is stored once
+    across all tables and buckets, and only the most frequent queries and users of each
+    aggregate are tracked (see SpaceSavingCounter). Once more than
+    `max_in_memory_aggregates` aggregates are held, the oldest time buckets are spilled
+    to a temporary SQLite file. Audit logs are read roughly in time order, so these
+    buckets are usually finished; late events simply start a new partial aggregate that
+    is merged when the workunits are generated. The workunits are streamed from disk
+    one aggregate at a time.
+    """
+
+    def __init__(
+        self,
+        config: BaseUsageConfig,
+        user_email_pattern: AllowDenyPattern = AllowDenyPattern.allow_all(),
+    ):
+        self.config = config
+        self.user_email_pattern = user_email_pattern
+        self.query_frequency_capacity = config.get_query_frequency_capacity()
+
+        self._aggregates: Dict[
+            datetime, Dict[ResourceType, _UsageAggregate]
+        ] = collections.defaultdict(dict)
+        self._num_in_memory_aggregates = 0
+        self._query_texts: Dict[str, str] = {}
+        self._query_text_size = 0
+
+        self._db_path: Optional[str] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self.num_spilled_aggregates = 0
+        self.num_spilled_queries = 0
+
+    def add_read_entry(
+        self,
+        bucket_start_time: datetime,
+        resource: ResourceType,
+        user_email: str,
+        query: Optional[str],
+        fields: List[str],
+    ) -> None:
+        if not self.user_email_pattern.allowed(user_email):
+            return
+
+        bucket = self._aggregates[bucket_start_time]
+        agg = bucket.get(resource)
+        if agg is None:
+            agg = bucket[resource] = self._new_aggregate()
+            self._num_in_memory_aggregates += 1
+
+        agg.read_count += 1
+        agg.users.add(user_email)
+        if query:
+            agg.query_count += 1
+            agg.queries.add(self._intern_query(query))
+        for column in fields:
+            agg.columns[column] += 1
+
+        if self._num_in_memory_aggregates > self.config.max_in_memory_aggregates:
+            self._spill_oldest_buckets()
+
+    def _new_aggregate(self) -> _UsageAggregate:
+        return _UsageAggregate(
+            users=SpaceSavingCounter(self.config.user_frequency_capacity),
+            queries=SpaceSavingCounter(self.query_frequency_capacity),
+        )
+
+    def _intern_query(self, query: str) -> str:
+        digest = get_query_digest(query)
+        if digest not in self._query_texts:
+            self._query_texts[digest] = query
+            self._query_text_size += len(query)
+            if self._query_text_size > self.config.max_in_memory_query_text_size:
+                self._spill_query_texts()
+        return digest
+
+    def _get_db(self) -> sqlite3.Connection:
+        if self._db is None:
+            fd, self._db_path = tempfile.mkstemp(
+                prefix="datahub_usage_",
+                suffix=".sqlite",
+                dir=self.config.spill_directory,
+            )
+            os.close(fd)
+            self._db = sqlite3.connect(self._db_path)
+            # The file is temporary, so there is no need for crash safety.
+            self._db.execute("PRAGMA journal_mode = OFF")
+            self._db.execute("PRAGMA synchronous = OFF")
+            self._db.execute(
+                "CREATE TABLE usage_aggregate (bucket INTEGER NOT NULL, "
+                "resource_key TEXT NOT NULL, resource BLOB NOT NULL, data TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE query_text (digest TEXT PRIMARY KEY, query TEXT NOT NULL)"
+            )
+            logger.info(f"Spilling usage aggregates to {self._db_path}")
+        return self._db
+
+    def _spill_query_texts(self) -> None:
+        db = self._get_db()
+        db.executemany(
+            "INSERT OR IGNORE INTO query_text (digest, query) VALUES (?, ?)",
+            self._query_texts.items(),
+        )
+        db.commit()
+        self.num_spilled_queries += len(self._query_texts)
+        self._query_texts = {}
+        self._query_text_size = 0
+
+    def _spill_oldest_buckets(self) -> None:
+        # Spill down to half of the limit, so that spills are not triggered by every
+        # new aggregate.
+        target = self.config.max_in_memory_aggregates // 2
+        for bucket_start_time in sorted(self._aggregates):
+            if self._num_in_memory_aggregates <= target:
+                break
+            self._spill_bucket(bucket_start_time)
+
+    def _spill_bucket(self, bucket_start_time: datetime) -> None:
+        bucket = self._aggregates.pop(bucket_start_time)
+        db = self._get_db()
+        db.executemany(
+            "INSERT INTO usage_aggregate (bucket, resource_key, resource, data) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (
+                    _bucket_sort_key(bucket_start_time),
+                    str(resource),
+                    pickle.dumps((bucket_start_time, resource)),
+                    agg.to_json(),
+                )
+                for resource, agg in bucket.items()
+            ),
+        )
+        db.commit()
+        self._num_in_memory_aggregates -= len(bucket)
+        self.num_spilled_aggregates += len(bucket)
+
+    def _get_query_text(self, digest: str) -> Optional[str]:
+        query = self._query_texts.get(digest)
+        if query is None and self._db is not None:
+            row = self._db.execute(
+                "SELECT query FROM query_text WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is not None:
+                query = row[0]
+        return query
+
+    def _iterate_aggregates(
+        self,
+    ) -> Iterable[Tuple[datetime, ResourceType, _UsageAggregate]]:
+        if self._db is None or self.num_spilled_aggregates == 0:
+            for bucket_start_time, bucket in self._aggregates.items():
+                for resource, agg in bucket.items():
+                    yield bucket_start_time, resource, agg
+            return
+
+        for bucket_start_time in list(self._aggregates):
+            self._spill_bucket(bucket_start_time)
+        # Partial aggregates of the same table and bucket are adjacent in this order.
+        rows = self._db.execute(
+            "SELECT bucket, resource_key, resource, data FROM usage_aggregate "
+            "ORDER BY bucket, resource_key, rowid"
+        )
+        for _, group in itertools.groupby(rows, key=lambda row: row[:2]):
+            agg = self._new_aggregate()
+            for _, _, pickled, data in group:
+                agg.merge_json(data)
+            bucket_start_time, resource = pickle.loads(pickled)
+            yield bucket_start_time, resource, agg
+
+    def _to_aggregated_dataset(
+        self,
+        bucket_start_time: datetime,
+        resource: ResourceType,
+        agg: _UsageAggregate,
+    ) -> GenericAggregatedDataset[ResourceType]:
+        query_freq: Counter[str] = collections.Counter()
+        if self.config.include_top_n_queries:
+            for digest, count in agg.queries.most_common(self.config.top_n_queries):
+                query = self._get_query_text(digest)
+                if query is not None:
+                    query_freq[query] = count
+        return GenericAggregatedDataset(
+            bucket_start_time=bucket_start_time,
+            resource=resource,
+            readCount=agg.read_count,
+            queryCount=agg.query_count,
+            queryFreq=query_freq,
+            userFreq=collections.Counter(dict(agg.users.most_common())),
+            columnFreq=agg.columns,
+        )
+
+    def generate_workunits(
+        self,
+        bucket_duration: BucketDuration,
+        urn_builder: Callable[[ResourceType], str],
+    ) -> Iterable[MetadataWorkUnit]:
+        """
+        Generates a usage workunit per table and time bucket. The spilled aggregates are
+        read back one at a time and the aggregator is closed afterwards.
+        """
+        try:
+            for bucket_start_time, resource, agg in self._iterate_aggregates():
+                yield self._to_aggregated_dataset(
+                    bucket_start_time, resource, agg
+                ).make_usage_workunit(
+                    bucket_duration,
+                    urn_builder,
+                    self.config.top_n_queries,
+                    self.config.format_sql_queries,
+                    self.config.include_top_n_queries,
+                )
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._aggregates = collections.defaultdict(dict)
+        self._num_in_memory_aggregates = 0
+        self._query_texts = {}
+        self._query_text_size = 0
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._db_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(self._db_path)
+            self._db_path = None
+
+
+def _bucket_sort_key(bucket_start_time: datetime) -> int:
+    return int(bucket_start_time.timestamp() * 1000)
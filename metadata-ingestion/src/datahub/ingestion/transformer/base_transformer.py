@@ -3,11 +3,21 @@ from abc import ABCMeta, abstractmethod
 from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
 import datahub.emitter.mce_builder as builder
+from datahub.configuration.common import (
+    TransformerSemantics,
+    TransformerSemanticsConfigModel,
+)
 from datahub.emitter.aspect import ASPECT_MAP
 from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
+from datahub.ingestion.api.common import (
+    ControlRecord,
+    EndOfStream,
+    PipelineContext,
+    RecordEnvelope,
+)
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.graph.client import DataHubGraph
 from datahub.metadata.schema_classes import (
     DataFlowSnapshotClass,
     DataJobSnapshotClass,
@@ -15,7 +25,7 @@ from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
 )
-from datahub.utilities.urns.urn import Urn
+from datahub.utilities.urns.urn import Urn, guess_entity_type
 
 log = logging.getLogger(__name__)
 
@@ -69,6 +79,53 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 "Class does not implement one of required traits {self.allowed_mixins}"
             )
 
+    def get_patch_graph(self) -> Optional[DataHubGraph]:
+        """
+        Returns the graph that the server version of the transformed aspect is read from
+        when the transformer patches it, or None if the transformer does not read it.
+        """
+        config = getattr(self, "config", None)
+        ctx: Optional[PipelineContext] = getattr(self, "ctx", None)
+        if (
+            isinstance(config, TransformerSemanticsConfigModel)
+            and config.semantics == TransformerSemantics.PATCH
+            and ctx is not None
+        ):
+            return ctx.graph
+        return None
+
+    def prefetch_server_aspects(self, entity_urns: Iterable[str]) -> None:
+        """
+        Warms the graph's aspect cache with the server version of the transformed aspect
+        for the given entities, so that patching them does not need a request each.
+        """
+        graph = self.get_patch_graph()
+        if graph is None or not isinstance(self, SingleAspectTransformer):
+            return
+        aspect_type = ASPECT_MAP.get(self.aspect_name())
+        if aspect_type is None:
+            return
+        entity_types = self.entity_types()
+        if "*" not in entity_types:
+            entity_urns = [
+                urn for urn in entity_urns if guess_entity_type(urn) in entity_types
+            ]
+        graph.prefetch_aspects(entity_urns, [aspect_type])
+
+    def _transform_aspect(
+        self, entity_urn: str, aspect_name: str, aspect: Optional[builder.Aspect]
+    ) -> Optional[builder.Aspect]:
+        assert isinstance(self, SingleAspectTransformer)
+        transformed_aspect = self.transform_aspect(
+            entity_urn=entity_urn, aspect_name=aspect_name, aspect=aspect
+        )
+        graph = self.get_patch_graph()
+        if graph is not None and transformed_aspect is not None:
+            # The patched aspect replaces the server version once it is written, so the
+            # cached server version is updated for later patches of the same entity.
+            graph.update_cached_aspect(entity_urn, transformed_aspect)
+        return transformed_aspect
+
     def _should_process(
         self,
         record: Union[
@@ -141,7 +198,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                         # use the transform_one pathway to transform this MCE
                         envelope.record = self.transform_one(mce)
                     else:
-                        transformed_aspect = self.transform_aspect(
+                        transformed_aspect = self._transform_aspect(
                             entity_urn=mce.proposedSnapshot.urn,
                             aspect_name=self.aspect_name(),
                             aspect=old_aspect,
@@ -173,7 +230,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         assert isinstance(self, SingleAspectTransformer)
         if envelope.record.aspectName == self.aspect_name() and envelope.record.aspect:
             # we have a match on the aspect name, call the specific transform function
-            transformed_aspect = self.transform_aspect(
+            transformed_aspect = self._transform_aspect(
                 entity_urn=envelope.record.entityUrn,
                 aspect_name=envelope.record.aspectName,
                 aspect=envelope.record.aspect,
@@ -216,7 +273,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                         last_seen_mcp = state["seen"].get("mcp")
                         last_seen_mce_system_metadata = state["seen"].get("mce")
 
-                        transformed_aspect = self.transform_aspect(
+                        transformed_aspect = self._transform_aspect(
                             entity_urn=urn,
                             aspect_name=self.aspect_name(),
                             aspect=last_seen_mcp.aspect
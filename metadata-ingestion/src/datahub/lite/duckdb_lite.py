@@ -1,8 +1,24 @@
+import contextlib
+import itertools
 import json
 import logging
+import multiprocessing
 import pathlib
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import duckdb
 
@@ -15,9 +31,19 @@ from datahub.lite.lite_local import (
     AutoComplete,
     Browseable,
     DataHubLiteLocal,
+    FacetValue,
     PathNotFoundException,
     Searchable,
     SearchFlavor,
+    SearchResults,
+)
+from datahub.lite.search_index import (
+    FACET_ENTITY_TYPE,
+    URN_ASPECT_NAME,
+    SearchDocument,
+    get_aspect_search_document,
+    get_urn_search_document,
+    tokenize,
 )
 from datahub.metadata.schema_classes import (
     ChartInfoClass,
@@ -38,6 +64,72 @@ from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# Number of rows per multi-row INSERT statement in bulk writes.
+_INSERT_CHUNK_SIZE = 500
+
+_AspectKey = Tuple[str, str]
+
+
+def _deserialize_rows(
+    rows: List[Tuple[Any, ...]], typed: bool, with_system_metadata: bool
+) -> List[Tuple[Any, ...]]:
+    """
+    Deserializes rows of (urn, aspect_name, metadata, system_metadata). This runs in
+    worker processes when reads are parallelized, so it must be a top-level function.
+    """
+    deserialized: List[Tuple[Any, ...]] = []
+    for urn, aspect_name, metadata, system_metadata in rows:
+        aspect_payload = json.loads(metadata)
+        if typed:
+            assert (
+                aspect_name in ASPECT_MAP
+            ), f"Missing aspect name {aspect_name} in the registry"
+            try:
+                aspect_payload = ASPECT_MAP[aspect_name].from_obj(
+                    post_json_transform(aspect_payload)
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Failed to process urn: {urn}, aspect_name: {aspect_name}, metadata: {aspect_payload}",
+                    exc_info=e,
+                )
+                raise
+        typed_system_metadata = None
+        if with_system_metadata:
+            system_metadata_obj = json.loads(system_metadata)
+            # sysVersion is stored as a number, but properties are a map of strings.
+            if system_metadata_obj.get("properties"):
+                system_metadata_obj["properties"] = {
+                    k: str(v) for k, v in system_metadata_obj["properties"].items()
+                }
+            typed_system_metadata = SystemMetadataClass.from_obj(system_metadata_obj)
+        deserialized.append((urn, aspect_name, aspect_payload, typed_system_metadata))
+    return deserialized
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    # The smallest string that is greater than every string starting with prefix.
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class _AspectState:
+    """The current (version 0) state of an aspect while a batch is being written."""
+
+    def __init__(
+        self,
+        metadata: dict,
+        system_metadata: dict,
+        max_version: int,
+        in_db: bool,
+        created_on: int,
+    ) -> None:
+        self.metadata = metadata
+        self.system_metadata = system_metadata
+        self.max_version = max_version
+        self.in_db = in_db
+        self.created_on = created_on
+        self.dirty = False
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -47,13 +139,58 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
     def __init__(self, config: DuckDBLiteConfig) -> None:
         self.config = config
+        # When set, add_edge calls are collected here and applied in bulk.
+        self._edge_buffer: Optional[
+            List[Tuple[str, str, str, Optional[str], bool]]
+        ] = None
+        # Likewise for search index updates, keyed by the (urn, aspect name) they replace.
+        self._search_buffer: Optional[Dict[_AspectKey, SearchDocument]] = None
         fpath = pathlib.Path(self.config.file)
         fpath.parent.mkdir(exist_ok=True)
         self.duckdb_client = duckdb.connect(
             str(fpath), read_only=config.read_only, config=config.options
         )
+        self._search_index_missing = False
         if not config.read_only:
             self._init_db()
+            if self._is_search_index_missing():
+                logger.info(
+                    f"Building the search index of the DataHub Lite catalog at {self.config.file}"
+                )
+                self.reindex()
+        elif self._is_search_index_missing():
+            # Catalogs written by older versions have no search index, and it can't be
+            # built on a read-only connection.
+            self._search_index_missing = True
+            logger.warning(
+                f"The DataHub Lite catalog at {self.config.file} has no search index, so free text "
+                "searches return no results. Run `datahub lite reindex` to build it."
+            )
+
+    def _is_search_index_missing(self) -> bool:
+        tables = {
+            row[0]
+            for row in self.duckdb_client.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_name IN ('metadata_aspect_v2', 'metadata_search_facet')"
+            ).fetchall()
+        }
+        if "metadata_aspect_v2" not in tables:
+            return False
+        # Every indexed entity has an entity type facet.
+        if (
+            "metadata_search_facet" in tables
+            and self.duckdb_client.execute(
+                "SELECT 1 FROM metadata_search_facet LIMIT 1"
+            ).fetchone()
+        ):
+            return False
+        return (
+            self.duckdb_client.execute(
+                "SELECT 1 FROM metadata_aspect_v2 LIMIT 1"
+            ).fetchone()
+            is not None
+        )
 
     def _init_db(self):
         self.duckdb_client.execute(
@@ -70,6 +207,23 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS edge_idx ON metadata_edge_v2 (src_id, relnship, dst_id)"
         )
+        # An inverted index from the tokens of searchable fields to the aspects they
+        # came from, and the facet values of each entity. Both are maintained from
+        # post_update_hook, and can be rebuilt from the aspects with reindex.
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_token "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR, field VARCHAR, weight DOUBLE)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_token_idx ON metadata_search_token (token)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_facet "
+            "(urn VARCHAR, aspect_name VARCHAR, facet VARCHAR, value VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_facet_idx ON metadata_search_facet (facet, value)"
+        )
 
     def location(self) -> str:
         return self.config.file
@@ -85,52 +239,70 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             MetadataChangeProposalWrapper,
         ],
     ) -> None:
-        writeables: Iterable[MetadataChangeProposalWrapper]
-        if isinstance(record, MetadataChangeProposalWrapper):
-            writeables = [record]
-        elif isinstance(record, MetadataChangeEventClass):
-            writeables = mcps_from_mce(record)
-        else:
-            raise ValueError(
-                f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
-            )
+        self.write_batch([record])
+
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """
+        Writes a batch of records in a single transaction. The current versions of all
+        aspects in the batch are read with one query, new versions are written with
+        multi-row inserts and updates, and the resulting edges are applied in bulk.
+        """
+        writeables: List[MetadataChangeProposalWrapper] = []
+        for record in records:
+            if isinstance(record, MetadataChangeProposalWrapper):
+                writeables.append(record)
+            elif isinstance(record, MetadataChangeEventClass):
+                writeables.extend(mcps_from_mce(record))
+            else:
+                raise ValueError(
+                    f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
+                )
 
         if not writeables:
             return
 
-        # TODO use `with` for transaction
         self.duckdb_client.begin()
+        try:
+            updated = self._write_aspects(writeables)
+            with self._buffered_updates():
+                for writeable in updated:
+                    assert (
+                        writeable.entityUrn
+                        and writeable.aspectName
+                        and writeable.aspect
+                    )
+                    self.post_update_hook(
+                        writeable.entityUrn, writeable.aspectName, writeable.aspect
+                    )
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        self.duckdb_client.commit()
+
+    def _write_aspects(
+        self, writeables: List[MetadataChangeProposalWrapper]
+    ) -> List[MetadataChangeProposalWrapper]:
+        # Returns the writeables that changed the stored aspect.
+        states = self._read_aspect_states(
+            {(str(w.entityUrn), str(w.aspectName)) for w in writeables}
+        )
+
+        new_version_rows: List[Tuple[Any, ...]] = []
+        updated: List[MetadataChangeProposalWrapper] = []
         for writeable in writeables:
-            needs_write = False
             try:
-                writeable_dict = writeable.to_obj(simplified_structure=True)
-                exists = self.duckdb_client.execute(
-                    "SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? AND version = 0",
-                    [writeable.entityUrn, writeable.aspectName],
-                )
-                max_row = exists.fetchone()
-                if max_row is None:
-                    new_version = 1
-                    needs_write = True
-                else:
-                    metadata_dict = json.loads(max_row[0])  # type: ignore
-                    system_metadata = json.loads(max_row[1])  # type: ignore
-                    real_version = system_metadata.get("properties", {}).get(
-                        "sysVersion"
-                    )
-                    if real_version is None:
-                        max_version_row = self.duckdb_client.execute(
-                            "SELECT max(version) FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ?",
-                            [writeable.entityUrn, writeable.aspectName],
-                        ).fetchone()
-                        real_version = max_version_row[0]  # type: ignore
-
-                    if writeable_dict["aspect"]["json"] == metadata_dict:
-                        needs_write = False
-                        new_version = real_version
-                    else:
-                        needs_write = True
-                        new_version = real_version + 1
+                key = (str(writeable.entityUrn), str(writeable.aspectName))
+                aspect_json = writeable.to_obj(simplified_structure=True)["aspect"][
+                    "json"
+                ]
 
                 current_time = int(time.time() * 1000.0)
                 created_on = current_time
@@ -147,83 +319,262 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                 elif writeable.systemMetadata.lastObserved is None:
                     writeable.systemMetadata.lastObserved = created_on
 
-                if "properties" not in writeable_dict["systemMetadata"]:
-                    writeable_dict["systemMetadata"]["properties"] = {}
-                writeable_dict["systemMetadata"]["properties"][
-                    "sysVersion"
-                ] = new_version
-                if needs_write:
-                    self.duckdb_client.execute(
-                        query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
-                        parameters=[
-                            writeable.entityUrn,
-                            writeable.aspectName,
-                            new_version,
-                            json.dumps(writeable_dict["aspect"]["json"]),
-                            json.dumps(writeable_dict["systemMetadata"]),
-                            created_on,
-                        ],
-                    )
-                    if not max_row:
-                        self.duckdb_client.execute(
-                            query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
-                            parameters=[
-                                writeable.entityUrn,
-                                writeable.aspectName,
-                                0,
-                                json.dumps(writeable_dict["aspect"]["json"]),
-                                json.dumps(writeable_dict["systemMetadata"]),
-                                created_on,
-                            ],
-                        )
-                    else:
-                        # we update the existing v0 row
-                        self.duckdb_client.execute(
-                            query="UPDATE metadata_aspect_v2 SET metadata = ?, system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
-                            parameters=[
-                                json.dumps(writeable_dict["aspect"]["json"]),
-                                json.dumps(writeable_dict["systemMetadata"]),
-                                writeable.entityUrn,
-                                writeable.aspectName,
-                            ],
-                        )
-                else:
+                state = states.get(key)
+                if state is not None and state.metadata == aspect_json:
                     # this is a dup, we still want to update the lastObserved timestamp
-                    if not system_metadata:
-                        system_metadata = {
-                            "lastObserved": writeable.systemMetadata.lastObserved
-                        }
-                    else:
-                        system_metadata[
-                            "lastObserved"
-                        ] = writeable.systemMetadata.lastObserved
-                    self.duckdb_client.execute(
-                        query="UPDATE metadata_aspect_v2 SET system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
-                        parameters=[
-                            json.dumps(system_metadata),
-                            writeable.entityUrn,
-                            writeable.aspectName,
-                        ],
+                    state.system_metadata[
+                        "lastObserved"
+                    ] = writeable.systemMetadata.lastObserved
+                    state.dirty = True
+                    continue
+
+                if state is None:
+                    new_version = 1
+                else:
+                    real_version = state.system_metadata.get("properties", {}).get(
+                        "sysVersion"
                     )
+                    if real_version is None:
+                        real_version = state.max_version
+                    new_version = real_version + 1
+
+                system_metadata = writeable.systemMetadata.to_obj()
+                if not system_metadata.get("properties"):
+                    system_metadata["properties"] = {}
+                system_metadata["properties"]["sysVersion"] = new_version
+
+                new_version_rows.append(
+                    (
+                        key[0],
+                        key[1],
+                        new_version,
+                        json.dumps(aspect_json),
+                        json.dumps(system_metadata),
+                        created_on,
+                    )
+                )
+                if state is None:
+                    state = _AspectState(
+                        aspect_json,
+                        system_metadata,
+                        new_version,
+                        in_db=False,
+                        created_on=created_on,
+                    )
+                    states[key] = state
+                else:
+                    state.metadata = aspect_json
+                    state.system_metadata = system_metadata
+                    state.max_version = new_version
+                state.dirty = True
             except Exception as e:
                 logger.error(f"Failed to write {writeable}", e)
             else:
-                if needs_write:
-                    assert (
-                        writeable.entityUrn
-                        and writeable.aspectName
-                        and writeable.aspect
-                    )
-                    self.post_update_hook(
-                        writeable.entityUrn, writeable.aspectName, writeable.aspect
+                updated.append(writeable)
+
+        # Version 0 always holds a copy of the latest version.
+        new_v0_rows: List[Tuple[Any, ...]] = []
+        updated_v0_rows: List[Tuple[Any, ...]] = []
+        for (urn, aspect_name), state in states.items():
+            if not state.dirty:
+                continue
+            metadata_str = json.dumps(state.metadata)
+            system_metadata_str = json.dumps(state.system_metadata)
+            if state.in_db:
+                updated_v0_rows.append(
+                    (urn, aspect_name, metadata_str, system_metadata_str)
+                )
+            else:
+                new_v0_rows.append(
+                    (
+                        urn,
+                        aspect_name,
+                        0,
+                        metadata_str,
+                        system_metadata_str,
+                        state.created_on,
                     )
+                )
 
-        self.duckdb_client.commit()
+        self._insert_rows("metadata_aspect_v2", new_version_rows + new_v0_rows)
+        if updated_v0_rows:
+            self._stage_rows(
+                "lite_staged_aspects",
+                "urn VARCHAR, aspect_name VARCHAR, metadata JSON, system_metadata JSON",
+                updated_v0_rows,
+            )
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 SET metadata = s.metadata, system_metadata = s.system_metadata "
+                "FROM lite_staged_aspects s "
+                "WHERE metadata_aspect_v2.urn = s.urn AND metadata_aspect_v2.aspect_name = s.aspect_name "
+                "AND metadata_aspect_v2.version = 0"
+            )
+        return updated
+
+    def _read_aspect_states(
+        self, keys: Iterable[_AspectKey]
+    ) -> Dict[_AspectKey, _AspectState]:
+        self._stage_rows(
+            "lite_staged_keys", "urn VARCHAR, aspect_name VARCHAR", list(keys)
+        )
+        rows = self.duckdb_client.execute(
+            "SELECT a.urn, a.aspect_name, a.metadata, a.system_metadata, v.max_version "
+            "FROM metadata_aspect_v2 a JOIN ("
+            "  SELECT k.urn, k.aspect_name, max(m.version) AS max_version "
+            "  FROM lite_staged_keys k JOIN metadata_aspect_v2 m "
+            "  ON m.urn = k.urn AND m.aspect_name = k.aspect_name "
+            "  GROUP BY k.urn, k.aspect_name"
+            ") v ON a.urn = v.urn AND a.aspect_name = v.aspect_name "
+            "WHERE a.version = 0"
+        ).fetchall()
+        return {
+            (r[0], r[1]): _AspectState(
+                json.loads(r[2]),
+                json.loads(r[3]) or {},
+                r[4],
+                in_db=True,
+                created_on=0,
+            )
+            for r in rows
+        }
+
+    def _insert_rows(self, table: str, rows: List[Tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        row_placeholder = "(" + ", ".join(["?"] * len(rows[0])) + ")"
+        for i in range(0, len(rows), _INSERT_CHUNK_SIZE):
+            chunk = rows[i : i + _INSERT_CHUNK_SIZE]
+            self.duckdb_client.execute(
+                f"INSERT INTO {table} VALUES "
+                + ", ".join([row_placeholder] * len(chunk)),
+                [value for row in chunk for value in row],
+            )
+
+    def _stage_rows(
+        self, table: str, columns: str, rows: List[Tuple[Any, ...]]
+    ) -> None:
+        # Staging tables are temporary, so they are private to this connection.
+        self.duckdb_client.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {table} ({columns})"
+        )
+        self.duckdb_client.execute(f"DELETE FROM {table}")
+        self._insert_rows(table, rows)
+
+    @contextlib.contextmanager
+    def _buffered_updates(self) -> Iterator[None]:
+        """
+        Collects the edges and search index updates made within the block and applies
+        them with a few set-based queries at the end. Does not commit, the caller is
+        expected to hold a transaction.
+        """
+        self._edge_buffer = []
+        self._search_buffer = {}
+        try:
+            yield
+            self._apply_edges(self._edge_buffer)
+            self._apply_search_updates(self._search_buffer)
+        finally:
+            self._edge_buffer = None
+            self._search_buffer = None
+
+    def _apply_edges(
+        self, edges: List[Tuple[str, str, str, Optional[str], bool]]
+    ) -> None:
+        # Collapse the edges into their final state, following the semantics of
+        # calling add_edge for each of them in order.
+        replaced: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+        added: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
+        for src_id, relnship, dst_id, dst_label, remove_existing in edges:
+            pair = (src_id, relnship)
+            if remove_existing:
+                replaced[pair] = (dst_id, dst_label)
+                added.pop(pair, None)
+            elif pair in replaced and replaced[pair][0] == dst_id:
+                replaced[pair] = (dst_id, dst_label)
+            else:
+                added.setdefault(pair, {})[dst_id] = dst_label
+
+        staged: List[Tuple[Any, ...]] = [
+            (src_id, relnship, dst_id, dst_label, True)
+            for (src_id, relnship), (dst_id, dst_label) in replaced.items()
+        ]
+        staged.extend(
+            (src_id, relnship, dst_id, dst_label, False)
+            for (src_id, relnship), dsts in added.items()
+            for dst_id, dst_label in dsts.items()
+        )
+        if not staged:
+            return
+
+        self._stage_rows(
+            "lite_staged_edges",
+            "src_id VARCHAR, relnship VARCHAR, dst_id VARCHAR, dst_label VARCHAR, remove_existing BOOLEAN",
+            staged,
+        )
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_edge_v2 WHERE EXISTS ("
+            "  SELECT 1 FROM lite_staged_edges s WHERE s.remove_existing "
+            "  AND s.src_id = metadata_edge_v2.src_id AND s.relnship = metadata_edge_v2.relnship "
+            "  AND s.dst_id <> metadata_edge_v2.dst_id)"
+        )
+        self.duckdb_client.execute(
+            "UPDATE metadata_edge_v2 SET dst_label = s.dst_label FROM lite_staged_edges s "
+            "WHERE metadata_edge_v2.src_id = s.src_id AND metadata_edge_v2.relnship = s.relnship "
+            "AND metadata_edge_v2.dst_id = s.dst_id "
+            "AND metadata_edge_v2.dst_label IS DISTINCT FROM s.dst_label"
+        )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_edge_v2 "
+            "SELECT s.src_id, s.relnship, s.dst_id, s.dst_label FROM lite_staged_edges s "
+            "WHERE NOT EXISTS ("
+            "  SELECT 1 FROM metadata_edge_v2 e WHERE e.src_id = s.src_id "
+            "  AND e.relnship = s.relnship AND e.dst_id = s.dst_id)"
+        )
+
+    def _index_aspect(self, entity_urn: str, aspect_name: str, aspect: _Aspect) -> None:
+        updates = {(entity_urn, URN_ASPECT_NAME): get_urn_search_document(entity_urn)}
+        document = get_aspect_search_document(aspect)
+        if document is not None:
+            updates[(entity_urn, aspect_name)] = document
+        if self._search_buffer is not None:
+            self._search_buffer.update(updates)
+        else:
+            self._apply_search_updates(updates)
+
+    def _apply_search_updates(self, updates: Dict[_AspectKey, SearchDocument]) -> None:
+        if not updates:
+            return
+        self._stage_rows(
+            "lite_staged_search_keys", "urn VARCHAR, aspect_name VARCHAR", list(updates)
+        )
+        for table in ["metadata_search_token", "metadata_search_facet"]:
+            self.duckdb_client.execute(
+                f"DELETE FROM {table} WHERE EXISTS ("
+                f"  SELECT 1 FROM lite_staged_search_keys k "
+                f"  WHERE k.urn = {table}.urn AND k.aspect_name = {table}.aspect_name)"
+            )
+
+        token_rows: List[Tuple[Any, ...]] = []
+        facet_rows: List[Tuple[Any, ...]] = []
+        for (urn, aspect_name), document in updates.items():
+            for field in document.fields:
+                token_rows.extend(
+                    (token, urn, aspect_name, field.field, field.weight)
+                    for token in sorted(set(tokenize(field.value)))
+                )
+            facet_rows.extend(
+                (urn, aspect_name, facet.facet, facet.value)
+                for facet in set(document.facets)
+            )
+        self._insert_rows("metadata_search_token", token_rows)
+        self._insert_rows("metadata_search_facet", facet_rows)
 
     def list_ids(self) -> Iterable[str]:
-        self.duckdb_client.execute("SELECT distinct(urn) from metadata_aspect_v2")
-        for row in self.duckdb_client.fetchall():
-            yield row[0]
+        for rows in self._iterate_row_batches(
+            "SELECT distinct(urn) from metadata_aspect_v2"
+        ):
+            for row in rows:
+                yield row[0]
 
     def get(
         self,
@@ -266,6 +617,107 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             return None
 
+    def _find_search_matches(
+        self, query: str, filters: Optional[Dict[str, List[str]]]
+    ) -> None:
+        """
+        Finds the entities that match a free text query and filters, and stores their
+        urn, score and best matching aspect in the lite_search_matches temp table.
+        Entities must match all query tokens, where the last token is matched as a
+        prefix. The score is the sum of the weights of the best matching field per token.
+        """
+        tokens = tokenize(query)
+        params: List[Any] = []
+        if not tokens:
+            # An empty query, e.g. "*", matches every indexed entity.
+            matches = (
+                "SELECT urn, 0.0 AS score, NULL::VARCHAR AS aspect_name FROM metadata_search_facet "
+                "WHERE aspect_name = ? AND facet = ?"
+            )
+            params.extend([URN_ASPECT_NAME, FACET_ENTITY_TYPE])
+        else:
+            token_queries = []
+            for i, token in enumerate(tokens):
+                if i == len(tokens) - 1:
+                    condition = "token >= ? AND token < ?"
+                    params.extend([token, _prefix_upper_bound(token)])
+                else:
+                    condition = "token = ?"
+                    params.append(token)
+                token_queries.append(
+                    "SELECT urn, max(weight) AS weight, arg_max(aspect_name, weight) AS aspect_name "
+                    f"FROM metadata_search_token WHERE {condition} GROUP BY urn"
+                )
+            matches = (
+                "SELECT urn, sum(weight) AS score, arg_max(aspect_name, weight) AS aspect_name "
+                f"FROM ({' UNION ALL '.join(token_queries)}) GROUP BY urn HAVING count(*) = ?"
+            )
+            params.append(len(tokens))
+
+        for facet, values in (filters or {}).items():
+            matches = (
+                f"SELECT * FROM ({matches}) WHERE urn IN ("
+                "  SELECT urn FROM metadata_search_facet "
+                f"  WHERE facet = ? AND value IN ({', '.join(['?'] * len(values))}))"
+            )
+            params.extend([facet, *values])
+
+        # Temp tables are private to this connection, and work on read-only databases.
+        self.duckdb_client.execute(
+            f"CREATE OR REPLACE TEMP TABLE lite_search_matches AS {matches}", params
+        )
+
+    def _get_search_page(
+        self, start: int, count: Optional[int], snippet: bool
+    ) -> List[Searchable]:
+        # Only the aspects of the requested page are joined in for the snippets.
+        page_query = "SELECT * FROM lite_search_matches ORDER BY score DESC, urn"
+        params: List[Any] = []
+        if count is not None:
+            page_query += " LIMIT ?"
+            params.append(count)
+        page_query += " OFFSET ?"
+        params.append(start)
+        query = (
+            f"SELECT p.urn, p.aspect_name, {'a.metadata' if snippet else 'NULL'}, p.score "
+            f"FROM ({page_query}) p LEFT JOIN metadata_aspect_v2 a "
+            "ON a.urn = p.urn AND a.aspect_name = p.aspect_name AND a.version = 0 "
+            "ORDER BY p.score DESC, p.urn"
+        )
+        return [
+            Searchable(id=r[0], aspect=r[1], snippet=r[2], score=r[3])
+            for r in self.duckdb_client.execute(query, params).fetchall()
+        ]
+
+    def search_with_facets(
+        self,
+        query: str,
+        start: int = 0,
+        count: Optional[int] = 10,
+        filters: Optional[Dict[str, List[str]]] = None,
+        snippet: bool = True,
+    ) -> SearchResults:
+        if self._search_index_missing:
+            return SearchResults(total=0, start=start, results=[])
+        self._find_search_matches(query, filters)
+        results = self._get_search_page(start, count, snippet)
+        total_row = self.duckdb_client.execute(
+            "SELECT count(*) FROM lite_search_matches"
+        ).fetchone()
+        assert total_row is not None
+        facets: Dict[str, List[FacetValue]] = {}
+        for facet, value, value_count in self.duckdb_client.execute(
+            "SELECT f.facet, f.value, count(DISTINCT f.urn) AS value_count "
+            "FROM metadata_search_facet f JOIN lite_search_matches m ON f.urn = m.urn "
+            "GROUP BY f.facet, f.value ORDER BY f.facet, value_count DESC, f.value"
+        ).fetchall():
+            facets.setdefault(facet, []).append(
+                FacetValue(value=value, count=value_count)
+            )
+        return SearchResults(
+            total=total_row[0], start=start, results=results, facets=facets
+        )
+
     def search(
         self,
         query: str,
@@ -274,11 +726,10 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         snippet: bool = True,
     ) -> Iterable[Searchable]:
         if flavor == SearchFlavor.FREE_TEXT:
-            base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
-            for r in self.duckdb_client.execute(base_query).fetchall():
-                yield Searchable(
-                    id=r[0], aspect=r[1], snippet=r[2] if snippet else None
-                )
+            if self._search_index_missing:
+                return
+            self._find_search_matches(query, filters=None)
+            yield from self._get_search_page(start=0, count=None, snippet=snippet)
         elif flavor == SearchFlavor.EXACT:
             base_query = f"SELECT urn, aspect_name, metadata from metadata_aspect_v2 where version = 0 AND ({query})"
             for r in self.duckdb_client.execute(base_query).fetchall():
@@ -310,6 +761,11 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         src_id = str(src)
         dst_id = str(dst)
         logger.debug(f"Add edge {src_id},{dst_id},{relnship},{dst_label}")
+        if self._edge_buffer is not None:
+            self._edge_buffer.append(
+                (src_id, relnship, dst_id, dst_label, remove_existing)
+            )
+            return
         try:
             query = "SELECT * FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?"
             params = [src_id, relnship]
@@ -462,50 +918,99 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             ]
 
     def reindex(self) -> None:
+        """
+        Rebuilds the edges and the search index from the latest version of every
+        aspect. Entities are read in batches, and the updates of each batch are
+        applied in bulk.
+        """
+        # DuckDB rejects re-inserting a unique key that was deleted in the same
+        # transaction, so the existing edges are cleared in a transaction of their own.
         self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
+        self.duckdb_client.execute("DELETE FROM metadata_search_token")
+        self.duckdb_client.execute("DELETE FROM metadata_search_facet")
+        self.duckdb_client.commit()
+        self.duckdb_client.begin()
+        try:
+            entities = iter(self.get_all_entities(typed=True))
+            while True:
+                batch = list(itertools.islice(entities, self.config.fetch_batch_size))
+                if not batch:
+                    break
+                with self._buffered_updates():
+                    for urn_aspect_dict in batch:
+                        for urn, aspect_map in urn_aspect_dict.items():
+                            for aspect_name, aspect_value in aspect_map.items():
+                                assert isinstance(aspect_value, _Aspect)
+                                self.post_update_hook(urn, aspect_name, aspect_value)
+                            self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
         self.duckdb_client.commit()
-        for urn_aspect_dict in self.get_all_entities(typed=True):
-            for urn, aspect_map in urn_aspect_dict.items():
-                for aspect_name, aspect_value in aspect_map.items():
-                    assert isinstance(aspect_value, _Aspect)
-                    self.post_update_hook(urn, aspect_name, aspect_value)
-                self.global_post_update_hook(urn, aspect_map)  # type: ignore
+
+    def _iterate_row_batches(self, query: str) -> Iterator[List[Tuple[Any, ...]]]:
+        # Rows are read through a separate cursor, so that the caller can keep using
+        # the connection (e.g. to write edges) while iterating.
+        cursor = self.duckdb_client.cursor()
+        try:
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(self.config.fetch_batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    def _deserialize_row_batches(
+        self,
+        row_batches: Iterator[List[Tuple[Any, ...]]],
+        typed: bool,
+        with_system_metadata: bool,
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        if not typed or self.config.parallelism <= 1:
+            for rows in row_batches:
+                yield _deserialize_rows(rows, typed, with_system_metadata)
+            return
+
+        # Forking a process that has DuckDB's threads running is not safe, so the
+        # workers are spawned instead.
+        with ProcessPoolExecutor(
+            max_workers=self.config.parallelism,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            # Keep a bounded number of batches in flight, and consume them in order.
+            pending: Deque[Future] = deque()
+            for rows in row_batches:
+                pending.append(
+                    executor.submit(
+                        _deserialize_rows, rows, typed, with_system_metadata
+                    )
+                )
+                if len(pending) >= 2 * self.config.parallelism:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
     def get_all_entities(
         self, typed: bool = False
     ) -> Iterable[Dict[str, Union[dict, _Aspect]]]:
         query = "SELECT urn, aspect_name, metadata, system_metadata from metadata_aspect_v2 where version = 0 order by (urn, aspect_name)"
-        results = self.duckdb_client.execute(query)
-        aspect_map: Dict[str, _Aspect] = {}
+        aspect_map: Dict[str, Union[dict, _Aspect]] = {}
         current_urn = None
-        for r in results.fetchall():
-            urn = r[0]
-            aspect_name = r[1]
-            aspect_payload = json.loads(r[2])
-            if typed:
-                assert (
-                    aspect_name in ASPECT_MAP
-                ), f"Missing aspect name {aspect_name} in the registry"
-                try:
-                    aspect_payload = ASPECT_MAP[aspect_name].from_obj(
-                        post_json_transform(aspect_payload)
-                    )
-                except Exception as e:
-                    logger.exception(
-                        f"Failed to process urn: {urn}, aspect_name: {aspect_name}, metadata: {aspect_payload}",
-                        exc_info=e,
-                    )
-                    raise
-
-            if current_urn is None:
-                current_urn = urn
-            if urn != current_urn:
-                if aspect_map:
-                    yield {current_urn: aspect_map}
-                    aspect_map = {}
+        for rows in self._deserialize_row_batches(
+            self._iterate_row_batches(query), typed, with_system_metadata=False
+        ):
+            for urn, aspect_name, aspect_payload, _ in rows:
+                if current_urn is None:
                     current_urn = urn
+                if urn != current_urn:
+                    if aspect_map:
+                        yield {current_urn: aspect_map}
+                        aspect_map = {}
+                        current_urn = urn
 
-            aspect_map[aspect_name] = aspect_payload
+                aspect_map[aspect_name] = aspect_payload
 
         if aspect_map:
             assert current_urn
@@ -513,19 +1018,16 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
     def get_all_aspects(self) -> Iterable[MetadataChangeProposalWrapper]:
         query = "SELECT urn, aspect_name, metadata, system_metadata from metadata_aspect_v2 where version = 0"
-        results = self.duckdb_client.execute(query)
-        for r in results.fetchall():
-            urn = r[0]
-            aspect_name = r[1]
-            aspect_metadata = ASPECT_MAP[aspect_name].from_obj(post_json_transform(json.loads(r[2])))  # type: ignore
-            system_metadata = SystemMetadataClass.from_obj(json.loads(r[3]))
-            mcp = MetadataChangeProposalWrapper(
-                entityUrn=urn,
-                aspectName=aspect_name,
-                aspect=aspect_metadata,
-                systemMetadata=system_metadata,
-            )
-            yield mcp
+        for rows in self._deserialize_row_batches(
+            self._iterate_row_batches(query), typed=True, with_system_metadata=True
+        ):
+            for urn, aspect_name, aspect_metadata, system_metadata in rows:
+                yield MetadataChangeProposalWrapper(
+                    entityUrn=urn,
+                    aspectName=aspect_name,
+                    aspect=aspect_metadata,
+                    systemMetadata=system_metadata,
+                )
 
     def close(self) -> None:
         self.reindex()
@@ -719,6 +1221,7 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     def post_update_hook(
         self, entity_urn: str, aspect_name: str, aspect: _Aspect
     ) -> None:
+        self._index_aspect(entity_urn, aspect_name, aspect)
 
         if isinstance(aspect, DatasetPropertiesClass):
             dp: DatasetPropertiesClass = aspect
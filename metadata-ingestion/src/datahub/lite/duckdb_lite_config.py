@@ -5,3 +5,9 @@ class DuckDBLiteConfig(ConfigModel):
     file: str
     read_only: bool = False
     options: dict = {}
+    # Number of rows fetched at a time when iterating over the whole catalog, e.g. for
+    # exports and reindexing. This bounds the memory used by these reads.
+    fetch_batch_size: int = 10000
+    # Number of processes used to deserialize aspects when iterating over the whole
+    # catalog. Deserialization happens in the calling process if this is 1.
+    parallelism: int = 1
@@ -29,6 +29,19 @@ class Searchable(ConfigModel):
     id: str
     aspect: Optional[str]
     snippet: Optional[str]
+    score: Optional[float] = None
+
+
+class FacetValue(ConfigModel):
+    value: str
+    count: int
+
+
+class SearchResults(ConfigModel):
+    total: int
+    start: int
+    results: List[Searchable]
+    facets: Dict[str, List[FacetValue]] = {}
 
 
 class SearchFlavor(Enum):
@@ -70,6 +83,19 @@ class DataHubLiteLocal(Generic[LiteConfig], Closeable, metaclass=ABCMeta):
     ) -> None:
         pass
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """Writes a batch of records. Implementations can override this to write in bulk."""
+        for record in records:
+            self.write(record)
+
     @abstractmethod
     def list_ids(self) -> Iterable[str]:
         pass
@@ -95,6 +121,22 @@ class DataHubLiteLocal(Generic[LiteConfig], Closeable, metaclass=ABCMeta):
     ) -> Iterable[Searchable]:
         pass
 
+    @abstractmethod
+    def search_with_facets(
+        self,
+        query: str,
+        start: int = 0,
+        count: Optional[int] = 10,
+        filters: Optional[Dict[str, List[str]]] = None,
+        snippet: bool = True,
+    ) -> SearchResults:
+        """
+        Runs a free text search and returns a page of ranked results along with the
+        facet counts of all matching entities. If count is None, all results from start
+        onwards are returned.
+        """
+        pass
+
     @abstractmethod
     def ls(self, path: str) -> List[Browseable]:
         pass
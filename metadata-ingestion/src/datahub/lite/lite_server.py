@@ -1,3 +1,4 @@
+import itertools
 import logging
 from typing import Dict, List, Optional, Union
 
@@ -9,7 +10,9 @@ from datahub.lite.lite_local import (
     DataHubLiteLocal,
     Searchable,
     SearchFlavor,
+    SearchResults,
 )
+from datahub.lite.search_index import parse_facet_filters
 
 app = FastAPI()
 logger = logging.getLogger(__name__)
@@ -67,11 +70,34 @@ def browse(
 def search(
     query: str = Query("*"),
     flavor: SearchFlavor = Query(SearchFlavor.FREE_TEXT),
+    start: int = Query(0, ge=0),
+    count: Optional[int] = Query(None, ge=0),
     lite: DataHubLiteLocal = Depends(lite),
 ) -> List[Searchable]:
-    # Queried as GET /search/?query=<url-encoded-query>
+    # Queried as GET /search/?query=<url-encoded-query>&start=0&count=10
     logger.info(f"search {query}")
-    return list(lite.search(query=query, flavor=flavor))
+    results = lite.search(query=query, flavor=flavor)
+    end = None if count is None else start + count
+    return list(itertools.islice(results, start, end))
+
+
+@app.get("/search/faceted")
+def search_faceted(
+    query: str = Query("*"),
+    start: int = Query(0, ge=0),
+    count: int = Query(10, ge=0),
+    filters: Optional[List[str]] = Query(None),
+    lite: DataHubLiteLocal = Depends(lite),
+) -> SearchResults:
+    # Queried as GET /search/faceted/?query=<url-encoded-query>&filters=platform%3Dhive&...
+    logger.info(f"faceted search {query} filters={filters}")
+    try:
+        parsed_filters = parse_facet_filters(filters or [])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return lite.search_with_facets(
+        query=query, start=start, count=count, filters=parsed_filters
+    )
 
 
 # TODO put command
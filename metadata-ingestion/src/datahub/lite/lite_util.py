@@ -12,6 +12,7 @@ from datahub.lite.lite_local import (
     DataHubLiteLocal,
     Searchable,
     SearchFlavor,
+    SearchResults,
 )
 from datahub.lite.lite_registry import lite_registry
 from datahub.metadata.schema_classes import MetadataChangeEventClass, _Aspect
@@ -43,6 +44,23 @@ class DataHubLiteWrapper(DataHubLiteLocal):
             record_envelope=record_envelope, write_callback=NoopWriteCallback()
         )
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        records = list(records)
+        self.lite.write_batch(records)
+        for record in records:
+            self.forward_to.write_record_async(
+                record_envelope=RecordEnvelope(record=record, metadata={}),
+                write_callback=NoopWriteCallback(),
+            )
+
     def close(self) -> None:
         self.lite.close()
         self.forward_to.close()
@@ -75,6 +93,16 @@ class DataHubLiteWrapper(DataHubLiteLocal):
     ) -> Iterable[Searchable]:
         yield from self.lite.search(query, flavor, aspects, snippet)
 
+    def search_with_facets(
+        self,
+        query: str,
+        start: int = 0,
+        count: Optional[int] = 10,
+        filters: Optional[Dict[str, List[str]]] = None,
+        snippet: bool = True,
+    ) -> SearchResults:
+        return self.lite.search_with_facets(query, start, count, filters, snippet)
+
     def ls(self, path: str) -> List[Browseable]:
         return self.lite.ls(path)
 
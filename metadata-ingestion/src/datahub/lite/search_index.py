@@ -0,0 +1,164 @@
+"""
+Extracts the searchable text and facets of entities for the DataHub Lite search index.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from datahub.metadata.schema_classes import (
+    ChartInfoClass,
+    ContainerPropertiesClass,
+    DashboardInfoClass,
+    DataFlowInfoClass,
+    DataJobInfoClass,
+    DataPlatformInstanceClass,
+    DatasetPropertiesClass,
+    EditableDatasetPropertiesClass,
+    GlobalTagsClass,
+    GlossaryTermsClass,
+    TagPropertiesClass,
+    _Aspect,
+)
+from datahub.utilities.urns.data_platform_urn import DataPlatformUrn
+from datahub.utilities.urns.urn import Urn
+
+# The pseudo aspect name under which fields derived from the urn itself are indexed.
+URN_ASPECT_NAME = "urn"
+
+FACET_ENTITY_TYPE = "entity_type"
+FACET_PLATFORM = "platform"
+FACET_TAG = "tag"
+
+NAME_WEIGHT = 3.0
+URN_WEIGHT = 2.0
+TAG_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+PLATFORM_WEIGHT = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class SearchField(NamedTuple):
+    field: str
+    value: str
+    weight: float
+
+
+class SearchFacet(NamedTuple):
+    facet: str
+    value: str
+
+
+class SearchDocument(NamedTuple):
+    fields: List[SearchField]
+    facets: List[SearchFacet]
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def parse_facet_filters(filters: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Parses filters of the form `facet=value` into a map of facet to values. Entities
+    must match at least one value of every facet that is filtered on.
+    """
+    parsed: Dict[str, List[str]] = {}
+    for f in filters:
+        facet, sep, value = f.partition("=")
+        if not sep or not facet or not value:
+            raise ValueError(f"Filter {f} must be of the form facet=value")
+        parsed.setdefault(facet.strip(), []).append(value.strip())
+    return parsed
+
+
+def _platform_from_urn(urn: Urn) -> Optional[str]:
+    entity_type = urn.get_type()
+    entity_id = urn.get_entity_id()
+    if entity_type == "dataset" or entity_type == "dataPlatformInstance":
+        return DataPlatformUrn.create_from_string(
+            entity_id[0]
+        ).get_entity_id_as_string()
+    if entity_type in {"chart", "dashboard", "dataFlow"}:
+        return entity_id[0]
+    if entity_type == "dataJob":
+        return _platform_from_urn(Urn.create_from_string(entity_id[0]))
+    return None
+
+
+def get_urn_search_document(entity_urn: str) -> SearchDocument:
+    """Returns the fields and facets that are derived from an entity's urn."""
+    urn = Urn.create_from_string(entity_urn)
+    id_parts = [
+        part for part in urn.get_entity_id() if not part.startswith(Urn.URN_PREFIX)
+    ]
+    facets = [SearchFacet(FACET_ENTITY_TYPE, urn.get_type())]
+    fields = [SearchField("urn", " ".join(id_parts), URN_WEIGHT)]
+    platform = _platform_from_urn(urn)
+    if platform:
+        facets.append(SearchFacet(FACET_PLATFORM, platform))
+        fields.append(SearchField("platform", platform, PLATFORM_WEIGHT))
+    return SearchDocument(fields, facets)
+
+
+def get_aspect_search_document(aspect: _Aspect) -> Optional[SearchDocument]:
+    """
+    Returns the fields and facets to index for an aspect, or None if the aspect
+    is not searchable.
+    """
+    fields: List[SearchField] = []
+    facets: List[SearchFacet] = []
+
+    if isinstance(
+        aspect,
+        (
+            DatasetPropertiesClass,
+            ContainerPropertiesClass,
+            TagPropertiesClass,
+            DataFlowInfoClass,
+            DataJobInfoClass,
+        ),
+    ):
+        if aspect.name:
+            fields.append(SearchField("name", aspect.name, NAME_WEIGHT))
+        if aspect.description:
+            fields.append(
+                SearchField("description", aspect.description, DESCRIPTION_WEIGHT)
+            )
+    elif isinstance(aspect, (ChartInfoClass, DashboardInfoClass)):
+        fields.append(SearchField("name", aspect.title, NAME_WEIGHT))
+        if aspect.description:
+            fields.append(
+                SearchField("description", aspect.description, DESCRIPTION_WEIGHT)
+            )
+    elif isinstance(aspect, EditableDatasetPropertiesClass):
+        if aspect.description:
+            fields.append(
+                SearchField(
+                    "editable_description", aspect.description, DESCRIPTION_WEIGHT
+                )
+            )
+    elif isinstance(aspect, GlobalTagsClass):
+        tags = [
+            Urn.create_from_string(t.tag).get_entity_id_as_string() for t in aspect.tags
+        ]
+        if tags:
+            fields.append(SearchField("tags", " ".join(tags), TAG_WEIGHT))
+        facets.extend(SearchFacet(FACET_TAG, tag) for tag in tags)
+    elif isinstance(aspect, GlossaryTermsClass):
+        terms = [
+            Urn.create_from_string(t.urn).get_entity_id_as_string()
+            for t in aspect.terms
+        ]
+        if terms:
+            fields.append(SearchField("terms", " ".join(terms), TAG_WEIGHT))
+    elif isinstance(aspect, DataPlatformInstanceClass):
+        platform = DataPlatformUrn.create_from_string(
+            aspect.platform
+        ).get_entity_id_as_string()
+        facets.append(SearchFacet(FACET_PLATFORM, platform))
+        fields.append(SearchField("platform", platform, PLATFORM_WEIGHT))
+    else:
+        return None
+
+    return SearchDocument(fields, facets)
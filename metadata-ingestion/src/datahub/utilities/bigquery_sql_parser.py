@@ -1,13 +1,19 @@
 import re
-from typing import List
+from typing import List, Optional
 
+import sqllineage
 import sqlparse
 
 from datahub.utilities.sql_parser import SqlLineageSQLParser, SQLParser
+from datahub.utilities.sql_parser_cache import get_sql_parse_cache, sql_parse_cache_key
 
 
 class BigQuerySQLParser(SQLParser):
-    parser: SQLParser
+    # Bump this whenever the query rewriting below changes.
+    _CACHE_VERSION = "1"
+
+    parser: Optional[SQLParser] = None
+    _rewritten_sql_query: Optional[str] = None
 
     def __init__(
         self,
@@ -17,10 +23,31 @@ class BigQuerySQLParser(SQLParser):
     ) -> None:
         super().__init__(sql_query)
 
-        self._parsed_sql_query = self.parse_sql_query(sql_query)
-        self.parser = SqlLineageSQLParser(
+        # Check the cache before rewriting the query, since the rewrite itself is costly.
+        cache_key = sql_parse_cache_key(
+            "bigquery" + ("-raw-names" if use_raw_names else ""),
+            f"{self._CACHE_VERSION}-{sqllineage.VERSION}",
+            sql_query,
+        )
+        cached = get_sql_parse_cache().get(cache_key)
+        if cached is not None:
+            self._tables, self._columns = cached
+            return
+
+        parser = SqlLineageSQLParser(
             self._parsed_sql_query, use_external_process, use_raw_names
         )
+        self.parser = parser
+        self._tables = parser.get_tables()
+        self._columns = parser.get_columns()
+        if not parser.failed:
+            get_sql_parse_cache().put(cache_key, self._tables, self._columns)
+
+    @property
+    def _parsed_sql_query(self) -> str:
+        if self._rewritten_sql_query is None:
+            self._rewritten_sql_query = self.parse_sql_query(self._sql_query)
+        return self._rewritten_sql_query
 
     def parse_sql_query(self, sql_query: str) -> str:
         sql_query = BigQuerySQLParser._parse_bigquery_comment_sign(sql_query)
@@ -86,7 +113,7 @@ class BigQuerySQLParser(SQLParser):
         )
 
     def get_tables(self) -> List[str]:
-        return self.parser.get_tables()
+        return list(self._tables)
 
     def get_columns(self) -> List[str]:
-        return self.parser.get_columns()
+        return list(self._columns)
@@ -0,0 +1,146 @@
+"""
+Helpers for reading and writing newline-delimited JSON (JSON lines) files.
+
+Files whose name ends in `.gz` or `.zst` are transparently (de)compressed. Encoding and
+decoding use orjson when it is installed, and fall back to the standard library otherwise.
+Zstandard compression requires the zstandard package.
+"""
+
+import contextlib
+import gzip
+import json
+import os
+from typing import IO, Any, Iterator, List, Optional, Tuple
+
+orjson: Any = None
+with contextlib.suppress(ImportError):
+    import orjson  # type: ignore
+
+zstandard: Any = None
+with contextlib.suppress(ImportError):
+    import zstandard  # type: ignore
+
+GZIP_SUFFIX = ".gz"
+ZSTD_SUFFIX = ".zst"
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+# The number of characters that are read to detect the format of a metadata file.
+_DETECTION_PREFIX_SIZE = 64 * 1024
+
+
+def is_compressed(path: str) -> bool:
+    return path.endswith(GZIP_SUFFIX) or path.endswith(ZSTD_SUFFIX)
+
+
+def open_file(path: str, mode: str) -> IO:
+    """
+    Opens a file for reading or writing, in text ("r", "w") or binary ("rb", "wb") mode,
+    compressing or decompressing it based on its suffix.
+    """
+    assert mode in {"r", "w", "rb", "wb"}
+    binary = mode.endswith("b")
+    compressed_mode = mode if binary else mode + "t"
+    encoding = None if binary else "utf-8"
+    if path.endswith(GZIP_SUFFIX):
+        return gzip.open(path, compressed_mode, encoding=encoding)
+    if path.endswith(ZSTD_SUFFIX):
+        if zstandard is None:
+            raise ImportError(
+                f"Reading or writing {path} requires the zstandard package. "
+                "Please install it with `pip install zstandard`."
+            )
+        return zstandard.open(path, compressed_mode, encoding=encoding)
+    return open(path, mode, encoding=encoding)
+
+
+def has_json_lines_suffix(path: str) -> bool:
+    if path.endswith(GZIP_SUFFIX):
+        path = path[: -len(GZIP_SUFFIX)]
+    elif path.endswith(ZSTD_SUFFIX):
+        path = path[: -len(ZSTD_SUFFIX)]
+    return path.endswith(JSON_LINES_SUFFIXES)
+
+
+def dumps(obj: Any) -> str:
+    """Serializes an object as compact JSON on a single line."""
+    if orjson is not None:
+        # orjson does not support some values, e.g. integers beyond 64 bits.
+        with contextlib.suppress(TypeError):
+            return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(line: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def is_json_lines_file(path: str) -> bool:
+    """
+    Returns whether a metadata file is in the JSON lines format, as opposed to a single
+    JSON array or object. Files with a `.jsonl` or `.ndjson` suffix are always treated as
+    JSON lines. For other files, only a bounded prefix is read: a file that starts with
+    `[` is a JSON array, and otherwise we check whether the first line is a complete
+    JSON object.
+    """
+    if has_json_lines_suffix(path):
+        return True
+    with open_file(path, "r") as f:
+        prefix = f.read(_DETECTION_PREFIX_SIZE)
+    content = prefix.lstrip()
+    if not content.startswith("{"):
+        return False
+    first_line, newline, _ = content.partition("\n")
+    if not newline and len(prefix) == _DETECTION_PREFIX_SIZE:
+        # The first line is too long to check. It starts a one-line object, which is
+        # read the same way as a JSON lines file.
+        return True
+    try:
+        return isinstance(loads(first_line), dict)
+    except ValueError:
+        return False
+
+
+def split_byte_ranges(path: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Splits an uncompressed file into byte ranges of roughly `chunk_size` bytes, which can
+    be read independently with `iterate_json_lines`.
+    """
+    assert not is_compressed(path), "compressed files cannot be split by byte range"
+    size = os.path.getsize(path)
+    return [
+        (start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)
+    ]
+
+
+def iterate_json_lines(
+    path: str, start: int = 0, end: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Yields the objects of a JSON lines file. If a byte range is given, only the lines that
+    start within [start, end) are read. Since every line starts in exactly one range, a
+    file can be read in parallel by splitting it with `split_byte_ranges`.
+    """
+    if start == 0 and end is None:
+        with open_file(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+        return
+
+    with open(path, "rb") as f:
+        if start > 0:
+            # Skip the line that is in progress at `start`, since it belongs to the
+            # previous range. If `start` is exactly at the start of a line, the
+            # preceding newline tells us so.
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        while end is None or position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            if line.strip():
+                yield loads(line.decode("utf-8"))
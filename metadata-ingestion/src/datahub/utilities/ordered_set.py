@@ -0,0 +1,64 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    MutableSet,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class OrderedSet(MutableSet[T], Generic[T]):
+    """
+    A set that remembers insertion order, backed by a single dict.
+
+    It can be used as a pydantic field, which is parsed from and serialized to a list.
+    """
+
+    def __init__(self, iterable: Optional[Iterable[T]] = None) -> None:
+        self._dict: Dict[T, None] = dict.fromkeys(iterable or [])
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._dict
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._dict)
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def add(self, item: T) -> None:
+        self._dict[item] = None
+
+    def discard(self, item: T) -> None:
+        self._dict.pop(item, None)
+
+    def __eq__(self, other: object) -> bool:
+        # Like lists, ordered sets are only equal if their order matches.
+        if isinstance(other, (OrderedSet, list)):
+            return list(self) == list(other)
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], "OrderedSet"]]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> "OrderedSet":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return cls(value)
+        raise TypeError(f"Cannot convert {type(value).__name__} to {cls.__name__}")
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="array", uniqueItems=True)
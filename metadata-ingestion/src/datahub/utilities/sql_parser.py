@@ -1,16 +1,27 @@
+import atexit
 import contextlib
 import logging
 import multiprocessing
+import os
+import queue
 import re
 import sys
+import threading
 import traceback
-from multiprocessing import Process, Queue
-from typing import Any, List, Optional, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Iterable, List, Optional, Tuple, Type
+
+import psutil
 
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
-from datahub.utilities.sql_parser_base import SQLParser
+from datahub.utilities.sql_parser_base import SQLParser, SqlParserException
+from datahub.utilities.sql_parser_cache import get_sql_parse_cache, sql_parse_cache_key
 
 with contextlib.suppress(ImportError):
+    import sqllineage
+with contextlib.suppress(ImportError):
+    import sql_metadata
     from sql_metadata import Parser as MetadataSQLParser
 logger = logging.getLogger(__name__)
 
@@ -21,6 +32,16 @@ class MetadataSQLSQLParser(SQLParser):
     def __init__(self, sql_query: str, use_external_process: bool = True) -> None:
         super().__init__(sql_query, use_external_process)
 
+        self._tables: Optional[List[str]] = None
+        self._columns: Optional[List[str]] = None
+        cache_key = sql_parse_cache_key(
+            "sql_metadata", getattr(sql_metadata, "__version__", ""), sql_query
+        )
+        cached = get_sql_parse_cache().get(cache_key)
+        if cached is not None:
+            self._tables, self._columns = cached
+            return
+
         original_sql_query = sql_query
 
         # MetadataSQLParser makes mistakes on lateral flatten queries, use the prefix
@@ -38,13 +59,31 @@ class MetadataSQLSQLParser(SQLParser):
 
         self._parser = MetadataSQLParser(sql_query)
 
+        # Only cache queries that both tables and columns can be extracted from. For
+        # the others, get_tables and get_columns raise the parser's errors as usual.
+        with contextlib.suppress(Exception):
+            tables = self._get_tables()
+            columns = self._get_columns()
+            get_sql_parse_cache().put(cache_key, tables, columns)
+            self._tables, self._columns = tables, columns
+
     def get_tables(self) -> List[str]:
+        if self._tables is not None:
+            return list(self._tables)
+        return self._get_tables()
+
+    def get_columns(self) -> List[str]:
+        if self._columns is not None:
+            return list(self._columns)
+        return self._get_columns()
+
+    def _get_tables(self) -> List[str]:
         result = self._parser.tables
         # Sort tables to make the list deterministic
         result.sort()
         return result
 
-    def get_columns(self) -> List[str]:
+    def _get_columns(self) -> List[str]:
         columns_dict = self._parser.columns_dict
         # don't attempt to parse columns if there are joins involved
         if columns_dict.get("join", {}) != {}:
@@ -108,10 +147,22 @@ class SqlLineageSQLParser(SQLParser):
         use_raw_names: bool = False,
     ) -> None:
         super().__init__(sql_query, use_external_process)
-        if use_external_process:
+        # Set when parsing failed in-process, in which case tables and columns are empty.
+        self.failed = False
+        cache = get_sql_parse_cache()
+        cache_key = sql_parse_cache_key(
+            "sqllineage" + ("-raw-names" if use_raw_names else ""),
+            sqllineage.VERSION,
+            sql_query,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            self.tables, self.columns = cached
+        elif use_external_process:
             self.tables, self.columns = self._get_tables_columns_process_wrapped(
                 sql_query, use_raw_names
             )
+            cache.put(cache_key, self.tables, self.columns)
         else:
             return_tuple = sql_lineage_parser_impl_func_wrapper(
                 None, sql_query, use_raw_names
@@ -122,25 +173,21 @@ class SqlLineageSQLParser(SQLParser):
                     self.columns,
                     some_exception,
                 ) = return_tuple
+                self.failed = some_exception is not None
+                if not self.failed:
+                    cache.put(cache_key, self.tables, self.columns)
 
     @staticmethod
     def _get_tables_columns_process_wrapped(
         sql_query: str, use_raw_names: bool = False
     ) -> Tuple[List[str], List[str]]:
-        # Invoke sql_lineage_parser_impl_func_wrapper in a separate process to avoid
+        # Run sql_lineage_parser_impl_func_wrapper in a separate process to avoid
         # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
         # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
         # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
-            args=(queue, sql_query, use_raw_names),
-        )
-        process.start()
-        tables, columns, exception_details = queue.get(block=True)
-        if exception_details is not None:
-            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
-        return tables, columns
+        # The worker processes are long-lived and recycled periodically, so we don't pay
+        # the process startup cost for every query.
+        return get_sql_parser_pool().parse(sql_query, use_raw_names)
 
     def get_tables(self) -> List[str]:
         return self.tables
@@ -149,4 +196,195 @@ class SqlLineageSQLParser(SQLParser):
         return self.columns
 
 
+def _sql_parser_worker_main(
+    conn: Connection, max_parses: int, max_rss_bytes: Optional[int]
+) -> None:
+    """
+    Main loop of a parser worker process. Receives (sql_query, use_raw_names) tuples
+    over the pipe and replies with (tables, columns, exception_details, retiring).
+    The worker exits once it has parsed `max_parses` queries or its RSS grows beyond
+    `max_rss_bytes`, so that memory leaked by sqllineage is regularly released.
+    """
+    process = psutil.Process()
+    parses = 0
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        sql_query, use_raw_names = request
+        tables, columns, exception_details = sql_lineage_parser_impl_func_wrapper(
+            None, sql_query, use_raw_names
+        ) or ([], [], None)
+        parses += 1
+        retiring = parses >= max_parses or (
+            max_rss_bytes is not None and process.memory_info().rss > max_rss_bytes
+        )
+        conn.send((tables, columns, exception_details, retiring))
+        if retiring:
+            return
+
+
+class _SqlParserWorker:
+    def __init__(
+        self,
+        ctx: Any,
+        max_parses: int,
+        max_rss_bytes: Optional[int],
+    ) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_sql_parser_worker_main,
+            args=(child_conn, max_parses, max_rss_bytes),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        with contextlib.suppress(Exception):
+            self.conn.send(None)
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SqlParserPool:
+    """
+    A pool of long-lived worker processes that run SqlLineageSQLParserImpl.
+
+    Parsing still happens outside of the main process, so memory leaked by
+    sqllineage does not accumulate in the datahub cli, but workers are reused
+    across queries. A worker is replaced after `max_parses_per_worker` queries
+    or once its RSS exceeds `max_worker_rss_mb`. A query that takes longer than
+    `timeout_sec` kills its worker and raises a SqlParserException.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        max_parses_per_worker: int = 1000,
+        max_worker_rss_mb: Optional[int] = 1024,
+        timeout_sec: Optional[float] = 60,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_parses_per_worker = max_parses_per_worker
+        self.max_worker_rss_bytes = (
+            max_worker_rss_mb * 1024 * 1024 if max_worker_rss_mb is not None else None
+        )
+        self.timeout_sec = timeout_sec
+
+        self._ctx = multiprocessing.get_context()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers_started = 0
+        self._idle_workers: "queue.Queue[Optional[_SqlParserWorker]]" = queue.Queue()
+        # Each slot stands for a worker that may be started lazily.
+        for _ in range(max_workers):
+            self._idle_workers.put(None)
+
+    def _new_worker(self) -> _SqlParserWorker:
+        with self._lock:
+            self._workers_started += 1
+        return _SqlParserWorker(
+            self._ctx, self.max_parses_per_worker, self.max_worker_rss_bytes
+        )
+
+    def parse(
+        self, sql_query: str, use_raw_names: bool = False
+    ) -> Tuple[List[str], List[str]]:
+        if self._closed:
+            raise RuntimeError("SqlParserPool is closed")
+
+        worker: Optional[_SqlParserWorker] = (
+            self._idle_workers.get() or self._new_worker()
+        )
+        try:
+            try:
+                assert worker is not None
+                worker.conn.send((sql_query, use_raw_names))
+                if not worker.conn.poll(self.timeout_sec):
+                    worker.kill()
+                    worker = None
+                    raise SqlParserException(
+                        f"Parsing SQL query timed out after {self.timeout_sec} seconds"
+                    )
+                tables, columns, exception_details, retiring = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                # The worker died, e.g. because it was OOM-killed.
+                if worker is not None:
+                    worker.kill()
+                worker = None
+                raise SqlParserException(f"SQL parser worker process failed: {e}")
+
+            if retiring:
+                worker.process.join()
+                worker.conn.close()
+                worker = None
+        finally:
+            self._idle_workers.put(worker)
+
+        if exception_details is not None:
+            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
+        return tables, columns
+
+    def parse_many(
+        self, sql_queries: Iterable[str], use_raw_names: bool = False
+    ) -> List[Tuple[List[str], List[str], Optional[BaseException]]]:
+        """
+        Parses a batch of queries across the worker pool. Results are returned in
+        the order of the input as (tables, columns, exception) tuples, where the
+        exception is set if parsing that query failed.
+        """
+
+        def _parse_one(
+            sql_query: str,
+        ) -> Tuple[List[str], List[str], Optional[BaseException]]:
+            try:
+                tables, columns = self.parse(sql_query, use_raw_names)
+                return tables, columns, None
+            except Exception as e:
+                return [], [], e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(_parse_one, sql_queries))
+
+    @property
+    def workers_started(self) -> int:
+        return self._workers_started
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle_workers.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.stop()
+
+
+_sql_parser_pool: Optional[SqlParserPool] = None
+_sql_parser_pool_lock = threading.Lock()
+
+
+def get_sql_parser_pool() -> SqlParserPool:
+    """Returns the process-wide parser pool, starting it on first use."""
+    global _sql_parser_pool
+    with _sql_parser_pool_lock:
+        if _sql_parser_pool is None:
+            _sql_parser_pool = SqlParserPool(max_workers=min(4, os.cpu_count() or 1))
+            atexit.register(_sql_parser_pool.close)
+        return _sql_parser_pool
+
+
 DefaultSQLParser = SqlLineageSQLParser
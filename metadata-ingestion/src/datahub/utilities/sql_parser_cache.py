@@ -0,0 +1,165 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from datahub import __version__
+
+logger = logging.getLogger(__name__)
+
+ENV_SQL_PARSE_CACHE_PATH = "DATAHUB_SQL_PARSE_CACHE_PATH"
+ENV_SQL_PARSE_CACHE_SIZE = "DATAHUB_SQL_PARSE_CACHE_SIZE"
+
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_COMMIT_INTERVAL = 100
+
+TablesAndColumns = Tuple[List[str], List[str]]
+
+_HORIZONTAL_WHITESPACE_RE = re.compile(r"[ \t\f\v]+")
+
+
+def normalize_sql(sql_query: str) -> str:
+    """
+    Normalizes a SQL query so that trivially different spellings of the same statement
+    share a cache entry. Line breaks are kept, because they terminate `--` comments.
+    """
+    lines = (
+        _HORIZONTAL_WHITESPACE_RE.sub(" ", line).strip()
+        for line in sql_query.strip().rstrip(";").splitlines()
+    )
+    return "\n".join(line for line in lines if line)
+
+
+def sql_parse_cache_key(parser_name: str, parser_version: str, sql_query: str) -> str:
+    """
+    Computes the cache key of a query. It includes the parser name and version, so
+    that results of different parsers or parser releases are never mixed up.
+    """
+    key_material = "\0".join(
+        [parser_name, parser_version, __version__, normalize_sql(sql_query)]
+    )
+    return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+
+class SqlParseCache:
+    """
+    A cache of the tables and columns extracted from SQL queries.
+
+    Entries are kept in an in-memory LRU. If `path` is set, they are also written to a
+    SQLite file so that they survive between ingestion runs. Writes are committed every
+    `commit_interval` entries and on `close`. The cache is thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        path: Optional[str] = None,
+        commit_interval: int = DEFAULT_COMMIT_INTERVAL,
+    ):
+        self.max_size = max_size
+        self.path = path
+        self.commit_interval = commit_interval
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, TablesAndColumns]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._uncommitted_writes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sql_parse_cache "
+                "(key TEXT PRIMARY KEY, tables TEXT NOT NULL, columns TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[TablesAndColumns]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT tables, columns FROM sql_parse_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value = (json.loads(row[0]), json.loads(row[1]))
+                    self._put_memory(key, value)
+
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Return copies, since callers are free to modify the lists.
+            return list(value[0]), list(value[1])
+
+    def put(self, key: str, tables: List[str], columns: List[str]) -> None:
+        value = (list(tables), list(columns))
+        with self._lock:
+            self._put_memory(key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sql_parse_cache (key, tables, columns) VALUES (?, ?, ?)",
+                    (key, json.dumps(value[0]), json.dumps(value[1])),
+                )
+                self._uncommitted_writes += 1
+                if self._uncommitted_writes >= self.commit_interval:
+                    self._commit()
+
+    def _commit(self) -> None:
+        assert self._db is not None
+        self._db.commit()
+        self._uncommitted_writes = 0
+
+    def _put_memory(self, key: str, value: TablesAndColumns) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._commit()
+                self._db.close()
+                self._db = None
+
+
+_sql_parse_cache: Optional[SqlParseCache] = None
+_sql_parse_cache_lock = threading.Lock()
+
+
+def get_sql_parse_cache() -> SqlParseCache:
+    """
+    Returns the process-wide parse cache. The on-disk tier is enabled by setting the
+    DATAHUB_SQL_PARSE_CACHE_PATH environment variable to the path of a SQLite file.
+    """
+    global _sql_parse_cache
+    with _sql_parse_cache_lock:
+        if _sql_parse_cache is None:
+            _sql_parse_cache = SqlParseCache(
+                max_size=int(
+                    os.getenv(ENV_SQL_PARSE_CACHE_SIZE, str(DEFAULT_CACHE_SIZE))
+                ),
+                path=os.getenv(ENV_SQL_PARSE_CACHE_PATH),
+            )
+            # Commits the remaining writes of the on-disk tier.
+            atexit.register(_sql_parse_cache.close)
+        return _sql_parse_cache
+
+
+def set_sql_parse_cache(cache: Optional[SqlParseCache]) -> None:
+    """Replaces the process-wide parse cache. Passing None resets it to the default."""
+    global _sql_parse_cache
+    with _sql_parse_cache_lock:
+        if _sql_parse_cache is not None and _sql_parse_cache is not cache:
+            _sql_parse_cache.close()
+        _sql_parse_cache = cache
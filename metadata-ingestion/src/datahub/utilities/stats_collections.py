@@ -1,4 +1,6 @@
-from typing import Any, Dict, TypeVar, Union
+import heapq
+import itertools
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
 
 T = TypeVar("T")
 _KT = TypeVar("_KT")
@@ -33,3 +35,84 @@ class TopKDict(Dict[_KT, _VT]):
     def as_obj(self) -> Dict[Union[_KT, str], Union[_VT, str]]:
         base_dict: Dict[Union[_KT, str], Union[_VT, str]] = super().copy()  # type: ignore
         return self._trim_dictionary(base_dict)  # type: ignore
+
+
+class SpaceSavingCounter(Generic[_KT]):
+    """
+    An approximate counter of the most frequent items, using the space-saving algorithm
+    of Metwally et al. At most `capacity` items are tracked. Counts are exact as long as
+    no more than `capacity` distinct items were added. Afterwards, each new item replaces
+    the least frequent one and inherits its count, so counts may be overestimated by at
+    most the smallest tracked count, but every item more frequent than that is kept.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._counts: Dict[_KT, int] = {}
+        # A min-heap of (count, insertion order, item), built once the counter is full.
+        # Counts only grow, so stale entries are lower bounds and are refreshed lazily
+        # when they reach the top.
+        self._heap: Optional[List[Tuple[int, int, _KT]]] = None
+        self._order = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._counts
+
+    def __getitem__(self, item: _KT) -> int:
+        return self._counts.get(item, 0)
+
+    def add(self, item: _KT, count: int = 1) -> None:
+        if item in self._counts:
+            self._counts[item] += count
+            return
+        if len(self._counts) < self.capacity:
+            self._counts[item] = count
+            return
+        heap = self._get_heap()
+        count += self._evict_min(heap)
+        self._counts[item] = count
+        heapq.heappush(heap, (count, next(self._order), item))
+
+    def _get_heap(self) -> List[Tuple[int, int, _KT]]:
+        if self._heap is None:
+            self._heap = [
+                (count, next(self._order), item) for item, count in self._counts.items()
+            ]
+            heapq.heapify(self._heap)
+        return self._heap
+
+    def _evict_min(self, heap: List[Tuple[int, int, _KT]]) -> int:
+        while True:
+            count, _, item = heapq.heappop(heap)
+            current = self._counts[item]
+            if current == count:
+                del self._counts[item]
+                return count
+            heapq.heappush(heap, (current, next(self._order), item))
+
+    def update(self, items: Iterable[Tuple[_KT, int]]) -> None:
+        """
+        Merges (item, count) pairs, e.g. from another counter's most_common(). Counts of
+        the same item are summed and only the `capacity` most frequent items are kept.
+        """
+        merged = dict(self._counts)
+        for item, count in items:
+            merged[item] = merged.get(item, 0) + count
+        if len(merged) > self.capacity:
+            merged = dict(
+                sorted(merged.items(), key=lambda x: x[1], reverse=True)[
+                    : self.capacity
+                ]
+            )
+        self._counts = merged
+        self._heap = None
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[_KT, int]]:
+        """Returns the items by decreasing count. Ties keep their insertion order."""
+        items = sorted(self._counts.items(), key=lambda x: x[1], reverse=True)
+        return items if n is None else items[:n]
@@ -121,6 +121,64 @@ def test_lookml_ingest_offline(pytestconfig, tmp_path, mock_time):
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_lookml_ingest_offline_parse_upfront(pytestconfig, tmp_path, mock_time):
+    """Parsing all files upfront and caching them on disk must not change the output"""
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/lookml"
+    mce_out = "lookml_mces_offline.json"
+    cache_dir = tmp_path / "lookml_cache"
+
+    for run in range(2):
+        pipeline = Pipeline.create(
+            {
+                "run_id": "lookml-test",
+                "source": {
+                    "type": "lookml",
+                    "config": {
+                        "base_folder": str(test_resources_dir / "lkml_samples"),
+                        "connection_to_platform_map": {
+                            "my_connection": {
+                                "platform": "snowflake",
+                                "default_db": "default_db",
+                                "default_schema": "default_schema",
+                            }
+                        },
+                        "parse_table_names_from_sql": True,
+                        "project_name": "lkml_samples",
+                        "model_pattern": {"deny": ["data2"]},
+                        "emit_reachable_views_only": False,
+                        "parse_workers": 2,
+                        "lookml_cache_dir": str(cache_dir),
+                    },
+                },
+                "sink": {
+                    "type": "file",
+                    "config": {
+                        "filename": f"{tmp_path}/{mce_out}",
+                    },
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status(raise_warnings=True)
+
+        mce_helpers.check_golden_file(
+            pytestconfig,
+            output_path=tmp_path / mce_out,
+            golden_path=test_resources_dir / mce_out,
+        )
+
+        report = cast(LookMLSource, pipeline.source).reporter
+        if run == 0:
+            assert report.lookml_files_parsed > 0
+            assert report.lookml_files_disk_cache_hits == 0
+        else:
+            # Unchanged files are read back from the cache directory.
+            assert report.lookml_files_parsed == 0
+            assert report.lookml_files_disk_cache_hits > 0
+        assert report.lookml_files_cache_hits > 0
+
+
 @freeze_time(FROZEN_TIME)
 def test_lookml_ingest_offline_with_model_deny(pytestconfig, tmp_path, mock_time):
     """New form of config with offline specification of connection defaults"""
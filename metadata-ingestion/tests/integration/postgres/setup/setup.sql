@@ -0,0 +1,31 @@
+CREATE SCHEMA sales;
+
+CREATE TYPE sales.order_status AS ENUM ('open', 'shipped', 'cancelled');
+CREATE DOMAIN sales.positive_amount AS numeric(10, 2) CHECK (VALUE > 0);
+
+CREATE TABLE sales.customers (
+  id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+  name varchar(100) NOT NULL,
+  tags text[]
+);
+COMMENT ON TABLE sales.customers IS 'All customers';
+
+CREATE TABLE sales.orders (
+  id bigserial,
+  customer_id integer REFERENCES sales.customers (id),
+  status sales.order_status DEFAULT 'open',
+  amount sales.positive_amount,
+  amount_with_tax numeric GENERATED ALWAYS AS (amount * 1.2) STORED,
+  placed_at timestamp with time zone NOT NULL DEFAULT now(),
+  CONSTRAINT orders_pkey PRIMARY KEY (id, placed_at)
+) PARTITION BY RANGE (placed_at);
+COMMENT ON COLUMN sales.orders.status IS 'The status of the order';
+
+CREATE TABLE sales.orders_2023 PARTITION OF sales.orders
+  FOR VALUES FROM ('2023-01-01') TO ('2024-01-01');
+
+CREATE VIEW sales.open_orders AS
+  SELECT id, customer_id, amount FROM sales.orders WHERE status = 'open';
+
+CREATE MATERIALIZED VIEW sales.customer_totals AS
+  SELECT customer_id, sum(amount) AS total FROM sales.orders GROUP BY customer_id;
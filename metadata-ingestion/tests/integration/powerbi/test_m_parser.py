@@ -1,5 +1,6 @@
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
 import pytest
@@ -391,3 +392,35 @@ def test_expression_is_none():
     )
 
     assert len(data_platform_tables) == 0
+
+
+@pytest.mark.integration
+def test_parse_expressions_upfront():
+    assert parser.get_lark_parser() is parser.get_lark_parser()
+
+    tables = [
+        powerbi_data_classes.Table(
+            expression=q,
+            name=f"table_{i}",
+            full_name=f"OrderDataSet.table_{i}",
+        )
+        for i, q in enumerate([M_QUERIES[0], M_QUERIES[13], M_QUERIES[0], "invalid"])
+    ]
+
+    parser.clear_parse_tree_cache()
+    reporter = PowerBiDashboardSourceReport()
+    expected = [parser.get_upstream_tables(table, reporter) for table in tables]
+    # The second table with the same expression and the invalid one are cached.
+    assert reporter.m_query_parse_cache_hits == 1
+    assert len(reporter.warnings) == 1
+
+    parser.clear_parse_tree_cache()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parser.parse_expressions(
+            (t.expression for t in tables if t.expression is not None), executor
+        )
+    reporter = PowerBiDashboardSourceReport()
+    assert [parser.get_upstream_tables(table, reporter) for table in tables] == expected
+    # Expressions that fail to parse upfront are parsed again to report the error.
+    assert reporter.m_query_parse_cache_hits == 3
+    assert len(reporter.warnings) == 1
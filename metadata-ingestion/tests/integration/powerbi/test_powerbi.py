@@ -2,6 +2,7 @@ import logging
 import sys
 from typing import Any, Dict
 from unittest import mock
+from urllib.parse import parse_qs
 
 import pytest
 from freezegun import freeze_time
@@ -28,9 +29,15 @@ def mock_msal_cca(*args, **kwargs):
     return MsalClient()
 
 
+BATCH_SCAN_ID = "b674efd1-603c-4129-8d82-03cf2be05aff"
+
+
 def scan_init_response(request, context):
-    # Request mock is passing POST input in the form of workspaces=<workspace_id>
-    workspace_id = request.text.split("=")[1]
+    # Request mock is passing POST input in the form of workspaces=<workspace_id>&workspaces=<workspace_id>
+    workspace_ids = parse_qs(request.text)["workspaces"]
+    if len(workspace_ids) > 1:
+        # All workspaces are scanned by one scan job
+        return {"id": BATCH_SCAN_ID}
 
     w_id_vs_response: Dict[str, Any] = {
         "64ED5CAD-7C10-4684-8180-826122881108": {
@@ -41,7 +48,7 @@ def scan_init_response(request, context):
         },
     }
 
-    return w_id_vs_response[workspace_id]
+    return w_id_vs_response[workspace_ids[0]]
 
 
 def register_mock_api(request_mock: Any, override_data: dict = {}) -> None:
@@ -514,6 +521,28 @@ def register_mock_api(request_mock: Any, override_data: dict = {}) -> None:
         },
     }
 
+    # The scan job of a batch returns the scan results of all workspaces of the batch
+    scan_url = "https://api.powerbi.com/v1.0/myorg/admin/workspaces"
+    api_vs_response[f"{scan_url}/scanStatus/{BATCH_SCAN_ID}"] = api_vs_response[
+        f"{scan_url}/scanStatus/4674efd1-603c-4129-8d82-03cf2be05aff"
+    ]
+    api_vs_response[f"{scan_url}/scanResult/{BATCH_SCAN_ID}"] = {
+        "method": "GET",
+        "status_code": 200,
+        "json": {
+            "workspaces": [
+                workspace
+                for scan_id in [
+                    "4674efd1-603c-4129-8d82-03cf2be05aff",
+                    "a674efd1-603c-4129-8d82-03cf2be05aff",
+                ]
+                for workspace in api_vs_response[f"{scan_url}/scanResult/{scan_id}"][
+                    "json"
+                ]["workspaces"]
+            ]
+        },
+    }
+
     api_vs_response.update(override_data)
 
     for url in api_vs_response.keys():
@@ -713,6 +742,59 @@ def test_scan_all_workspaces(
     )
 
 
+@freeze_time(FROZEN_TIME)
+@mock.patch("msal.ConfidentialClientApplication", side_effect=mock_msal_cca)
+@pytest.mark.integration
+def test_scan_workspaces_in_batch(
+    mock_msal, pytestconfig, tmp_path, mock_time, requests_mock
+):
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/powerbi"
+
+    register_mock_api(request_mock=requests_mock)
+
+    pipeline = Pipeline.create(
+        {
+            "run_id": "powerbi-test",
+            "source": {
+                "type": "powerbi",
+                "config": {
+                    **default_source_config(),
+                    "extract_reports": False,
+                    "extract_ownership": False,
+                    "workspace_id_pattern": {
+                        "deny": ["64ED5CAD-7322-4684-8180-826122881108"],
+                    },
+                    "scan_batch_size": 100,
+                    "max_workers": 2,
+                },
+            },
+            "sink": {
+                "type": "file",
+                "config": {
+                    "filename": f"{tmp_path}/powerbi_mces_scan_in_batch.json",
+                },
+            },
+        }
+    )
+
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    # Both workspaces are scanned by a single scan job
+    scan_requests = [
+        request
+        for request in requests_mock.request_history
+        if request.path.endswith("/admin/workspaces/getinfo")
+    ]
+    assert len(scan_requests) == 1
+
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=tmp_path / "powerbi_mces_scan_in_batch.json",
+        golden_path=f"{test_resources_dir}/golden_test_scan_all_workspaces.json",
+    )
+
+
 @freeze_time(FROZEN_TIME)
 @mock.patch("msal.ConfidentialClientApplication", side_effect=mock_msal_cca)
 @pytest.mark.integration
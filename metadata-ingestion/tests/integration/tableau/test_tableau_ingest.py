@@ -1,5 +1,7 @@
 import json
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, cast
 from unittest import mock
 
@@ -7,6 +9,7 @@ import pytest
 from freezegun import freeze_time
 from requests.adapters import ConnectionError
 from tableauserverclient.models import ViewItem
+from tableauserverclient.server.endpoint.exceptions import NonXMLResponseError
 
 from datahub.configuration.source_common import DEFAULT_ENV
 from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
@@ -439,3 +442,76 @@ def test_tableau_signout_timeout(pytestconfig, tmp_path, mock_datahub_graph):
         mock_datahub_graph,
         sign_out_side_effect=ConnectionError,
     )
+
+
+def test_tableau_fetches_pages_concurrently_in_order():
+    def query_page(query, connection_type, query_filter, count, offset):
+        nodes = [{"id": str(i)} for i in range(offset, offset + count)]
+        return {"nodes": nodes}, 23, offset + count < 23
+
+    with mock.patch("datahub.ingestion.source.tableau.Server"):
+        source = TableauSource.create(
+            {
+                "connect_uri": "https://do-not-connect",
+                "site": "acryl",
+                "username": "username",
+                "password": "pass",
+                "page_size": 5,
+                "max_workers": 2,
+            },
+            PipelineContext(run_id="0"),
+        )
+    with mock.patch.object(
+        source, "get_connection_object_page", side_effect=query_page
+    ) as mock_query:
+        nodes = list(source.get_connection_objects("query", "workbooksConnection", ""))
+
+    assert [node["id"] for node in nodes] == [str(i) for i in range(23)]
+    assert sorted(
+        (call.args[4], call.args[3]) for call in mock_query.call_args_list
+    ) == [(0, 5), (5, 5), (10, 5), (15, 5), (20, 3)]
+    source.close()
+
+
+def test_tableau_reauthenticates_once_for_concurrent_failures():
+    with mock.patch("datahub.ingestion.source.tableau.Server"):
+        source = TableauSource.create(
+            {
+                "connect_uri": "https://do-not-connect",
+                "site": "acryl",
+                "username": "username",
+                "password": "pass",
+                "max_workers": 4,
+            },
+            PipelineContext(run_id="0"),
+        )
+    expired_server = source.server
+    # All requests start with the expired credentials before any of them fails.
+    barrier = threading.Barrier(4)
+
+    def query_metadata(server, *args):
+        if server is expired_server:
+            barrier.wait(timeout=10)
+            raise NonXMLResponseError("expired")
+        return {"data": {"workbooksConnection": {"totalCount": 1}}}
+
+    with mock.patch(
+        "datahub.ingestion.source.tableau.query_metadata", side_effect=query_metadata
+    ), mock.patch(
+        "datahub.ingestion.source.tableau.TableauConfig.make_tableau_client",
+        side_effect=lambda: mock.MagicMock(),
+    ) as mock_make_client, ThreadPoolExecutor(
+        max_workers=4
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda offset: source.get_connection_object_page(
+                    "query", "workbooksConnection", "", 1, offset
+                ),
+                range(4),
+            )
+        )
+
+    assert [total_count for _, total_count, _ in results] == [1, 1, 1, 1]
+    mock_make_client.assert_called_once()
+    source.close()
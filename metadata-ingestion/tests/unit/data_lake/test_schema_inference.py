@@ -1,5 +1,5 @@
 import tempfile
-from typing import List, Type
+from typing import Any, Dict, List, Type
 
 import avro.schema
 import pandas as pd
@@ -128,3 +128,38 @@ def test_infer_schema_avro():
 
         assert_field_paths_match(fields, expected_field_paths_avro)
         assert_field_types_match(fields, expected_field_types)
+
+
+def _infer_json(data: bytes, **kwargs: Any) -> Dict[str, bool]:
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(data)
+        file.seek(0)
+        fields = json.JsonInferrer(**kwargs).infer_schema(file)
+    return {field.fieldPath: field.nullable for field in fields}
+
+
+def test_infer_schema_json_lines():
+    records = [{"a": 1, "b": {"c": "x"}}, {"a": 2}, {"a": 3, "b": {"c": "y"}}]
+    data = b"\n".join(ujson.dumps(record).encode() for record in records)
+
+    assert _infer_json(data) == {"a": False, "b": True, "b.c": True}
+    # Invalid lines are skipped.
+    assert _infer_json(data + b"\nnot json\n" + data) == {
+        "a": False,
+        "b": True,
+        "b.c": True,
+    }
+
+
+def test_infer_schema_json_sampling():
+    records = [{"a": i} for i in range(1000)] + [{"a": 0, "late": True}]
+    data = ujson.dumps(records).encode()
+
+    assert _infer_json(data) == {"a": False, "late": True}
+    assert _infer_json(data, max_rows=1000) == {"a": False}
+    # The array is cut off in the middle of a record.
+    assert _infer_json(data, max_bytes=len(data) // 2) == {"a": False}
+
+    data = b"\n".join(ujson.dumps(record).encode() for record in records)
+    assert _infer_json(data, max_rows=10) == {"a": False}
+    assert _infer_json(data, max_bytes=len(data) - 5) == {"a": False}
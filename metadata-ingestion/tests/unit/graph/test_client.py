@@ -21,3 +21,52 @@ def test_get_aspect(mock_test_connection):
         mock_get.return_value = mock_response
         editable = graph.get_aspect(user_urn, CorpUserEditableInfoClass)
         assert editable is not None
+
+
+@patch("datahub.ingestion.graph.client.telemetry_enabled", False)
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_prefetch_aspects(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DataHubGraphConfig(prefetch_max_threads=2))
+    user_urns = [f"urn:li:corpuser:user_{i}" for i in range(5)]
+
+    def _get(url):
+        response = Mock()
+        response.status_code = 404 if "user_4" in url else 200
+        response.json = Mock(
+            return_value={
+                "version": 0,
+                "aspect": {
+                    "com.linkedin.identity.CorpUserEditableInfo": {
+                        "displayName": url.split("%3A")[-1].split("?")[0]
+                    }
+                },
+            }
+        )
+        return response
+
+    with patch("requests.Session.get", side_effect=_get) as mock_get:
+        graph.prefetch_aspects(user_urns + user_urns[:2], [CorpUserEditableInfoClass])
+        assert mock_get.call_count == 5
+
+        editable = graph.get_aspect(user_urns[1], CorpUserEditableInfoClass)
+        assert editable is not None
+        assert editable.displayName == "user_1"
+        # Aspects that don't exist are cached as well.
+        assert graph.get_aspect(user_urns[4], CorpUserEditableInfoClass) is None
+        # Specific versions are never served from the cache.
+        graph.get_aspect(user_urns[0], CorpUserEditableInfoClass, version=1)
+        assert mock_get.call_count == 6
+
+        # Prefetching again doesn't refetch cached aspects.
+        graph.prefetch_aspects(user_urns, [CorpUserEditableInfoClass])
+        assert mock_get.call_count == 6
+
+        # Writes replace the cached server version.
+        graph.update_cached_aspect(
+            user_urns[1], CorpUserEditableInfoClass(displayName="patched")
+        )
+        editable = graph.get_aspect(user_urns[1], CorpUserEditableInfoClass)
+        assert editable is not None
+        assert editable.displayName == "patched"
+        assert mock_get.call_count == 6
@@ -14,7 +14,11 @@ from datahub.cli.json_file import check_mce_file
 from datahub.emitter import mce_builder
 from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
 from datahub.ingestion.run.pipeline import Pipeline
-from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.ingestion.source.file import (
+    FileSourceConfig,
+    GenericFileSource,
+    read_metadata_file,
+)
 from datahub.metadata.schema_classes import (
     ASPECT_CLASSES,
     KEY_ASPECTS,
@@ -23,6 +27,7 @@ from datahub.metadata.schema_classes import (
     _Aspect,
 )
 from datahub.metadata.schemas import getMetadataChangeEventSchema
+from datahub.utilities import json_lines
 from tests.test_helpers import mce_helpers
 from tests.test_helpers.click_helpers import run_datahub_cmd
 from tests.test_helpers.type_helpers import PytestConfig
@@ -86,6 +91,65 @@ def test_serde_to_json(
     )
 
 
+@freeze_time(FROZEN_TIME)
+@pytest.mark.parametrize("output_filename", ["output.jsonl", "output.jsonl.gz"])
+@pytest.mark.parametrize("parallelism", [1, 3])
+def test_serde_json_lines_roundtrip(
+    pytestconfig: PytestConfig,
+    tmp_path: pathlib.Path,
+    output_filename: str,
+    parallelism: int,
+) -> None:
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+
+    output_file = tmp_path / output_filename
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "file", "config": {"filename": str(golden_file)}},
+            "sink": {"type": "file", "config": {"filename": str(output_file)}},
+            "run_id": "serde_test",
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    # Read the JSON lines file back, split into many small chunks.
+    source = GenericFileSource.create(
+        {
+            "path": str(output_file),
+            "parallelism": parallelism,
+            "chunk_size_in_bytes": 1000,
+        },
+        None,
+    )
+    records = [record for _, record in source.iterate_generic_file(str(output_file))]
+    source.close()
+
+    assert not source.report.failures
+    assert records == read_metadata_file(golden_file)
+
+
+def test_is_json_lines_file(tmp_path: pathlib.Path) -> None:
+    long_value = "x" * 100_000
+    files = {
+        "lines.json": '{"a": 1}\n{"a": 2}\n',
+        "indented_lines.json": '\n  {"a": 1}\n{"a": 2}\n',
+        "array.json": json.dumps([{"a": long_value}]),
+        "indented_array.json": json.dumps([{"a": 1}], indent=4),
+        "object.json": json.dumps({"a": 1}, indent=4),
+        "long_line.json": json.dumps({"a": long_value}) + "\n{}\n",
+    }
+    for filename, content in files.items():
+        (tmp_path / filename).write_text(content)
+
+    assert json_lines.is_json_lines_file(str(tmp_path / "lines.json"))
+    assert json_lines.is_json_lines_file(str(tmp_path / "indented_lines.json"))
+    assert not json_lines.is_json_lines_file(str(tmp_path / "array.json"))
+    assert not json_lines.is_json_lines_file(str(tmp_path / "indented_array.json"))
+    assert not json_lines.is_json_lines_file(str(tmp_path / "object.json"))
+    assert json_lines.is_json_lines_file(str(tmp_path / "long_line.json"))
+
+
 @pytest.mark.parametrize(
     "json_filename",
     [
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from typing import Dict, List
 
@@ -6,6 +7,12 @@ import pytest
 
 from datahub.emitter.mce_builder import make_dataset_urn
 from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
+from datahub.ingestion.source.state.profiling_state import (
+    ColumnProfileStats,
+    PartitionProfileStats,
+    ProfilingCheckpointState,
+)
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -74,11 +81,34 @@ def _make_usage_checkpoint_state() -> BaseUsageCheckpointState:
     return base_usage_checkpoint_state_obj
 
 
+def _make_profiling_checkpoint_state() -> ProfilingCheckpointState:
+    urn = make_dataset_urn("bigquery", "project.dataset.table", "prod")
+    return ProfilingCheckpointState(
+        last_profiled={urn: 1000},
+        partition_stats={
+            urn: {
+                "20230101": PartitionProfileStats(
+                    last_modified=900,
+                    row_count=10,
+                    columns={
+                        "a": ColumnProfileStats(
+                            null_count=1, min="1", max="9", mean=5.0
+                        ),
+                        "b": ColumnProfileStats(null_count=0),
+                    },
+                )
+            }
+        },
+    )
+
+
 _checkpoint_aspect_test_cases: Dict[str, CheckpointStateBase] = {
     # An instance of BaseSQLAlchemyCheckpointState.
     "BaseSQLAlchemyCheckpointState": _make_sql_alchemy_checkpoint_state(),
     # An instance of BaseUsageCheckpointState.
     "BaseUsageCheckpointState": _make_usage_checkpoint_state(),
+    # An instance of ProfilingCheckpointState with partition statistics.
+    "ProfilingCheckpointState": _make_profiling_checkpoint_state(),
 }
 
 
@@ -153,6 +183,31 @@ def test_supported_encodings():
     test_state.serde = "base85-bz2-json"
     test_serde_idempotence(test_state)
 
+    # 3. Test Base85 encoding with zstd compression
+    test_state.serde = "base85-zstd-json"
+    test_serde_idempotence(test_state)
+
+
+def test_zstd_reads_bz2_state():
+    """Verify that a base85-bz2-json state can be read and rewritten as base85-zstd-json."""
+    state = GenericCheckpointState(
+        urns=[make_dataset_urn("mysql", f"db1.t{i}", "prod") for i in range(1000)]
+    )
+    bz2_state = IngestionCheckpointStateClass(
+        formatVersion=state.version, serde=state.serde, payload=state.to_bytes()
+    )
+    checkpoint = _assert_checkpoint_deserialization(bz2_state, state)
+
+    checkpoint.state.serde = "base85-zstd-json"
+    zstd_payload = checkpoint.state.to_bytes()
+    zstd_state = IngestionCheckpointStateClass(
+        formatVersion=state.version, serde="base85-zstd-json", payload=zstd_payload
+    )
+    assert (
+        _assert_checkpoint_deserialization(zstd_state, checkpoint.state).state.urns
+        == state.urns
+    )
+
 
 def test_base85_upgrade_pickle_to_json():
     """Verify that base85 (pickle) encoding is transitioned to base85-bz2-json."""
@@ -198,3 +253,15 @@ def test_state_forward_compatibility(serde: str) -> None:
     )
 
     _assert_checkpoint_deserialization(checkpoint_state, expected_next_state)
+
+
+def test_generic_state_defaults_to_bz2_and_serializes_urns_as_list():
+    urns = [make_dataset_urn("mysql", f"db1.t{i}", "prod") for i in [2, 1, 2, 3]]
+    state = GenericCheckpointState(urns=urns)
+    # zstd is opt-in, so that older versions can still read new states.
+    assert state.serde == "base85-bz2-json"
+    # The urns are deduplicated, and keep their order.
+    assert state.urns == urns[:2] + urns[3:]
+
+    state.serde = "utf-8"
+    assert json.loads(state.to_bytes()) == {"urns": urns[:2] + urns[3:]}
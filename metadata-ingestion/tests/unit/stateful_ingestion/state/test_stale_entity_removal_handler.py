@@ -2,8 +2,10 @@ from typing import Dict, List, Tuple
 
 import pytest
 
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityCheckpointStateBase,
+    StatefulStaleMetadataRemovalConfig,
 )
 
 OldNewEntLists = List[Tuple[List[str], List[str]]]
@@ -49,3 +51,33 @@ def test_change_percent(
         )
     )
     assert actual_percent_change == expected_percent_change
+
+
+@pytest.mark.parametrize(
+    "new_old_entity_list, expected_percent_change",
+    old_new_ent_tests.values(),
+    ids=old_new_ent_tests.keys(),
+)
+def test_generic_state_change_percent(
+    new_old_entity_list: OldNewEntLists, expected_percent_change: float
+) -> None:
+    [(new_entities, old_entities)] = new_old_entity_list
+    new_state = GenericCheckpointState(urns=new_entities)
+    old_state = GenericCheckpointState(urns=old_entities)
+    assert new_state.get_percent_entities_changed(old_state) == expected_percent_change
+    assert sorted(old_state.get_urns_not_in("*", new_state)) == sorted(
+        set(old_entities) - set(new_entities)
+    )
+
+
+def test_checkpoint_serde_is_opt_in():
+    # Older versions can't read zstd states, so bz2 stays the default.
+    assert StatefulStaleMetadataRemovalConfig().checkpoint_serde == "base85-bz2-json"
+    assert (
+        StatefulStaleMetadataRemovalConfig(
+            checkpoint_serde="base85-zstd-json"
+        ).checkpoint_serde
+        == "base85-zstd-json"
+    )
+    with pytest.raises(ValueError):
+        StatefulStaleMetadataRemovalConfig(checkpoint_serde="base85")
@@ -1,13 +1,19 @@
 from datetime import datetime, timezone
+from unittest.mock import Mock, patch
 
 from datahub.ingestion.source.bigquery_v2.bigquery_config import BigQueryV2Config
 from datahub.ingestion.source.bigquery_v2.bigquery_report import BigQueryV2Report
 from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
     BigqueryColumn,
+    BigQueryDataDictionary,
     BigqueryTable,
     PartitionInfo,
 )
-from datahub.ingestion.source.bigquery_v2.profiler import BigqueryProfiler
+from datahub.ingestion.source.bigquery_v2.profiler import (
+    BigqueryProfiler,
+    BigqueryProfilerRequest,
+)
+from datahub.ingestion.source.state.profiling_state import PartitionProfileStats
 
 
 def test_not_generate_partition_profiler_query_if_not_partitioned_sharded_table():
@@ -71,6 +77,49 @@ WHERE
     assert expected_query == query[1].strip()
 
 
+# Incremental profiling profiles the given partition instead of the max partition id
+def test_generate_day_partitioned_partition_profiler_query_with_partition_id():
+    column = BigqueryColumn(
+        name="date",
+        field_path="date",
+        ordinal_position=1,
+        data_type="TIMESTAMP",
+        is_partition_column=True,
+        comment=None,
+        is_nullable=False,
+    )
+    partition_info = PartitionInfo(type="DAY", field="date", column=column)
+    profiler = BigqueryProfiler(config=BigQueryV2Config(), report=BigQueryV2Report())
+    test_table = BigqueryTable(
+        name="test_table",
+        comment="test_comment",
+        rows_count=1,
+        size_in_bytes=1,
+        last_altered=datetime.now(timezone.utc),
+        created=datetime.now(timezone.utc),
+        partition_info=partition_info,
+        max_partition_id="20200101",
+    )
+    query = profiler.generate_partition_profiler_query(
+        project="test_project",
+        schema="test_dataset",
+        table=test_table,
+        partition_id="20191231",
+    )
+    expected_query = """
+SELECT
+    *
+FROM
+    `test_project.test_dataset.test_table`
+WHERE
+    TIMESTAMP(`date`) BETWEEN TIMESTAMP('2019-12-31 00:00:00') AND TIMESTAMP('2020-01-01 00:00:00')
+""".strip()
+
+    assert "20191231" == query[0]
+    assert query[1]
+    assert expected_query == query[1].strip()
+
+
 # If partition time is passed in we force to use that time instead of the max partition id
 def test_generate_day_partitioned_partition_profiler_query_with_set_partition_time():
     column = BigqueryColumn(
@@ -207,3 +256,70 @@ def test_generate_sharded_table_profiler_query():
 
     assert "20200101" == query[0]
     assert query[1] is None
+
+
+def test_get_partition_profile_requests_keeps_the_newest_partitions():
+    config = BigQueryV2Config(
+        profiling={
+            "enabled": True,
+            "incremental_profiling": True,
+            "incremental_profiling_max_partitions": 2,
+            "incremental_profiling_max_stored_partitions": 3,
+        }
+    )
+    state_handler = Mock()
+    state_handler.get_last_partition_stats.return_value = {
+        "20200101": PartitionProfileStats(last_modified=1000, row_count=1),
+        "20200103": PartitionProfileStats(last_modified=1000, row_count=1),
+    }
+    profiler = BigqueryProfiler(
+        config=config, report=BigQueryV2Report(), state_handler=state_handler
+    )
+    profiler._client = Mock()
+    column = BigqueryColumn(
+        name="date",
+        field_path="date",
+        ordinal_position=1,
+        data_type="TIMESTAMP",
+        is_partition_column=True,
+        comment=None,
+        is_nullable=False,
+    )
+    test_table = BigqueryTable(
+        name="test_table",
+        comment="test_comment",
+        rows_count=4,
+        size_in_bytes=1,
+        last_altered=datetime.now(timezone.utc),
+        created=datetime.now(timezone.utc),
+        partition_info=PartitionInfo(type="DAY", field="date", column=column),
+        max_partition_id="20200104",
+    )
+    request = BigqueryProfilerRequest(
+        pretty_name="test_project.test_dataset.test_table",
+        batch_kwargs={},
+        table=test_table,
+    )
+    last_modified = datetime.fromtimestamp(1, timezone.utc)
+    with patch.object(
+        BigQueryDataDictionary,
+        "get_partitions_for_table",
+        return_value={f"2020010{day}": last_modified for day in range(1, 5)},
+    ):
+        requests = profiler.get_partition_profile_requests(
+            "test_project", "test_dataset", request
+        )
+
+    # Only the newest 3 partitions are considered, so the oldest one is neither
+    # profiled nor kept, and each partition is profiled under its own name.
+    assert [r.pretty_name for r in requests] == [
+        "test_project.test_dataset.test_table$20200104",
+        "test_project.test_dataset.test_table$20200102",
+    ]
+    assert all(
+        r.incremental_table_name == "test_project.test_dataset.test_table"
+        for r in requests
+    )
+    incremental = profiler.incremental_tables["test_project.test_dataset.test_table"]
+    assert list(incremental.partitions) == ["20200104", "20200103", "20200102"]
+    assert list(incremental.partition_stats) == ["20200103"]
@@ -1,3 +1,4 @@
+import json
 import os
 from unittest import mock
 
@@ -59,3 +60,36 @@ def test_correct_url_when_gms_host_port_url_protocol_set():
 )
 def test_correct_url_when_url_set():
     assert cli_utils.get_details_from_env() == ("https://example.com", None)
+
+
+def test_get_urns_by_filter_scrolls_through_results():
+    # More results than Elasticsearch returns when paging with an offset.
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,table_{i},PROD)"
+        for i in range(25000)
+    ]
+    session = mock.Mock()
+
+    def scroll(url, payload):
+        assert url == "http://gms/entities?action=scrollAcrossEntities"
+        body = json.loads(payload)
+        assert "start" not in body
+        start = int(body.get("scrollId", 0))
+        end = start + body["count"]
+        value = {
+            "numEntities": len(urns),
+            "pageSize": body["count"],
+            "entities": [{"entity": urn} for urn in urns[start:end]],
+        }
+        if end < len(urns):
+            value["scrollId"] = str(end)
+        response = mock.Mock(status_code=200)
+        response._content = json.dumps({"value": value})
+        return response
+
+    session.post.side_effect = scroll
+    with mock.patch.object(
+        cli_utils, "get_session_and_host", return_value=(session, "http://gms")
+    ):
+        assert list(cli_utils.get_urns_by_filter(platform="hive")) == urns
+    assert session.post.call_count == 3
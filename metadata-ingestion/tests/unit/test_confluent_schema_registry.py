@@ -1,4 +1,7 @@
+import sys
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from confluent_kafka.schema_registry.schema_registry_client import (
@@ -117,6 +120,129 @@ class ConfluentSchemaRegistryTest(unittest.TestCase):
                 schema_str_final
             )
 
+    def test_schemas_and_fields_are_cached(self):
+        kafka_source_config = KafkaSourceConfig.parse_obj(
+            {
+                "connection": {
+                    "bootstrap": "localhost:9092",
+                    "schema_registry_url": "http://localhost:8081",
+                },
+            }
+        )
+        with patch(
+            "confluent_kafka.schema_registry.schema_registry_client.SchemaRegistryClient.get_subjects",
+            return_value=["topic1-value", "topic2-value", "io.acryl.Shared"],
+        ):
+            confluent_schema_registry = ConfluentSchemaRegistry.create(
+                kafka_source_config, KafkaSourceReport()
+            )
+
+        shared_schema = RegisteredSchema(
+            schema_id="schema_id_shared",
+            schema=Schema(
+                schema_str='{"type":"record","name":"Shared","namespace":"io.acryl","fields":[{"name":"f","type":"int"}]}',
+                schema_type="AVRO",
+            ),
+            subject="io.acryl.Shared",
+            version=1,
+        )
+        value_schema = Schema(
+            schema_str='{"type":"record","name":"Value","namespace":"io.acryl","fields":[{"name":"shared","type":"Shared"}]}',
+            schema_type="AVRO",
+            references=[dict(name="Shared", subject="io.acryl.Shared", version=1)],
+        )
+        requested_subjects = []
+
+        def new_get_latest_version(subject_name: str) -> RegisteredSchema:
+            requested_subjects.append(subject_name)
+            if subject_name == "io.acryl.Shared":
+                return shared_schema
+            return RegisteredSchema(
+                schema_id="schema_id_value",
+                schema=value_schema,
+                subject=subject_name,
+                version=1,
+            )
+
+        with patch.object(
+            confluent_schema_registry.schema_registry_client,
+            "get_latest_version",
+            new_get_latest_version,
+        ):
+            schema_metadata_1 = confluent_schema_registry.get_schema_metadata(
+                "topic1", "urn:li:dataPlatform:kafka"
+            )
+            schema_metadata_2 = confluent_schema_registry.get_schema_metadata(
+                "topic2", "urn:li:dataPlatform:kafka"
+            )
+
+        assert schema_metadata_1 is not None and schema_metadata_2 is not None
+        # The shared reference is fetched only once.
+        assert sorted(requested_subjects) == [
+            "io.acryl.Shared",
+            "topic1-value",
+            "topic2-value",
+        ]
+        assert schema_metadata_1.fields == schema_metadata_2.fields
+        assert [f.fieldPath for f in schema_metadata_1.fields] == [
+            "[version=2.0].[type=Value].[type=Shared].shared",
+            "[version=2.0].[type=Value].[type=Shared].shared.[type=int].f",
+        ]
+        # Every topic gets its own copy of the cached fields.
+        assert schema_metadata_1.fields[0] is not schema_metadata_2.fields[0]
+
+    def test_protobuf_schemas_are_converted_concurrently(self):
+        kafka_source_config = KafkaSourceConfig.parse_obj(
+            {
+                "connection": {
+                    "bootstrap": "localhost:9092",
+                    "schema_registry_url": "http://localhost:8081",
+                },
+            }
+        )
+        topics = [f"proto_topic_{i}" for i in range(16)]
+        with patch(
+            "confluent_kafka.schema_registry.schema_registry_client.SchemaRegistryClient.get_subjects",
+            return_value=[f"{topic}-value" for topic in topics],
+        ):
+            confluent_schema_registry = ConfluentSchemaRegistry.create(
+                kafka_source_config, KafkaSourceReport()
+            )
+
+        def new_get_latest_version(subject_name: str) -> RegisteredSchema:
+            topic = subject_name[: -len("-value")]
+            return RegisteredSchema(
+                schema_id=f"schema_id_{topic}",
+                schema=Schema(
+                    schema_str=f'syntax = "proto3";\nmessage M_{topic} {{ string field_{topic} = 1; }}\n',
+                    schema_type="PROTOBUF",
+                ),
+                subject=subject_name,
+                version=1,
+            )
+
+        with patch.object(
+            confluent_schema_registry.schema_registry_client,
+            "get_latest_version",
+            new_get_latest_version,
+        ), ThreadPoolExecutor(max_workers=8) as executor:
+            schema_metadatas = list(
+                executor.map(
+                    lambda topic: confluent_schema_registry.get_schema_metadata(
+                        topic, "urn:li:dataPlatform:kafka"
+                    ),
+                    topics,
+                )
+            )
+
+        for topic, schema_metadata in zip(topics, schema_metadatas):
+            assert schema_metadata is not None
+            assert [f.fieldPath for f in schema_metadata.fields] == [
+                f"[version=2.0].[type=M_{topic}].[type=string].field_{topic}"
+            ]
+        # The temporary directories of the compiled schemas are removed from the path.
+        assert not [path for path in sys.path if path.startswith(tempfile.gettempdir())]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+from unittest import mock
+
+from datahub.cli import delete_cli
+from datahub.configuration.common import OperationalError
+
+URNS = [
+    f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i},PROD)" for i in range(7)
+]
+
+
+def _delete_with_filters(emit_mcps=None, **kwargs):
+    post_delete_endpoint = mock.Mock(
+        side_effect=lambda payload, *args, **kwargs: (payload["urn"], 2, 1)
+    )
+    with mock.patch.multiple(
+        "datahub.cli.delete_cli.cli_utils",
+        get_session_and_host=mock.Mock(return_value=(mock.Mock(), "http://gms")),
+        get_token=mock.Mock(return_value=None),
+        get_urns_by_filter=mock.Mock(return_value=iter(URNS)),
+        post_delete_endpoint=post_delete_endpoint,
+    ), mock.patch(
+        "datahub.cli.delete_cli.rest_emitter.DatahubRestEmitter"
+    ) as mock_emitter:
+        mock_emitter.return_value.emit_mcps = emit_mcps or mock.Mock(return_value={})
+        result = delete_cli.delete_with_filters(
+            dry_run=False, force=True, include_removed=False, **kwargs
+        )
+    return result, post_delete_endpoint, mock_emitter.return_value
+
+
+def test_soft_delete_with_filters_in_batches():
+    result, _, emitter = _delete_with_filters(soft=True, workers=2, batch_size=3)
+
+    assert result.num_entities == len(URNS)
+    batches = [
+        [mcp.entityUrn for mcp in call.args[0]]
+        for call in emitter.emit_mcps.call_args_list
+    ]
+    assert sorted(batches) == [URNS[0:3], URNS[3:6]]
+    assert emitter.emit_mcp.call_count == 1
+    assert emitter.emit_mcp.call_args.args[0].entityUrn == URNS[6]
+
+
+def test_hard_delete_with_filters_resumes_from_checkpoint(tmp_path):
+    checkpoint_file = tmp_path / "deleted_urns.txt"
+    checkpoint_file.write_text("\n".join(URNS[:2]) + "\n")
+
+    result, post_delete_endpoint, _ = _delete_with_filters(
+        soft=False,
+        workers=3,
+        max_requests_per_second=1000,
+        checkpoint_file=checkpoint_file,
+    )
+
+    assert result.num_entities == len(URNS) - 2
+    assert result.num_records == 2 * (len(URNS) - 2)
+    assert result.num_timeseries_records == len(URNS) - 2
+    assert sorted(
+        call.args[0]["urn"] for call in post_delete_endpoint.call_args_list
+    ) == sorted(URNS[2:])
+    assert checkpoint_file.read_text().splitlines() == URNS
+
+
+def test_soft_delete_with_filters_checkpoints_only_deleted_urns(tmp_path):
+    checkpoint_file = tmp_path / "deleted_urns.txt"
+    # The second proposal of every batch fails.
+    emit_mcps = mock.Mock(return_value={1: "Failed to ingest"})
+
+    result, _, _ = _delete_with_filters(
+        emit_mcps=emit_mcps,
+        soft=True,
+        workers=1,
+        batch_size=3,
+        checkpoint_file=checkpoint_file,
+    )
+
+    assert result.num_entities == len(URNS) - 2
+    assert result.num_failed_entities == 2
+    failed_urns = {URNS[1], URNS[4]}
+    assert checkpoint_file.read_text().splitlines() == [
+        urn for urn in URNS if urn not in failed_urns
+    ]
+
+
+def test_soft_delete_with_filters_without_batch_endpoint():
+    emit_mcps = mock.Mock(
+        side_effect=OperationalError(
+            "Unable to emit metadata to DataHub GMS", {"status": 404}
+        )
+    )
+
+    result, _, emitter = _delete_with_filters(
+        emit_mcps=emit_mcps, soft=True, workers=1, batch_size=3
+    )
+
+    assert result.num_entities == len(URNS)
+    # The batch endpoint is not tried again once it is known to be unsupported.
+    assert emit_mcps.call_count == 1
+    assert [call.args[0].entityUrn for call in emitter.emit_mcp.call_args_list] == URNS
@@ -0,0 +1,226 @@
+import pathlib
+from typing import List
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.mce_builder import make_dataset_urn, make_tag_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import FacetValue, SearchFlavor
+
+
+def _make_lite(path: pathlib.Path) -> DuckDBLite:
+    return DuckDBLite(DuckDBLiteConfig(file=str(path)))
+
+
+def _make_mcps() -> List[MetadataChangeProposalWrapper]:
+    mcps = []
+    for i in range(5):
+        urn = make_dataset_urn("hive", f"db.table_{i}")
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=models.DatasetPropertiesClass(name=f"table_{i}"),
+                systemMetadata=models.SystemMetadataClass(lastObserved=1000 + i),
+            )
+        )
+    urn = make_dataset_urn("hive", "db.table_0")
+    # A duplicate, a change and another change of the same aspect.
+    for last_observed, name in [(2000, "table_0"), (3000, "renamed"), (4000, "final")]:
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=models.DatasetPropertiesClass(name=name),
+                systemMetadata=models.SystemMetadataClass(lastObserved=last_observed),
+            )
+        )
+    return mcps
+
+
+def _dump(lite: DuckDBLite) -> tuple:
+    aspects = lite.duckdb_client.execute(
+        "SELECT urn, aspect_name, version, metadata, system_metadata, createdon "
+        "FROM metadata_aspect_v2 ORDER BY urn, aspect_name, version"
+    ).fetchall()
+    edges = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_edge_v2 ORDER BY src_id, relnship, dst_id"
+    ).fetchall()
+    return aspects, edges
+
+
+def test_duckdb_lite_write_batch_matches_single_writes(tmp_path):
+    single = _make_lite(tmp_path / "single.duckdb")
+    for mcp in _make_mcps():
+        single.write(mcp)
+
+    batched = _make_lite(tmp_path / "batched.duckdb")
+    mcps = _make_mcps()
+    batched.write_batch(mcps[:6])
+    batched.write_batch(mcps[6:])
+
+    assert _dump(single) == _dump(batched)
+
+    urn = make_dataset_urn("hive", "db.table_0")
+    versions = batched.duckdb_client.execute(
+        "SELECT version, metadata->>'$.name' FROM metadata_aspect_v2 "
+        "WHERE urn = ? ORDER BY version",
+        [urn],
+    ).fetchall()
+    assert versions == [(0, "final"), (1, "table_0"), (2, "renamed"), (3, "final")]
+    assert batched.duckdb_client.execute(
+        "SELECT dst_id FROM metadata_edge_v2 WHERE src_id = ? AND relnship = 'name'",
+        [urn],
+    ).fetchall() == [("final",)]
+
+    single.close()
+    batched.close()
+
+
+def test_duckdb_lite_search(tmp_path):
+    lite = _make_lite(tmp_path / "search.duckdb")
+    mcps = []
+    for platform, name in [
+        ("hive", "customer_orders"),
+        ("hive", "customer_returns"),
+        ("mysql", "customer_orders"),
+    ]:
+        urn = make_dataset_urn(platform, f"db.{name}")
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=models.DatasetPropertiesClass(
+                    name=name, description="Everything the pets bought"
+                ),
+            )
+        )
+    mcps.append(
+        MetadataChangeProposalWrapper(
+            entityUrn=make_dataset_urn("hive", "db.customer_orders"),
+            aspect=models.GlobalTagsClass(
+                tags=[models.TagAssociationClass(tag=make_tag_urn("pii"))]
+            ),
+        )
+    )
+    lite.write_batch(mcps)
+
+    # Tokens must all match, with the last one matched as a prefix.
+    results = lite.search_with_facets("customer ord")
+    assert results.total == 2
+    assert {r.id for r in results.results} == {
+        make_dataset_urn("hive", "db.customer_orders"),
+        make_dataset_urn("mysql", "db.customer_orders"),
+    }
+    # Tokens can match different aspects of an entity.
+    assert [r.id for r in lite.search_with_facets("pii pets").results] == [
+        make_dataset_urn("hive", "db.customer_orders")
+    ]
+
+    results = lite.search_with_facets("pets", filters={"platform": ["hive"]})
+    assert results.total == 2
+    assert results.facets["platform"] == [FacetValue(value="hive", count=2)]
+    assert results.facets["tag"] == [FacetValue(value="pii", count=1)]
+
+    page = lite.search_with_facets("*", start=1, count=1)
+    assert page.total == 3
+    assert len(page.results) == 1
+    assert page.facets["platform"] == [
+        FacetValue(value="hive", count=2),
+        FacetValue(value="mysql", count=1),
+    ]
+
+    # The index is updated when an aspect changes.
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=make_dataset_urn("hive", "db.customer_returns"),
+            aspect=models.DatasetPropertiesClass(name="refunds"),
+        )
+    )
+    assert lite.search_with_facets("pets").total == 2
+    assert [
+        (r.id, r.aspect)
+        for r in lite.search(query="refunds", flavor=SearchFlavor.FREE_TEXT)
+    ] == [(make_dataset_urn("hive", "db.customer_returns"), "datasetProperties")]
+
+    # Query text is never interpolated into SQL.
+    assert lite.search_with_facets("x' OR 1=1 --").total == 0
+
+    lite.close()
+    reopened = _make_lite(tmp_path / "search.duckdb")
+    assert reopened.search_with_facets("pets").total == 2
+    reopened.close()
+
+
+def _dump_search_index(lite: DuckDBLite) -> tuple:
+    tokens = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_search_token ORDER BY ALL"
+    ).fetchall()
+    facets = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_search_facet ORDER BY ALL"
+    ).fetchall()
+    return tokens, facets
+
+
+def test_duckdb_lite_streaming_reads_and_reindex(tmp_path):
+    lite = DuckDBLite(
+        DuckDBLiteConfig(file=str(tmp_path / "stream.duckdb"), fetch_batch_size=2)
+    )
+    lite.write_batch(_make_mcps())
+    (aspects_before, edges_before), index_before = _dump(lite), _dump_search_index(lite)
+
+    # Reindexing also runs the global hooks, which add the browse path edges.
+    lite.reindex()
+    aspects_after, edges_after = _dump(lite)
+    assert aspects_after == aspects_before
+    assert set(edges_before) < set(edges_after)
+    assert _dump_search_index(lite) == index_before
+
+    assert sorted(lite.list_ids()) == sorted(
+        make_dataset_urn("hive", f"db.table_{i}") for i in range(5)
+    )
+    entities = list(lite.get_all_entities(typed=False))
+    assert len(entities) == 5
+    assert entities[0] == {
+        make_dataset_urn("hive", "db.table_0"): {
+            "datasetProperties": {"customProperties": {}, "name": "final", "tags": []}
+        }
+    }
+
+    def _aspects() -> list:
+        return [
+            (
+                mcp.entityUrn,
+                mcp.aspectName,
+                mcp.aspect.to_obj() if mcp.aspect else None,
+                mcp.systemMetadata.lastObserved if mcp.systemMetadata else None,
+            )
+            for mcp in lite.get_all_aspects()
+        ]
+
+    aspects = _aspects()
+    assert len(aspects) == 5
+    lite.config.parallelism = 2
+    assert _aspects() == aspects
+    lite.close()
+
+
+def test_duckdb_lite_builds_missing_search_index(tmp_path, caplog):
+    path = tmp_path / "old.duckdb"
+    lite = _make_lite(path)
+    lite.write_batch(_make_mcps())
+    # Catalogs written by older versions have no search index.
+    lite.duckdb_client.execute("DROP TABLE metadata_search_token")
+    lite.duckdb_client.execute("DROP TABLE metadata_search_facet")
+    lite.duckdb_client.close()
+
+    read_only = DuckDBLite(DuckDBLiteConfig(file=str(path), read_only=True))
+    assert "datahub lite reindex" in caplog.text
+    assert read_only.search_with_facets("final").total == 0
+    assert list(read_only.search("final", SearchFlavor.FREE_TEXT)) == []
+    read_only.duckdb_client.close()
+
+    # The index is built when the catalog is opened for writing.
+    lite = _make_lite(path)
+    assert [r.id for r in lite.search_with_facets("final").results] == [
+        make_dataset_urn("hive", "db.table_0")
+    ]
+    lite.close()
@@ -0,0 +1,189 @@
+import threading
+import time
+from typing import Optional, Tuple
+from unittest import mock
+
+import pytest
+import sqlalchemy as sa
+
+from datahub.ingestion.source.ge_data_profiler import (
+    _APPROX_COUNT_DISTINCT_SQL,
+    _TABLE_SAMPLE_CLAUSES,
+    DatahubGEProfiler,
+    GEProfilerRequest,
+)
+from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+from datahub.metadata.schema_classes import DatasetProfileClass
+
+
+def _make_request(
+    name: str, rows_count: Optional[int], column_count: Optional[int]
+) -> GEProfilerRequest:
+    request = GEProfilerRequest(pretty_name=name, batch_kwargs={})
+    request.rows_count = rows_count
+    request.column_count = column_count
+    return request
+
+
+def test_generate_profiles_schedules_by_cost_and_yields_as_completed():
+    report = SQLSourceReport()
+    profiler = DatahubGEProfiler(
+        conn=sa.create_engine("sqlite://"),
+        report=report,
+        config=GEProfilingConfig(enabled=True, profile_table_timeout_seconds=0.5),
+        platform="sqlite",
+    )
+    requests = [
+        _make_request("unknown", None, None),
+        _make_request("small", 10, 2),
+        _make_request("stuck", 1000, 10),
+        _make_request("large", 1000, 5),
+        _make_request("medium", 100, 5),
+    ]
+    delays = {"stuck": 5, "large": 0.2}
+
+    started = []
+    release = threading.Event()
+
+    def _profile(
+        query_combiner, request, platform=None, profiler_args=None
+    ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
+        started.append(request.pretty_name)
+        release.wait(delays.get(request.pretty_name, 0))
+        return request, DatasetProfileClass(timestampMillis=0)
+
+    with mock.patch.object(
+        profiler, "_generate_profile_from_request", side_effect=_profile
+    ):
+        start = time.perf_counter()
+        results = []
+        for request, profile in profiler.generate_profiles(requests, 2):
+            results.append((request.pretty_name, profile is not None))
+            if profile is None:
+                # The profiler waits for the thread of the timed out table.
+                release.set()
+
+    # The most expensive tables are started first, and the ones of unknown cost last.
+    assert started == ["stuck", "large", "medium", "small", "unknown"]
+    # Profiles are yielded as they complete, and the stuck table times out.
+    assert results == [
+        ("large", True),
+        ("medium", True),
+        ("small", True),
+        ("unknown", True),
+        ("stuck", False),
+    ]
+    assert time.perf_counter() - start < 5
+
+    assert list(report.profiling_timed_out) == ["stuck"]
+    assert "stuck" in report.warnings
+    assert set(report.profiling_time_taken_seconds) == {
+        "unknown",
+        "small",
+        "large",
+        "medium",
+    }
+    assert report.profiling_cost_estimate == {
+        "small": 20,
+        "large": 5000,
+        "medium": 500,
+    }
+
+
+def test_generate_profiles_stops_queries_of_timed_out_tables(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    report = SQLSourceReport()
+    profiler = DatahubGEProfiler(
+        conn=engine,
+        report=report,
+        config=GEProfilingConfig(enabled=True, profile_table_timeout_seconds=0.2),
+        platform="sqlite",
+    )
+    queries_run = []
+
+    def _profile(
+        query_combiner, request, platform=None, profiler_args=None
+    ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
+        # A table that takes long to profile, with many short queries.
+        for _ in range(100):
+            engine.execute("SELECT 1")
+            queries_run.append(request.pretty_name)
+            time.sleep(0.05)
+        return request, DatasetProfileClass(timestampMillis=0)
+
+    with mock.patch.object(
+        profiler, "_generate_profile_from_request", side_effect=_profile
+    ):
+        start = time.perf_counter()
+        results = list(
+            profiler.generate_profiles([_make_request("slow", None, None)], 1)
+        )
+
+    assert [(request.pretty_name, profile) for request, profile in results] == [
+        ("slow", None)
+    ]
+    # No more queries are run once the table timed out, or profiling has finished.
+    assert time.perf_counter() - start < 2
+    queries_after_profiling = len(queries_run)
+    assert queries_after_profiling < 100
+    time.sleep(0.2)
+    assert len(queries_run) == queries_after_profiling
+
+
+def test_generate_profiles_on_a_sample(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    with engine.begin() as conn:
+        conn.execute("CREATE TABLE t (a INTEGER, b TEXT, c INTEGER)")
+        conn.execute(
+            sa.text("INSERT INTO t VALUES (:a, :b, :c)"),
+            [
+                {"a": i, "b": None if i % 3 == 0 else f"x{i % 7}", "c": i}
+                for i in range(10000)
+            ],
+        )
+
+    report = SQLSourceReport()
+    config = GEProfilingConfig(
+        enabled=True,
+        approximate_profiling=True,
+        sample_percent=10,
+        sample_row_count_threshold=1000,
+    )
+    profiler = DatahubGEProfiler(
+        conn=engine, report=report, config=config, platform="sqlite"
+    )
+    request = GEProfilerRequest(
+        pretty_name="main.t", batch_kwargs={"schema": "main", "table": "t"}
+    )
+
+    # SQLite cannot sample tables, so every tenth row is picked with a join instead.
+    with mock.patch.dict(
+        _TABLE_SAMPLE_CLAUSES,
+        {"sqlite": "JOIN (SELECT {seed}) ON a % {percent} = 0"},
+    ), mock.patch.dict(
+        _APPROX_COUNT_DISTINCT_SQL, {"sqlite": "count(distinct {column})"}
+    ):
+        [(_, profile)] = profiler.generate_profiles([request], 1)
+
+    assert profile is not None
+    assert profile.rowCount == 10000
+    assert profile.sampleFraction == 0.1
+    assert profile.sampleErrorBound == pytest.approx(0.0294, abs=1e-4)
+
+    assert profile.fieldProfiles is not None
+    fields = {field.fieldPath: field for field in profile.fieldProfiles}
+    # 334 of the 1000 sampled rows are null.
+    assert fields["b"].nullProportion == 0.334
+    assert fields["b"].nullCount == 3340
+    # Distinct counts are not extrapolated, except for unique columns.
+    assert fields["b"].uniqueCount == 7
+    assert fields["c"].uniqueCount == 10000
+    assert fields["c"].min == "0"
+    assert fields["c"].max == "9990"
+
+
+def test_table_samples_are_repeatable():
+    # The queries of a profile must all read the same sample.
+    for dialect, clause in _TABLE_SAMPLE_CLAUSES.items():
+        assert "{seed}" in clause, dialect
@@ -3,9 +3,11 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, Type, cast
 from unittest.mock import patch
 
+import boto3
 import pytest
 from botocore.stub import Stubber
 from freezegun import freeze_time
+from moto import mock_glue
 
 from datahub.configuration.common import ConfigurationError
 from datahub.ingestion.api.common import PipelineContext
@@ -17,6 +19,7 @@ from datahub.ingestion.source.state.checkpoint import Checkpoint
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
+from datahub.metadata.com.linkedin.pegasus2avro.dataset import DatasetProfile
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     ArrayTypeClass,
     MapTypeClass,
@@ -225,6 +228,16 @@ def test_without_underlying_platform():
     assert source.platform == "glue"
 
 
+def test_aws_retry_mode_is_opt_in():
+    config = GlueSourceConfig(aws_region="us-west-2")
+    assert config.aws_retry_mode is None
+    # The retry mode of botocore, or the one configured for it, is used.
+    assert config._aws_config().retries is None
+
+    config = GlueSourceConfig(aws_region="us-west-2", aws_retry_mode="adaptive")
+    assert config.glue_client.meta.config.retries["mode"] == "adaptive"
+
+
 def get_current_checkpoint_from_pipeline(
     pipeline: Pipeline,
 ) -> Optional[Checkpoint]:
@@ -331,3 +344,75 @@ def test_glue_stateful(pytestconfig, tmp_path, mock_time, mock_datahub_graph):
                 "urn:li:dataset:(urn:li:dataPlatform:glue,flights-database.avro,PROD)",
                 "urn:li:container:0b9f1f731ecf6743be6207fec3dc9cba",
             }
+
+
+def _create_glue_catalog() -> None:
+    glue_client = boto3.client("glue", region_name="us-west-2")
+    for database_index in range(3):
+        database_name = f"database-{database_index}"
+        glue_client.create_database(DatabaseInput={"Name": database_name})
+        for table_index in range(4):
+            storage_descriptor = {
+                "Columns": [
+                    {
+                        "Name": "id",
+                        "Type": "int",
+                        "Parameters": {"null_count": str(table_index)},
+                    }
+                ],
+                "Location": f"s3://bucket/{database_name}/table-{table_index}",
+            }
+            partitioned = table_index % 2 == 1
+            glue_client.create_table(
+                DatabaseName=database_name,
+                TableInput={
+                    "Name": f"table-{table_index}",
+                    "StorageDescriptor": storage_descriptor,
+                    "Parameters": {"row_count": "10"},
+                    "PartitionKeys": [{"Name": "dt", "Type": "string"}]
+                    if partitioned
+                    else [],
+                },
+            )
+            if partitioned:
+                for day in ["2020-04-13", "2020-04-14"]:
+                    glue_client.create_partition(
+                        DatabaseName=database_name,
+                        TableName=f"table-{table_index}",
+                        PartitionInput={
+                            "Values": [day],
+                            "StorageDescriptor": storage_descriptor,
+                            "Parameters": {"row_count": "5"},
+                        },
+                    )
+
+
+@freeze_time(FROZEN_TIME)
+@mock_glue
+def test_glue_concurrent_crawl_matches_serial_crawl(monkeypatch):
+    for env_var in ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"]:
+        monkeypatch.setenv(env_var, "testing")
+    _create_glue_catalog()
+
+    def crawl(max_workers: int) -> list:
+        source = GlueSource(
+            ctx=PipelineContext(run_id="glue-source-test"),
+            config=GlueSourceConfig(
+                aws_region="us-west-2",
+                extract_transforms=False,
+                profiling={"row_count": "row_count", "null_count": "null_count"},
+                max_workers=max_workers,
+            ),
+        )
+        metadata = [wu.metadata.to_obj() for wu in source.get_workunits()]
+        source.close()
+        return metadata
+
+    serial = crawl(max_workers=1)
+    assert crawl(max_workers=4) == serial
+
+    profiles = [
+        obj for obj in serial if obj.get("aspectName") == DatasetProfile.ASPECT_NAME
+    ]
+    # 6 unpartitioned tables and 6 partitioned tables with 2 partitions each.
+    assert len(profiles) == 6 + 6 * 2
@@ -0,0 +1,117 @@
+from datahub.ingestion.source.profiling.partition_stats import (
+    get_partition_stats,
+    get_partitions_to_profile,
+    merge_partition_stats,
+)
+from datahub.ingestion.source.state.profiling_state import (
+    ColumnProfileStats,
+    PartitionProfileStats,
+)
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+)
+
+
+def test_get_partition_stats():
+    profile = DatasetProfileClass(
+        timestampMillis=0,
+        rowCount=10,
+        fieldProfiles=[
+            DatasetFieldProfileClass(
+                fieldPath="a", nullCount=2, min="1", max="8", mean="4.5", median="4"
+            ),
+            DatasetFieldProfileClass(fieldPath="b", mean="NaN?"),
+        ],
+    )
+    assert get_partition_stats(profile, 1000) == PartitionProfileStats(
+        last_modified=1000,
+        row_count=10,
+        columns={
+            "a": ColumnProfileStats(null_count=2, min="1", max="8", mean=4.5),
+            "b": ColumnProfileStats(),
+        },
+    )
+
+
+def test_get_partitions_to_profile():
+    partition_stats = {
+        "20230101": PartitionProfileStats(last_modified=100, row_count=1),
+        "20230102": PartitionProfileStats(last_modified=200, row_count=1),
+        "20230103": PartitionProfileStats(last_modified=300, row_count=1),
+    }
+    partitions = {
+        "20230101": 100,
+        "20230102": 250,
+        "20230103": None,
+        "20230104": 400,
+        "20230105": 500,
+    }
+    assert get_partitions_to_profile(partitions, partition_stats) == [
+        "20230105",
+        "20230104",
+        "20230103",
+        "20230102",
+    ]
+    assert get_partitions_to_profile(partitions, partition_stats, 2) == [
+        "20230105",
+        "20230104",
+    ]
+    assert get_partitions_to_profile({"20230101": 100}, partition_stats) == []
+
+
+def test_merge_partition_stats():
+    partitions = [
+        PartitionProfileStats(
+            row_count=10,
+            columns={
+                "num": ColumnProfileStats(null_count=0, min="9", max="20", mean=15.0),
+                "day": ColumnProfileStats(
+                    null_count=5, min="2023-01-01", max="2023-01-01"
+                ),
+            },
+        ),
+        PartitionProfileStats(
+            row_count=30,
+            columns={
+                "num": ColumnProfileStats(null_count=10, min="-1", max="100", mean=5.0),
+                "day": ColumnProfileStats(
+                    null_count=0, min="2023-01-02", max="2023-01-02"
+                ),
+                "new": ColumnProfileStats(min="a", max="b"),
+            },
+        ),
+    ]
+
+    profile = merge_partition_stats(partitions)
+    assert profile.rowCount == 40
+    assert profile.columnCount == 3
+    assert profile.fieldProfiles is not None
+    fields = {field.fieldPath: field for field in profile.fieldProfiles}
+
+    assert fields["num"].nullCount == 10
+    assert fields["num"].nullProportion == 0.25
+    # Numbers are compared as numbers rather than strings.
+    assert fields["num"].min == "-1"
+    assert fields["num"].max == "100"
+    # The means are weighted by the non-null counts, 10 and 20.
+    assert fields["num"].mean == str((10 * 15.0 + 20 * 5.0) / 30)
+
+    assert fields["day"].nullCount == 5
+    assert fields["day"].min == "2023-01-01"
+    assert fields["day"].max == "2023-01-02"
+
+    # A column without null counts in a partition has no merged null count.
+    assert fields["new"].nullCount is None
+    assert fields["new"].min == "a"
+    assert fields["new"].mean is None
+    assert fields["new"].uniqueCount is None
+
+    # Null counts are extrapolated when the partitions cover part of the table.
+    profile = merge_partition_stats(partitions, total_row_count=80)
+    assert profile.rowCount == 80
+    assert profile.partitionCoverage == 0.5
+    assert profile.fieldProfiles is not None
+    fields = {field.fieldPath: field for field in profile.fieldProfiles}
+    assert fields["num"].nullCount == 20
+    assert fields["num"].nullProportion == 0.25
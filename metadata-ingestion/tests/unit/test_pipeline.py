@@ -1,10 +1,12 @@
-from typing import Iterable, List, cast
+import json
+from typing import Dict, Iterable, List, cast
 from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
 
 from datahub.configuration.common import DynamicTypedConfig
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.committable import CommitPolicy, Committable
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.source import Source, SourceReport
@@ -306,6 +308,62 @@ class TestPipeline(object):
             else:
                 mock_commit.assert_not_called()
 
+    def test_run_staged(self, tmp_path):
+        output_file = tmp_path / "output.jsonl"
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyEntities"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "file", "config": {"filename": str(output_file)}},
+                "execution": {"transform_workers": 3, "queue_size": 2},
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        records = [json.loads(line) for line in output_file.read_text().splitlines()]
+        assert len(records) == len(FakeSourceWithManyEntities().work_units)
+        # Records of the same entity are written in the order the source produced them.
+        descriptions: Dict[str, List[str]] = {}
+        for record in records:
+            descriptions.setdefault(record["entityUrn"], []).append(
+                record["aspect"]["json"]["description"]
+            )
+        assert descriptions == {
+            urn: [f"version {v}" for v in range(3)]
+            for urn in FakeSourceWithManyEntities.urns
+        }
+
+        assert pipeline.stage_report
+        assert pipeline.stage_report.workunits_dispatched == len(records)
+        assert pipeline.stage_report.as_obj()["bottleneck"] in {
+            "source",
+            "transform",
+            "sink",
+        }
+        assert "stages" in pipeline._get_structured_report()
+
+    def test_run_staged_raises_worker_errors(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyEntities"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.FailingTransformer"}
+                ],
+                "sink": {"type": "console"},
+                "execution": {"transform_workers": 2, "queue_size": 1},
+            }
+        )
+        with pytest.raises(RuntimeError, match="transformer failed"):
+            pipeline.run()
+        assert pipeline.final_status == "cancelled"
+
 
 class AddStatusRemovedTransformer(Transformer):
     @classmethod
@@ -366,6 +424,37 @@ class FakeSourceWithFailures(FakeSource):
         return self.source_report
 
 
+class FakeSourceWithManyEntities(FakeSource):
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:test_platform,table_{i},PROD)"
+        for i in range(10)
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self.work_units = [
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=DatasetPropertiesClass(description=f"version {version}"),
+            ).as_workunit()
+            for version in range(3)
+            for urn in self.urns
+        ]
+
+
+class FailingTransformer(Transformer):
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            raise RuntimeError("transformer failed")
+            yield record_envelope
+
+
 def get_initial_mce() -> MetadataChangeEventClass:
     return MetadataChangeEventClass(
         proposedSnapshot=DatasetSnapshotClass(
@@ -1,4 +1,7 @@
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 import pytest
 import requests
@@ -6,6 +9,9 @@ import requests
 import datahub.metadata.schema_classes as models
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -259,3 +265,187 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+class StubGMS:
+    """A minimal, in-process stand-in for GMS that records ingested proposals."""
+
+    def __init__(self, supports_batch: bool = True) -> None:
+        self.supports_batch = supports_batch
+        self.rejected_urns: Set[str] = set()
+        self.unauthorized_urns: Set[str] = set()
+        self.requests: List[str] = []
+        self.ingested_urns: List[str] = []
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _respond(self, status: int, body: Dict[str, Any]) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                self._respond(200, {"noCode": "true"})
+
+            def do_POST(self) -> None:
+                length = int(self.headers["Content-Length"])
+                body = json.loads(self.rfile.read(length))
+                self._respond(*stub.handle(self.path, body))
+
+        self.server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.url = f"http://localhost:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def handle(self, path: str, body: Dict[str, Any]) -> Any:
+        with self._lock:
+            self.requests.append(path)
+        if path == "/aspects?action=ingestProposal":
+            proposals = [body["proposal"]]
+        elif path == "/aspects?action=ingestProposalBatch" and self.supports_batch:
+            proposals = body["proposals"]
+        else:
+            return 400, {
+                "status": 400,
+                "message": f"POST operation named {path.split('=')[-1]} not supported",
+            }
+
+        urns = [proposal["entityUrn"] for proposal in proposals]
+        if any(urn in self.unauthorized_urns for urn in urns):
+            return 401, {"status": 401, "message": "User is unauthorized"}
+        failures = {
+            str(i): "Failed to validate proposal"
+            for i, urn in enumerate(urns)
+            if urn in self.rejected_urns
+        }
+        with self._lock:
+            self.ingested_urns.extend(
+                urn for urn in urns if urn not in self.rejected_urns
+            )
+        if "proposals" in body:
+            # Like GMS, the batch action ingests the valid proposals and returns
+            # the failures of the others.
+            return 200, {"value": failures}
+        if failures:
+            return 422, {"status": 422, "message": "Failed to validate proposal"}
+        return 200, {"value": urns[0]}
+
+    def __enter__(self) -> "StubGMS":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class RecordingWriteCallback(WriteCallback):
+    def __init__(self) -> None:
+        self.successes: List[str] = []
+        self.failures: List[str] = []
+
+    def on_success(
+        self, record_envelope: RecordEnvelope, success_metadata: dict
+    ) -> None:
+        self.successes.append(record_envelope.record.entityUrn)
+
+    def on_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        failure_exception: Exception,
+        failure_metadata: dict,
+    ) -> None:
+        self.failures.append(record_envelope.record.entityUrn)
+
+
+def _make_mcps(count: int) -> Iterator[MetadataChangeProposalWrapper]:
+    for i in range(count):
+        yield MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:foo,table_{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+
+
+def _run_batch_sink(
+    gms: StubGMS, count: int, batch_config: Optional[Dict[str, Any]] = None
+) -> RecordingWriteCallback:
+    sink = DatahubRestSink.create(
+        {
+            "server": gms.url,
+            "mode": "ASYNC_BATCH",
+            "retry_max_times": 1,
+            "retry_status_codes": [],
+            **(batch_config or {}),
+        },
+        PipelineContext(run_id="test-batch-sink"),
+    )
+    callback = RecordingWriteCallback()
+    for mcp in _make_mcps(count):
+        sink.write_record_async(RecordEnvelope(mcp, metadata={}), callback)
+    sink.close()
+    return callback
+
+
+def test_datahub_rest_sink_batches_by_count():
+    with StubGMS() as gms:
+        callback = _run_batch_sink(gms, 25, {"max_batch_size": 10})
+
+    assert gms.requests == ["/aspects?action=ingestProposalBatch"] * 3
+    assert len(callback.successes) == 25
+    assert not callback.failures
+    assert sorted(gms.ingested_urns) == sorted(mcp.entityUrn for mcp in _make_mcps(25))
+
+
+def test_datahub_rest_sink_batches_by_bytes():
+    with StubGMS() as gms:
+        # Each serialized proposal is a bit over 200 bytes.
+        callback = _run_batch_sink(
+            gms, 10, {"max_batch_size": 1000, "max_batch_bytes": 500}
+        )
+
+    assert len(gms.requests) == 5
+    assert len(callback.successes) == 10
+
+
+def test_datahub_rest_sink_batch_failure_reported_per_record():
+    with StubGMS() as gms:
+        bad_urn = "urn:li:dataset:(urn:li:dataPlatform:foo,table_3,PROD)"
+        gms.rejected_urns.add(bad_urn)
+        callback = _run_batch_sink(gms, 5, {"max_batch_size": 5})
+
+    # Only the failed proposal is reported, and the others are ingested once.
+    assert gms.requests == ["/aspects?action=ingestProposalBatch"]
+    assert callback.failures == [bad_urn]
+    assert len(callback.successes) == 4
+    assert len(gms.ingested_urns) == 4
+
+
+def test_datahub_rest_sink_batch_request_failure_retried_per_record():
+    with StubGMS() as gms:
+        bad_urn = "urn:li:dataset:(urn:li:dataPlatform:foo,table_3,PROD)"
+        gms.unauthorized_urns.add(bad_urn)
+        callback = _run_batch_sink(gms, 5, {"max_batch_size": 5})
+
+    assert gms.requests[0] == "/aspects?action=ingestProposalBatch"
+    assert gms.requests[1:] == ["/aspects?action=ingestProposal"] * 5
+    assert callback.failures == [bad_urn]
+    assert len(callback.successes) == 4
+    assert len(gms.ingested_urns) == 4
+
+
+def test_datahub_rest_sink_batch_unsupported_falls_back():
+    with StubGMS(supports_batch=False) as gms:
+        callback = _run_batch_sink(gms, 12, {"max_batch_size": 5})
+
+    # Only the first batch is attempted; afterwards records are sent one by one.
+    assert gms.requests.count("/aspects?action=ingestProposalBatch") == 1
+    assert gms.requests.count("/aspects?action=ingestProposal") == 12
+    assert len(callback.successes) == 12
+    assert not callback.failures
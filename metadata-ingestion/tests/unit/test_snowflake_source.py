@@ -11,6 +11,8 @@ from datahub.ingestion.source.snowflake.constants import (
     SnowflakeCloudProvider,
 )
 from datahub.ingestion.source.snowflake.snowflake_config import SnowflakeV2Config
+from datahub.ingestion.source.snowflake.snowflake_schema import SnowflakeDataDictionary
+from datahub.ingestion.source.snowflake.snowflake_utils import SnowflakeConnectionPool
 from datahub.ingestion.source.snowflake.snowflake_v2 import SnowflakeV2Source
 
 
@@ -235,6 +237,13 @@ def test_snowflake_config_with_no_connect_args_returns_base_connect_args():
     }
 
 
+def test_snowflake_config_max_workers_defaults_to_single_connection():
+    config = SnowflakeV2Config.parse_obj({"account_id": "test"})
+    assert config.max_workers == 1
+    with pytest.raises(ValidationError):
+        SnowflakeV2Config.parse_obj({"account_id": "test", "max_workers": 0})
+
+
 def test_snowflake_config_with_connect_args_overrides_base_connect_args():
     config: SnowflakeV2Config = SnowflakeV2Config.parse_obj(
         {
@@ -546,3 +555,47 @@ def test_unknown_cloud_region_from_snowflake_region_id():
             "somecloud_someregion"
         )
     assert "Unknown snowflake region" in str(e)
+
+
+def test_snowflake_data_dictionary_prefetches_schemas_on_pool():
+    def _connection(table_name):
+        connection = MagicMock()
+        connection.cursor().execute.return_value = [
+            {
+                "TABLE_NAME": table_name,
+                "COLUMN_NAME": "id",
+                "ORDINAL_POSITION": 1,
+                "IS_NULLABLE": "NO",
+                "DATA_TYPE": "NUMBER",
+                "COMMENT": None,
+                "CHARACTER_MAXIMUM_LENGTH": None,
+                "NUMERIC_PRECISION": 38,
+                "NUMERIC_SCALE": 0,
+            }
+        ]
+        return connection
+
+    main_connection = _connection("main")
+    pool = SnowflakeConnectionPool([_connection("pool"), _connection("pool")])
+
+    data_dictionary = SnowflakeDataDictionary()
+    data_dictionary.set_connection(main_connection)
+    assert data_dictionary.prefetch_window == 0
+    data_dictionary.set_connection_pool(pool)
+    assert data_dictionary.prefetch_window == 3
+
+    schemas = ["S1", "S2", "S3"]
+    data_dictionary.prefetch_schema_metadata(schemas, "DB", include_constraints=False)
+    for schema in schemas:
+        columns = data_dictionary.get_columns_for_schema(schema, "DB")
+        assert columns is not None and list(columns) == ["pool"]
+    assert data_dictionary.schema_cache_info["get_columns_for_schema"] == {
+        "hits": 3,
+        "misses": 3,
+        "prefetched": 3,
+    }
+
+    # Schemas that were not prefetched are fetched on the main connection.
+    columns = data_dictionary.get_columns_for_schema("S4", "DB")
+    assert columns is not None and list(columns) == ["main"]
+    data_dictionary.close()
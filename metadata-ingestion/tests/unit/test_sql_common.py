@@ -1,7 +1,10 @@
-from typing import Dict
+import json
+import sqlite3
+from typing import Dict, Iterable
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.engine.reflection import Inspector
 
 from datahub.ingestion.source.sql.sql_common import (
@@ -103,3 +106,83 @@ PLATFORM_FROM_SQLALCHEMY_URI_TEST_CASES: Dict[str, str] = {
 def test_get_platform_from_sqlalchemy_uri(uri: str, expected_platform: str) -> None:
     platform: str = get_platform_from_sqlalchemy_uri(uri)
     assert platform == expected_platform
+
+
+class _SQLiteConfig(SQLAlchemyConfig):
+    file: str
+
+    def get_sql_alchemy_url(self):
+        return f"sqlite:///{self.file}"
+
+
+class _SQLiteSource(SQLAlchemySource):
+    """Reads the main database and two attached databases, which SQLite exposes as schemas."""
+
+    def get_inspectors(self) -> Iterable[Inspector]:
+        engine = create_engine(self.config.get_sql_alchemy_url())
+
+        @event.listens_for(engine, "connect")
+        def _attach_schemas(dbapi_connection, connection_record):
+            for schema in ["sales", "marketing"]:
+                dbapi_connection.execute(
+                    f"ATTACH DATABASE '{self.config.file}.{schema}' AS {schema}"
+                )
+
+        with engine.connect() as conn:
+            yield inspect(conn)
+
+    def get_db_name(self, inspector: Inspector) -> str:
+        return "test_db"
+
+
+class _SQLiteSourceWithSchemaExtras(_SQLiteSource):
+    """Reads more metadata of each schema after the base class, like Vertica does."""
+
+    def loop_schema(self, inspector, schema, db_name, profile_requests=None):
+        yield from super().loop_schema(inspector, schema, db_name, profile_requests)
+        cached = self._schema_reflections.get((id(inspector), schema))
+        assert cached is not None
+        assert self.get_schema_reflection(inspector, schema) is cached
+        assert cached.get_columns("t0")
+
+
+def _create_sqlite_source(tmp_path, max_workers, source_class=_SQLiteSource):
+    file = str(tmp_path / "test.db")
+    for path in [file, f"{file}.sales", f"{file}.marketing"]:
+        with sqlite3.connect(path) as conn:
+            for i in range(3):
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS t{i} (id INTEGER PRIMARY KEY)"
+                )
+            conn.execute("CREATE VIEW IF NOT EXISTS v AS SELECT * FROM t0")
+    config = _SQLiteConfig.parse_obj({"file": file, "max_workers": max_workers})
+    return source_class(config, PipelineContext(run_id="test"), "sqlite")
+
+
+def _run_sqlite_source(tmp_path, max_workers):
+    source = _create_sqlite_source(tmp_path, max_workers)
+    workunits = list(source.get_workunits())
+    return source.report, sorted(
+        json.dumps(wu.metadata.to_obj(), sort_keys=True) for wu in workunits
+    )
+
+
+def test_schemas_processed_concurrently_match_serial_processing(tmp_path):
+    serial_report, serial_workunits = _run_sqlite_source(tmp_path, max_workers=1)
+    report, workunits = _run_sqlite_source(tmp_path, max_workers=3)
+
+    assert workunits == serial_workunits
+    assert report.tables_scanned == serial_report.tables_scanned == 9
+    assert report.views_scanned == serial_report.views_scanned == 3
+    assert report.events_produced == serial_report.events_produced
+    assert not report.failures and not report.warnings
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_schema_reflections_are_kept_until_schema_is_done(tmp_path, max_workers):
+    source = _create_sqlite_source(
+        tmp_path, max_workers, source_class=_SQLiteSourceWithSchemaExtras
+    )
+    list(source.get_workunits())
+    assert not source.report.failures
+    assert source._schema_reflections == {}
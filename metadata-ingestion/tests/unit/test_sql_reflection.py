@@ -0,0 +1,153 @@
+from unittest import mock
+
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.sql import sqltypes
+
+from datahub.ingestion.source.sql.sql_reflection import (
+    PostgresSchemaReflection,
+    SchemaReflection,
+    get_schema_reflection,
+)
+
+# The rows that the catalog queries return, keyed by a snippet of the query.
+POSTGRES_CATALOG_ROWS = {
+    "pg_catalog.format_type": [
+        ("orders", "id", "integer", None, True, "The order id", "", None),
+        ("orders", "customer_id", "integer", None, False, None, "", None),
+        ("orders", "note", "character varying(20)", None, False, None, "", None),
+        ("customers", "id", "integer", None, True, None, "", None),
+    ],
+    "con.contype = 'p'": [
+        ("orders", "orders_pkey", "id"),
+        ("customers", "customers_pkey", "id"),
+    ],
+    "con.contype = 'f'": [
+        ("orders", "orders_customer_fk", "sales", "customers", ["customer_id"], ["id"]),
+    ],
+    "pgd.objsubid = 0": [("orders", "All orders")],
+    "pg_get_viewdef": [("big_orders", "SELECT * FROM orders")],
+    "SELECT c.relname\n": [("orders",), ("customers",), ("big_orders",)],
+}
+
+
+def _execute_catalog_query(query, params):
+    assert params == {"schema": "sales"}
+    for snippet, rows in POSTGRES_CATALOG_ROWS.items():
+        if snippet in str(query):
+            return mock.Mock(fetchall=mock.Mock(return_value=rows))
+    raise AssertionError(f"Unexpected query {query}")
+
+
+def _make_postgres_inspector(server_version_info=(14, 0)):
+    dialect = PGDialect_psycopg2()
+    dialect.server_version_info = server_version_info
+    dialect._load_domains = mock.Mock(return_value={})
+    dialect._load_enums = mock.Mock(return_value=[])
+    inspector = mock.Mock(dialect=dialect)
+    inspector.bind.execute.side_effect = _execute_catalog_query
+    return inspector
+
+
+def test_postgres_schema_is_reflected_in_bulk():
+    inspector = _make_postgres_inspector()
+    reflection = get_schema_reflection(inspector, "sales")
+    assert isinstance(reflection, PostgresSchemaReflection)
+
+    columns = reflection.get_columns("orders")
+    assert [(c["name"], c["nullable"], c["comment"]) for c in columns] == [
+        ("id", False, "The order id"),
+        ("customer_id", True, None),
+        ("note", True, None),
+    ]
+    assert isinstance(columns[0]["type"], sqltypes.INTEGER)
+    assert isinstance(columns[2]["type"], sqltypes.VARCHAR)
+    assert columns[2]["type"].length == 20
+    assert reflection.get_columns("big_orders") == []
+
+    assert reflection.get_pk_constraint("orders") == {
+        "constrained_columns": ["id"],
+        "name": "orders_pkey",
+    }
+    assert reflection.get_pk_constraint("big_orders") == {
+        "constrained_columns": [],
+        "name": None,
+    }
+    assert reflection.get_foreign_keys("orders") == [
+        {
+            "name": "orders_customer_fk",
+            "constrained_columns": ["customer_id"],
+            "referred_schema": "sales",
+            "referred_table": "customers",
+            "referred_columns": ["id"],
+            "options": {},
+        }
+    ]
+    assert reflection.get_foreign_keys("customers") == []
+    assert reflection.get_table_comment("orders") == {"text": "All orders"}
+    assert reflection.get_table_comment("customers") == {"text": None}
+    assert reflection.get_view_definition("big_orders") == "SELECT * FROM orders"
+
+    # Every kind of metadata is loaded with one query, however many tables are read.
+    reflection.get_columns("customers")
+    reflection.get_pk_constraint("customers")
+    assert inspector.bind.execute.call_count == len(POSTGRES_CATALOG_ROWS)
+    inspector.get_columns.assert_not_called()
+    inspector.get_pk_constraint.assert_not_called()
+
+
+def test_postgres_columns_are_reflected_without_identity_support():
+    # Before SQLAlchemy 1.4, the dialect doesn't reflect identity columns.
+    inspector = _make_postgres_inspector()
+    get_column_info = inspector.dialect._get_column_info
+
+    def _get_column_info_1_3(
+        name, format_type, default, notnull, domains, enums, schema, comment, generated
+    ):
+        return get_column_info(
+            name,
+            format_type,
+            default,
+            notnull,
+            domains,
+            enums,
+            schema,
+            comment,
+            generated,
+            None,
+        )
+
+    inspector.dialect._get_column_info = _get_column_info_1_3
+    reflection = get_schema_reflection(inspector, "sales")
+    assert [c["name"] for c in reflection.get_columns("orders")] == [
+        "id",
+        "customer_id",
+        "note",
+    ]
+    inspector.get_columns.assert_not_called()
+
+
+def test_schema_reflection_falls_back_to_inspector():
+    inspector = _make_postgres_inspector()
+    reflection = get_schema_reflection(inspector, "sales")
+    # Tables that are missing from the bulk index, for example because they were
+    # created after it was loaded, are reflected on their own.
+    assert reflection.get_columns("new_table") is inspector.get_columns.return_value
+    inspector.get_columns.assert_called_once_with("new_table", "sales")
+
+    # Bulk loads that fail fall back to reflecting each table.
+    inspector = _make_postgres_inspector()
+    inspector.dialect._load_domains.side_effect = TypeError
+    reflection = get_schema_reflection(inspector, "sales")
+    assert reflection.get_columns("orders") is inspector.get_columns.return_value
+
+    # Older Postgres versions and other dialects are always reflected per table.
+    for inspector in [
+        _make_postgres_inspector(server_version_info=(9, 6)),
+        mock.Mock(dialect=mock.Mock(name="mysql")),
+    ]:
+        reflection = get_schema_reflection(inspector, "sales")
+        assert type(reflection) is SchemaReflection
+        assert reflection.get_foreign_keys("orders") is (
+            inspector.get_foreign_keys.return_value
+        )
+        inspector.get_foreign_keys.assert_called_once_with("orders", "sales")
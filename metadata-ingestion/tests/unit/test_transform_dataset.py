@@ -2457,3 +2457,26 @@ def test_pattern_dataset_schema_tags_transformation_patch(
     assert builder.make_tag_urn("pii") in global_tags_urn
     assert builder.make_tag_urn("FirstName") in global_tags_urn
     assert builder.make_tag_urn("Name") in global_tags_urn
+
+
+def test_prefetch_server_aspects(mock_datahub_graph):
+    pipeline_context = PipelineContext(run_id="test_prefetch_server_aspects")
+    pipeline_context.graph = mock_datahub_graph(DatahubClientConfig())
+    dataset_urn = builder.make_dataset_urn("bigquery", "example1")
+    entity_urns = [dataset_urn, "urn:li:chart:(looker,chart1)"]
+
+    transformer = SimpleAddDatasetTags.create(
+        {"tag_urns": [], "semantics": TransformerSemantics.OVERWRITE}, pipeline_context
+    )
+    assert transformer.get_patch_graph() is None
+    transformer.prefetch_server_aspects(entity_urns)
+    pipeline_context.graph.prefetch_aspects.assert_not_called()
+
+    transformer = SimpleAddDatasetTags.create(
+        {"tag_urns": [], "semantics": TransformerSemantics.PATCH}, pipeline_context
+    )
+    assert transformer.get_patch_graph() is pipeline_context.graph
+    transformer.prefetch_server_aspects(entity_urns)
+    pipeline_context.graph.prefetch_aspects.assert_called_once_with(
+        [dataset_urn], [models.GlobalTagsClass]
+    )
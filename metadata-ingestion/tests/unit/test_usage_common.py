@@ -12,6 +12,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
     GenericAggregatedDataset,
+    UsageAggregator,
 )
 from datahub.metadata.schema_classes import DatasetUsageStatisticsClass
 
@@ -273,3 +274,96 @@ def test_make_usage_workunit_include_top_n_queries():
     du: DatasetUsageStatisticsClass = wu.get_metadata()["metadata"].aspect
     assert du.totalSqlQueries == 1
     assert du.topSqlQueries is None
+
+
+def _generate_usage(aggregator: UsageAggregator[str]) -> list:
+    return [
+        (wu.id, wu.get_metadata()["metadata"].aspect.to_obj())
+        for wu in aggregator.generate_workunits(BucketDuration.DAY, _simple_urn_builder)
+    ]
+
+
+def _add_events(aggregator: UsageAggregator[str]) -> None:
+    for day in [1, 2, 3, 1]:
+        floored_ts = get_time_bucket(datetime(2020, 1, day, 12), BucketDuration.DAY)
+        for table in ["a", "b", "c"]:
+            resource = f"test_db.test_schema.{table}"
+            aggregator.add_read_entry(
+                floored_ts, resource, "user1@test.com", f"select * from {table}", ["x"]
+            )
+            aggregator.add_read_entry(
+                floored_ts, resource, "user2@test.com", "select 1", ["x", "y"]
+            )
+            aggregator.add_read_entry(floored_ts, resource, "user1@test.com", None, [])
+
+
+def test_usage_aggregator_matches_aggregated_dataset():
+    aggregator: UsageAggregator[str] = UsageAggregator(BaseUsageConfig())
+    _add_events(aggregator)
+
+    datasets: dict = {}
+    for day in [1, 2, 3, 1]:
+        floored_ts = get_time_bucket(datetime(2020, 1, day, 12), BucketDuration.DAY)
+        for table in ["a", "b", "c"]:
+            resource = f"test_db.test_schema.{table}"
+            ta = datasets.setdefault(
+                (floored_ts, resource),
+                _TestAggregatedDataset(bucket_start_time=floored_ts, resource=resource),
+            )
+            ta.add_read_entry("user1@test.com", f"select * from {table}", ["x"])
+            ta.add_read_entry("user2@test.com", "select 1", ["x", "y"])
+            ta.add_read_entry("user1@test.com", None, [])
+    expected = []
+    for ta in datasets.values():
+        wu = ta.make_usage_workunit(
+            BucketDuration.DAY, _simple_urn_builder, 10, False, True
+        )
+        expected.append((wu.id, wu.get_metadata()["metadata"].aspect.to_obj()))
+
+    assert _generate_usage(aggregator) == expected
+
+
+def test_usage_aggregator_spills_to_disk(tmp_path):
+    in_memory: UsageAggregator[str] = UsageAggregator(BaseUsageConfig())
+    _add_events(in_memory)
+    expected = sorted(_generate_usage(in_memory))
+
+    spilled: UsageAggregator[str] = UsageAggregator(
+        BaseUsageConfig(
+            max_in_memory_aggregates=2,
+            max_in_memory_query_text_size=10,
+            spill_directory=str(tmp_path),
+        )
+    )
+    _add_events(spilled)
+    assert spilled.num_spilled_aggregates > 0
+    assert spilled.num_spilled_queries > 0
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Spilled aggregates are emitted in bucket order, and the late events of the first
+    # day are merged into its earlier aggregates.
+    assert _generate_usage(spilled) == expected
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_usage_aggregator_top_n_queries_are_approximate():
+    aggregator: UsageAggregator[str] = UsageAggregator(
+        BaseUsageConfig(top_n_queries=1, query_frequency_capacity=2)
+    )
+    floored_ts = get_time_bucket(datetime(2020, 1, 1), BucketDuration.DAY)
+    for i in range(100):
+        aggregator.add_read_entry(
+            floored_ts, "test_db.test_schema.a", "u@test.com", "select frequent", []
+        )
+        aggregator.add_read_entry(
+            floored_ts, "test_db.test_schema.a", "u@test.com", f"select {i}", []
+        )
+
+    [(_, usage)] = _generate_usage(aggregator)
+    assert usage["totalSqlQueries"] == 200
+    assert usage["topSqlQueries"] == ["select frequent"]
+
+
+def test_query_frequency_capacity_validator_fails():
+    with pytest.raises(ValidationError, match="must be at least top_n_queries"):
+        BaseUsageConfig(top_n_queries=10, query_frequency_capacity=5)
@@ -1,5 +1,9 @@
 from datahub.utilities.delayed_iter import delayed_iter
-from datahub.utilities.sql_parser import MetadataSQLSQLParser, SqlLineageSQLParser
+from datahub.utilities.sql_parser import (
+    MetadataSQLSQLParser,
+    SqlLineageSQLParser,
+    SqlParserPool,
+)
 
 
 def test_delayed_iter():
@@ -348,3 +352,18 @@ JOIN `admin-table` a on d.`column-date` = a.`column-admin`
     ]
     assert sorted(SqlLineageSQLParser(sql_query).get_tables()) == expected_tables
     assert sorted(SqlLineageSQLParser(sql_query).get_columns()) == expected_columns
+
+
+def test_sql_parser_pool_recycles_workers():
+    pool = SqlParserPool(max_workers=2, max_parses_per_worker=3)
+    try:
+        sql_queries = [f"SELECT col_{i} FROM table_{i}" for i in range(10)]
+        results = pool.parse_many(sql_queries)
+    finally:
+        pool.close()
+
+    assert [tables for tables, _, _ in results] == [[f"table_{i}"] for i in range(10)]
+    assert [columns for _, columns, _ in results] == [[f"col_{i}"] for i in range(10)]
+    assert all(exception is None for _, _, exception in results)
+    # Each worker serves at most 3 queries before it is replaced.
+    assert pool.workers_started == 4
@@ -0,0 +1,87 @@
+import contextlib
+import sqlite3
+
+from datahub.utilities.bigquery_sql_parser import BigQuerySQLParser
+from datahub.utilities.sql_parser import SqlLineageSQLParser
+from datahub.utilities.sql_parser_cache import (
+    SqlParseCache,
+    normalize_sql,
+    set_sql_parse_cache,
+    sql_parse_cache_key,
+)
+
+
+def test_normalize_sql():
+    assert (
+        normalize_sql("  SELECT   a,\tb\n\n  FROM foo -- comment\nWHERE x = 1;  ")
+        == "SELECT a, b\nFROM foo -- comment\nWHERE x = 1"
+    )
+    assert sql_parse_cache_key("p", "1", "SELECT a FROM foo") == sql_parse_cache_key(
+        "p", "1", "SELECT  a\tFROM foo;"
+    )
+    assert sql_parse_cache_key("p", "1", "SELECT a FROM foo") != sql_parse_cache_key(
+        "p", "2", "SELECT a FROM foo"
+    )
+
+
+def test_sql_parse_cache_lru_eviction():
+    cache = SqlParseCache(max_size=2)
+    cache.put("a", ["t_a"], ["c_a"])
+    cache.put("b", ["t_b"], ["c_b"])
+    assert cache.get("a") == (["t_a"], ["c_a"])
+    cache.put("c", ["t_c"], ["c_c"])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (["t_a"], ["c_a"])
+    assert cache.get("c") == (["t_c"], ["c_c"])
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_sql_parse_cache_persists_to_disk(tmp_path):
+    path = str(tmp_path / "sql_parse_cache.db")
+    cache = SqlParseCache(path=path)
+    cache.put("a", ["t_a"], ["c_a"])
+    cache.close()
+
+    reopened = SqlParseCache(path=path)
+    assert reopened.get("a") == (["t_a"], ["c_a"])
+    assert reopened.get("b") is None
+    reopened.close()
+
+
+def test_sql_parse_cache_commits_in_batches(tmp_path):
+    path = str(tmp_path / "sql_parse_cache.db")
+    cache = SqlParseCache(path=path, commit_interval=2)
+
+    def _committed_keys():
+        with contextlib.closing(sqlite3.connect(path)) as db:
+            return sorted(
+                row[0] for row in db.execute("SELECT key FROM sql_parse_cache")
+            )
+
+    cache.put("a", ["t_a"], ["c_a"])
+    assert _committed_keys() == []
+    cache.put("b", ["t_b"], ["c_b"])
+    assert _committed_keys() == ["a", "b"]
+    cache.put("c", ["t_c"], ["c_c"])
+    assert _committed_keys() == ["a", "b"]
+    cache.close()
+    assert _committed_keys() == ["a", "b", "c"]
+
+
+def test_parsers_use_sql_parse_cache():
+    cache = SqlParseCache()
+    set_sql_parse_cache(cache)
+    try:
+        sql_query = "SELECT a, b FROM foo JOIN bar ON foo.id = bar.id"
+        for _ in range(2):
+            assert sorted(
+                SqlLineageSQLParser(sql_query, use_external_process=False).get_tables()
+            ) == ["bar", "foo"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        for _ in range(2):
+            assert sorted(BigQuerySQLParser(sql_query).get_tables()) == ["bar", "foo"]
+        assert cache.hits == 2
+    finally:
+        set_sql_parse_cache(None)
@@ -0,0 +1,43 @@
+import collections
+import random
+
+from datahub.utilities.stats_collections import SpaceSavingCounter
+
+
+def test_space_saving_counter_is_exact_within_capacity():
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(capacity=3)
+    for item in ["a", "b", "a", "c", "a", "b"]:
+        counter.add(item)
+
+    assert counter.most_common() == [("a", 3), ("b", 2), ("c", 1)]
+    assert counter.most_common(1) == [("a", 3)]
+    assert counter["d"] == 0
+
+
+def test_space_saving_counter_keeps_heavy_hitters():
+    rng = random.Random(42)
+    items = [f"heavy_{i}" for i in range(5) for _ in range(200)]
+    items += [f"light_{i}" for i in range(500)]
+    rng.shuffle(items)
+
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(capacity=20)
+    for item in items:
+        counter.add(item)
+
+    assert len(counter) == 20
+    exact = collections.Counter(items)
+    top = counter.most_common(5)
+    assert {item for item, _ in top} == {f"heavy_{i}" for i in range(5)}
+    # Counts are never underestimated.
+    assert all(count >= exact[item] for item, count in counter.most_common())
+
+
+def test_space_saving_counter_update():
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(capacity=2)
+    counter.add("a", 2)
+    counter.add("b")
+    counter.update([("b", 3), ("c", 1)])
+
+    assert counter.most_common() == [("b", 4), ("a", 2)]
+    counter.add("d")
+    assert counter.most_common() == [("b", 4), ("d", 3)]
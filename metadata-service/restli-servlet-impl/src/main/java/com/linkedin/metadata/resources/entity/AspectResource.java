@@ -9,6 +9,7 @@ import com.google.common.collect.ImmutableList;
 import com.linkedin.aspect.GetTimeseriesAspectValuesResponse;
 import com.linkedin.common.AuditStamp;
 import com.linkedin.common.urn.Urn;
+import com.linkedin.data.template.StringMap;
 import com.linkedin.metadata.aspect.EnvelopedAspectArray;
 import com.linkedin.metadata.aspect.VersionedAspect;
 import com.linkedin.metadata.authorization.PoliciesConfig;
@@ -60,12 +61,14 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
 
   private static final String ACTION_GET_TIMESERIES_ASPECT = "getTimeseriesAspectValues";
   private static final String ACTION_INGEST_PROPOSAL = "ingestProposal";
+  private static final String ACTION_INGEST_PROPOSAL_BATCH = "ingestProposalBatch";
   private static final String ACTION_GET_COUNT = "getCount";
   private static final String ACTION_RESTORE_INDICES = "restoreIndices";
 
   private static final String PARAM_ENTITY = "entity";
   private static final String PARAM_ASPECT = "aspect";
   private static final String PARAM_PROPOSAL = "proposal";
+  private static final String PARAM_PROPOSALS = "proposals";
   private static final String PARAM_START_TIME_MILLIS = "startTimeMillis";
   private static final String PARAM_END_TIME_MILLIS = "endTimeMillis";
   private static final String PARAM_LATEST_VALUE = "latestValue";
@@ -165,14 +168,67 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
       @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
     log.info("INGEST PROPOSAL proposal: {}", metadataChangeProposal);
 
-    boolean asyncBool;
+    final boolean asyncBool = parseAsync(async);
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    authorizeProposalOrThrow(authentication, metadataChangeProposal);
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> {
+      log.debug("Proposal: {}", metadataChangeProposal);
+      try {
+        return ingestProposalAndAdditionalChanges(metadataChangeProposal, auditStamp, asyncBool).toString();
+      } catch (ValidationException e) {
+        throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+      }
+    }, MetricRegistry.name(this.getClass(), "ingestProposal"));
+  }
+
+  /**
+   * Ingests a batch of proposals in a single request. All proposals are authorized before any of them is ingested.
+   * The proposals are ingested one by one and not in a transaction, so a proposal that fails does not prevent the
+   * others from being ingested. Returns the error messages of the failed proposals, keyed by their index in the batch.
+   */
+  @Action(name = ACTION_INGEST_PROPOSAL_BATCH)
+  @Nonnull
+  @WithSpan
+  public Task<StringMap> ingestProposalBatch(
+      @ActionParam(PARAM_PROPOSALS) @Nonnull MetadataChangeProposal[] metadataChangeProposals,
+      @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
+    log.info("INGEST PROPOSAL BATCH proposals: {}", metadataChangeProposals.length);
+
+    final boolean asyncBool = parseAsync(async);
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    for (MetadataChangeProposal metadataChangeProposal : metadataChangeProposals) {
+      authorizeProposalOrThrow(authentication, metadataChangeProposal);
+    }
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> {
+      final StringMap failures = new StringMap();
+      for (int i = 0; i < metadataChangeProposals.length; i++) {
+        log.debug("Proposal: {}", metadataChangeProposals[i]);
+        try {
+          ingestProposalAndAdditionalChanges(metadataChangeProposals[i], auditStamp, asyncBool);
+        } catch (RuntimeException e) {
+          log.warn("Failed to ingest proposal {} of the batch", i, e);
+          failures.put(String.valueOf(i), String.valueOf(e.getMessage()));
+        }
+      }
+      return failures;
+    }, MetricRegistry.name(this.getClass(), "ingestProposalBatch"));
+  }
+
+  private static boolean parseAsync(String async) {
     if (UNSET.equals(async)) {
-      asyncBool = Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
-    } else {
-      asyncBool = Boolean.parseBoolean(async);
+      return Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
     }
+    return Boolean.parseBoolean(async);
+  }
 
-    Authentication authentication = AuthenticationContext.getAuthentication();
+  private void authorizeProposalOrThrow(@Nonnull Authentication authentication,
+      @Nonnull MetadataChangeProposal metadataChangeProposal) {
     EntitySpec entitySpec = _entityService.getEntityRegistry().getEntitySpec(metadataChangeProposal.getEntityType());
     Urn urn = EntityKeyUtils.getUrnFromProposal(metadataChangeProposal, entitySpec.getKeyAspectSpec());
     if (Boolean.parseBoolean(System.getenv(REST_API_AUTHORIZATION_ENABLED_ENV))
@@ -180,26 +236,20 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
         new ResourceSpec(urn.getEntityType(), urn.toString()))) {
       throw new RestLiServiceException(HttpStatus.S_401_UNAUTHORIZED, "User is unauthorized to modify entity " + urn);
     }
-    String actorUrnStr = authentication.getActor().toUrnStr();
-    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+  }
 
-    return RestliUtil.toTask(() -> {
-      log.debug("Proposal: {}", metadataChangeProposal);
-      try {
-        EntityService.IngestProposalResult result = _entityService.ingestProposal(metadataChangeProposal, auditStamp, asyncBool);
-        Urn responseUrn = result.getUrn();
+  private Urn ingestProposalAndAdditionalChanges(@Nonnull MetadataChangeProposal metadataChangeProposal,
+      @Nonnull AuditStamp auditStamp, boolean async) {
+    EntityService.IngestProposalResult result = _entityService.ingestProposal(metadataChangeProposal, auditStamp, async);
+    Urn responseUrn = result.getUrn();
 
-        AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService)
-                .forEach(proposal -> _entityService.ingestProposal(proposal, auditStamp, asyncBool));
+    AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService)
+            .forEach(proposal -> _entityService.ingestProposal(proposal, auditStamp, async));
 
-        if (!result.isQueued()) {
-          tryIndexRunId(responseUrn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
-        }
-        return responseUrn.toString();
-      } catch (ValidationException e) {
-        throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
-      }
-    }, MetricRegistry.name(this.getClass(), "ingestProposal"));
+    if (!result.isQueued()) {
+      tryIndexRunId(responseUrn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
+    }
+    return responseUrn;
   }
 
   @Action(name = ACTION_GET_COUNT)